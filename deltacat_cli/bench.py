@@ -0,0 +1,121 @@
+import json
+import sys
+from pathlib import Path
+from typing import Annotated, Any
+
+import typer
+from rich.table import Table
+
+from deltacat_cli.config import console, err_console
+from deltacat_cli.utils.emojis import get_emoji
+from deltacat_cli.utils.error_handlers import handle_catalog_error
+from deltacat_cli.utils.formatting import format_bytes
+from deltacat_cli.utils.output import dumps, output_context
+
+
+app = typer.Typer()
+
+SCALE_NAMES = ('small', 'medium', 'large')
+
+
+def print_report(report: dict[str, Any]) -> None:
+    """Print benchmark results as a table."""
+    scale = report['scale']
+    table = Table(
+        title=f'Benchmark: {scale["rows"]:,} row(s), {scale["tables"]:,} table(s), {scale["iterations"]} iteration(s)',
+        title_justify='left',
+    )
+    table.add_column('Command', style='cyan')
+    for column in ('p50 ms', 'p95 ms', 'ops/s', 'rows/s', 'Peak RSS'):
+        table.add_column(column, justify='right')
+
+    for result in report['results']:
+        table.add_row(
+            result['command'],
+            f'{result["p50_ms"]:,.1f}',
+            f'{result["p95_ms"]:,.1f}',
+            f'{result["ops_per_second"]:,.2f}' if result['ops_per_second'] else '-',
+            f'{result["rows_per_second"]:,.0f}' if result['rows_per_second'] else '-',
+            format_bytes(result['peak_rss_bytes']) if result['peak_rss_bytes'] else '-',
+        )
+    console.print(table)
+
+
+@app.command(name='bench')
+def bench_cmd(
+    scale: Annotated[
+        str, typer.Option(help=f'Size of the synthetic catalog ({", ".join(SCALE_NAMES)}). See --rows and --tables.')
+    ] = 'small',
+    rows: Annotated[int | None, typer.Option(min=1, help='Rows of the data table, overrides the scale')] = None,
+    tables: Annotated[
+        int | None, typer.Option(min=0, help='Empty tables in the namespace, overrides the scale')
+    ] = None,
+    iterations: Annotated[int, typer.Option(min=1, help='Timed runs of every command')] = 5,
+    warmup: Annotated[int, typer.Option(min=0, help='Untimed runs of every command before the timed ones')] = 1,
+    command: Annotated[
+        list[str] | None, typer.Option('--command', '-c', help='Only benchmark this command, e.g. "table read"')
+    ] = None,
+    save: Annotated[Path | None, typer.Option(help='Write the report as JSON to this file')] = None,
+    compare: Annotated[
+        Path | None, typer.Option(help='Report of a previous run to compare median latencies against')
+    ] = None,
+    max_regression: Annotated[
+        float, typer.Option(min=0, help='Fail when a median latency grows by more than this fraction of --compare')
+    ] = 0.2,
+) -> None:
+    """Benchmark the CLI commands against a synthetic catalog.
+
+    A catalog is provisioned in a temporary directory and removed afterwards, the configured catalog is
+    not touched. Reports p50/p95 latency, throughput and peak memory of every command.
+    """
+    from deltacat_cli.benchmarks.dataset import SCALES, BenchScale
+    from deltacat_cli.benchmarks.suite import COMMANDS, BenchmarkError, run_suite
+    from deltacat_cli.benchmarks.suite import compare as compare_reports
+
+    try:
+        if scale not in SCALES:
+            raise ValueError(f'Unknown scale {scale}, expected one of {", ".join(SCALE_NAMES)}')
+        unknown = [name for name in command or [] if name not in COMMANDS]
+        if unknown:
+            raise ValueError(f'Unknown command {", ".join(unknown)}, expected one of {", ".join(COMMANDS)}')
+        baseline = json.loads(compare.read_text()) if compare else None
+
+        preset = SCALES[scale]
+        bench_scale = BenchScale(
+            scale if rows is None and tables is None else 'custom',
+            rows=preset.rows if rows is None else rows,
+            tables=preset.tables if tables is None else tables,
+        )
+        console.print(f'{get_emoji("loading")} Benchmarking at {bench_scale.name} scale')
+        report = run_suite(
+            bench_scale,
+            iterations,
+            warmup,
+            commands=command or None,
+            progress=lambda message: console.print(f'  {message}', style='dim'),
+        )
+    except BenchmarkError as e:
+        err_console.print(f'{get_emoji("error")} Benchmark failed: {e}', style='bold red')
+        raise typer.Exit(1) from e
+    except Exception as e:
+        handle_catalog_error(e, 'running benchmark')
+
+    if save:
+        save.write_text(json.dumps(report, indent=2) + '\n')
+        console.print(f'{get_emoji("success")} Report saved to {save}', style='green')
+    if output_context.machine:
+        sys.stdout.write(dumps(report) + '\n')
+    else:
+        print_report(report)
+
+    if baseline is not None:
+        regressions = compare_reports(report, baseline, max_regression)
+        for regression in regressions:
+            err_console.print(
+                f'{get_emoji("warning")} {regression["command"]}: p50 {regression["p50_ms"]:,.1f} ms, '
+                f'{regression["change"]:+.0%} over {regression["baseline_p50_ms"]:,.1f} ms',
+                style='bold red',
+            )
+        if regressions:
+            raise typer.Exit(1)
+        console.print(f'{get_emoji("success")} No command regressed by more than {max_regression:.0%}', style='green')
@@ -0,0 +1,6 @@
+"""Benchmark suite of the CLI commands, run with `deltacat bench`.
+
+A catalog is provisioned in a temporary directory with a namespace of synthetic tables and one data table,
+and every command is run in-process against it a number of times. Reports carry p50/p95 latency, throughput
+and peak resident memory per command, and can be saved as JSON and compared against a previous release.
+"""
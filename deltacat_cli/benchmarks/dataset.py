@@ -0,0 +1,97 @@
+"""Synthetic namespaces, tables and data to benchmark against."""
+
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from deltacat import Schema, TableWriteMode, create_namespace, create_table, write_to_table
+
+
+NAMESPACE = 'bench'
+DATA_TABLE = 'events'
+INGEST_TABLE = 'ingest'
+
+SCHEMA = pa.schema([('id', pa.int64()), ('name', pa.string()), ('value', pa.float64()), ('ts', pa.timestamp('ms'))])
+SCHEMA_OPTION = 'id:int64,name:string,value:float64,ts:timestamp[ms]'
+
+# Rows per generated chunk, each committed as its own delta
+CHUNK_ROWS = 1_000_000
+
+# Rows of the file ingested by `table write`, whatever the scale
+MAX_INGEST_ROWS = 1_000_000
+
+# 2026-01-01T00:00:00Z
+BASE_TIMESTAMP_MS = 1_767_225_600_000
+
+
+@dataclass(frozen=True)
+class BenchScale:
+    """Size of the synthetic catalog."""
+
+    name: str
+    rows: int
+    tables: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+SCALES = {
+    'small': BenchScale('small', rows=1_000, tables=10),
+    'medium': BenchScale('medium', rows=100_000, tables=1_000),
+    'large': BenchScale('large', rows=10_000_000, tables=1_000),
+}
+
+
+def table_name(index: int) -> str:
+    return f'table_{index:05d}'
+
+
+def synthetic_chunks(rows: int, chunk_rows: int = CHUNK_ROWS) -> Iterator[pa.Table]:
+    """Deterministic rows of SCHEMA, generated a chunk at a time to bound memory."""
+    for start in range(0, rows, chunk_rows):
+        count = min(chunk_rows, rows - start)
+        ids = pc.add(pc.cumulative_sum(pa.repeat(pa.scalar(1, pa.int64()), count)), start - 1)
+        yield pa.table(
+            {
+                'id': ids,
+                'name': pc.binary_join_element_wise('user-', pc.cast(pc.bit_wise_and(ids, 0x3FFF), pa.string()), ''),
+                'value': pc.random(count, initializer=start),
+                'ts': pc.add(pc.multiply(ids, 1000), BASE_TIMESTAMP_MS).cast(pa.timestamp('ms')),
+            },
+            schema=SCHEMA,
+        )
+
+
+def provision(
+    scale: BenchScale, catalog_name: str, workdir: Path, progress: Callable[[str], None] = lambda _: None
+) -> Path:
+    """Create the benchmark namespace with its tables and data in a registered catalog.
+
+    Returns a Parquet file to ingest with `table write`.
+    """
+    create_namespace(NAMESPACE, catalog=catalog_name)
+
+    schema = Schema.of(schema=SCHEMA)
+    for index in range(scale.tables):
+        create_table(table_name(index), namespace=NAMESPACE, schema=schema, catalog=catalog_name)
+        if (index + 1) % 100 == 0:
+            progress(f'{index + 1:,}/{scale.tables:,} tables created')
+    create_table(INGEST_TABLE, namespace=NAMESPACE, schema=schema, catalog=catalog_name)
+
+    written = 0
+    for chunk in synthetic_chunks(scale.rows):
+        write_to_table(chunk, DATA_TABLE, namespace=NAMESPACE, mode=TableWriteMode.AUTO, catalog=catalog_name)
+        written += chunk.num_rows
+        progress(f'{written:,}/{scale.rows:,} rows written')
+
+    ingest_file = workdir / 'ingest.parquet'
+    with pq.ParquetWriter(ingest_file, SCHEMA) as writer:
+        for chunk in synthetic_chunks(min(scale.rows, MAX_INGEST_ROWS)):
+            writer.write_table(chunk)
+    return ingest_file
@@ -0,0 +1,99 @@
+"""Latency percentiles and peak memory of benchmarked commands."""
+
+import math
+import os
+import sys
+import threading
+from dataclasses import dataclass, field
+from typing import Any
+
+
+# Interval between resident set size samples
+RSS_SAMPLE_SECONDS = 0.005
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """The q-th percentile of samples, interpolated linearly between the closest ranks."""
+    if not samples:
+        raise ValueError('percentile of no samples')
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * q / 100
+    lower, upper = math.floor(position), math.ceil(position)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def current_rss() -> int | None:
+    """Resident set size of this process in bytes.
+
+    Read from /proc on Linux. Elsewhere this is the peak of the process' lifetime, which only grows.
+    """
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS, in KiB everywhere else
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class RssSampler:
+    """Track the peak resident set size while a block runs, sampling from a background thread."""
+
+    def __init__(self, interval: float = RSS_SAMPLE_SECONDS):
+        self.interval = interval
+        self.peak: int | None = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample_until_stopped, name='rss-sampler', daemon=True)
+
+    def _sample(self) -> None:
+        rss = current_rss()
+        if rss is not None and (self.peak is None or rss > self.peak):
+            self.peak = rss
+
+    def _sample_until_stopped(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self) -> 'RssSampler':
+        self._sample()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+
+
+@dataclass
+class Measurement:
+    """Timings of one benchmarked command."""
+
+    command: str
+    seconds: list[float] = field(default_factory=list)
+    rows: int = 0
+    peak_rss_bytes: int | None = None
+
+    def summary(self) -> dict[str, Any]:
+        """Latency percentiles in milliseconds, throughput and peak memory."""
+        total = sum(self.seconds)
+        summary: dict[str, Any] = {
+            'command': self.command,
+            'iterations': len(self.seconds),
+            'p50_ms': round(percentile(self.seconds, 50) * 1000, 3),
+            'p95_ms': round(percentile(self.seconds, 95) * 1000, 3),
+            'mean_ms': round(total / len(self.seconds) * 1000, 3),
+            'min_ms': round(min(self.seconds) * 1000, 3),
+            'max_ms': round(max(self.seconds) * 1000, 3),
+            'ops_per_second': round(len(self.seconds) / total, 3) if total else None,
+            'rows_per_second': None,
+            'peak_rss_bytes': self.peak_rss_bytes,
+        }
+        if self.rows and total:
+            summary['rows_per_second'] = round(self.rows * len(self.seconds) / total, 1)
+        return summary
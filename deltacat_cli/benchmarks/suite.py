@@ -0,0 +1,236 @@
+"""Run CLI commands against a synthetic catalog and report their latency, throughput and memory."""
+
+import datetime
+import io
+import platform
+import shutil
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from deltacat_cli import __version__
+from deltacat_cli.benchmarks.dataset import (
+    DATA_TABLE,
+    INGEST_TABLE,
+    MAX_INGEST_ROWS,
+    NAMESPACE,
+    SCHEMA_OPTION,
+    BenchScale,
+    provision,
+    table_name,
+)
+from deltacat_cli.benchmarks.measure import Measurement, RssSampler
+from deltacat_cli.utils.catalog_context import catalog_context
+from deltacat_cli.utils.invoke import NoInput, invoke
+
+
+CATALOG_NAME = 'bench'
+
+# Version of the report layout, bumped when fields change meaning
+REPORT_VERSION = 1
+
+
+class BenchmarkError(Exception):
+    """Raised when a benchmarked command fails."""
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """A command run once per iteration. `args` builds the command line of the n-th run.
+
+    `prepare` builds the command lines run untimed before the n-th run, creating what it works on, so every
+    benchmark runs on its own whichever others are selected. Output is encoded the way scripts consume it rather
+    than rendered for a terminal.
+    """
+
+    command: str
+    args: Callable[[int], list[str]]
+    rows: Callable[[BenchScale], int] = lambda _: 0
+    output: str = 'ndjson'
+    prepare: Callable[[int], list[list[str]]] = lambda _: []
+
+
+def _create_namespace(name: str) -> list[str]:
+    return ['namespace', 'create', '--name', name]
+
+
+def _create_table(name: str) -> list[str]:
+    return ['table', 'create', '--name', name, '--namespace', NAMESPACE, '--schema', SCHEMA_OPTION]
+
+
+BENCHMARKS = [
+    Benchmark('namespace list', lambda _: ['namespace', 'list']),
+    Benchmark('namespace get', lambda _: ['namespace', 'get', '--name', NAMESPACE]),
+    Benchmark('namespace create', lambda n: _create_namespace(f'bench_ns_{n}')),
+    Benchmark(
+        'namespace alter',
+        lambda n: ['namespace', 'alter', '--name', f'bench_alter_ns_{n}', '--new-name', f'bench_altered_ns_{n}'],
+        prepare=lambda n: [_create_namespace(f'bench_alter_ns_{n}')],
+    ),
+    Benchmark(
+        'namespace drop',
+        lambda n: ['namespace', 'drop', '--name', f'bench_drop_ns_{n}', '--drop'],
+        prepare=lambda n: [_create_namespace(f'bench_drop_ns_{n}')],
+    ),
+    Benchmark('table list', lambda _: ['table', 'list', '--namespace', NAMESPACE]),
+    Benchmark('table get', lambda _: ['table', 'get', '--name', table_name(0), '--namespace', NAMESPACE]),
+    Benchmark('table create', lambda n: _create_table(f'bench_table_{n}')),
+    Benchmark(
+        'table alter',
+        lambda n: [
+            'table',
+            'alter',
+            '--name',
+            f'bench_alter_table_{n}',
+            '--namespace',
+            NAMESPACE,
+            '--table-description',
+            f'altered {n}',
+        ],
+        prepare=lambda n: [_create_table(f'bench_alter_table_{n}')],
+    ),
+    Benchmark(
+        'table drop',
+        lambda n: ['table', 'drop', '--name', f'bench_drop_table_{n}', '--namespace', NAMESPACE, '--drop'],
+        prepare=lambda n: [_create_table(f'bench_drop_table_{n}')],
+    ),
+    Benchmark(
+        'table read',
+        lambda _: ['table', 'read', '--name', DATA_TABLE, '--namespace', NAMESPACE, '--num-rows', '0'],
+        rows=lambda scale: scale.rows,
+        # Measures the scan rather than encoding every row as JSON
+        output='arrow',
+    ),
+    Benchmark(
+        'table write',
+        lambda _: ['table', 'write', '--name', INGEST_TABLE, '--namespace', NAMESPACE, '--input', '{ingest_file}'],
+        rows=lambda scale: min(scale.rows, MAX_INGEST_ROWS),
+    ),
+]
+
+COMMANDS = [benchmark.command for benchmark in BENCHMARKS]
+
+
+class _NullOutput(io.TextIOBase):
+    """Discards command output, text or binary."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.buffer = io.BufferedWriter(_NullBinary())
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+    def isatty(self) -> bool:
+        return False
+
+
+class _NullBinary(io.RawIOBase):
+    """Discards binary output."""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        return len(data)
+
+
+def run_command(args: list[str], output: str = 'ndjson') -> float:
+    """Run a command in this process with its output discarded. Returns its duration in seconds.
+
+    Metadata is always read from the catalog, bypassing the metadata cache.
+    """
+    stderr = io.StringIO()
+    start = time.perf_counter()
+    exit_code = invoke(['--no-cache', '--output', output, *args], _NullOutput(), stderr, stdin=NoInput())
+    seconds = time.perf_counter() - start
+    if exit_code:
+        raise BenchmarkError(f'deltacat {" ".join(args)} exited with {exit_code}: {stderr.getvalue().strip()}')
+    return seconds
+
+
+def run_suite(
+    scale: BenchScale,
+    iterations: int,
+    warmup: int = 1,
+    commands: list[str] | None = None,
+    progress: Callable[[str], None] = lambda _: None,
+) -> dict[str, Any]:
+    """Provision a catalog in a temporary directory, benchmark commands against it and remove it again.
+
+    Every command runs `warmup` times untimed, then `iterations` times timed.
+    """
+    import deltacat
+
+    benchmarks = [benchmark for benchmark in BENCHMARKS if commands is None or benchmark.command in commands]
+    workdir = Path(tempfile.mkdtemp(prefix='deltacat-bench-'))
+    started = datetime.datetime.now(datetime.timezone.utc)
+    try:
+        with catalog_context.scoped(CATALOG_NAME, str(workdir)):
+            progress(f'Provisioning {scale.tables:,} table(s) and {scale.rows:,} row(s) in {workdir}')
+            start = time.perf_counter()
+            catalog_context.get_catalog()
+            ingest_file = provision(scale, CATALOG_NAME, workdir, progress)
+            provision_seconds = time.perf_counter() - start
+
+            measurements = []
+            for benchmark in benchmarks:
+                progress(f'Benchmarking {benchmark.command}')
+                measurement = Measurement(benchmark.command, rows=benchmark.rows(scale))
+
+                def args(run: int, benchmark: Benchmark = benchmark) -> list[str]:
+                    return [arg.format(ingest_file=ingest_file) for arg in benchmark.args(run)]
+
+                for run in range(warmup + iterations):
+                    for setup in benchmark.prepare(run):
+                        run_command(setup)
+                for run in range(warmup):
+                    run_command(args(run), benchmark.output)
+                with RssSampler() as sampler:
+                    for run in range(warmup, warmup + iterations):
+                        measurement.seconds.append(run_command(args(run), benchmark.output))
+                measurement.peak_rss_bytes = sampler.peak
+                measurements.append(measurement)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return {
+        'report_version': REPORT_VERSION,
+        'started': started.isoformat(),
+        'environment': {
+            'deltacat_cli': __version__,
+            'deltacat': deltacat.__version__,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+        },
+        'scale': {**scale.to_dict(), 'iterations': iterations, 'warmup': warmup},
+        'provision_seconds': round(provision_seconds, 3),
+        'results': [measurement.summary() for measurement in measurements],
+    }
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any], max_regression: float) -> list[dict[str, Any]]:
+    """Commands whose median latency grew by more than `max_regression` (0.2 = 20%) over the baseline."""
+    baseline_results = {result['command']: result for result in baseline.get('results', [])}
+    regressions = []
+    for result in report['results']:
+        previous = baseline_results.get(result['command'])
+        if not previous or not previous.get('p50_ms'):
+            continue
+        change = result['p50_ms'] / previous['p50_ms'] - 1
+        if change > max_regression:
+            regressions.append(
+                {
+                    'command': result['command'],
+                    'baseline_p50_ms': previous['p50_ms'],
+                    'p50_ms': result['p50_ms'],
+                    'change': round(change, 3),
+                }
+            )
+    return regressions
@@ -1,14 +1,19 @@
 import typer
 
-from deltacat_cli.catalog.clear import app as clear_app
-from deltacat_cli.catalog.init import app as initialize_app
-from deltacat_cli.catalog.set import app as set_app
-from deltacat_cli.catalog.show import app as show_app
+from deltacat_cli.utils.lazy_group import lazy_group
 
 
-app = typer.Typer()
-
-app.add_typer(initialize_app)
-app.add_typer(set_app)
-app.add_typer(show_app)
-app.add_typer(clear_app)
+app = typer.Typer(
+    cls=lazy_group(
+        {
+            'init': ('deltacat_cli.catalog.init:app', 'Create and set a new Catalog.'),
+            'set': ('deltacat_cli.catalog.set:app', 'Set the current Catalog for this session.'),
+            'show': ('deltacat_cli.catalog.show:app', 'Show the current active Catalog.'),
+            'export': (
+                'deltacat_cli.catalog.export:app',
+                'Export the metadata and data of every table in the catalog.',
+            ),
+            'clear': ('deltacat_cli.catalog.clear:app', 'Clear the current Catalog configuration.'),
+        }
+    )
+)
@@ -0,0 +1,152 @@
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Annotated, Any
+
+import typer
+from deltacat.exceptions import NamespaceNotFoundError
+from deltacat.storage import Namespace, metastore
+
+from deltacat_cli.config import console
+from deltacat_cli.utils.catalog_context import catalog_context
+from deltacat_cli.utils.catalog_export import (
+    ExportManifest,
+    ExportSettings,
+    TableExport,
+    export_catalog_table,
+    export_namespace_metadata,
+)
+from deltacat_cli.utils.emojis import get_emoji
+from deltacat_cli.utils.error_handlers import handle_catalog_error
+from deltacat_cli.utils.formatting import format_bytes, format_rate, parse_bytes
+from deltacat_cli.utils.metafile_listing import list_namespaces_lazily, list_tables_lazily
+from deltacat_cli.utils.output_files import COMPRESSIONS, EXPORT_FORMATS, resolve_output_dir, validate_compression
+
+
+app = typer.Typer()
+
+
+def get_namespace(name: str, inner: Any) -> Namespace:
+    namespace = metastore.get_namespace(name, inner=inner)
+    if namespace is None:
+        raise NamespaceNotFoundError(f'Namespace {name} not found')
+    return namespace
+
+
+@app.command(name='export')
+def export_catalog_cmd(
+    out: Annotated[str, typer.Option('--out', help='Output directory, local path or URI (s3://bucket/prefix)')],
+    namespaces: Annotated[
+        list[str] | None, typer.Option('--namespace', help='Only export these namespaces, repeatable')
+    ] = None,
+    export_format: Annotated[
+        str, typer.Option('--format', help=f'Output format ({", ".join(EXPORT_FORMATS)})')
+    ] = 'parquet',
+    compression: Annotated[
+        str | None,
+        typer.Option(
+            help='Compression codec. '
+            + '; '.join(f'{fmt}: {", ".join(codecs)}' for fmt, codecs in COMPRESSIONS.items())
+            + '. Defaults to the first one.'
+        ),
+    ] = None,
+    row_group_size: Annotated[
+        int, typer.Option(min=1, help='Rows per Parquet row group or IPC record batch, buffered per writer')
+    ] = 1_000_000,
+    max_file_size: Annotated[
+        str, typer.Option(help='Start a new part file once one reaches this size, e.g. 256MiB or 1GB')
+    ] = '512MiB',
+    workers: Annotated[int, typer.Option(min=1, help='Tables exported concurrently')] = min(4, os.cpu_count() or 1),
+    table_workers: Annotated[int, typer.Option(min=1, help='Data files of a table exported concurrently')] = 1,
+    overwrite: Annotated[
+        bool, typer.Option('--overwrite', help='Export every table again instead of resuming an earlier export')
+    ] = False,
+) -> None:
+    """Export the metadata and data of every table in the catalog.
+
+    Tables are exported to <out>/<namespace>/<table> by a pool of workers, as table export would. A manifest
+    in <out> records each finished table, so running the same command again after an interruption or failure
+    resumes with the tables that weren't finished.
+    """
+    try:
+        settings = ExportSettings(
+            format=export_format,
+            compression=validate_compression(export_format, compression),
+            row_group_size=row_group_size,
+            max_bytes=parse_bytes(max_file_size),
+        )
+        catalog = catalog_context.get_catalog()
+        filesystem, directory = resolve_output_dir(out)
+        manifest = ExportManifest(filesystem, directory, settings)
+        if not overwrite:
+            manifest.load()
+
+        console.print(
+            f'{get_emoji("loading")} Exporting catalog to {out} as {settings.format} ({settings.compression}) '
+            f'with {workers} worker(s)'
+        )
+        start = time.perf_counter()
+        exported: list[TableExport] = []
+        skipped = 0
+        failed: list[str] = []
+
+        def export_table(namespace: str, table: str) -> None:
+            try:
+                export = export_catalog_table(
+                    catalog.inner, filesystem, directory, namespace, table, settings, table_workers
+                )
+            except Exception as e:
+                failed.append(f'{namespace}/{table}')
+                console.print(f'{get_emoji("error")} {namespace}/{table}: {e}', style='red')
+                return
+            manifest.record(export)
+            exported.append(export)
+            console.print(
+                f'{get_emoji("success")} {export.key}: {export.rows:,} row(s), {export.parts} part(s), '
+                f'{format_bytes(export.bytes)} in {export.seconds:.2f}s, {format_rate(export.rows, export.seconds, "rows")}'
+            )
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='catalog-export') as executor:
+            futures: list[Future[None]] = []
+            listing = (
+                ((name, get_namespace(name, catalog.inner)) for name in namespaces)
+                if namespaces
+                else ((item.name, item.metafile) for item in list_namespaces_lazily(catalog.inner))
+            )
+            for namespace, metadata in listing:
+                export_namespace_metadata(filesystem, directory, namespace, metadata)
+                # Tables are submitted as they are listed, so the first exports start before listing finishes
+                for item in list_tables_lazily(namespace, catalog.inner):
+                    table = item.name
+                    if manifest.completed(namespace, table):
+                        skipped += 1
+                        console.print(f'{get_emoji("info")} {namespace}/{table}: already exported', style='dim')
+                        continue
+                    futures.append(executor.submit(export_table, namespace, table))
+            for future in futures:
+                future.result()
+
+        elapsed = time.perf_counter() - start
+        rows = sum(export.rows for export in exported)
+        total_bytes = sum(export.bytes for export in exported)
+        console.print(
+            f'{get_emoji("success")} Exported {len(exported)} table(s), {rows:,} row(s), {format_bytes(total_bytes)} '
+            f'in {elapsed:.2f}s' + (f', {skipped} already exported' if skipped else ''),
+            style='green',
+        )
+        console.print(
+            f'Throughput: {format_rate(rows, elapsed, "rows")}, {format_rate(total_bytes, elapsed, "bytes")}',
+            style='dim',
+        )
+        if failed:
+            console.print(
+                f'{get_emoji("error")} {len(failed)} table(s) failed: {", ".join(sorted(failed))}. '
+                'Run the same command again to resume.',
+                style='red',
+            )
+            raise typer.Exit(1)
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        handle_catalog_error(e, 'exporting catalog')
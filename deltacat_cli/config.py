@@ -1,7 +1,21 @@
 from rich.console import Console
 
+from deltacat_cli.utils.output import output_context
 
-console = Console()
+
+class StatusConsole(Console):
+    """Console for status messages, moved to stderr while stdout carries machine-readable output."""
+
+    @property
+    def stderr(self) -> bool:
+        return self._stderr or output_context.machine
+
+    @stderr.setter
+    def stderr(self, value: bool) -> None:
+        self._stderr = value
+
+
+console = StatusConsole()
 err_console = Console(stderr=True)
 
 # Configure Typer to show full tracebacks in development
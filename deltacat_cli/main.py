@@ -1,15 +1,20 @@
 """Main CLI application for deltacat."""
 
+import sys
+from pathlib import Path
+
 import typer
 from rich import print as rich_print
 
 from deltacat_cli import __version__
-from deltacat_cli.catalog import app as catalog_app
 from deltacat_cli.config import SHOW_TRACEBACK, err_console
-from deltacat_cli.namespace import app as namespace_app
-from deltacat_cli.table import app as table_app
+from deltacat_cli.utils import daemon
 from deltacat_cli.utils.catalog_context import catalog_context
 from deltacat_cli.utils.emojis import get_emoji
+from deltacat_cli.utils.lazy_group import lazy_group
+from deltacat_cli.utils.metadata_cache import metadata_cache
+from deltacat_cli.utils.output import OUTPUT_FORMATS, output_context
+from deltacat_cli.utils.profiling import profiler
 
 
 def version_callback(value: bool) -> None:
@@ -22,6 +27,17 @@ def version_callback(value: bool) -> None:
 app = typer.Typer(
     name='deltacat',
     help='A CLI application for working with deltacat',
+    # Command groups are imported on first use so --help, --version and completion stay fast
+    cls=lazy_group(
+        {
+            'catalog': ('deltacat_cli.catalog:app', 'Catalog operations for DeltaCat'),
+            'namespace': ('deltacat_cli.namespace:app', 'Namespace operations for DeltaCat'),
+            'table': ('deltacat_cli.table:app', 'Table operations for DeltaCat'),
+            'run': ('deltacat_cli.run:app', 'Run a script of deltacat commands in a single process.'),
+            'serve': ('deltacat_cli.serve:app', 'Run a local daemon that keeps the catalog warm.'),
+            'bench': ('deltacat_cli.bench:app', 'Benchmark the CLI commands against a synthetic catalog.'),
+        }
+    ),
     add_completion=True,
     pretty_exceptions_enable=not SHOW_TRACEBACK,
     pretty_exceptions_show_locals=SHOW_TRACEBACK,
@@ -39,13 +55,46 @@ def main_callback(
         is_eager=True,
         help='Show version and exit',
     ),
+    output: str | None = typer.Option(
+        None,
+        '--output',
+        '-o',
+        help=f'Output format ({", ".join(OUTPUT_FORMATS)}). auto renders with Rich on a terminal, ndjson otherwise.',
+    ),
+    no_cache: bool = typer.Option(
+        False,  # noqa: FBT003
+        '--no-cache',
+        help='Read metadata from the catalog, bypassing the cache enabled by DELTACAT_CLI_CACHE_TTL.',
+    ),
+    profile: bool = typer.Option(
+        False,  # noqa: FBT003
+        '--profile',
+        help='Print where the command spent its time: startup, imports, config, catalog, deltacat and rendering.',
+    ),
+    profile_file: Path | None = typer.Option(
+        None, '--profile-file', help='Also write a cProfile of the command to this .prof file. Implies --profile.'
+    ),
+    profile_memory: int = typer.Option(
+        0, '--profile-memory', min=0, help='Also list the N largest allocation sites. Implies --profile.'
+    ),
 ) -> None:
     """DeltaCat CLI - A command-line interface for working with deltacat.
 
     Use 'deltacat catalog init' to get started.
     """
+    if output is not None:
+        try:
+            # Applies until the command finishes, so in-process runs (`run`, `serve`) don't leak it to the next one
+            ctx.with_resource(output_context.scoped(output))
+        except ValueError as e:
+            raise typer.BadParameter(str(e), param_hint='--output') from e
+    if no_cache:
+        ctx.with_resource(metadata_cache.bypassed())
+    if profile or profile_file or profile_memory:
+        ctx.with_resource(profiler.session(profile_file, profile_memory))
+
     if ctx.invoked_subcommand:
-        commands_without_catalog = {'catalog'}
+        commands_without_catalog = {'catalog', 'run', 'serve', 'bench'}
 
         if ctx.invoked_subcommand not in commands_without_catalog:
             catalog_context.get_catalog_info(silent=True)
@@ -80,13 +129,14 @@ def main_callback(
 # rich_print(f'{get_emoji("success")} Emoji style changed to: [bold cyan]{style}[/bold cyan]')
 
 
-app.add_typer(catalog_app, name='catalog', help='Catalog operations for DeltaCat')
-app.add_typer(namespace_app, name='namespace', help='Namespace operations for DeltaCat')
-app.add_typer(table_app, name='table', help='Table operations for DeltaCat')
-
-
 def main() -> None:
     """Entry point for the CLI application."""
+    # Hand the command to a running `deltacat serve` daemon, it has deltacat imported and the catalog warm
+    if daemon.should_forward(sys.argv[1:]):
+        exit_code = daemon.forward(sys.argv[1:])
+        if exit_code is not None:
+            raise SystemExit(exit_code)
+
     try:
         app()
     except Exception as e:
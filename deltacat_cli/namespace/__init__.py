@@ -1,16 +1,16 @@
 import typer
 
-from deltacat_cli.namespace.alter import app as alter_app
-from deltacat_cli.namespace.create import app as creat_app
-from deltacat_cli.namespace.drop import app as drop_app
-from deltacat_cli.namespace.get import app as get_app
-from deltacat_cli.namespace.list import app as list_app
+from deltacat_cli.utils.lazy_group import lazy_group
 
 
-app = typer.Typer()
-
-app.add_typer(alter_app)
-app.add_typer(creat_app)
-app.add_typer(drop_app)
-app.add_typer(list_app)
-app.add_typer(get_app)
+app = typer.Typer(
+    cls=lazy_group(
+        {
+            'alter': ('deltacat_cli.namespace.alter:app', 'Alter (rename) a namespace in the current catalog.'),
+            'create': ('deltacat_cli.namespace.create:app', 'Create a new namespace in the current catalog.'),
+            'drop': ('deltacat_cli.namespace.drop:app', 'Drop the Namespace with the given name.'),
+            'list': ('deltacat_cli.namespace.list:app', 'List all namespaces in the current catalog.'),
+            'get': ('deltacat_cli.namespace.get:app', 'Get the Namespace with the given name.'),
+        }
+    )
+)
@@ -7,6 +7,7 @@ from deltacat_cli.config import console
 from deltacat_cli.utils.catalog_context import catalog_context
 from deltacat_cli.utils.emojis import get_emoji
 from deltacat_cli.utils.error_handlers import handle_catalog_error
+from deltacat_cli.utils.metadata_cache import metadata_cache, namespace_key, namespaces_key
 
 
 app = typer.Typer()
@@ -29,6 +30,7 @@ def alter_namespace_cmd(
         )
 
         alter_namespace(namespace=name, new_namespace=new_name, catalog=catalog_name)
+        metadata_cache.invalidate(namespaces_key(), namespace_key(name), namespace_key(new_name))
 
         console.print(
             f'{get_emoji("success")} Namespace renamed: [bold cyan]{name}[/bold cyan] → [bold green]{new_name}[/bold green]',
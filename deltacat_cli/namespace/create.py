@@ -7,6 +7,7 @@ from deltacat_cli.config import console
 from deltacat_cli.utils.catalog_context import catalog_context
 from deltacat_cli.utils.emojis import get_emoji
 from deltacat_cli.utils.error_handlers import handle_catalog_error
+from deltacat_cli.utils.metadata_cache import metadata_cache, namespace_key, namespaces_key
 
 
 app = typer.Typer()
@@ -23,6 +24,7 @@ def create_namespace_cmd(name: Annotated[str, typer.Option(help='Namespace name
 
         catalog_context.get_catalog()
         create_namespace(namespace=name, catalog=catalog_name)
+        metadata_cache.invalidate(namespaces_key(), namespace_key(name))
 
         console.print(
             f'{get_emoji("success")} Namespace "[bold cyan]{name}[/bold cyan]" created successfully', style='green'
@@ -7,6 +7,7 @@ from deltacat_cli.config import console
 from deltacat_cli.utils.catalog_context import catalog_context
 from deltacat_cli.utils.emojis import get_emoji
 from deltacat_cli.utils.error_handlers import handle_catalog_error
+from deltacat_cli.utils.metadata_cache import metadata_cache, namespace_key, namespaces_key
 
 
 app = typer.Typer()
@@ -28,6 +29,7 @@ def drop_namespace_cmd(
             )
 
             drop_namespace(namespace=name, catalog=catalog_name)
+            metadata_cache.invalidate(namespaces_key(), namespace_key(name))
             console.print(
                 f'{get_emoji("success")} Namespace "[bold cyan]{name}[/bold cyan]" dropped successfully', style='green'
             )
@@ -7,7 +7,8 @@ from deltacat_cli.config import console
 from deltacat_cli.utils.catalog_context import catalog_context
 from deltacat_cli.utils.emojis import get_emoji
 from deltacat_cli.utils.error_handlers import handle_catalog_error
-from deltacat_cli.utils.print_as_json import print_as_json
+from deltacat_cli.utils.metadata_cache import metadata_cache, namespace_key
+from deltacat_cli.utils.output import print_record
 
 
 app = typer.Typer()
@@ -18,15 +19,19 @@ def get_namespace_cmd(name: Annotated[str, typer.Option(help='Namespace name to
     """Get the Namespace with the given name."""
     try:
         catalog_name, _ = catalog_context.get_catalog_info(silent=True)
-        catalog_context.get_catalog()
         console.print(f'{get_emoji("loading")} Get namespace "[cyan]{name}[/cyan]"')
 
-        namespace = get_namespace(namespace=name, catalog=catalog_name)
+        namespace = metadata_cache.get(namespace_key(name))
+        if namespace is None:
+            catalog_context.get_catalog()
+            namespace = get_namespace(namespace=name, catalog=catalog_name)
+            if namespace:
+                metadata_cache.put(namespace_key(name), namespace)
         if not namespace:
             console.print(f'{get_emoji("empty")} No namespace with name {name} found in this catalog', style='yellow')
             raise typer.Exit()
 
-        print_as_json(source_type='namespace', data=namespace)
+        print_record(source_type='namespace', record=namespace)
 
         console.print(
             f'{get_emoji("success")} Namespace "[bold cyan]{name}[/bold cyan]" get successfully', style='green'
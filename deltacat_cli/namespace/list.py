@@ -1,35 +1,47 @@
+from itertools import islice
+from typing import Annotated
+
 import typer
 
-from deltacat import list_namespaces
 from deltacat_cli.config import console
 from deltacat_cli.utils.catalog_context import catalog_context
 from deltacat_cli.utils.emojis import get_emoji
 from deltacat_cli.utils.error_handlers import handle_catalog_error
-from deltacat_cli.utils.print_as_json import print_as_json
+from deltacat_cli.utils.metafile_listing import list_namespaces_lazily
+from deltacat_cli.utils.output import print_records
 
 
 app = typer.Typer()
 
 
 @app.command(name='list')
-def list_namespace_cmd() -> None:
-    """List all namespaces in the current catalog."""
+def list_namespace_cmd(
+    limit: Annotated[int | None, typer.Option(min=1, help='Maximum number of namespaces to list.')] = None,
+    page_size: Annotated[int, typer.Option(min=1, help='Namespaces read from the catalog per page.')] = 100,
+    after: Annotated[
+        str | None, typer.Option(help='Continue a listing after the namespace with this ID, as printed by --limit.')
+    ] = None,
+) -> None:
+    """List all namespaces in the current catalog, printing each page of namespaces as it is read."""
     try:
         catalog_name, _ = catalog_context.get_catalog_info(silent=True)
-        catalog_context.get_catalog()
         console.print(f'{get_emoji("loading")} Listing Namespaces in Catalog "[cyan]{catalog_name}[/cyan]"...')
 
-        all_namespaces = list_namespaces(catalog=catalog_name).all_items()
+        listing = list_namespaces_lazily(catalog_context.get_catalog_properties(), page_size=page_size, after=after)
+        count = print_records(source_type='namespace', records=(item.metafile for item in islice(listing, limit)))
 
-        if not all_namespaces:
+        if not count:
             console.print(f'{get_emoji("empty")} No namespaces found in this catalog', style='yellow')
             raise typer.Exit()
 
-        for namespace in all_namespaces:
-            print_as_json(source_type='namespace', data=namespace)
-
-        console.print(f'{get_emoji("success")} Found {len(all_namespaces)} namespace(s)', style='green')
+        console.print(f'{get_emoji("success")} Found {count} namespace(s)', style='green')
+        if count == limit:
+            console.print(
+                f'More namespaces may follow, continue with: --after {listing.last_token}', style='dim', soft_wrap=True
+            )
         console.print()
 
+    except typer.Exit:
+        raise
     except Exception as e:
         handle_catalog_error(e, 'listing namespaces')
@@ -0,0 +1,170 @@
+import io
+import shlex
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Annotated
+
+import typer
+from rich.table import Table
+
+from deltacat_cli.config import console, err_console
+from deltacat_cli.utils.emojis import get_emoji
+from deltacat_cli.utils.invoke import InteractiveInputRequired, NoInput, invoke
+from deltacat_cli.utils.output import output_context
+
+
+app = typer.Typer()
+
+# Commands that can't run from a script: they'd block or recurse
+UNSUPPORTED_COMMANDS = {'serve', 'run', 'bench'}
+
+
+@dataclass
+class ScriptCommand:
+    """A command line from a script and the outcome of running it."""
+
+    line_number: int
+    args: list[str]
+    exit_code: int | None = None
+    seconds: float = 0.0
+
+    @property
+    def display(self) -> str:
+        return shlex.join(['deltacat', *self.args])
+
+
+def parse_script(text: str) -> list[ScriptCommand]:
+    """Parse `deltacat ...` command lines, skipping blank lines and # comments.
+
+    Lines ending with a backslash continue on the next line. The leading `deltacat` is optional.
+    """
+    commands = []
+    pending, start = '', 0
+    for line_number, line in enumerate(text.splitlines(), start=1):
+        if not pending:
+            start = line_number
+        if line.rstrip().endswith('\\'):
+            pending += line.rstrip()[:-1] + ' '
+            continue
+        args = shlex.split(pending + line, comments=True)
+        pending = ''
+        if not args:
+            continue
+        if args[0] == 'deltacat':
+            args = args[1:]
+        if args and args[0] in UNSUPPORTED_COMMANDS:
+            raise ValueError(f'line {start}: "{args[0]}" commands cannot be run from a script')
+        commands.append(ScriptCommand(line_number=start, args=args))
+    return commands
+
+
+def run_command(command: ScriptCommand, stdout: io.TextIOBase, stderr: io.TextIOBase) -> ScriptCommand:
+    """Run a script command in this process, recording its exit code and duration."""
+    start = time.perf_counter()
+    try:
+        command.exit_code = invoke(command.args, stdout, stderr, stdin=NoInput())
+    except InteractiveInputRequired:
+        stderr.write(f'{get_emoji("error")} Command prompted for input, pass all options on the command line\n')
+        command.exit_code = 1
+    command.seconds = time.perf_counter() - start
+    return command
+
+
+def run_sequential(commands: list[ScriptCommand], keep_going: bool) -> None:
+    """Run commands one after the other, streaming their output."""
+    for command in commands:
+        console.print(f'[dim]$ {command.display}[/dim]')
+        run_command(command, sys.stdout, sys.stderr)
+        if command.exit_code and not keep_going:
+            return
+
+
+def run_parallel(commands: list[ScriptCommand], parallel: int, keep_going: bool) -> None:
+    """Run commands on a thread pool, printing each command's output once it finishes."""
+    failed = False
+    # Buffers aren't terminals, so resolve an automatic output format against the real stdout up front
+    output_format = output_context.resolve()
+
+    def run_buffered(command: ScriptCommand) -> tuple[ScriptCommand, str, str]:
+        stdout, stderr = io.StringIO(), io.StringIO()
+        if failed and not keep_going:
+            return command, '', ''
+        with output_context.scoped(output_format):
+            run_command(command, stdout, stderr)
+        return command, stdout.getvalue(), stderr.getvalue()
+
+    with ThreadPoolExecutor(max_workers=parallel) as executor:
+        for command, out, err in executor.map(run_buffered, commands):
+            if command.exit_code is None:
+                continue
+            console.print(f'[dim]$ {command.display}[/dim]')
+            sys.stdout.write(out)
+            sys.stderr.write(err)
+            failed = failed or bool(command.exit_code)
+
+
+def print_summary(commands: list[ScriptCommand], wall_seconds: float) -> None:
+    """Print per-command timings and totals."""
+    table = Table(title='Run summary', title_justify='left')
+    table.add_column('Line', justify='right', style='dim')
+    table.add_column('Command', style='cyan', overflow='fold')
+    table.add_column('Status')
+    table.add_column('Seconds', justify='right')
+
+    for command in commands:
+        if command.exit_code is None:
+            status = '[dim]skipped[/dim]'
+        elif command.exit_code == 0:
+            status = f'[green]{get_emoji("success")} ok[/green]'
+        else:
+            status = f'[red]{get_emoji("error")} exit {command.exit_code}[/red]'
+        table.add_row(str(command.line_number), command.display, status, f'{command.seconds:.3f}')
+
+    console.print()
+    console.print(table)
+    ran = [command for command in commands if command.exit_code is not None]
+    failed = [command for command in ran if command.exit_code]
+    command_seconds = sum(command.seconds for command in ran)
+    console.print(
+        f'{len(ran)}/{len(commands)} command(s) run, {len(failed)} failed, '
+        f'{command_seconds:.3f}s in commands, {wall_seconds:.3f}s wall',
+        style='red' if failed else 'green',
+    )
+
+
+@app.command(name='run')
+def run_cmd(
+    script: Annotated[str, typer.Argument(help='File with one deltacat command per line, or - for stdin')],
+    parallel: Annotated[
+        int, typer.Option(min=1, help='Number of commands to run at once, for scripts of independent commands')
+    ] = 1,
+    keep_going: Annotated[bool, typer.Option('--keep-going', help='Keep running after a command fails')] = False,
+) -> None:
+    """Run a script of deltacat commands in a single process.
+
+    Each line is an ordinary `deltacat ...` command line. Commands share the process and the
+    registered catalog, so only the first one pays for startup.
+    """
+    try:
+        text = sys.stdin.read() if script == '-' else Path(script).read_text()
+        commands = parse_script(text)
+    except (OSError, ValueError) as e:
+        err_console.print(f'{get_emoji("error")} Error reading script {script}: {e}', style='bold red')
+        raise typer.Exit(1) from e
+
+    if not commands:
+        console.print(f'{get_emoji("empty")} No commands in {script}', style='yellow')
+        raise typer.Exit(0)
+
+    start = time.perf_counter()
+    if parallel > 1:
+        run_parallel(commands, parallel, keep_going)
+    else:
+        run_sequential(commands, keep_going)
+    print_summary(commands, time.perf_counter() - start)
+
+    if any(command.exit_code for command in commands):
+        raise typer.Exit(1)
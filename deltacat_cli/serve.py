@@ -0,0 +1,120 @@
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from deltacat_cli.config import console, err_console
+from deltacat_cli.utils import daemon
+from deltacat_cli.utils.emojis import get_emoji
+
+
+app = typer.Typer()
+
+DETACH_START_TIMEOUT_SECONDS = 60
+
+
+def warm_up() -> None:
+    """Import the command modules and register the configured catalog ahead of the first command."""
+    from deltacat_cli.main import app as main_app
+    from deltacat_cli.utils.catalog_context import catalog_context
+    from deltacat_cli.utils.lazy_group import LazyGroup
+
+    group = typer.main.get_command(main_app)
+    ctx = typer.Context(group)
+    for name in group.list_commands(ctx):
+        command = group.get_command(ctx, name)
+        if isinstance(command, LazyGroup):
+            for sub_name in command.list_commands(ctx):
+                command.get_command(ctx, sub_name)
+
+    try:
+        catalog_context.get_catalog()
+    except typer.Exit:
+        console.print('Commands will register the catalog once one is configured.', style='dim')
+
+
+def start_detached(path: Path) -> None:
+    """Start the daemon in a background process and wait until it accepts connections."""
+    log_path = path.with_suffix('.log')
+    with open(log_path, 'ab') as log:
+        subprocess.Popen(  # noqa: S603
+            [sys.executable, '-c', 'from deltacat_cli.main import main; main()', 'serve', '--socket', str(path)],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,
+        )
+
+    deadline = time.monotonic() + DETACH_START_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        if daemon.request({'control': 'status'}, path):
+            return
+        time.sleep(0.1)
+    err_console.print(f'{get_emoji("error")} Daemon did not start, see {log_path}', style='bold red')
+    raise typer.Exit(1)
+
+
+def wait_until_stopped(path: Path) -> None:
+    """Wait for a daemon asked to stop to remove its socket."""
+    deadline = time.monotonic() + DETACH_START_TIMEOUT_SECONDS
+    while path.exists() and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+
+@app.command(name='serve')
+def serve_cmd(
+    socket: Annotated[
+        Path | None, typer.Option(help='Unix socket path (default: ~/.deltacat_cli/serve.sock or DELTACAT_CLI_SOCKET)')
+    ] = None,
+    detach: Annotated[bool, typer.Option('--detach', help='Run the daemon in the background')] = False,
+    status: Annotated[bool, typer.Option('--status', help='Show whether the daemon is running and exit')] = False,
+    stop: Annotated[bool, typer.Option('--stop', help='Stop the running daemon and exit')] = False,
+) -> None:
+    """Run a local daemon that keeps the catalog warm and runs forwarded commands.
+
+    While it runs, namespace and table commands are forwarded to it over a Unix socket instead of
+    importing deltacat and registering the catalog in every process. Set DELTACAT_CLI_NO_DAEMON=1 to
+    run a command locally anyway.
+    """
+    path = socket or daemon.socket_path()
+
+    if status or stop:
+        reply = daemon.request({'control': 'stop' if stop else 'status'}, path)
+        if reply is None:
+            console.print(f'{get_emoji("empty")} No daemon running on {path}', style='yellow')
+            raise typer.Exit(1 if status else 0)
+        if stop:
+            wait_until_stopped(path)
+            console.print(f'{get_emoji("success")} Daemon stopped', style='green')
+        else:
+            console.print(
+                f'{get_emoji("success")} Daemon running on [cyan]{path}[/cyan] '
+                f'(pid {reply["pid"]}, {reply["commands_served"]} command(s) served)',
+                style='green',
+            )
+        return
+
+    if daemon.request({'control': 'status'}, path) is not None:
+        err_console.print(f'{get_emoji("error")} A daemon is already running on {path}', style='bold red')
+        raise typer.Exit(1)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Left over by a daemon that didn't shut down cleanly
+    path.unlink(missing_ok=True)
+
+    if detach:
+        start_detached(path)
+        console.print(f'{get_emoji("success")} Daemon started on [cyan]{path}[/cyan]', style='green')
+        return
+
+    console.print(f'{get_emoji("loading")} Warming up...')
+    warm_up()
+    with daemon.DaemonServer(path) as server:
+        console.print(f'{get_emoji("success")} Serving on [cyan]{path}[/cyan], stop with Ctrl+C', style='green')
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    console.print(f'{get_emoji("success")} Daemon stopped, {server.commands_served} command(s) served', style='green')
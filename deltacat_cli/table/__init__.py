@@ -1,19 +1,68 @@
 import typer
 
-from deltacat_cli.table.alter import app as alter_app
-from deltacat_cli.table.create import app as create_app
-from deltacat_cli.table.drop import app as drop_app
-from deltacat_cli.table.get import app as get_app
-from deltacat_cli.table.list import app as list_app
-from deltacat_cli.table.read import app as read_app
+from deltacat_cli.utils.lazy_group import lazy_group
 
 
-app = typer.Typer()
-
-
-app.add_typer(get_app)
-app.add_typer(create_app)
-app.add_typer(drop_app)
-app.add_typer(alter_app)
-app.add_typer(read_app)
-app.add_typer(list_app)
+app = typer.Typer(
+    cls=lazy_group(
+        {
+            'get': ('deltacat_cli.table.get:app', 'Get the Table definition with the given name and given namespace.'),
+            'create': (
+                'deltacat_cli.table.create:app',
+                'Create a new DeltaCat table with specified schema and configuration.',
+            ),
+            'drop': ('deltacat_cli.table.drop:app', 'Drop the Table with the given name in the given namespace.'),
+            'alter': ('deltacat_cli.table.alter:app', 'Alter deltacat table/table_version definition.'),
+            'read': ('deltacat_cli.table.read:app', 'Read the Table data with the given name and given namespace.'),
+            'changes': (
+                'deltacat_cli.table.changes:app',
+                'Read the rows of every delta committed after a stream position or time, in commit order.',
+            ),
+            'aggregate': (
+                'deltacat_cli.table.aggregate:app',
+                'Compute group-by aggregates of a table, reading only the columns grouped by and aggregated.',
+            ),
+            'advise': (
+                'deltacat_cli.table.advise:app',
+                'Recommend hash bucket count, records per compacted file and compaction triggers for a table.',
+            ),
+            'stats': (
+                'deltacat_cli.table.stats:app',
+                'Report row, delta, file and byte counts and column statistics of a table without reading its data.',
+            ),
+            'profile': (
+                'deltacat_cli.table.profile:app',
+                (
+                    'Profile the columns of a table from per-delta sketches, or stream them exactly for histograms '
+                    'and most frequent values.'
+                ),
+            ),
+            'compact': (
+                'deltacat_cli.table.compact:app',
+                'Compact the partitions of a table with deltas not compacted yet, or show their compaction status.',
+            ),
+            'optimize': (
+                'deltacat_cli.table.optimize:app',
+                'Rewrite runs of small data files of an append-only table into files of the target size.',
+            ),
+            'lookup': (
+                'deltacat_cli.table.lookup:app',
+                'Look up records of a table by merge key, reading only the row groups that hold them.',
+            ),
+            'index': (
+                'deltacat_cli.table.index:app',
+                'Build the sidecar indexes of a table: its skip index and the merge key index of table lookup.',
+            ),
+            'list': ('deltacat_cli.table.list:app', 'List the Tables in the given namespace.'),
+            'export': ('deltacat_cli.table.export:app', 'Export table data to Parquet, Arrow IPC or CSV part files.'),
+            'register': (
+                'deltacat_cli.table.register:app',
+                'Register existing Parquet files as a new delta of a table, without copying them.',
+            ),
+            'write': (
+                'deltacat_cli.table.write:app',
+                'Bulk write Parquet, CSV or NDJSON files into an existing table.',
+            ),
+        }
+    )
+)
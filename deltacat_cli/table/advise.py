@@ -0,0 +1,113 @@
+import sys
+from typing import Annotated
+
+import typer
+from rich.table import Table
+
+from deltacat_cli.config import console
+from deltacat_cli.table.alter import alter_table_cmd
+from deltacat_cli.utils.catalog_context import catalog_context
+from deltacat_cli.utils.compaction_advice import DEFAULT_SAMPLE_FILES, CompactionAdvice, advise_compaction
+from deltacat_cli.utils.emojis import get_emoji
+from deltacat_cli.utils.error_handlers import handle_catalog_error
+from deltacat_cli.utils.formatting import format_bytes, parse_bytes
+from deltacat_cli.utils.output import dumps, output_context
+
+
+app = typer.Typer()
+
+
+def print_advice(advice: CompactionAdvice) -> None:
+    """Print what was measured, then each setting with its current and recommended value."""
+    console.print(
+        f'{advice.rows:,} row(s) in {advice.files:,} file(s) and {advice.deltas:,} delta(s), '
+        f'{format_bytes(advice.bytes)}: {advice.average_row_bytes:,.1f} bytes per row, '
+        f'{format_bytes(advice.average_file_bytes)} per file',
+        style='dim',
+    )
+    if advice.sketched_deltas:
+        console.print(
+            f'Merge keys {", ".join(advice.merge_keys)}: ~{advice.distinct_keys:,} distinct, merged from the '
+            f'sketches of {advice.sketched_deltas:,} delta(s)',
+            style='dim',
+        )
+    elif advice.merge_keys:
+        console.print(
+            f'Merge keys {", ".join(advice.merge_keys)}: ~{advice.sampled_distinct_keys:,} distinct in '
+            f'{advice.sampled_rows:,} row(s) of {advice.sampled_files:,} sampled file(s), '
+            f'~{advice.distinct_keys:,} estimated in the table',
+            style='dim',
+        )
+    table = Table(title='Compaction settings', title_justify='left')
+    table.add_column('Option', style='cyan')
+    table.add_column('Current', justify='right')
+    table.add_column('Recommended', justify='right')
+    table.add_column('Why')
+    for item in advice.recommendations:
+        table.add_row(
+            f'--{item.option.replace("_", "-")}',
+            '' if item.current is None else f'{item.current:,}',
+            f'[bold]{item.recommended:,}[/bold]' if item.changed else f'{item.recommended:,}',
+            item.reason,
+        )
+    console.print(table)
+
+
+@app.command(name='advise')
+def advise_table_cmd(
+    name: Annotated[str, typer.Option(help='Table name to advise on')],
+    namespace: Annotated[str, typer.Option(help='Namespace name where table is located')],
+    target_file_size: Annotated[
+        str, typer.Option(help='On-disk size compacted files should reach, e.g. 256MiB or 1GB')
+    ] = '256MiB',
+    sample_files: Annotated[
+        int, typer.Option(min=1, help='Data files whose merge keys are read to estimate distinct keys')
+    ] = DEFAULT_SAMPLE_FILES,
+    apply: Annotated[bool, typer.Option('--apply', help='Apply the recommendations with table alter')] = False,
+    table_version: Annotated[str | None, typer.Option(help='Optional specific version of the table')] = None,
+) -> None:
+    """Recommend hash bucket count, records per compacted file and compaction triggers for a table.
+
+    Row counts and sizes come from delta manifests, and the number of distinct merge keys is merged from the
+    sketches of every delta if the table has them (see table profile), or else estimated with a HyperLogLog
+    sketch over the merge key columns of a sample of data files. With --apply, the recommended
+    values are set through table alter.
+    """
+    try:
+        inner = catalog_context.get_catalog().inner
+        console.print(f'{get_emoji("loading")} Measuring table "[cyan]{name}[/cyan]"')
+        advice = advise_compaction(inner, namespace, name, table_version, parse_bytes(target_file_size), sample_files)
+
+        if output_context.machine:
+            sys.stdout.write(dumps(advice.to_dict()) + '\n')
+        else:
+            print_advice(advice)
+        records_per_file = advice.recommended('records_per_compacted_file')
+        buckets = advice.recommended('default_compaction_hash_bucket_count')
+        console.print(
+            f'The appended record count trigger follows as {records_per_file:,} x {buckets:,} x 2 = '
+            f'{records_per_file * buckets * 2:,} record(s)',
+            style='dim',
+        )
+
+        if not apply:
+            if any(item.changed for item in advice.recommendations):
+                console.print(f'{get_emoji("info")} Run again with --apply to set the recommended values')
+            return
+        if not any(item.changed for item in advice.recommendations):
+            console.print(f'{get_emoji("success")} Table "[cyan]{name}[/cyan]" already uses the recommended values')
+            return
+        alter_table_cmd(
+            name=name,
+            namespace=namespace,
+            table_version=table_version,
+            default_compaction_hash_bucket_count=buckets,
+            records_per_compacted_file=records_per_file,
+            appended_file_count_compaction_trigger=advice.recommended('appended_file_count_compaction_trigger'),
+            appended_delta_count_compaction_trigger=advice.recommended('appended_delta_count_compaction_trigger'),
+        )
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        handle_catalog_error(e, 'advising on table')
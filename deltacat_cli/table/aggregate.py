@@ -0,0 +1,102 @@
+import os
+import time
+from typing import Annotated
+
+import typer
+
+from deltacat_cli.config import console
+from deltacat_cli.utils.aggregation import (
+    aggregate_scan,
+    parse_aggregates,
+    parse_group_keys,
+    source_columns,
+    validate_aggregation,
+)
+from deltacat_cli.utils.catalog_context import catalog_context
+from deltacat_cli.utils.emojis import get_emoji
+from deltacat_cli.utils.error_handlers import handle_catalog_error
+from deltacat_cli.utils.filter_expression import compile_where
+from deltacat_cli.utils.formatting import format_rate
+from deltacat_cli.utils.output import print_table_batches
+from deltacat_cli.utils.skip_index import apply_skip_index
+from deltacat_cli.utils.table_scan import TableScan
+
+
+app = typer.Typer()
+
+
+@app.command(name='aggregate')
+def aggregate_table_cmd(
+    name: Annotated[str, typer.Option(help='Table name to aggregate')],
+    namespace: Annotated[str, typer.Option(help='Namespace name where table is located')],
+    agg: Annotated[
+        list[str],
+        typer.Option(
+            help='Aggregate to compute: count, sum(col), min(col), max(col), mean(col) or count_distinct(col). '
+            'Repeatable or comma-separated'
+        ),
+    ],
+    group_by: Annotated[
+        str | None,
+        typer.Option(
+            help='Comma-separated columns to group rows by, or time buckets of date/timestamp columns: '
+            'year(col), month(col), day(col), hour(col), minute(col). Without it the whole table is one group'
+        ),
+    ] = None,
+    where: Annotated[
+        str | None,
+        typer.Option(help="Optional row filter, e.g. \"tenant = 'acme' AND ts >= '2026-01-01'\", applied before"),
+    ] = None,
+    table_version: Annotated[
+        str | None, typer.Option(help='Optional specific version of the table to aggregate')
+    ] = None,
+    workers: Annotated[int, typer.Option(min=1, help='Data files read concurrently')] = min(4, os.cpu_count() or 1),
+) -> None:
+    """Compute group-by aggregates of a table, reading only the columns grouped by and aggregated.
+
+    Every record batch is aggregated as it's decoded and partial results are merged per group, so memory is
+    bounded by the number of groups rather than rows, count_distinct by the distinct values per group. Groups
+    are printed ordered by their keys, nulls last.
+    """
+    try:
+        catalog = catalog_context.get_catalog()
+        aggregates = parse_aggregates(agg)
+        group_keys = parse_group_keys([group_by] if group_by else [])
+        scan = TableScan(
+            namespace=namespace,
+            table=name,
+            inner=catalog.inner,
+            table_version=table_version,
+            columns=source_columns(group_keys, aggregates),
+        )
+        validate_aggregation(group_keys, aggregates, scan.arrow_schema)
+        indexed = False
+        if where:
+            scan.filter = compile_where(where, scan.arrow_schema)
+            indexed = apply_skip_index(scan, where)
+        console.print(
+            f'{get_emoji("loading")} Aggregate table "[cyan]{name}[/cyan]"'
+            + (f' by {", ".join(key.name for key in group_keys)}' if group_keys else '')
+        )
+
+        start = time.perf_counter()
+        result = aggregate_scan(scan, group_keys, aggregates, workers)
+        seconds = time.perf_counter() - start
+        print_table_batches(result.to_batches())
+
+        stats = scan.stats
+        if where:
+            console.print(
+                f'Filter skipped {stats.row_groups_skipped} of {stats.row_groups_skipped + stats.row_groups_read} '
+                f'row group(s) and {stats.files_skipped + stats.files_skipped_by_index} file(s)'
+                + (f', {stats.files_skipped_by_index} by the skip index' if indexed else ''),
+                style='dim',
+            )
+        console.print(
+            f'{get_emoji("success")} Aggregated {stats.rows_read:,} row(s) of {stats.files_read:,} file(s) into '
+            f'{result.num_rows:,} group(s) in {seconds:.2f}s ({format_rate(stats.rows_read, seconds, "rows")})',
+            style='green',
+        )
+
+    except Exception as e:
+        handle_catalog_error(e, 'aggregating table')
@@ -1,5 +1,6 @@
 from typing import Annotated
 
+import pyarrow as pa
 import typer
 
 from deltacat import (
@@ -12,10 +13,27 @@ from deltacat import (
 )
 from deltacat_cli.config import console
 from deltacat_cli.utils.catalog_context import catalog_context
+from deltacat_cli.utils.clustering import (
+    CLUSTERING_MODES,
+    CLUSTERING_PROPERTY,
+    SORT_KEYS_PROPERTY,
+    clustering_properties,
+    parse_columns,
+    table_clustering,
+    validate_clustering,
+)
 from deltacat_cli.utils.emojis import get_emoji
 from deltacat_cli.utils.error_handlers import handle_catalog_error
-from deltacat_cli.utils.print_as_json import print_as_json
-from deltacat_cli.utils.table_utils import DeltacatTableSchema, TableProperties, TableSchema
+from deltacat_cli.utils.metadata_cache import metadata_cache, table_key, tables_key
+from deltacat_cli.utils.output import print_record
+from deltacat_cli.utils.skip_index import SKIP_INDEX_PROPERTY, SkipIndexConfig
+from deltacat_cli.utils.table_utils import (
+    TYPE_MAPPING,
+    DeltacatTableSchema,
+    TableProperties,
+    TableSchema,
+    merge_key_names,
+)
 
 
 app = typer.Typer()
@@ -41,6 +59,19 @@ def alter_table_cmd(
     merge_keys: Annotated[
         str | None, typer.Option(help='New merge keys for the table (comma-separated column names)')
     ] = None,
+    sort_keys: Annotated[
+        str | None, typer.Option(help='New sort keys for the table (comma-separated column names)')
+    ] = None,
+    clustering: Annotated[
+        str | None, typer.Option(help=f'New ordering of rows by the sort keys ({", ".join(CLUSTERING_MODES)})')
+    ] = None,
+    skip_index_columns: Annotated[
+        str | None,
+        typer.Option(help='New columns whose min/max and null counts are kept in the skip index, "" for none'),
+    ] = None,
+    bloom_filter_columns: Annotated[
+        str | None, typer.Option(help='New columns with a Bloom filter in the skip index, "" for none')
+    ] = None,
     table_description: Annotated[str | None, typer.Option(help='New description for the table')] = None,
     table_version_description: Annotated[
         str | None,
@@ -108,6 +139,12 @@ def alter_table_cmd(
     # Update merge keys
     deltacat table alter --name events --namespace analytics --merge-keys "user_id,event_timestamp"
 
+    # Cluster rows by two columns in Z-order on writes and table optimize
+    deltacat table alter --name events --namespace analytics --sort-keys "user_id,event_timestamp" --clustering zorder
+
+    # Index event_date statistics and a Bloom filter of session_id, then build the index with table index rebuild
+    deltacat table alter --name events --namespace analytics --skip-index-columns event_date --bloom-filter-columns session_id
+
     # Update compaction settings
     deltacat table alter --name large_table --namespace prod --records-per-compacted-file 8000000
 
@@ -165,6 +202,63 @@ def alter_table_cmd(
                 default_schema_consistency_type,
             )
 
+        # Sort keys and the skip index live in the table version's properties, where the write and read paths
+        # read them; alter_table replaces them with the table's properties, so keep those set before. Compaction
+        # reads its properties from the table version too, so they're set on both
+        current_properties = table.table_version.properties or {}
+        table_version_properties = None
+        if table_properties is not None or any(
+            option is not None for option in (sort_keys, clustering, skip_index_columns, bloom_filter_columns)
+        ):
+            table_version_properties = {
+                key: current_properties[key]
+                for key in (SORT_KEYS_PROPERTY, CLUSTERING_PROPERTY, SKIP_INDEX_PROPERTY)
+                if key in current_properties
+            }
+            table_version_properties.update(table_properties or {})
+            new_schema, table_merge_keys = None, parse_columns(merge_keys)
+            current_schema = table.table_version.schema
+            if current_schema is not None:
+                removed = set(parse_columns(remove_columns))
+                new_schema = pa.schema(
+                    [field for field in current_schema.arrow if field.name not in removed]
+                    + [
+                        pa.field(column, TYPE_MAPPING.get(column_type, TYPE_MAPPING['string']))
+                        for column, column_type in TableSchema.of(schema_updates).items()
+                    ]
+                )
+                if merge_keys is None:
+                    table_merge_keys = merge_key_names(current_schema)
+
+        if sort_keys is not None or clustering is not None:
+            current_keys, current_clustering = table_clustering(table.table_version)
+            sort_key_list = parse_columns(sort_keys) if sort_keys is not None else current_keys
+            new_clustering = clustering or (current_clustering if sort_key_list else None)
+            columns = new_schema.names if new_schema is not None else None
+            validate_clustering(sort_key_list, new_clustering, columns, table_merge_keys)
+            table_version_properties.update(clustering_properties(sort_key_list, new_clustering))
+            console.print(
+                f'  {get_emoji("success")} Sort keys: {", ".join(sort_key_list) or "none"} '
+                f'({table_version_properties["clustering"]})'
+            )
+
+        if skip_index_columns is not None or bloom_filter_columns is not None:
+            current_config = SkipIndexConfig.from_table_version(table.table_version)
+            skip_index = SkipIndexConfig.of(
+                parse_columns(skip_index_columns)
+                if skip_index_columns is not None
+                else (current_config.columns if current_config else []),
+                parse_columns(bloom_filter_columns)
+                if bloom_filter_columns is not None
+                else (current_config.bloom_filter_columns if current_config else []),
+            )
+            skip_index.validate(new_schema)
+            table_version_properties[SKIP_INDEX_PROPERTY] = skip_index.to_dict()
+            console.print(
+                f'  {get_emoji("success")} Skip index columns: {", ".join(skip_index.columns) or "none"}, '
+                f'Bloom filters: {", ".join(skip_index.bloom_filter_columns) or "none"}'
+            )
+
         alter_table(
             table=name,
             namespace=namespace,
@@ -175,7 +269,9 @@ def alter_table_cmd(
             table_description=table_description,
             table_version_description=table_version_description,
             table_properties=table_properties,
+            table_version_properties=table_version_properties,
         )
+        metadata_cache.invalidate(tables_key(namespace), table_key(namespace, name))
 
         console.print(
             f'{get_emoji("success")} Table "[bold cyan]{name}[/bold cyan]" altered successfully.', style='green'
@@ -183,7 +279,7 @@ def alter_table_cmd(
 
         # Refresh and print the updated table
         updated_table = get_table(table=name, namespace=namespace, catalog=catalog_name)
-        print_as_json(source_type='table', data=updated_table)
+        print_record(source_type='table', record=updated_table)
 
     except Exception as e:
         handle_catalog_error(e, 'altering table')
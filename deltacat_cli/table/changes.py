@@ -0,0 +1,103 @@
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Annotated
+
+import pyarrow as pa
+import typer
+from deltacat.storage import DeltaType
+
+from deltacat_cli.config import console
+from deltacat_cli.utils.catalog_context import catalog_context
+from deltacat_cli.utils.change_scan import ChangeScan, HighWaterMark, print_high_water_mark
+from deltacat_cli.utils.emojis import get_emoji
+from deltacat_cli.utils.error_handlers import handle_catalog_error
+from deltacat_cli.utils.filter_expression import compile_where
+from deltacat_cli.utils.formatting import parse_timestamp
+from deltacat_cli.utils.output import print_table_batches
+
+
+app = typer.Typer()
+
+CHANGE_COLUMNS = pa.schema(
+    [('_change_type', pa.string()), ('_stream_position', pa.int64()), ('_commit_time', pa.timestamp('ns', tz='UTC'))]
+)
+
+
+def change_batches(scan: ChangeScan) -> Iterator[pa.RecordBatch]:
+    """The rows of each selected delta, in commit order, with the delta's change columns appended."""
+    for change in scan.changes():
+        values = [change.delta.type.value, change.delta.stream_position, change.commit_time]
+        for scan_file in scan.files_of(change.delta):
+            for batch in scan.file_batches(scan_file):
+                columns = [
+                    pa.repeat(pa.scalar(value, field.type), batch.num_rows)
+                    for value, field in zip(values, CHANGE_COLUMNS, strict=True)
+                ]
+                scan.stats.rows_read += batch.num_rows
+                yield pa.RecordBatch.from_arrays(
+                    batch.columns + columns, schema=pa.schema(list(batch.schema) + list(CHANGE_COLUMNS))
+                )
+
+
+@app.command(name='changes')
+def table_changes_cmd(
+    name: Annotated[str, typer.Option(help='Table name to read changes from')],
+    namespace: Annotated[str, typer.Option(help='Namespace name where table is located')],
+    since_position: Annotated[
+        int | None, typer.Option(min=0, help='Only read the deltas committed after this stream position.')
+    ] = None,
+    since_time: Annotated[
+        str | None,
+        typer.Option(help='Only read the deltas committed after this time, e.g. 2026-01-01T12:00:00Z (UTC default).'),
+    ] = None,
+    state_file: Annotated[
+        Path | None,
+        typer.Option(
+            help='Read the deltas committed after the high-water mark saved in this file, then save the new one.'
+        ),
+    ] = None,
+    columns: Annotated[str | None, typer.Option(help='Optional comma-separated column names to include.')] = None,
+    where: Annotated[str | None, typer.Option(help='Optional row filter, as for table read.')] = None,
+    table_version: Annotated[str | None, typer.Option(help='Optional specific version of the table to read')] = None,
+) -> None:
+    """
+    Read the rows of every delta committed after a stream position or time, in commit order.
+    Each row carries the _change_type (add, append, upsert, delete), _stream_position and _commit_time of its
+    delta, and the high-water mark to continue from is printed, or saved to --state-file.
+    """
+    try:
+        catalog = catalog_context.get_catalog()
+        console.print(f'{get_emoji("loading")} Read changes of table "[cyan]{name}[/cyan]"')
+
+        column_list = [key.strip() for key in columns.split(',') if key.strip()] if columns else None
+        scan = ChangeScan(
+            namespace=namespace,
+            table=name,
+            inner=catalog.inner,
+            table_version=table_version,
+            columns=column_list,
+            since_position=since_position,
+            since_time=parse_timestamp(since_time) if since_time else None,
+            since=HighWaterMark.load(state_file) if state_file else None,
+            delta_types=frozenset(DeltaType),
+        )
+        if where:
+            scan.filter = compile_where(where, scan.arrow_schema)
+        rows = print_table_batches(change_batches(scan))
+        print_high_water_mark(scan, state_file)
+        if not rows:
+            console.print(
+                f'{get_emoji("empty")} Table "[bold cyan]{name}[/bold cyan]" has no new changes', style='yellow'
+            )
+            raise typer.Exit(0)
+
+        console.print(
+            f'{get_emoji("success")} Read {rows} changed row(s) from {len(scan.changes())} delta(s) of table '
+            f'"[bold cyan]{name}[/bold cyan]"',
+            style='green',
+        )
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        handle_catalog_error(e, 'reading table changes')
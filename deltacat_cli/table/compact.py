@@ -0,0 +1,141 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Annotated
+
+import typer
+from rich.table import Table
+
+from deltacat_cli.config import console
+from deltacat_cli.utils.catalog_context import catalog_context
+from deltacat_cli.utils.compaction import (
+    CompactionStatus,
+    auto_compaction_enabled,
+    compact_partition,
+    compaction_status,
+)
+from deltacat_cli.utils.delta_sketches import refresh_sketches
+from deltacat_cli.utils.emojis import get_emoji
+from deltacat_cli.utils.error_handlers import handle_catalog_error
+from deltacat_cli.utils.formatting import format_rate
+from deltacat_cli.utils.output import output_context, print_records
+from deltacat_cli.utils.table_scan import TableScan
+
+
+app = typer.Typer()
+
+# Seconds between updates of the elapsed time while a partition compacts
+PROGRESS_INTERVAL = 0.5
+
+
+def _partition_label(status: CompactionStatus) -> str:
+    return ', '.join(str(value) for value in status.partition_values or []) or status.partition.partition_id
+
+
+def _against(count: int, trigger: int | None) -> str:
+    if not trigger:
+        return f'{count:,}'
+    return f'{count:,} / {trigger:,} ({count / trigger:.0%})'
+
+
+def print_status(statuses: list[CompactionStatus]) -> None:
+    """Print counts since the last compaction against the triggers, one row per partition."""
+    table = Table(title='Compaction status', title_justify='left')
+    table.add_column('Partition', style='cyan')
+    table.add_column('Deltas')
+    table.add_column('Files')
+    table.add_column('Records')
+    table.add_column('UPSERT/DELETE', justify='right')
+    table.add_column('Hash buckets', justify='right')
+    table.add_column('Due')
+    for status in statuses:
+        table.add_row(
+            _partition_label(status),
+            _against(status.deltas, status.delta_trigger),
+            _against(status.files, status.file_trigger),
+            _against(status.records, status.record_trigger),
+            f'{status.merge_deltas:,}',
+            str(status.hash_bucket_count or ''),
+            '[yellow]yes[/yellow]' if status.due else 'no',
+        )
+    console.print(table)
+
+
+@app.command(name='compact')
+def compact_table_cmd(
+    name: Annotated[str, typer.Option(help='Table name to compact')],
+    namespace: Annotated[str, typer.Option(help='Namespace name where table is located')],
+    status: Annotated[
+        bool, typer.Option('--status', help='Only show the deltas since the last compaction against the triggers')
+    ] = False,
+    workers: Annotated[
+        int | None, typer.Option(min=1, help='Maximum concurrent compaction tasks, defaults to the cluster size')
+    ] = None,
+    hash_buckets: Annotated[
+        int | None, typer.Option(min=1, help="Hash buckets, defaults to the last compaction's or the table's default")
+    ] = None,
+    table_version: Annotated[str | None, typer.Option(help='Optional specific version of the table to compact')] = None,
+) -> None:
+    """Compact the partitions of a table with deltas not compacted yet, or show how close they are to compaction.
+
+    Compaction merges the deltas appended since the last compaction, applying UPSERT and DELETE deltas, into
+    larger files, as the automatic compaction after a write would. Partitions are compacted one at a time.
+    """
+    try:
+        inner = catalog_context.get_catalog().inner
+        resolved = TableScan(namespace=namespace, table=name, inner=inner, table_version=table_version).table_version
+        statuses = compaction_status(inner, namespace, resolved)
+
+        if status:
+            if output_context.machine:
+                print_records('table', (partition_status.to_dict() for partition_status in statuses))
+            else:
+                print_status(statuses)
+            if not auto_compaction_enabled(resolved):
+                console.print(
+                    f'{get_emoji("info")} The read optimization level of table "{name}" is not MAX, it is only '
+                    'compacted by table compact',
+                    style='dim',
+                )
+            return
+
+        pending = [partition_status for partition_status in statuses if partition_status.deltas]
+        if not pending:
+            console.print(f'{get_emoji("success")} Table "[cyan]{name}[/cyan]" has nothing to compact', style='green')
+            return
+
+        console.print(
+            f'{get_emoji("loading")} Compacting {len(pending)} partition(s) of table "[cyan]{name}[/cyan]", '
+            f'{sum(partition_status.deltas for partition_status in pending):,} delta(s)'
+        )
+        start = time.perf_counter()
+        records = 0
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='compaction') as executor:
+            for index, partition_status in enumerate(pending, 1):
+                label = f'partition {index}/{len(pending)} ({_partition_label(partition_status)})'
+                partition_start = time.perf_counter()
+                future = executor.submit(
+                    compact_partition, inner, resolved, partition_status.partition, hash_buckets, workers
+                )
+                with console.status(f'Compacting {label}') as spinner:
+                    while wait([future], timeout=PROGRESS_INTERVAL).not_done:
+                        spinner.update(f'Compacting {label}, {time.perf_counter() - partition_start:.0f}s')
+                future.result()
+                seconds = time.perf_counter() - partition_start
+                records += partition_status.records
+                console.print(
+                    f'{get_emoji("success")} Compacted {label}: {partition_status.deltas:,} delta(s), '
+                    f'{partition_status.records:,} record(s) in {seconds:.2f}s'
+                )
+
+        elapsed = time.perf_counter() - start
+        console.print(
+            f'{get_emoji("success")} Compacted table "[bold cyan]{name}[/bold cyan]" in {elapsed:.2f}s, '
+            f'{format_rate(records, elapsed, "records")}',
+            style='green',
+        )
+        refresh = refresh_sketches(inner, namespace, resolved)
+        if refresh is not None and refresh.deltas:
+            console.print(f'Sketched {refresh.deltas} delta(s) of the compacted table for table profile', style='dim')
+
+    except Exception as e:
+        handle_catalog_error(e, 'compacting table')
@@ -14,9 +14,12 @@ from deltacat import (
 )
 from deltacat_cli.config import console
 from deltacat_cli.utils.catalog_context import catalog_context
+from deltacat_cli.utils.clustering import CLUSTERING_MODES, clustering_properties, parse_columns, validate_clustering
 from deltacat_cli.utils.emojis import get_emoji
 from deltacat_cli.utils.error_handlers import handle_catalog_error
-from deltacat_cli.utils.print_as_json import print_as_json
+from deltacat_cli.utils.metadata_cache import metadata_cache, namespaces_key, table_key, tables_key
+from deltacat_cli.utils.output import print_record
+from deltacat_cli.utils.skip_index import SKIP_INDEX_PROPERTY, SkipIndexConfig
 from deltacat_cli.utils.table_utils import DeltacatTableSchema, TableProperties, TableSchema
 
 
@@ -111,6 +114,34 @@ def create_table_cmd(
             show_default=False,
         ),
     ] = None,
+    sort_keys: Annotated[
+        str | None,
+        typer.Option(
+            help='Sort keys for the table (comma-separated column names). Writes and table optimize order rows by them',
+            show_default=False,
+        ),
+    ] = None,
+    clustering: Annotated[
+        str | None,
+        typer.Option(
+            help=f'How rows are ordered by the sort keys ({", ".join(CLUSTERING_MODES)}). Defaults to (linear)',
+            show_default=False,
+        ),
+    ] = None,
+    skip_index_columns: Annotated[
+        str | None,
+        typer.Option(
+            help='Columns whose min/max and null counts per data file are kept in the skip index (comma-separated)',
+            show_default=False,
+        ),
+    ] = None,
+    bloom_filter_columns: Annotated[
+        str | None,
+        typer.Option(
+            help='Columns with a Bloom filter per data file in the skip index, for equality filters (comma-separated)',
+            show_default=False,
+        ),
+    ] = None,
     fail_if_exists: Annotated[
         bool, typer.Option(help='If True, raises an error if table already exists. If False, returns existing table')
     ] = True,
@@ -182,6 +213,17 @@ def create_table_cmd(
     - Composite key: "user_id,timestamp"
     - No merge keys: "" (append-only table)
 
+    SORT KEYS:
+    Columns rows are ordered by when written or optimized, so file statistics skip files on filtered reads:
+    - Linear: "event_date,user_id" sorts by event_date, then user_id
+    - Z-order: --clustering zorder interleaves the keys, so filters on any of them skip files
+
+    SKIP INDEX:
+    Statistics of each data file kept beside the table, so table read --where rules files out without opening them:
+    - Min/max and null counts: --skip-index-columns "event_date,amount"
+    - Bloom filters for equality filters on high-cardinality columns: --bloom-filter-columns "session_id"
+    Build it with table index rebuild once data is written.
+
     EXAMPLES:
     # Create table without schema (schema can be defined later)
     deltacat table create --name users --namespace prod
@@ -203,7 +245,15 @@ def create_table_cmd(
         console.print(f'{get_emoji("loading")} Creating table "[cyan]{name}[/cyan]"')
 
         table_schema = TableSchema.of(schema)
+        sort_key_list = parse_columns(sort_keys)
+        if clustering and not sort_key_list:
+            raise ValueError('--clustering needs --sort-keys')
+        validate_clustering(
+            sort_key_list, clustering, list(table_schema) if table_schema else None, parse_columns(merge_keys)
+        )
         dc_schema = DeltacatTableSchema.of(table_schema, merge_keys) if table_schema else None
+        skip_index = SkipIndexConfig.of(parse_columns(skip_index_columns), parse_columns(bloom_filter_columns))
+        skip_index.validate(dc_schema.arrow if dc_schema else None)
 
         # Prepare table properties if any property is specified
         table_properties = None
@@ -229,6 +279,13 @@ def create_table_cmd(
                 default_schema_consistency_type,
             )
 
+        if sort_key_list:
+            table_properties = table_properties or TableProperties()
+            table_properties.update(clustering_properties(sort_key_list, clustering))
+        if skip_index.columns:
+            table_properties = table_properties or TableProperties()
+            table_properties[SKIP_INDEX_PROPERTY] = skip_index.to_dict()
+
         table = create_table(
             table=name,
             namespace=namespace,
@@ -242,7 +299,9 @@ def create_table_cmd(
             auto_create_namespace=auto_create_namespace,
             table_properties=table_properties,
         )
-        print_as_json(source_type='table', data=table)
+        # auto_create_namespace may have added a namespace too
+        metadata_cache.invalidate(namespaces_key(), tables_key(namespace), table_key(namespace, name))
+        print_record(source_type='table', record=table)
 
         console.print(
             f'{get_emoji("success")} Table "[bold cyan]{name}[/bold cyan]" created successfully', style='green'
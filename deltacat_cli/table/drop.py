@@ -7,6 +7,7 @@ from deltacat_cli.config import console
 from deltacat_cli.utils.catalog_context import catalog_context
 from deltacat_cli.utils.emojis import get_emoji
 from deltacat_cli.utils.error_handlers import handle_catalog_error
+from deltacat_cli.utils.metadata_cache import metadata_cache, table_key, tables_key
 
 
 app = typer.Typer()
@@ -29,6 +30,7 @@ def drop_table_cmd(
             )
 
             drop_table(table=name, namespace=namespace, catalog=catalog_name)
+            metadata_cache.invalidate(tables_key(namespace), table_key(namespace, name))
             console.print(
                 f'{get_emoji("success")} Table "[bold cyan]{name}[/bold cyan]" dropped successfully', style='green'
             )
@@ -0,0 +1,117 @@
+import os
+import time
+from typing import Annotated
+
+import typer
+
+from deltacat_cli.config import console
+from deltacat_cli.utils.catalog_context import catalog_context
+from deltacat_cli.utils.emojis import get_emoji
+from deltacat_cli.utils.error_handlers import handle_catalog_error
+from deltacat_cli.utils.filter_expression import compile_where
+from deltacat_cli.utils.formatting import format_bytes, format_rate, parse_bytes
+from deltacat_cli.utils.output_files import (
+    COMPRESSIONS,
+    EXPORT_FORMATS,
+    ExportProgress,
+    OutputPart,
+    export_scan,
+    resolve_output_dir,
+    validate_compression,
+)
+from deltacat_cli.utils.skip_index import apply_skip_index
+from deltacat_cli.utils.table_scan import TableScan
+
+
+app = typer.Typer()
+
+
+@app.command(name='export')
+def export_table_cmd(
+    name: Annotated[str, typer.Option(help='Table name to export')],
+    namespace: Annotated[str, typer.Option(help='Namespace name where table is located')],
+    out: Annotated[str, typer.Option('--out', help='Output directory, local path or URI (s3://bucket/prefix)')],
+    export_format: Annotated[
+        str, typer.Option('--format', help=f'Output format ({", ".join(EXPORT_FORMATS)})')
+    ] = 'parquet',
+    compression: Annotated[
+        str | None,
+        typer.Option(
+            help='Compression codec. '
+            + '; '.join(f'{fmt}: {", ".join(codecs)}' for fmt, codecs in COMPRESSIONS.items())
+            + '. Defaults to the first one.'
+        ),
+    ] = None,
+    row_group_size: Annotated[
+        int, typer.Option(min=1, help='Rows per Parquet row group or IPC record batch, buffered per writer')
+    ] = 1_000_000,
+    max_file_size: Annotated[
+        str, typer.Option(help='Start a new part file once one reaches this size, e.g. 256MiB or 1GB')
+    ] = '512MiB',
+    workers: Annotated[
+        int, typer.Option(min=1, help='Data files exported concurrently, each writer produces its own parts')
+    ] = min(4, os.cpu_count() or 1),
+    columns: Annotated[str | None, typer.Option(help='Optional comma-separated column names to include.')] = None,
+    where: Annotated[str | None, typer.Option(help='Optional row filter, as for table read.')] = None,
+    table_version: Annotated[str | None, typer.Option(help='Optional specific version of the table to export')] = None,
+    overwrite: Annotated[
+        bool, typer.Option('--overwrite', help='Replace part files left in --out by an earlier export')
+    ] = False,
+) -> None:
+    """Export table data to Parquet, Arrow IPC or CSV part files.
+
+    Data files are scanned as record batches, the same way as table read, and streamed to size-bounded
+    part files by a pool of writers, so tables of any size are exported in bounded memory. Parts are named
+    part-<writer>-<sequence>; rows keep the table order within a part, not across writers.
+    """
+    try:
+        compression = validate_compression(export_format, compression)
+        max_bytes = parse_bytes(max_file_size)
+
+        catalog = catalog_context.get_catalog()
+        column_list = [key.strip() for key in columns.split(',') if key.strip()] if columns else None
+        scan = TableScan(
+            namespace=namespace, table=name, inner=catalog.inner, table_version=table_version, columns=column_list
+        )
+        if where:
+            scan.filter = compile_where(where, scan.arrow_schema)
+            apply_skip_index(scan, where)
+        filesystem, directory = resolve_output_dir(out, overwrite)
+
+        console.print(
+            f'{get_emoji("loading")} Exporting table "[cyan]{name}[/cyan]" to {out} as {export_format} '
+            f'({compression}) with {workers} writer(s)'
+        )
+        start = time.perf_counter()
+
+        def report(part: OutputPart, progress: ExportProgress) -> None:
+            console.print(
+                f'  {os.path.basename(part.path)}: {part.rows:,} row(s), {format_bytes(part.bytes)}, '
+                f'{progress.rows:,} total, {format_rate(progress.rows, time.perf_counter() - start, "rows")}',
+                style='dim',
+            )
+
+        progress = export_scan(
+            scan, filesystem, directory, export_format, compression, row_group_size, max_bytes, workers, report
+        )
+
+        elapsed = time.perf_counter() - start
+        if not progress.parts:
+            message = 'has no rows matching the filter' if where else 'has no rows'
+            console.print(f'{get_emoji("empty")} Table "[bold cyan]{name}[/bold cyan]" {message}', style='yellow')
+            raise typer.Exit(0)
+
+        console.print(
+            f'{get_emoji("success")} Exported {progress.rows:,} row(s) from table "[bold cyan]{name}[/bold cyan]" '
+            f'to {progress.parts} part file(s), {format_bytes(progress.bytes)} in {elapsed:.2f}s',
+            style='green',
+        )
+        console.print(
+            f'Throughput: {format_rate(progress.rows, elapsed, "rows")}, {format_rate(progress.bytes, elapsed, "bytes")}',
+            style='dim',
+        )
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        handle_catalog_error(e, 'exporting table')
@@ -7,7 +7,8 @@ from deltacat_cli.config import console
 from deltacat_cli.utils.catalog_context import catalog_context
 from deltacat_cli.utils.emojis import get_emoji
 from deltacat_cli.utils.error_handlers import handle_catalog_error
-from deltacat_cli.utils.print_as_json import print_as_json
+from deltacat_cli.utils.metadata_cache import metadata_cache, table_key
+from deltacat_cli.utils.output import print_record
 
 
 app = typer.Typer()
@@ -21,10 +22,14 @@ def get_table_cmd(
     """Get the Table definition with the given name and given namespace."""
     try:
         catalog_name, _ = catalog_context.get_catalog_info(silent=True)
-        catalog_context.get_catalog()
         console.print(f'{get_emoji("loading")} Get table "[cyan]{name}[/cyan]"')
 
-        table = get_table(table=name, namespace=namespace, catalog=catalog_name)
+        table = metadata_cache.get(table_key(namespace, name))
+        if table is None:
+            catalog_context.get_catalog()
+            table = get_table(table=name, namespace=namespace, catalog=catalog_name)
+            if table:
+                metadata_cache.put(table_key(namespace, name), table)
         if not table:
             console.print(
                 f'{get_emoji("empty")} No table with name {name} found in namespace: {namespace} in catalog: {catalog_name}',
@@ -32,7 +37,7 @@ def get_table_cmd(
             )
             raise typer.Exit(0)
 
-        print_as_json(source_type='table', data=table)
+        print_record(source_type='table', record=table)
 
         console.print(f'{get_emoji("success")} Table "[bold cyan]{name}[/bold cyan]" get successfully', style='green')
 
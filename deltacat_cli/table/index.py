@@ -0,0 +1,82 @@
+import os
+import time
+from typing import Annotated
+
+import typer
+
+from deltacat_cli.config import console
+from deltacat_cli.utils.catalog_context import catalog_context
+from deltacat_cli.utils.emojis import get_emoji
+from deltacat_cli.utils.error_handlers import handle_catalog_error
+from deltacat_cli.utils.formatting import format_rate
+from deltacat_cli.utils.index_store import IndexRefresh
+from deltacat_cli.utils.key_index import KeyIndex
+from deltacat_cli.utils.skip_index import SkipIndex
+from deltacat_cli.utils.table_scan import TableScan
+from deltacat_cli.utils.table_utils import merge_key_names
+
+
+app = typer.Typer()
+
+
+@app.callback()
+def index_cmd() -> None:
+    """Build the sidecar indexes of a table: its skip index and the merge key index of table lookup."""
+
+
+def _print_refresh(kind: str, refresh: IndexRefresh) -> None:
+    action = f'Rebuilt {kind} ({refresh.reason})' if refresh.rebuilt else f'Refreshed {kind}'
+    console.print(
+        f'{get_emoji("success")} {action}: {refresh.deltas:,} delta(s), {refresh.files:,} file(s), '
+        f'{refresh.rows:,} row(s) in {refresh.seconds:.2f}s ({format_rate(refresh.rows, refresh.seconds, "rows")})',
+        style='green',
+    )
+
+
+@app.command(name='rebuild')
+def rebuild_index_cmd(
+    name: Annotated[str, typer.Option(help='Table name to index')],
+    namespace: Annotated[str, typer.Option(help='Namespace name where table is located')],
+    table_version: Annotated[str | None, typer.Option(help='Optional specific version of the table to index')] = None,
+    incremental: Annotated[
+        bool, typer.Option('--incremental', help='Only index the deltas committed since the last build')
+    ] = False,
+    keys: Annotated[
+        bool, typer.Option('--keys', help='Also build the merge key index table lookup uses, for tables with them')
+    ] = False,
+    workers: Annotated[int, typer.Option(min=1, help='Data files indexed concurrently')] = min(4, os.cpu_count() or 1),
+) -> None:
+    """Build the skip index of a table from every data file, reading only the indexed columns.
+
+    The skip index keeps the min/max and null count of the columns set with --skip-index-columns on table create
+    or alter, and Bloom filters of the --bloom-filter-columns, for each data file. table read --where consults
+    it to rule files out without opening them. Files committed after a build aren't ruled out until the next one,
+    which can be --incremental. Compaction and table optimize replace files, after which the index is rebuilt.
+    """
+    try:
+        inner = catalog_context.get_catalog().inner
+        resolved = TableScan(namespace=namespace, table=name, inner=inner, table_version=table_version).table_version
+        skip_index = SkipIndex.of(inner, namespace, resolved)
+        if skip_index is None and not keys:
+            raise ValueError(
+                f'Table {namespace}.{name} has no skip index columns, set them with table alter --skip-index-columns '
+                'or --bloom-filter-columns'
+            )
+        if keys and not merge_key_names(resolved.schema):
+            raise ValueError(f'Table {namespace}.{name} has no merge keys to index')
+
+        start = time.perf_counter()
+        if skip_index is not None:
+            console.print(
+                f'{get_emoji("loading")} Indexing {", ".join(skip_index.config.columns)} of table '
+                f'"[cyan]{name}[/cyan]" with {workers} worker(s)'
+            )
+            _print_refresh('skip index', skip_index.refresh(workers, rebuild=not incremental))
+        if keys:
+            key_index = KeyIndex(inner, namespace, resolved)
+            console.print(f'{get_emoji("loading")} Indexing merge keys {", ".join(key_index.merge_keys)}')
+            _print_refresh('key index', key_index.refresh(workers, rebuild=not incremental))
+        console.print(f'Indexes of table "[bold cyan]{name}[/bold cyan]" built in {time.perf_counter() - start:.2f}s')
+
+    except Exception as e:
+        handle_catalog_error(e, 'building table indexes')
@@ -1,3 +1,4 @@
+from itertools import islice
 from typing import Annotated
 
 import typer
@@ -7,7 +8,8 @@ from deltacat_cli.config import console
 from deltacat_cli.utils.catalog_context import catalog_context
 from deltacat_cli.utils.emojis import get_emoji
 from deltacat_cli.utils.error_handlers import handle_catalog_error
-from deltacat_cli.utils.print_as_json import print_as_json
+from deltacat_cli.utils.metafile_listing import list_tables_lazily
+from deltacat_cli.utils.output import print_records
 
 
 app = typer.Typer()
@@ -22,28 +24,48 @@ def list_tables_cmd(
             help='Optional table to list its table versions. If not specified, lists the latest active version of each table in the namespace.'
         ),
     ] = None,
+    limit: Annotated[int | None, typer.Option(min=1, help='Maximum number of tables to list.')] = None,
+    page_size: Annotated[int, typer.Option(min=1, help='Tables read from the catalog per page.')] = 100,
+    after: Annotated[
+        str | None, typer.Option(help='Continue a listing after the table with this ID, as printed by --limit.')
+    ] = None,
 ) -> None:
-    """Get the Table definition with the given name and given namespace."""
+    """List the tables of a namespace, printing each page of tables as it is read."""
     try:
         catalog_name, _ = catalog_context.get_catalog_info(silent=True)
-        catalog_context.get_catalog()
         console.print(f'{get_emoji("loading")} List tables in namespace: [cyan]{namespace}[/cyan]"')
 
-        tables = list_tables(namespace=namespace, table=table, catalog=catalog_name)
-        if not tables:
+        if table:
+            if after:
+                raise ValueError('--after is not supported when listing the versions of a table')
+            catalog_context.get_catalog()
+            tables = list_tables(namespace=namespace, table=table, catalog=catalog_name)
+            records = (table_definition.table for table_definition in islice(tables.all_items(), limit))
+            listing = None
+        else:
+            listing = list_tables_lazily(
+                namespace, catalog_context.get_catalog_properties(), page_size=page_size, after=after
+            )
+            records = (item.metafile for item in islice(listing, limit))
+
+        count = print_records(source_type='table', records=records)
+        if not count:
             console.print(
                 f'{get_emoji("empty")} No tables found in namespace: {namespace} in catalog: {catalog_name}',
                 style='yellow',
             )
             raise typer.Exit(0)
 
-        for table in tables.all_items():
-            print_as_json(source_type='table', data=table.table)
-
+        console.print(
+            f'{get_emoji("success")} Found {count} table(s) in namespace "[bold cyan]{namespace}[/bold cyan]"',
+            style='green',
+        )
+        if listing is not None and count == limit:
             console.print(
-                f'{get_emoji("success")} Table "[bold cyan]{table.table.name}[/bold cyan]" get successfully',
-                style='green',
+                f'More tables may follow, continue with: --after {listing.last_token}', style='dim', soft_wrap=True
             )
 
+    except typer.Exit:
+        raise
     except Exception as e:
         handle_catalog_error(e, 'get table')
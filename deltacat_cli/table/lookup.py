@@ -0,0 +1,114 @@
+import os
+from typing import Annotated
+
+import pyarrow as pa
+import typer
+
+from deltacat_cli.config import console
+from deltacat_cli.utils.catalog_context import catalog_context
+from deltacat_cli.utils.clustering import parse_columns
+from deltacat_cli.utils.emojis import get_emoji
+from deltacat_cli.utils.error_handlers import handle_catalog_error
+from deltacat_cli.utils.input_files import read_batches, resolve_inputs
+from deltacat_cli.utils.key_index import KeyIndex, lookup
+from deltacat_cli.utils.output import print_table_batches
+from deltacat_cli.utils.table_scan import TableScan
+
+
+app = typer.Typer()
+
+
+def parse_keys(keys: list[str], merge_keys: list[str]) -> pa.Table:
+    """Keys given as column=value pairs, comma-separated for composite merge keys, as a table of strings."""
+    rows = []
+    for key in keys:
+        row = {}
+        for pair in key.split(','):
+            column, separator, value = pair.partition('=')
+            if not separator or not column.strip():
+                raise ValueError(f'Invalid key {key}, expected column=value[,column=value]')
+            row[column.strip()] = value.strip()
+        rows.append(row)
+    for key, row in zip(keys, rows, strict=True):
+        if sorted(row) != sorted(merge_keys):
+            raise ValueError(f'Invalid key {key}, expected a value for each merge key: {", ".join(merge_keys)}')
+    return pa.table({column: pa.array([row[column] for row in rows], pa.string()) for column in merge_keys})
+
+
+@app.command(name='lookup')
+def lookup_table_cmd(
+    name: Annotated[str, typer.Option(help='Table name to look up records in')],
+    namespace: Annotated[str, typer.Option(help='Namespace name where table is located')],
+    key: Annotated[
+        list[str] | None,
+        typer.Option(
+            help='Merge key to look up, e.g. user_id=42, or tenant=a,user_id=42 for composite keys. Repeatable.'
+        ),
+    ] = None,
+    keys_file: Annotated[
+        list[str] | None,
+        typer.Option(help='Parquet, CSV or NDJSON file(s) or glob(s) of keys to look up, one per row. Repeatable.'),
+    ] = None,
+    keys_format: Annotated[
+        str | None, typer.Option(help='Format of the keys files: parquet, csv or ndjson. Detected by default.')
+    ] = None,
+    columns: Annotated[str | None, typer.Option(help='Optional comma-separated column names to include.')] = None,
+    table_version: Annotated[
+        str | None, typer.Option(help='Optional specific version of the table to look up records in')
+    ] = None,
+    all_versions: Annotated[
+        bool, typer.Option('--all-versions', help='Return every row of a key, not only the last one in stream order')
+    ] = False,
+    rebuild_index: Annotated[
+        bool, typer.Option('--rebuild-index', help='Rebuild the key index from every data file first')
+    ] = False,
+    workers: Annotated[int, typer.Option(min=1, help='Data files indexed concurrently')] = min(4, os.cpu_count() or 1),
+) -> None:
+    """Look up records of a table by merge key, reading only the row groups that hold them.
+
+    Keys are found through an index of the table's merge keys, kept in the catalog and shared by everyone using
+    it. Each lookup first indexes the deltas committed since the last one, reading only their merge key columns;
+    the index is rebuilt once compaction or table optimize replaces a partition. Like a merge, only the last row
+    of a key in stream order is returned unless --all-versions is given.
+    """
+    try:
+        if not key and not keys_file:
+            raise ValueError('Give the keys to look up with --key or --keys-file')
+        inner = catalog_context.get_catalog().inner
+        resolved = TableScan(namespace=namespace, table=name, inner=inner, table_version=table_version).table_version
+        index = KeyIndex(inner, namespace, resolved)
+
+        keys = [parse_keys(key, index.merge_keys).cast(index.key_schema)] if key else []
+        for input_file in resolve_inputs(keys_file or [], keys_format):
+            keys.extend(
+                pa.Table.from_batches([batch]).select(index.merge_keys)
+                for batch in read_batches(input_file, index.key_schema)
+            )
+        refresh = index.refresh(workers, rebuild=rebuild_index)
+        result = lookup(index, pa.concat_tables(keys), parse_columns(columns) or None, all_versions)
+        if refresh.rebuilt or refresh.deltas:
+            action = f'Rebuilt key index ({refresh.reason})' if refresh.rebuilt else 'Indexed'
+            console.print(
+                f'{action}: {refresh.deltas:,} delta(s), {refresh.files:,} file(s), {refresh.rows:,} row(s) '
+                f'in {refresh.seconds:.2f}s',
+                style='dim',
+            )
+
+        print_table_batches(result.rows.to_batches())
+        console.print(
+            f'Read {result.row_groups_read:,} row group(s) of {result.files_read:,} file(s) and '
+            f'{result.index_row_groups_read:,} index row group(s)',
+            style='dim',
+        )
+        for missing in result.missing[:10]:
+            console.print(f'{get_emoji("empty")} Key {missing} not found', style='yellow')
+        if len(result.missing) > 10:
+            console.print(f'... and {len(result.missing) - 10:,} more key(s) not found', style='yellow')
+        console.print(
+            f'{get_emoji("success")} Found {result.found:,} of {result.keys:,} key(s) in table '
+            f'"[bold cyan]{name}[/bold cyan]"',
+            style='green' if result.found else 'yellow',
+        )
+
+    except Exception as e:
+        handle_catalog_error(e, 'looking up records')
@@ -0,0 +1,155 @@
+import os
+import threading
+import time
+from typing import Annotated
+
+import typer
+from rich.table import Table
+
+from deltacat_cli.config import console
+from deltacat_cli.utils.catalog_context import catalog_context
+from deltacat_cli.utils.clustering import table_clustering
+from deltacat_cli.utils.delta_sketches import refresh_sketches
+from deltacat_cli.utils.emojis import get_emoji
+from deltacat_cli.utils.error_handlers import handle_catalog_error
+from deltacat_cli.utils.formatting import format_bytes, format_rate, parse_bytes
+from deltacat_cli.utils.optimization import (
+    DEFAULT_ROW_GROUP_SIZE,
+    PartitionPlan,
+    RewriteGroup,
+    optimize_partition,
+    plan_optimize,
+)
+from deltacat_cli.utils.output import output_context, print_records
+from deltacat_cli.utils.table_scan import TableScan
+
+
+app = typer.Typer()
+
+
+def _partition_label(plan: PartitionPlan) -> str:
+    return ', '.join(str(value) for value in plan.partition_values or []) or plan.partition.partition_id
+
+
+def _reduction(before: int, after: int) -> str:
+    return f'{before:,} -> {after:,} file(s) ({(before - after) / before:.0%} fewer)' if before else '0 files'
+
+
+def print_plan(plans: list[PartitionPlan]) -> None:
+    """Print the files of each partition before and after, and what is rewritten."""
+    table = Table(title='Optimization plan', title_justify='left')
+    table.add_column('Partition', style='cyan')
+    table.add_column('Deltas', justify='right')
+    table.add_column('Files', justify='right')
+    table.add_column('Groups', justify='right')
+    table.add_column('Rewritten', justify='right')
+    for plan in plans:
+        table.add_row(
+            _partition_label(plan),
+            f'{plan.deltas:,}',
+            f'{len(plan.files):,} -> {plan.files_after:,}',
+            f'{len(plan.groups):,}',
+            f'{plan.files_rewritten:,} file(s), {plan.rows_rewritten:,} row(s), {format_bytes(plan.bytes_rewritten)}',
+        )
+    console.print(table)
+
+
+@app.command(name='optimize')
+def optimize_table_cmd(
+    name: Annotated[str, typer.Option(help='Table name to optimize')],
+    namespace: Annotated[str, typer.Option(help='Namespace name where table is located')],
+    target_file_size: Annotated[
+        str, typer.Option(help='Size small files are packed into, e.g. 256MiB or 1GB')
+    ] = '256MiB',
+    workers: Annotated[int, typer.Option(min=1, help='Files rewritten concurrently')] = min(4, os.cpu_count() or 1),
+    row_group_size: Annotated[int, typer.Option(min=1, help='Rows per row group of the rewritten files')] = (
+        DEFAULT_ROW_GROUP_SIZE
+    ),
+    table_version: Annotated[
+        str | None, typer.Option(help='Optional specific version of the table to optimize')
+    ] = None,
+    cluster: Annotated[
+        bool,
+        typer.Option('--cluster', help="Rewrite every file, ordered by the table's sort keys across each partition"),
+    ] = False,
+    dry_run: Annotated[
+        bool, typer.Option('--dry-run', help='Only print the plan and the expected file count reduction')
+    ] = False,
+) -> None:
+    """Rewrite runs of small data files of an append-only table into files of the target size.
+
+    The plan is made from delta manifests alone: consecutive files smaller than three quarters of the target
+    size are bin-packed, in stream order, into groups of up to the target size. Groups are rewritten
+    concurrently and each partition's files are committed as a new revision of it, replacing the current one
+    atomically. Tables with merge keys, UPSERT or DELETE deltas are compacted with table compact instead.
+
+    Rewritten rows are ordered by the table's sort keys, linearly or in Z-order. With --cluster, each partition is
+    rewritten as a whole in that order, in memory, into files of the target size, so filters on the sort keys
+    skip most files.
+    """
+    try:
+        inner = catalog_context.get_catalog().inner
+        resolved = TableScan(namespace=namespace, table=name, inner=inner, table_version=table_version).table_version
+        plans = plan_optimize(inner, namespace, resolved, parse_bytes(target_file_size), cluster)
+        before = sum(len(plan.files) for plan in plans)
+        after = sum(plan.files_after for plan in plans)
+
+        if output_context.machine:
+            print_records('table', (plan.to_dict() for plan in plans))
+        else:
+            print_plan(plans)
+        pending = [plan for plan in plans if plan.groups]
+        if not pending:
+            console.print(
+                f'{get_emoji("success")} Table "[cyan]{name}[/cyan]" has no small files to pack', style='green'
+            )
+            return
+        if dry_run:
+            console.print(
+                f'{get_emoji("success")} Dry run, {_reduction(before, after)} expected, nothing was rewritten',
+                style='green',
+            )
+            return
+
+        groups = sum(len(plan.groups) for plan in pending)
+        sort_keys, clustering = table_clustering(resolved)
+        order = f', ordered by {", ".join(sort_keys)} ({clustering})' if sort_keys else ''
+        console.print(
+            f'{get_emoji("loading")} Rewriting {groups:,} group(s) of files in {len(pending)} partition(s) of '
+            f'table "[cyan]{name}[/cyan]" with {workers} worker(s){order}'
+        )
+        start = time.perf_counter()
+        lock = threading.Lock()
+        done = 0
+
+        def report(group: RewriteGroup) -> None:
+            nonlocal done
+            with lock:
+                done += 1
+                console.print(
+                    f'  Group {done}/{groups}: {len(group.files):,} file(s), {group.rows:,} row(s), '
+                    f'{format_bytes(group.bytes)}',
+                    style='dim',
+                )
+
+        for plan in pending:
+            optimize_partition(inner, namespace, resolved, plan, workers, row_group_size, report)
+
+        elapsed = time.perf_counter() - start
+        rows = sum(plan.rows_rewritten for plan in pending)
+        rewritten_bytes = sum(plan.bytes_rewritten for plan in pending)
+        console.print(
+            f'{get_emoji("success")} Optimized table "[bold cyan]{name}[/bold cyan]": {_reduction(before, after)} '
+            f'in {elapsed:.2f}s',
+            style='green',
+        )
+        console.print(
+            f'Throughput: {format_rate(rows, elapsed, "rows")}, {format_rate(rewritten_bytes, elapsed, "bytes")}',
+            style='dim',
+        )
+        refresh = refresh_sketches(inner, namespace, resolved)
+        if refresh is not None and refresh.deltas:
+            console.print(f'Sketched {refresh.deltas} delta(s) of the optimized table for table profile', style='dim')
+
+    except Exception as e:
+        handle_catalog_error(e, 'optimizing table')
@@ -0,0 +1,271 @@
+import math
+import os
+import time
+from typing import Annotated, Any
+
+import typer
+from rich.table import Table
+
+from deltacat import TableProperty
+from deltacat_cli.config import console
+from deltacat_cli.utils.catalog_context import catalog_context
+from deltacat_cli.utils.clustering import parse_columns
+from deltacat_cli.utils.column_profile import DEFAULT_BINS, DEFAULT_TOP_K, profile_scan
+from deltacat_cli.utils.delta_sketches import DEFAULT_QUANTILES, DeltaSketches, TableSketches, from_sketch_value
+from deltacat_cli.utils.emojis import get_emoji
+from deltacat_cli.utils.error_handlers import handle_catalog_error
+from deltacat_cli.utils.formatting import format_rate
+from deltacat_cli.utils.output import output_context, print_records
+from deltacat_cli.utils.table_scan import TableScan
+
+
+app = typer.Typer()
+
+
+def parse_quantiles(quantiles: str) -> list[float]:
+    """Fractions from comma-separated quantiles, e.g. "0.5,0.9,0.99"."""
+    fractions = []
+    for part in quantiles.split(','):
+        if not part.strip():
+            continue
+        try:
+            fraction = float(part)
+        except ValueError:
+            fraction = -1.0
+        if not 0 < fraction < 1:
+            raise ValueError(f'Invalid quantile {part.strip()}, expected a fraction between 0 and 1 such as 0.99')
+        fractions.append(fraction)
+    return sorted(set(fractions))
+
+
+def quantile_label(fraction: float) -> str:
+    return f'p{fraction * 100:g}'
+
+
+def column_profiles(sketches: TableSketches, fractions: list[float]) -> list[dict[str, Any]]:
+    """A record per column: null count, estimated distinct values, and min, quantiles and max where it has them."""
+    labels = ['min', *(quantile_label(fraction) for fraction in fractions), 'max']
+    records = []
+    for name, sketch in sketches.columns.items():
+        values = sketches.rows - sketch.null_count
+        record: dict[str, Any] = {
+            'column': name,
+            'type': str(sketch.type),
+            'null_count': sketch.null_count,
+            'distinct': min(sketch.distinct.estimate(), values),
+        }
+        # Every record has the same fields, for CSV output
+        estimates = sketch.quantiles.quantiles([0.0, *fractions, 1.0]) if sketch.quantiles else [None] * len(labels)
+        for label, value in zip(labels, estimates, strict=True):
+            record[label] = from_sketch_value(value, sketch.type)
+        records.append(record)
+    return records
+
+
+def print_profiles(records: list[dict[str, Any]], fractions: list[float]) -> None:
+    labels = ['min', *(quantile_label(fraction) for fraction in fractions), 'max']
+    table = Table(title='Column profile', title_justify='left')
+    table.add_column('Column', style='cyan')
+    table.add_column('Type')
+    table.add_column('Nulls', justify='right')
+    table.add_column('~Distinct', justify='right')
+    for label in labels:
+        table.add_column(label.capitalize() if label in ('min', 'max') else label, justify='right')
+    for record in records:
+        table.add_row(
+            record['column'],
+            record['type'],
+            f'{record["null_count"]:,}',
+            f'{record["distinct"]:,}',
+            *('' if record[label] is None else str(record[label]) for label in labels),
+        )
+    console.print(table)
+
+
+def _format(value: Any) -> str:
+    if value is None:
+        return ''
+    return f'{value:g}' if isinstance(value, float) else str(value)
+
+
+def _bar(count: int, largest: int, width: int = 30) -> str:
+    return '█' * round(width * count / largest) if largest else ''
+
+
+def print_histogram(title: str, bins: list[dict[str, Any]]) -> None:
+    table = Table(title=title, title_justify='left')
+    table.add_column('From', justify='right')
+    table.add_column('To', justify='right')
+    table.add_column('Count', justify='right')
+    table.add_column('')
+    largest = max((bin_['count'] for bin_ in bins), default=0)
+    for bin_ in bins:
+        table.add_row(
+            _format(bin_['lower']), _format(bin_['upper']), f'{bin_["count"]:,}', _bar(bin_['count'], largest)
+        )
+    console.print(table)
+
+
+def print_streamed_profiles(records: list[dict[str, Any]]) -> None:
+    table = Table(title='Column profile', title_justify='left')
+    table.add_column('Column', style='cyan')
+    table.add_column('Type')
+    table.add_column('Nulls', justify='right')
+    table.add_column('~Distinct', justify='right')
+    table.add_column('Unique')
+    table.add_column('Min', justify='right')
+    table.add_column('Max', justify='right')
+    table.add_column('Top values')
+    for record in records:
+        approximate = '' if record['top_values_exact'] else '~'
+        table.add_row(
+            record['column'],
+            record['type'],
+            f'{record["null_count"]:,} ({record["null_ratio"]:.1%})',
+            f'{record["distinct"]:,}',
+            {True: 'yes', False: 'no', None: '?'}[record['unique']],
+            _format(record['min']),
+            _format(record['max']),
+            '\n'.join(f'{_format(top["value"])} ({approximate}{top["count"]:,})' for top in record['top_values']),
+        )
+    console.print(table)
+    for record in records:
+        if record['histogram']:
+            print_histogram(f'{record["column"]} values', record['histogram'])
+        if record['length'] and record['length']['histogram']:
+            length = record['length']
+            print_histogram(
+                f'{record["column"]} lengths (min {length["min"]:,}, mean {length["mean"]:.1f}, max {length["max"]:,})',
+                length['histogram'],
+            )
+
+
+def stream_profile(
+    inner: Any,
+    name: str,
+    namespace: str,
+    table_version: str | None,
+    columns: list[str],
+    sample_fraction: float | None,
+    top_k: int,
+    bins: int,
+    workers: int,
+) -> None:
+    """Profile columns of a table exactly, streaming their values."""
+    if sample_fraction is not None and not 0 < sample_fraction <= 1:
+        raise ValueError(f'Invalid sample fraction {sample_fraction:g}, expected a fraction above 0 and up to 1')
+    scan = TableScan(
+        namespace=namespace, table=name, inner=inner, table_version=table_version, sample_fraction=sample_fraction
+    )
+    if scan.arrow_schema is None:
+        raise ValueError(f'Table {namespace}.{name} has no schema, its columns cannot be profiled')
+    missing = [column for column in columns if column not in scan.arrow_schema.names]
+    if missing:
+        raise ValueError(f'Column(s) {", ".join(missing)} not found in the table schema')
+    scan.columns = columns or scan.arrow_schema.names
+    console.print(
+        f'{get_emoji("loading")} Profiling {len(scan.columns)} column(s) of table "[cyan]{name}[/cyan]"'
+        + (f', sampling {sample_fraction:g} of it' if sample_fraction is not None else '')
+    )
+
+    start = time.perf_counter()
+    profiles = profile_scan(scan, top_k, bins, workers)
+    seconds = time.perf_counter() - start
+    records = [profile.to_dict(column) for column, profile in profiles.items()]
+    if output_context.machine:
+        print_records('table', records)
+    else:
+        print_streamed_profiles(records)
+
+    stats = scan.stats
+    if sample_fraction is not None and stats.row_groups_read + stats.row_groups_skipped:
+        console.print(
+            f'Sampled {stats.row_groups_read:,} of {stats.row_groups_read + stats.row_groups_skipped:,} row group(s)',
+            style='dim',
+        )
+    console.print(
+        f'{get_emoji("success")} Profiled {stats.rows_read:,} row(s) of {stats.files_read:,} file(s) of table '
+        f'"[bold cyan]{name}[/bold cyan]" in {seconds:.2f}s ({format_rate(stats.rows_read, seconds, "rows")})',
+        style='green',
+    )
+
+
+@app.command(name='profile')
+def profile_table_cmd(
+    name: Annotated[str, typer.Option(help='Table name to profile')],
+    namespace: Annotated[str, typer.Option(help='Namespace name where table is located')],
+    quantiles: Annotated[
+        str, typer.Option(help='Comma-separated quantiles of numeric and temporal columns to estimate')
+    ] = ','.join(str(fraction) for fraction in DEFAULT_QUANTILES),
+    rebuild: Annotated[bool, typer.Option('--rebuild', help='Sketch every delta again')] = False,
+    columns: Annotated[
+        str | None,
+        typer.Option(help='Comma-separated columns to profile exactly, streaming their values instead of sketches'),
+    ] = None,
+    sample_fraction: Annotated[
+        float | None, typer.Option(help='Fraction of the table to stream, sampled by Parquet row group')
+    ] = None,
+    top_k: Annotated[int, typer.Option(min=1, help='Most frequent values shown per column, streamed')] = DEFAULT_TOP_K,
+    bins: Annotated[int, typer.Option(min=1, help='Maximum histogram bins per column, streamed')] = DEFAULT_BINS,
+    workers: Annotated[int, typer.Option(min=1, help='Files read concurrently')] = min(4, os.cpu_count() or 1),
+    table_version: Annotated[str | None, typer.Option(help='Optional specific version of the table to profile')] = None,
+) -> None:
+    """Profile the columns of a table from per-delta sketches, or stream them exactly for histograms and top values.
+
+    Each delta is sketched once, with a HyperLogLog of every column and of the merge keys and a KLL sketch of
+    numeric and temporal columns, and the sketches are merged here, so a profile costs one sketch per delta
+    rather than a read of every row. Deltas not sketched yet are read first; once a table has sketches, table
+    write, compact and optimize sketch the deltas they commit.
+
+    With --columns or --sample-fraction, the columns are streamed instead, in record batches profiled with
+    vectorized kernels: null ratio, min and max, most frequent values, and histograms of numeric values and of
+    string lengths, in memory bounded by --top-k and --bins rather than rows.
+    """
+    try:
+        inner = catalog_context.get_catalog().inner
+        if columns is not None or sample_fraction is not None:
+            if rebuild:
+                raise ValueError(
+                    '--rebuild only applies to profiles from sketches, without --columns or --sample-fraction'
+                )
+            stream_profile(
+                inner, name, namespace, table_version, parse_columns(columns), sample_fraction, top_k, bins, workers
+            )
+            return
+        fractions = parse_quantiles(quantiles)
+        resolved = TableScan(namespace=namespace, table=name, inner=inner, table_version=table_version).table_version
+        sketches = DeltaSketches(inner, namespace, resolved)
+        console.print(f'{get_emoji("loading")} Profiling table "[cyan]{name}[/cyan]"')
+
+        start = time.perf_counter()
+        refresh = sketches.refresh(workers, rebuild=rebuild)
+        if refresh.rebuilt or refresh.deltas:
+            action = f'Rebuilt sketches ({refresh.reason})' if refresh.rebuilt else 'Sketched'
+            console.print(
+                f'{action}: {refresh.deltas:,} delta(s), {refresh.files:,} file(s), {refresh.rows:,} row(s) in '
+                f'{refresh.seconds:.2f}s ({format_rate(refresh.rows, refresh.seconds, "rows")})',
+                style='dim',
+            )
+        merged = sketches.merged()
+        records = column_profiles(merged, fractions)
+        if output_context.machine:
+            print_records('table', records)
+        else:
+            print_profiles(records, fractions)
+
+        if merged.merge_key_distinct is not None:
+            keys = min(merged.merge_key_distinct.estimate(), merged.rows)
+            records_per_file = resolved.read_table_property(TableProperty.RECORDS_PER_COMPACTED_FILE)
+            console.print(
+                f'Merge keys {", ".join(merged.merge_keys)}: ~{keys:,} distinct, '
+                f'{max(1, math.ceil(keys / records_per_file)):,} hash bucket(s) of {records_per_file:,} record(s)',
+                style='dim',
+            )
+        console.print(
+            f'{get_emoji("success")} Profiled {merged.rows:,} row(s) of {merged.deltas:,} delta(s) of table '
+            f'"[bold cyan]{name}[/bold cyan]" in {time.perf_counter() - start:.2f}s',
+            style='green',
+        )
+
+    except Exception as e:
+        handle_catalog_error(e, 'profiling table')
@@ -1,12 +1,18 @@
+from pathlib import Path
 from typing import Annotated
 
 import typer
 
-from deltacat import read_table
 from deltacat_cli.config import console
 from deltacat_cli.utils.catalog_context import catalog_context
+from deltacat_cli.utils.change_scan import ChangeScan, HighWaterMark, print_high_water_mark
 from deltacat_cli.utils.emojis import get_emoji
 from deltacat_cli.utils.error_handlers import handle_catalog_error
+from deltacat_cli.utils.filter_expression import compile_where
+from deltacat_cli.utils.formatting import parse_timestamp
+from deltacat_cli.utils.output import print_table_batches
+from deltacat_cli.utils.skip_index import apply_skip_index
+from deltacat_cli.utils.table_scan import TableScan
 
 
 app = typer.Typer()
@@ -18,23 +24,99 @@ def read_table_cmd(
     namespace: Annotated[str, typer.Option(help='Namespace name where table is located')],
     columns: Annotated[str | None, typer.Option(help='Optional comma-separated column names to include.')] = None,
     table_version: Annotated[str | None, typer.Option(help='Optional specific version of the table to read')] = None,
-    num_rows: Annotated[int, typer.Option(help='Number of rows to visualize. Default to 10.')] = 20,
+    where: Annotated[
+        str | None,
+        typer.Option(
+            help='Optional row filter, e.g. "user_id = 42 AND ts >= \'2026-01-01\'". Row groups whose statistics '
+            'cannot match are skipped without being read.'
+        ),
+    ] = None,
+    num_rows: Annotated[
+        int | None,
+        typer.Option(
+            min=0,
+            help='Number of rows to visualize. Default to 20, or every row for incremental reads, '
+            '0 reads the whole table.',
+        ),
+    ] = None,
+    since_position: Annotated[
+        int | None,
+        typer.Option(min=0, help='Only read the deltas committed after this stream position, in commit order.'),
+    ] = None,
+    since_time: Annotated[
+        str | None,
+        typer.Option(help='Only read the deltas committed after this time, e.g. 2026-01-01T12:00:00Z (UTC default).'),
+    ] = None,
+    state_file: Annotated[
+        Path | None,
+        typer.Option(
+            help='Read the deltas committed after the high-water mark saved in this file, then save the new one.'
+        ),
+    ] = None,
 ) -> None:
     """
     Read the Table data with the given name and given namespace.
-    If the table is empty TypeError will be raised `DataFrame.__init__() missing 1 required positional argument: 'builder'`
+    Only as many data files as needed for --num-rows are read, and rows are printed as they are decoded.
+    With --since-position, --since-time or --state-file only the deltas committed after them are read, and the
+    high-water mark to continue from is printed.
     """
     try:
-        catalog_name, _ = catalog_context.get_catalog_info(silent=True)
-        catalog_context.get_catalog()
+        catalog = catalog_context.get_catalog()
         console.print(f'{get_emoji("loading")} Read table "[cyan]{name}[/cyan]"')
 
         column_list = [key.strip() for key in columns.split(',') if key.strip()] if columns else None
-        table = read_table(
-            table=name, namespace=namespace, columns=column_list, table_version=table_version, catalog=catalog_name
+        incremental = since_position is not None or since_time is not None or state_file is not None
+        scan: TableScan
+        if incremental:
+            scan = ChangeScan(
+                namespace=namespace,
+                table=name,
+                inner=catalog.inner,
+                table_version=table_version,
+                columns=column_list,
+                since_position=since_position,
+                since_time=parse_timestamp(since_time) if since_time else None,
+                since=HighWaterMark.load(state_file) if state_file else None,
+            )
+        else:
+            scan = TableScan(
+                namespace=namespace, table=name, inner=catalog.inner, table_version=table_version, columns=column_list
+            )
+        indexed = False
+        if where:
+            scan.filter = compile_where(where, scan.arrow_schema)
+            indexed = apply_skip_index(scan, where)
+        limit = (0 if incremental else 20) if num_rows is None else num_rows
+        rows = print_table_batches(scan.batches(limit=limit or None))
+        if where:
+            stats = scan.stats
+            console.print(
+                f'Filter skipped {stats.row_groups_skipped} of {stats.row_groups_skipped + stats.row_groups_read} '
+                f'row group(s) and {stats.files_skipped} file(s) by statistics, {stats.bytes_read} byte(s) scanned',
+                style='dim',
+            )
+            if indexed:
+                console.print(
+                    f'Skip index ruled out {stats.files_skipped_by_index} file(s) without opening them', style='dim'
+                )
+        if isinstance(scan, ChangeScan):
+            if limit and rows >= limit:
+                console.print(f'Stopped after --num-rows {limit}, the high-water mark was not advanced', style='yellow')
+            else:
+                print_high_water_mark(scan, state_file)
+        if not rows:
+            kind = 'new rows' if incremental else 'rows'
+            message = f'has no {kind} matching the filter' if where else f'has no {kind}'
+            console.print(f'{get_emoji("empty")} Table "[bold cyan]{name}[/bold cyan]" {message}', style='yellow')
+            raise typer.Exit(0)
+
+        console.print(
+            f'{get_emoji("success")} Table "[bold cyan]{name}[/bold cyan]" read successfully: {rows} row(s) '
+            f'from {scan.stats.files_read} file(s)',
+            style='green',
         )
-        console.print(f'{get_emoji("success")} Table "[bold cyan]{name}[/bold cyan]" read successfully', style='green')
-        table.show(num_rows)
 
+    except typer.Exit:
+        raise
     except Exception as e:
         handle_catalog_error(e, 'read table')
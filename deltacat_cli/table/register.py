@@ -0,0 +1,148 @@
+import time
+from typing import Annotated
+
+import typer
+from deltacat.storage import Delta, DeltaLocator, DeltaType, EntryType, Manifest, ManifestAuthor, metastore
+from rich.table import Table
+
+from deltacat import __version__ as deltacat_version
+from deltacat_cli.config import console
+from deltacat_cli.utils.catalog_context import catalog_context
+from deltacat_cli.utils.emojis import get_emoji
+from deltacat_cli.utils.error_handlers import handle_catalog_error
+from deltacat_cli.utils.formatting import format_bytes, format_rate
+from deltacat_cli.utils.input_files import resolve_inputs
+from deltacat_cli.utils.parquet_footers import ColumnStats, manifest_entry, read_footers, validate_footer
+from deltacat_cli.utils.table_scan import TableScan
+from deltacat_cli.utils.table_utils import merge_key_names
+
+
+app = typer.Typer()
+
+REGISTER_MODES = {'append': DeltaType.APPEND, 'add': DeltaType.ADD}
+
+# Problems listed before the rest are summarized
+MAX_LISTED_PROBLEMS = 20
+
+
+def print_column_stats(columns: dict[str, ColumnStats]) -> None:
+    table = Table(title='Column statistics', title_justify='left')
+    table.add_column('Column', style='cyan')
+    table.add_column('Nulls', justify='right')
+    table.add_column('Min')
+    table.add_column('Max')
+    for name, stats in columns.items():
+        nulls = 'unknown' if stats.null_count is None else f'{stats.null_count:,}'
+        table.add_row(
+            name, nulls, '' if stats.min is None else str(stats.min), '' if stats.max is None else str(stats.max)
+        )
+    console.print(table)
+
+
+@app.command(name='register')
+def register_files_cmd(
+    name: Annotated[str, typer.Option(help='Table name to register files in')],
+    namespace: Annotated[str, typer.Option(help='Namespace name where table is located')],
+    input: Annotated[  # noqa: A002
+        list[str], typer.Option('--input', '-i', help='Parquet file, glob or URI. Can be given multiple times.')
+    ],
+    mode: Annotated[
+        str, typer.Option(help=f'Delta type to register the files as ({", ".join(REGISTER_MODES)})')
+    ] = 'append',
+    workers: Annotated[int, typer.Option(min=1, help='Footers read concurrently')] = 16,
+    table_version: Annotated[
+        str | None, typer.Option(help='Optional specific version of the table to register files in')
+    ] = None,
+    dry_run: Annotated[bool, typer.Option('--dry-run', help='Validate the files without registering them')] = False,
+) -> None:
+    """Register existing Parquet files as a new delta of a table, without copying them.
+
+    Only file footers are read, concurrently, to validate each file's schema against the table's and to
+    gather row counts and column statistics. The files are then committed as one delta whose manifest
+    references them where they are, so they must stay in place for as long as the table uses them.
+    """
+    try:
+        if mode not in REGISTER_MODES:
+            raise ValueError(f'Unknown mode {mode}, expected one of {", ".join(REGISTER_MODES)}')
+        catalog = catalog_context.get_catalog()
+        inputs = resolve_inputs(input, 'parquet')
+
+        scan = TableScan(namespace=namespace, table=name, inner=catalog.inner, table_version=table_version)
+        schema = scan.table_version.schema
+        if schema is None:
+            raise ValueError(f'Table {namespace}.{name} has no schema to validate files against')
+        if scan.table_version.partition_scheme and scan.table_version.partition_scheme.keys:
+            raise ValueError(f'Table {namespace}.{name} is partitioned, only unpartitioned tables are supported')
+        merge_keys = merge_key_names(schema)
+
+        console.print(
+            f'{get_emoji("loading")} Reading the footers of {len(inputs)} file(s) for table "[cyan]{name}[/cyan]"'
+        )
+        start = time.perf_counter()
+        footers = read_footers(inputs, workers)
+        elapsed = time.perf_counter() - start
+
+        problems = [
+            f'{footer.input_file.path}: {problem}'
+            for footer in footers
+            for problem in validate_footer(footer, schema.arrow, merge_keys)
+        ]
+        registered = {scan_file.path for scan_file in scan.files()}
+        problems += [f'{footer.uri}: already registered' for footer in footers if footer.uri in registered]
+        if len({footer.uri for footer in footers}) < len(footers):
+            problems.append('the same file is given more than once')
+        if problems:
+            for problem in problems[:MAX_LISTED_PROBLEMS]:
+                console.print(f'{get_emoji("error")} {problem}', style='red')
+            if len(problems) > MAX_LISTED_PROBLEMS:
+                console.print(f'... and {len(problems) - MAX_LISTED_PROBLEMS} more', style='red')
+            raise ValueError(f'{len(problems)} problem(s) found, no files were registered')
+
+        rows = sum(footer.rows for footer in footers)
+        total_bytes = sum(footer.input_file.size for footer in footers)
+        columns: dict[str, ColumnStats] = {}
+        for footer in footers:
+            for column, stats in footer.columns.items():
+                columns.setdefault(column, ColumnStats()).merge(stats.null_count, stats.min, stats.max)
+        console.print(
+            f'Validated {len(footers)} file(s): {rows:,} row(s) in {sum(f.row_groups for f in footers):,} row '
+            f'group(s), {format_bytes(total_bytes)}. Footers read in {elapsed:.2f}s, '
+            f'{format_rate(len(footers), elapsed, "files")}',
+            style='dim',
+        )
+        print_column_stats(columns)
+        if dry_run:
+            console.print(f'{get_emoji("success")} Dry run, no files were registered', style='green')
+            return
+
+        delta_type = REGISTER_MODES[mode]
+        stream = metastore.get_stream(namespace, name, scan.table_version.table_version, inner=catalog.inner)
+        partition = metastore.get_partition(stream.locator, None, inner=catalog.inner)
+        new_partition = partition is None
+        if new_partition:
+            partition = metastore.stage_partition(stream, inner=catalog.inner)
+        manifest = Manifest.of(
+            entries=[manifest_entry(footer, schema.id) for footer in footers],
+            author=ManifestAuthor.of(name='deltacat-cli.table.register', version=deltacat_version),
+            entry_type=EntryType.DATA,
+        )
+        delta = Delta.of(
+            locator=DeltaLocator.of(partition.locator, None),
+            delta_type=delta_type,
+            meta=manifest.meta,
+            properties=None,
+            manifest=manifest,
+            previous_stream_position=partition.stream_position if delta_type != DeltaType.ADD else None,
+        )
+        delta = metastore.commit_delta(delta, inner=catalog.inner)
+        if new_partition:
+            metastore.commit_partition(partition, inner=catalog.inner)
+
+        console.print(
+            f'{get_emoji("success")} Registered {len(footers)} file(s), {rows:,} row(s) in table '
+            f'"[bold cyan]{name}[/bold cyan]" as {mode} delta {delta.stream_position}, no data was copied',
+            style='green',
+        )
+
+    except Exception as e:
+        handle_catalog_error(e, 'registering files')
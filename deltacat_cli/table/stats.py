@@ -0,0 +1,147 @@
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated
+
+import typer
+from rich.table import Table
+
+from deltacat_cli.config import console
+from deltacat_cli.utils.catalog_context import catalog_context
+from deltacat_cli.utils.emojis import get_emoji
+from deltacat_cli.utils.error_handlers import handle_catalog_error
+from deltacat_cli.utils.formatting import format_bytes
+from deltacat_cli.utils.metafile_listing import list_tables_lazily
+from deltacat_cli.utils.output import dumps, output_context, print_records
+from deltacat_cli.utils.table_stats import TableStats, collect_table_stats
+
+
+app = typer.Typer()
+
+
+def print_table_stats(stats: TableStats) -> None:
+    """Print the statistics of one table, per partition and per column."""
+    partitions = Table(title=f'{stats.namespace}.{stats.table} (version {stats.table_version})', title_justify='left')
+    partitions.add_column('Partition', style='cyan')
+    for column in ('Deltas', 'Files', 'Rows', 'Deleted rows', 'Bytes'):
+        partitions.add_column(column, justify='right')
+    for partition in stats.partitions:
+        partitions.add_row(
+            ', '.join(str(value) for value in partition.partition_values or []) or partition.partition_id,
+            f'{partition.deltas:,}',
+            f'{partition.files:,}',
+            f'{partition.rows:,}',
+            f'{partition.deleted_rows:,}',
+            format_bytes(partition.bytes),
+        )
+    if len(stats.partitions) > 1:
+        partitions.add_row(
+            'Total',
+            f'{stats.deltas:,}',
+            f'{stats.files:,}',
+            f'{stats.rows:,}',
+            f'{stats.deleted_rows:,}',
+            format_bytes(stats.bytes),
+            style='bold',
+        )
+    console.print(partitions)
+
+    columns = stats.columns
+    if columns:
+        table = Table(title='Columns', title_justify='left')
+        table.add_column('Column', style='cyan')
+        table.add_column('Nulls', justify='right')
+        table.add_column('Min')
+        table.add_column('Max')
+        for name, column in columns.items():
+            table.add_row(
+                name,
+                'unknown' if column.null_count is None else f'{column.null_count:,}',
+                '' if column.min is None else str(column.min),
+                '' if column.max is None else str(column.max),
+            )
+        console.print(table)
+
+
+def print_namespace_stats(namespace: str, all_stats: list[TableStats]) -> None:
+    """Print one row of totals per table of a namespace."""
+    table = Table(title=f'Namespace {namespace}', title_justify='left')
+    table.add_column('Table', style='cyan')
+    for column in ('Partitions', 'Deltas', 'Files', 'Rows', 'Bytes'):
+        table.add_column(column, justify='right')
+    for stats in all_stats:
+        table.add_row(
+            stats.table,
+            f'{len(stats.partitions):,}',
+            f'{stats.deltas:,}',
+            f'{stats.files:,}',
+            f'{stats.rows:,}',
+            format_bytes(stats.bytes),
+        )
+    table.add_row(
+        'Total',
+        f'{sum(len(stats.partitions) for stats in all_stats):,}',
+        f'{sum(stats.deltas for stats in all_stats):,}',
+        f'{sum(stats.files for stats in all_stats):,}',
+        f'{sum(stats.rows for stats in all_stats):,}',
+        format_bytes(sum(stats.bytes for stats in all_stats)),
+        style='bold',
+    )
+    console.print(table)
+
+
+@app.command(name='stats')
+def table_stats_cmd(
+    namespace: Annotated[str, typer.Option(help='Namespace name where table is located')],
+    name: Annotated[
+        str | None, typer.Option(help='Table name. If not specified, every table in the namespace is aggregated.')
+    ] = None,
+    table_version: Annotated[
+        str | None, typer.Option(help='Optional specific version of the table, --name only')
+    ] = None,
+    column_stats: Annotated[bool, typer.Option(help='Read Parquet footers for column min, max and null counts')] = True,
+    workers: Annotated[
+        int, typer.Option(min=1, help='Parquet footers read concurrently, or tables with --namespace alone')
+    ] = min(16, (os.cpu_count() or 1) * 4),
+) -> None:
+    """Report row, delta, file and byte counts and column statistics of a table without reading its data.
+
+    Counts come from delta manifests, and column statistics from Parquet footers. Without --name, the
+    tables of the namespace are collected concurrently and reported one row per table.
+    """
+    try:
+        if table_version and not name:
+            raise ValueError('--table-version needs --name')
+        inner = catalog_context.get_catalog().inner
+        start = time.perf_counter()
+        if name:
+            console.print(f'{get_emoji("loading")} Collecting statistics of table "[cyan]{name}[/cyan]"')
+            all_stats = [collect_table_stats(inner, namespace, name, table_version, column_stats, workers)]
+        else:
+            console.print(f'{get_emoji("loading")} Collecting statistics of namespace "[cyan]{namespace}[/cyan]"')
+            tables = [item.name for item in list_tables_lazily(namespace, inner)]
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='table-stats') as executor:
+                all_stats = list(
+                    executor.map(lambda table: collect_table_stats(inner, namespace, table, None, column_stats), tables)
+                )
+        elapsed = time.perf_counter() - start
+
+        if output_context.machine:
+            if name:
+                sys.stdout.write(dumps(all_stats[0].to_dict()) + '\n')
+            else:
+                print_records('table', (stats.to_dict() for stats in all_stats))
+        elif name:
+            print_table_stats(all_stats[0])
+        else:
+            print_namespace_stats(namespace, all_stats)
+
+        console.print(
+            f'{get_emoji("success")} Collected statistics of {len(all_stats)} table(s) in {elapsed:.2f}s, '
+            f'{sum(stats.footers_read for stats in all_stats):,} Parquet footer(s) read, no data read',
+            style='green',
+        )
+
+    except Exception as e:
+        handle_catalog_error(e, 'collecting table statistics')
@@ -0,0 +1,187 @@
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Annotated
+
+import pyarrow as pa
+import typer
+from deltacat.storage import metastore
+
+from deltacat import TableWriteMode, write_to_table
+from deltacat_cli.config import console
+from deltacat_cli.utils.catalog_context import catalog_context
+from deltacat_cli.utils.clustering import cluster_table, table_clustering
+from deltacat_cli.utils.delta_sketches import DeltaSketches
+from deltacat_cli.utils.emojis import get_emoji
+from deltacat_cli.utils.error_handlers import handle_catalog_error
+from deltacat_cli.utils.formatting import format_bytes, format_rate
+from deltacat_cli.utils.input_files import INPUT_FORMATS, InputFile, read_batches, resolve_inputs
+
+
+app = typer.Typer()
+
+WRITE_MODES = {
+    mode.value: mode for mode in (TableWriteMode.AUTO, TableWriteMode.APPEND, TableWriteMode.ADD, TableWriteMode.MERGE)
+}
+
+_DONE = object()
+
+
+@dataclass
+class WriteStats:
+    """Progress of a bulk write."""
+
+    files: int = 0
+    rows: int = 0
+    bytes: int = 0
+    deltas: int = 0
+    sketched: int = 0
+
+
+def read_inputs(
+    inputs: list[InputFile], schema: pa.Schema, workers: int, batches: queue.Queue, stop: threading.Event
+) -> None:
+    """Read input files on a thread pool, feeding conformed batches to a bounded queue.
+
+    The queue bound keeps memory flat: readers block while the writer commits. Each reader puts the
+    input file it finished, or the exception it failed with, so the writer can track progress.
+    """
+
+    def read_file(input_file: InputFile) -> None:
+        try:
+            for batch in read_batches(input_file, schema):
+                if stop.is_set():
+                    return
+                batches.put(batch)
+            batches.put(input_file)
+        except Exception as e:  # noqa: BLE001
+            batches.put(e)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='table-write') as executor:
+        list(executor.map(read_file, inputs))
+    batches.put(_DONE)
+
+
+@app.command(name='write')
+def write_table_cmd(
+    name: Annotated[str, typer.Option(help='Table name to write to')],
+    namespace: Annotated[str, typer.Option(help='Namespace name where table is located')],
+    input: Annotated[  # noqa: A002
+        list[str], typer.Option('--input', '-i', help='Input file, glob or URI. Can be given multiple times.')
+    ],
+    input_format: Annotated[
+        str | None,
+        typer.Option('--format', help=f'Input format ({", ".join(INPUT_FORMATS)}). Detected from extensions.'),
+    ] = None,
+    mode: Annotated[
+        str, typer.Option(help=f'Write mode ({", ".join(WRITE_MODES)}). auto appends, or merges by merge keys.')
+    ] = 'auto',
+    batch_rows: Annotated[
+        int, typer.Option(min=1, help='Rows committed per delta. Bounds memory use of the write.')
+    ] = 1_000_000,
+    workers: Annotated[int, typer.Option(min=1, help='Input files read concurrently.')] = min(4, os.cpu_count() or 1),
+    table_version: Annotated[str | None, typer.Option(help='Optional specific version of the table to write')] = None,
+) -> None:
+    """Bulk write Parquet, CSV or NDJSON files into an existing table.
+
+    Input files are streamed as Arrow record batches, converted to the table schema and committed as
+    one delta per --batch-rows rows, ordered by the table's sort keys if it has any.
+    """
+    try:
+        if input_format and input_format not in INPUT_FORMATS:
+            raise ValueError(f'Unknown format {input_format}, expected one of {", ".join(INPUT_FORMATS)}')
+        if mode not in WRITE_MODES:
+            raise ValueError(f'Unknown mode {mode}, expected one of {", ".join(WRITE_MODES)}')
+
+        catalog_name, _ = catalog_context.get_catalog_info(silent=True)
+        catalog = catalog_context.get_catalog()
+        inputs = resolve_inputs(input, input_format)
+
+        if table_version is None:
+            version = metastore.get_latest_active_table_version(namespace, name, inner=catalog.inner)
+        else:
+            version = metastore.get_table_version(namespace, name, table_version, inner=catalog.inner)
+        if version is None or version.schema is None:
+            raise ValueError(f'Table {namespace}.{name} has no active table version with a schema to write to')
+        schema = version.schema.arrow
+        sort_keys, clustering = table_clustering(version)
+        sketches = DeltaSketches(catalog.inner, namespace, version)
+
+        total_bytes = sum(input_file.size for input_file in inputs)
+        console.print(
+            f'{get_emoji("loading")} Writing {len(inputs)} file(s) ({format_bytes(total_bytes)}) to table '
+            f'"[cyan]{name}[/cyan]" with {min(workers, len(inputs))} reader(s)'
+        )
+
+        stats = WriteStats()
+        start = time.perf_counter()
+
+        def commit(pending: list[pa.RecordBatch]) -> None:
+            data = cluster_table(pa.Table.from_batches(pending, schema=schema), sort_keys, clustering)
+            deltas = write_to_table(
+                data,
+                name,
+                namespace=namespace,
+                table_version=version.table_version,
+                mode=WRITE_MODES[mode],
+                catalog=catalog_name,
+            )
+            stats.deltas += len(deltas or [])
+            stats.rows += data.num_rows
+            # Tables with sketches get those of the new delta from the rows in memory, rather than from a read
+            stats.sketched += sketches.record(deltas or [], data)
+            console.print(
+                f'  committed {data.num_rows:,} row(s), {stats.rows:,} total, '
+                f'{format_rate(stats.rows, time.perf_counter() - start, "rows")}',
+                style='dim',
+            )
+
+        batches: queue.Queue = queue.Queue(maxsize=max(4, workers * 2))
+        stop = threading.Event()
+        reader = threading.Thread(target=read_inputs, args=(inputs, schema, workers, batches, stop), daemon=True)
+        reader.start()
+
+        pending: list[pa.RecordBatch] = []
+        pending_rows = 0
+        try:
+            while (item := batches.get()) is not _DONE:
+                if isinstance(item, Exception):
+                    raise item
+                if isinstance(item, InputFile):
+                    stats.files += 1
+                    stats.bytes += item.size
+                    continue
+                pending.append(item)
+                pending_rows += item.num_rows
+                if pending_rows >= batch_rows:
+                    commit(pending)
+                    pending, pending_rows = [], 0
+            if pending:
+                commit(pending)
+        finally:
+            stop.set()
+            # Unblock readers waiting on a full queue so they can see the stop flag
+            while reader.is_alive():
+                try:
+                    batches.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+
+        elapsed = time.perf_counter() - start
+        console.print(
+            f'{get_emoji("success")} Wrote {stats.rows:,} row(s) from {stats.files} file(s) in {stats.deltas} '
+            f'delta(s) to table "[bold cyan]{name}[/bold cyan]" in {elapsed:.2f}s',
+            style='green',
+        )
+        console.print(
+            f'Throughput: {format_rate(stats.rows, elapsed, "rows")}, {format_rate(stats.bytes, elapsed, "bytes")}',
+            style='dim',
+        )
+        if stats.sketched:
+            console.print(f'Sketched {stats.sketched} delta(s) for table profile', style='dim')
+
+    except Exception as e:
+        handle_catalog_error(e, 'writing table')
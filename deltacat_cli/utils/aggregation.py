@@ -0,0 +1,340 @@
+"""Group-by aggregation over streamed record batches, in memory bounded by the number of groups.
+
+Each batch is aggregated on its own with pyarrow's hash aggregation into partial states per group: a count, a
+sum, a min or a max, with means kept as a sum and a count. Partial states are merged with the same kernels once
+they add up to more rows than the groups merged so far, so however many rows are scanned, a worker holds about
+twice the number of groups. Workers aggregate data files of their own and their states are merged at the end.
+
+count_distinct can't be merged from partial counts: it keeps the distinct (group, value) pairs instead, deduplicated
+the same way, so its memory is bounded by those pairs.
+"""
+
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from decimal import Decimal
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from deltacat_cli.utils.table_scan import TableScan
+
+
+AGGREGATE_FUNCTIONS = ('count', 'sum', 'min', 'max', 'mean', 'count_distinct')
+TIME_BUCKETS = ('year', 'month', 'day', 'hour', 'minute')
+
+# Rows of partial states gathered before merging them, unless the groups merged so far are more
+MIN_MERGE_ROWS = 256 * 1024
+
+_CALL = re.compile(r'^(\w+)\s*\(\s*([^()]*?)\s*\)$')
+
+
+@dataclass(frozen=True)
+class Aggregate:
+    """An aggregate of a column, or the row count when column is None."""
+
+    function: str
+    column: str | None = None
+
+    @property
+    def name(self) -> str:
+        return f'{self.function}({self.column})' if self.column else self.function
+
+
+@dataclass(frozen=True)
+class GroupKey:
+    """A column rows are grouped by, or the time bucket of a date or timestamp column."""
+
+    column: str
+    bucket: str | None = None
+
+    @property
+    def name(self) -> str:
+        return f'{self.bucket}({self.column})' if self.bucket else self.column
+
+    def evaluate(self, batch: pa.RecordBatch) -> pa.Array:
+        values = batch.column(self.column)
+        return pc.floor_temporal(values, unit=self.bucket) if self.bucket else values
+
+
+def _split(specs: list[str]) -> list[str]:
+    return [part.strip() for spec in specs for part in spec.split(',') if part.strip()]
+
+
+def parse_aggregates(specs: list[str]) -> list[Aggregate]:
+    """Aggregates from specs such as "count", "sum(amount)" or "count_distinct(user_id)", comma-separated or not."""
+    aggregates = []
+    for spec in _split(specs):
+        match = _CALL.match(spec)
+        function, column = (match.group(1), match.group(2)) if match else (spec, None)
+        function = function.lower()
+        if function not in AGGREGATE_FUNCTIONS:
+            raise ValueError(f'Unknown aggregate {spec}, use one of {", ".join(AGGREGATE_FUNCTIONS)}')
+        if column in ('', '*'):
+            column = None
+        if column is None and function != 'count':
+            raise ValueError(f'Aggregate {function} needs a column, e.g. {function}(amount)')
+        aggregates.append(Aggregate(function, column))
+    if not aggregates:
+        raise ValueError('No aggregates given, e.g. --agg count --agg "sum(amount)"')
+    return list(dict.fromkeys(aggregates))
+
+
+def parse_group_keys(specs: list[str]) -> list[GroupKey]:
+    """Group keys from column names, or time buckets such as "day(created_at)"."""
+    keys = []
+    for spec in _split(specs):
+        match = _CALL.match(spec)
+        if not match:
+            keys.append(GroupKey(spec))
+            continue
+        bucket = match.group(1).lower()
+        if bucket not in TIME_BUCKETS:
+            raise ValueError(f'Unknown time bucket {spec}, use one of {", ".join(TIME_BUCKETS)}')
+        keys.append(GroupKey(match.group(2), bucket))
+    return list(dict.fromkeys(keys))
+
+
+def validate_aggregation(group_keys: list[GroupKey], aggregates: list[Aggregate], schema: pa.Schema | None) -> None:
+    """Fail on columns missing from the table schema, or of types their aggregate or bucket can't take."""
+    if schema is None:
+        return
+    columns = [key.column for key in group_keys] + [aggregate.column for aggregate in aggregates if aggregate.column]
+    missing = [column for column in dict.fromkeys(columns) if column not in schema.names]
+    if missing:
+        raise ValueError(f'Column(s) {", ".join(missing)} not found in the table schema')
+    for key in group_keys:
+        column_type = schema.field(key.column).type
+        if pa.types.is_nested(column_type):
+            raise ValueError(f"Can't group by nested column {key.column}")
+        if key.bucket and not pa.types.is_temporal(column_type):
+            raise ValueError(f'{key.name} needs a date or timestamp column, {key.column} is {column_type}')
+    for aggregate in aggregates:
+        if aggregate.column is None:
+            continue
+        column_type = schema.field(aggregate.column).type
+        numeric = pa.types.is_integer(column_type) or pa.types.is_floating(column_type)
+        if aggregate.function in ('sum', 'mean') and not (numeric or pa.types.is_decimal(column_type)):
+            raise ValueError(f'{aggregate.name} needs a numeric column, {aggregate.column} is {column_type}')
+        if pa.types.is_nested(column_type):
+            raise ValueError(f"Can't aggregate nested column {aggregate.column}")
+
+
+@dataclass(frozen=True)
+class _State:
+    """A partial state of a group: a hash aggregate of a column over batches, merged by another one."""
+
+    column: str | None
+    function: str
+    merge: str
+
+    @property
+    def name(self) -> str:
+        return f'{self.column}_{self.function}' if self.column else self.function
+
+
+def _states(aggregate: Aggregate) -> list[_State]:
+    if aggregate.function == 'count':
+        return [_State(aggregate.column, 'count', 'sum') if aggregate.column else _State(None, 'count_all', 'sum')]
+    if aggregate.function == 'mean':
+        return [_State(aggregate.column, 'sum', 'sum'), _State(aggregate.column, 'count', 'sum')]
+    if aggregate.function == 'count_distinct':
+        return []
+    return [_State(aggregate.column, aggregate.function, aggregate.function)]
+
+
+class _Partials:
+    """Partial tables of a group-by, merged once they outgrow the ones merged so far."""
+
+    def __init__(self, keys: list[str], aggregations: list[tuple[str, str]]):
+        self.keys = keys
+        self.aggregations = aggregations
+        self.merged: pa.Table | None = None
+        self.pending: list[pa.Table] = []
+        self.pending_rows = 0
+
+    def add(self, partial: pa.Table) -> None:
+        self.pending.append(partial)
+        self.pending_rows += partial.num_rows
+        if self.pending_rows >= max(MIN_MERGE_ROWS, self.merged.num_rows if self.merged is not None else 0):
+            self.merge()
+
+    def merge(self) -> pa.Table | None:
+        tables = ([self.merged] if self.merged is not None else []) + self.pending
+        if len(tables) > 1:
+            self.merged = _group_by(pa.concat_tables(tables), self.keys, self.aggregations)
+        elif tables:
+            self.merged = tables[0]
+        self.pending, self.pending_rows = [], 0
+        return self.merged
+
+
+def _group_by(table: pa.Table, keys: list[str], aggregations: list[tuple[str, str]]) -> pa.Table:
+    """Group a table, keeping each aggregated column under its own name."""
+    grouped = table.group_by(keys).aggregate([(column, function) for column, function in aggregations])
+    return grouped.select([*keys, *(f'{column}_{function}' for column, function in aggregations)]).rename_columns(
+        [*keys, *(column for column, _ in aggregations)]
+    )
+
+
+def _placeholder(data_type: pa.DataType) -> pa.Scalar:
+    """A value of a type standing in for nulls, which are told apart by a validity flag."""
+    if pa.types.is_string(data_type) or pa.types.is_large_string(data_type):
+        return pa.scalar('', data_type)
+    if pa.types.is_binary(data_type) or pa.types.is_large_binary(data_type):
+        return pa.scalar(b'', data_type)
+    if pa.types.is_boolean(data_type):
+        return pa.scalar(False)
+    if pa.types.is_decimal(data_type):
+        return pa.scalar(Decimal(0), data_type)
+    return pa.array([0], pa.type_for_alias(f'int{data_type.bit_width}')).view(data_type)[0]
+
+
+def _encode(name: str, values: pa.Array) -> dict[str, pa.Array]:
+    """A grouping column as values without nulls and a validity flag.
+
+    pyarrow 16 splits groups of several keys when one of them has nulls, so no key column grouped by has any.
+    """
+    if pa.types.is_null(values.type):
+        return {name: pa.array([0] * len(values), pa.int8()), f'{name}_valid': pa.array([0] * len(values), pa.int8())}
+    return {
+        name: pc.fill_null(values, _placeholder(values.type)),
+        f'{name}_valid': pc.cast(pc.is_valid(values), pa.int8()),
+    }
+
+
+def _decode(table: pa.Table, name: str) -> pa.ChunkedArray:
+    values = table.column(name)
+    return pc.if_else(pc.cast(table.column(f'{name}_valid'), pa.bool_()), values, pa.scalar(None, values.type))
+
+
+def source_columns(group_keys: list[GroupKey], aggregates: list[Aggregate]) -> list[str]:
+    """Columns of the table grouped by and aggregated, the only ones a scan needs to read."""
+    columns = [key.column for key in group_keys] + [aggregate.column for aggregate in aggregates if aggregate.column]
+    return list(dict.fromkeys(columns))
+
+
+class Aggregator:
+    """Group-by aggregates of the batches it's given, merged into states per group as it goes."""
+
+    def __init__(self, group_keys: list[GroupKey], aggregates: list[Aggregate]):
+        self.group_keys = group_keys
+        self.aggregates = aggregates
+        self.keys = [f'group_{index}' for index in range(len(group_keys))]
+        self.key_columns = [column for key in self.keys for column in (key, f'{key}_valid')]
+        self.states = list(dict.fromkeys(state for aggregate in aggregates for state in _states(aggregate)))
+        # Value columns get names of their own, so no column of the table can clash with a key or another state
+        self.values = {
+            column: f'column_{index}'
+            for index, column in enumerate(dict.fromkeys(state.column for state in self.states if state.column))
+        }
+        self.partials = _Partials(self.key_columns, [(state.name, state.merge) for state in self.states])
+        self.distinct = {
+            aggregate.column: _Partials([*self.key_columns, 'value', 'value_valid'], [])
+            for aggregate in aggregates
+            if aggregate.function == 'count_distinct'
+        }
+        self.rows = 0
+
+    def update(self, batch: pa.RecordBatch) -> None:
+        if batch.num_rows == 0:
+            return
+        self.rows += batch.num_rows
+        keys = {}
+        for name, key in zip(self.keys, self.group_keys, strict=True):
+            keys.update(_encode(name, key.evaluate(batch)))
+        columns = {**keys, **{self.values[column]: batch.column(column) for column in self.values}}
+        table = pa.table(columns or {'row': pa.nulls(batch.num_rows)})
+        grouped = table.group_by(self.key_columns).aggregate(
+            [(self.values[state.column] if state.column else [], state.function) for state in self.states]
+        )
+        batch_states = [
+            f'{self.values[state.column]}_{state.function}' if state.column else state.name for state in self.states
+        ]
+        self.partials.add(
+            grouped.select([*self.key_columns, *batch_states]).rename_columns(
+                [*self.key_columns, *(state.name for state in self.states)]
+            )
+        )
+        for column, partials in self.distinct.items():
+            pairs = pa.table({**keys, **_encode('value', batch.column(column))})
+            partials.add(pairs.group_by(partials.keys).aggregate([]))
+
+    def merge(self, other: 'Aggregator') -> None:
+        """Take in the partial states of an aggregator of other batches."""
+        self.rows += other.rows
+        if (merged := other.partials.merge()) is not None:
+            self.partials.add(merged)
+        for column, partials in self.distinct.items():
+            if (merged := other.distinct[column].merge()) is not None:
+                partials.add(merged)
+
+    def result(self, schema: pa.Schema | None = None) -> pa.Table:
+        """The aggregates of every group, ordered by the group keys, nulls last."""
+        merged = self.partials.merge()
+        if merged is None:
+            if self.keys:
+                return pa.table(
+                    {
+                        **{key.name: pa.array([], _key_type(key, schema)) for key in self.group_keys},
+                        **{aggregate.name: pa.array([], pa.null()) for aggregate in self.aggregates},
+                    }
+                )
+            # A table with no rows still has its row count, as SQL's does
+            merged = pa.table(
+                {state.name: pa.array([0 if state.function.startswith('count') else None]) for state in self.states}
+            )
+        sort_keys = [order for key in self.keys for order in ((f'{key}_valid', 'descending'), (key, 'ascending'))]
+        if sort_keys:
+            merged = merged.sort_by(sort_keys)
+        columns = {key.name: _decode(merged, name) for name, key in zip(self.keys, self.group_keys, strict=True)}
+        for aggregate in self.aggregates:
+            columns[aggregate.name] = self._finish(aggregate, merged, sort_keys)
+        return pa.table(columns)
+
+    def _finish(self, aggregate: Aggregate, merged: pa.Table, sort_keys: list[tuple[str, str]]) -> pa.ChunkedArray:
+        if aggregate.function == 'mean':
+            total, count = (merged.column(state.name) for state in _states(aggregate))
+            return pc.divide(pc.cast(total, pa.float64()), pc.cast(count, pa.float64()))
+        if aggregate.function == 'count_distinct':
+            pairs = self.distinct[aggregate.column].merge()
+            if pairs is None:
+                return pa.chunked_array([pa.array([0] * merged.num_rows, pa.int64())])
+            # Every row leaves a pair, null values too, so both tables hold the same groups in the same order
+            counts = pairs.group_by(self.key_columns).aggregate([('value_valid', 'sum')])
+            if sort_keys:
+                counts = counts.sort_by(sort_keys)
+            return counts.column('value_valid_sum')
+        return merged.column(_states(aggregate)[0].name)
+
+
+def _key_type(key: GroupKey, schema: pa.Schema | None) -> pa.DataType:
+    return schema.field(key.column).type if schema is not None else pa.null()
+
+
+def aggregate_scan(scan: TableScan, group_keys: list[GroupKey], aggregates: list[Aggregate], workers: int) -> pa.Table:
+    """Aggregate the rows of a scan, with workers each aggregating the data files they pull."""
+    files = scan.files()
+    lock = threading.Lock()
+
+    def aggregate_files() -> Aggregator:
+        aggregator = Aggregator(group_keys, aggregates)
+        while True:
+            with lock:
+                scan_file = next(files, None)
+            if scan_file is None:
+                return aggregator
+            for batch in scan.file_batches(scan_file):
+                aggregator.update(batch)
+
+    if workers == 1:
+        aggregator = aggregate_files()
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='table-aggregate') as executor:
+            aggregators = [future.result() for future in [executor.submit(aggregate_files) for _ in range(workers)]]
+        aggregator = aggregators[0]
+        for other in aggregators[1:]:
+            aggregator.merge(other)
+    scan.stats.rows_read += aggregator.rows
+    return aggregator.result(scan.arrow_schema)
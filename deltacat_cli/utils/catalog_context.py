@@ -1,12 +1,20 @@
 """Simple catalog context management."""
 
 import json
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 
-from deltacat import Catalog, CatalogProperties, put_catalog
 from deltacat_cli.config import CONFIG_ERROR_MODE, console, err_console
+from deltacat_cli.utils.profiling import profiler
+
+
+if TYPE_CHECKING:
+    from deltacat import Catalog, CatalogProperties
 
 
 class CatalogContext:
@@ -17,6 +25,9 @@ class CatalogContext:
         self._cached_name: str | None = None
         self._cached_root: str | None = None
         self._config_file = Path.home() / '.deltacat_cli_config.json'
+        self._override: tuple[str, str] | None = None
+        # Commands can run concurrently in one process (`run --parallel`), registering the catalog initializes Ray
+        self._lock = threading.Lock()
 
     def set_catalog(self, name: str, root: str) -> tuple[str, list[str]]:
         """Set the current catalog and persist to file. Returns success message and details."""
@@ -35,6 +46,9 @@ class CatalogContext:
 
     def get_catalog_info(self, silent: bool = True) -> tuple[str, str]:
         """Get current catalog name and root, or raise error if not set."""
+        if self._override:
+            return self._override
+
         config = self._load_config()
 
         if not config:
@@ -56,6 +70,16 @@ class CatalogContext:
 
         return name, root
 
+    @contextmanager
+    def scoped(self, name: str, root: str) -> Iterator[None]:
+        """Use a catalog instead of the configured one for the duration of a block, without persisting it."""
+        previous = self._override
+        self._override = (name, root)
+        try:
+            yield
+        finally:
+            self._override = previous
+
     def get_catalog_display_info(self) -> tuple[str, list[str]]:
         """Get catalog info formatted for display. Returns title and details list."""
         name, root = self.get_catalog_info(silent=True)
@@ -67,24 +91,42 @@ class CatalogContext:
         ]
         return title, details
 
-    def get_catalog(self) -> Catalog:
+    def get_catalog(self) -> 'Catalog':
         """Get the current catalog instance (cached)."""
+        # deltacat is imported here rather than at module level to keep CLI startup fast
+        with profiler.phase('import'):
+            from deltacat import Catalog, CatalogProperties, put_catalog
+
         name, root = self.get_catalog_info(silent=True)
 
-        # Return cached if same catalog
-        if self._cached_catalog and self._cached_name == name and self._cached_root == root:
-            return self._cached_catalog
+        with self._lock:
+            # Return cached if same catalog
+            if self._cached_catalog and self._cached_name == name and self._cached_root == root:
+                return self._cached_catalog
+
+            # Try to get from deltacat registry first
+            # Register the catalog when it changes: a process can run many commands, in a run script or in the
+            # serve daemon, and they reuse the catalog cached above
+            with profiler.phase('catalog'):
+                catalog_props = CatalogProperties(root=f'{root}/{name}')
+                self._cached_catalog = Catalog(config=catalog_props)
 
-        # Try to get from deltacat registry first
-        # Always create and register the catalog since each command runs in a new process
-        catalog_props = CatalogProperties(root=f'{root}/{name}')
-        self._cached_catalog = Catalog(config=catalog_props)
+                put_catalog(name, self._cached_catalog)
 
-        put_catalog(name, self._cached_catalog)
+            self._cached_name = name
+            self._cached_root = root
+            return self._cached_catalog
 
-        self._cached_name = name
-        self._cached_root = root
-        return self._cached_catalog
+    def get_catalog_properties(self) -> 'CatalogProperties':
+        """Get the current catalog's properties, enough for metastore reads without registering the catalog."""
+        with profiler.phase('import'):
+            from deltacat import CatalogProperties
+
+        name, root = self.get_catalog_info(silent=True)
+        with self._lock:
+            if self._cached_catalog and self._cached_name == name and self._cached_root == root:
+                return self._cached_catalog.inner
+        return CatalogProperties(root=f'{root}/{name}')
 
     def clear_catalog(self) -> str:
         """Clear the current catalog configuration. Returns success message."""
@@ -117,9 +159,10 @@ class CatalogContext:
     def _load_config(self) -> dict | None:
         """Load configuration from file."""
         try:
-            if self._config_file.exists():
-                with open(self._config_file) as f:
-                    return json.load(f)
+            with profiler.phase('config'):
+                if self._config_file.exists():
+                    with open(self._config_file) as f:
+                        return json.load(f)
         except (OSError, json.JSONDecodeError) as e:
             if CONFIG_ERROR_MODE == 'strict':
                 err_console.print(f'Error: Could not load config from {self._config_file}: {e}', style='bold red')
@@ -0,0 +1,152 @@
+"""Export of every table of a catalog to a directory tree of part files.
+
+The export directory holds one directory per namespace and table:
+
+    <out>/_manifest.json
+    <out>/<namespace>/_namespace.json
+    <out>/<namespace>/<table>/_table.json      table and table version metadata
+    <out>/<namespace>/<table>/_schema.arrow    Arrow schema, IPC serialized
+    <out>/<namespace>/<table>/part-*.parquet   data, as written by table export
+
+The manifest records each table once all of its files are written, so an interrupted export resumes with
+the tables it hadn't finished, after deleting their partial part files.
+"""
+
+import json
+import posixpath
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import pyarrow.fs as pa_fs
+from deltacat.storage import metastore
+
+from deltacat_cli.utils.output import dumps
+from deltacat_cli.utils.output_files import export_scan, prepare_output_dir
+from deltacat_cli.utils.table_scan import TableScan
+
+
+MANIFEST_FILE = '_manifest.json'
+
+
+@dataclass
+class ExportSettings:
+    """Options an export directory was written with, a resumed export must use the same."""
+
+    format: str
+    compression: str
+    row_group_size: int
+    max_bytes: int
+
+
+@dataclass
+class TableExport:
+    """Outcome of exporting one table."""
+
+    namespace: str
+    table: str
+    rows: int = 0
+    bytes: int = 0
+    parts: int = 0
+    seconds: float = 0.0
+
+    @property
+    def key(self) -> str:
+        return f'{self.namespace}/{self.table}'
+
+
+class ExportManifest:
+    """The tables already exported to a directory."""
+
+    def __init__(self, filesystem: pa_fs.FileSystem, directory: str, settings: ExportSettings):
+        self.filesystem = filesystem
+        self.path = posixpath.join(directory, MANIFEST_FILE)
+        self.settings = settings
+        self.tables: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        """Read the tables exported by an earlier run, which must have used the same settings."""
+        if self.filesystem.get_file_info(self.path).type != pa_fs.FileType.File:
+            return
+        with self.filesystem.open_input_stream(self.path) as stream:
+            manifest = json.loads(stream.read())
+        if manifest.get('settings') != asdict(self.settings):
+            raise ValueError(
+                f'{self.path} was written with different settings {manifest.get("settings")}, '
+                'pass --overwrite to export again'
+            )
+        self.tables = manifest.get('tables', {})
+
+    def completed(self, namespace: str, table: str) -> bool:
+        return f'{namespace}/{table}' in self.tables
+
+    def record(self, export: TableExport) -> None:
+        """Mark a table as exported, rewriting the manifest."""
+        with self._lock:
+            self.tables[export.key] = {
+                'rows': export.rows,
+                'bytes': export.bytes,
+                'parts': export.parts,
+                'seconds': round(export.seconds, 3),
+            }
+            manifest = {'settings': asdict(self.settings), 'tables': self.tables}
+            with self.filesystem.open_output_stream(self.path) as stream:
+                stream.write(json.dumps(manifest, indent=2).encode() + b'\n')
+
+
+def write_json(filesystem: pa_fs.FileSystem, path: str, value: Any) -> None:
+    with filesystem.open_output_stream(path) as stream:
+        stream.write(dumps(value).encode() + b'\n')
+
+
+def export_namespace_metadata(filesystem: pa_fs.FileSystem, directory: str, namespace: str, metadata: Any) -> None:
+    """Write a namespace's metadata to its directory."""
+    namespace_dir = posixpath.join(directory, namespace)
+    filesystem.create_dir(namespace_dir, recursive=True)
+    write_json(filesystem, posixpath.join(namespace_dir, '_namespace.json'), metadata)
+
+
+def export_catalog_table(
+    inner: Any,
+    filesystem: pa_fs.FileSystem,
+    directory: str,
+    namespace: str,
+    table: str,
+    settings: ExportSettings,
+    workers: int = 1,
+) -> TableExport:
+    """Export the metadata and data of a table to <directory>/<namespace>/<table>, replacing partial parts."""
+    start = time.perf_counter()
+    table_dir = posixpath.join(directory, namespace, table)
+    prepare_output_dir(filesystem, table_dir, overwrite=True)
+
+    scan = TableScan(namespace=namespace, table=table, inner=inner)
+    write_json(
+        filesystem,
+        posixpath.join(table_dir, '_table.json'),
+        {'table': metastore.get_table(namespace, table, inner=inner), 'tableVersion': scan.table_version},
+    )
+    if scan.arrow_schema is not None:
+        with filesystem.open_output_stream(posixpath.join(table_dir, '_schema.arrow')) as stream:
+            stream.write(scan.arrow_schema.serialize())
+
+    progress = export_scan(
+        scan,
+        filesystem,
+        table_dir,
+        settings.format,
+        settings.compression,
+        settings.row_group_size,
+        settings.max_bytes,
+        workers,
+    )
+    return TableExport(
+        namespace=namespace,
+        table=table,
+        rows=progress.rows,
+        bytes=progress.bytes,
+        parts=progress.parts,
+        seconds=time.perf_counter() - start,
+    )
@@ -0,0 +1,217 @@
+"""Incremental scans of the deltas committed after a high-water mark.
+
+Ordered deltas (APPEND, UPSERT, DELETE) get increasing stream positions per partition, so the deltas after a
+position are found by comparing positions alone. ADD deltas are unordered, their stream positions are random,
+and are only selected by commit time. A delta's commit time is the end time of the transaction that created
+it, read from the transaction log, so a delta whose transaction started before a mark but finished after it is
+not missed. Commit times are only looked up for the deltas that need one, and for ordered deltas with a binary
+search, since their commit times increase with their positions.
+"""
+
+import json
+import posixpath
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import pyarrow.fs as pa_fs
+from deltacat.constants import REVISION_DIR_NAME, SUCCESS_TXN_DIR_NAME, TXN_DIR_NAME
+from deltacat.storage import CommitState, Delta, DeltaType, Partition, metastore
+from deltacat.storage.model.metafile import MetafileRevisionInfo
+from deltacat.storage.model.transaction import Transaction
+
+from deltacat_cli.config import console
+from deltacat_cli.utils.formatting import format_timestamp
+from deltacat_cli.utils.table_scan import TableScan
+
+
+READ_DELTA_TYPES = frozenset({DeltaType.ADD, DeltaType.APPEND})
+
+
+@dataclass
+class HighWaterMark:
+    """Where the next incremental read continues from."""
+
+    # Last ordered stream position per partition id
+    positions: dict[str, int] = field(default_factory=dict)
+    # Commit time of the latest delta read, in nanoseconds since the epoch
+    commit_time: int | None = None
+
+    @property
+    def position(self) -> int | None:
+        """The stream position to pass to --since-position, exact for unpartitioned tables."""
+        return max(self.positions.values(), default=None)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {'positions': self.positions, 'commitTime': self.commit_time}
+
+    @staticmethod
+    def load(path: Path) -> 'HighWaterMark | None':
+        """The mark saved in a state file, None if there is none yet."""
+        if not path.exists():
+            return None
+        try:
+            state = json.loads(path.read_text())
+            return HighWaterMark(
+                positions={key: int(value) for key, value in state['positions'].items()},
+                commit_time=state['commitTime'],
+            )
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f'Invalid state file {path}: {e}') from e
+
+    def save(self, path: Path) -> None:
+        # Write then rename, so an interrupted save keeps the previous mark
+        temp_path = path.with_name(path.name + '.tmp')
+        temp_path.write_text(json.dumps(self.to_dict(), indent=2) + '\n')
+        temp_path.replace(path)
+
+
+@dataclass
+class DeltaChange:
+    """A delta selected by a change scan, with its commit time in nanoseconds since the epoch."""
+
+    delta: Delta
+    commit_time: int
+
+
+class ChangeScan(TableScan):
+    """Scan of the deltas committed after a stream position, a commit time or a saved mark, in commit order.
+
+    A partition's ordered deltas are selected by the position saved for it in `since`, else by `since_position`,
+    else by `since_time`. ADD deltas are selected by `since_time`, or the time of `since`, and skipped when
+    only a position is given. Without any of them, every delta is selected.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        since_position: int | None = None,
+        since_time: int | None = None,
+        since: HighWaterMark | None = None,
+        delta_types: frozenset[DeltaType] = READ_DELTA_TYPES,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.since_position = since_position
+        self.since = since or HighWaterMark()
+        self.since_time = since_time if since_time is not None else self.since.commit_time
+        self.delta_types = delta_types
+        self.mark = HighWaterMark(positions=dict(self.since.positions), commit_time=self.since_time)
+        self.unordered_skipped = 0
+        self._changes: list[DeltaChange] | None = None
+        self._success_txn_log_dir = posixpath.join(self.inner.root, TXN_DIR_NAME, SUCCESS_TXN_DIR_NAME)
+
+    def deltas(self) -> Iterator[Delta]:
+        """The selected deltas, in commit order."""
+        for change in self.changes():
+            yield change.delta
+
+    def changes(self) -> list[DeltaChange]:
+        """The selected deltas with their commit times, in commit order. Advances `mark` past them."""
+        if self._changes is None:
+            partitions = metastore.list_partitions(
+                self.namespace, self.table, table_version=self.table_version.table_version, inner=self.inner
+            ).all_items()
+            changes = [
+                change
+                for partition in partitions
+                if partition.state == CommitState.COMMITTED
+                for change in self._partition_changes(partition)
+            ]
+            changes.sort(key=lambda change: (change.commit_time, change.delta.stream_position))
+            for change in changes:
+                if change.delta.type not in self.delta_types:
+                    raise ValueError(
+                        f'Table {self.namespace}.{self.table} has {change.delta.type.value} deltas that need '
+                        'compaction before they can be read, use table changes to read them as changes'
+                    )
+            if changes:
+                self.mark.commit_time = max(changes[-1].commit_time, self.mark.commit_time or 0)
+            self._changes = changes
+        return self._changes
+
+    def _partition_changes(self, partition: Partition) -> list[DeltaChange]:
+        partition_id = partition.locator.partition_id
+        position = self.since.positions.get(partition_id, self.since_position)
+        deltas = metastore.list_partition_deltas(
+            partition,
+            first_stream_position=position + 1 if position is not None else None,
+            ascending_order=True,
+            include_manifest=True,
+            inner=self.inner,
+        ).all_items()
+        ordered = [delta for delta in deltas if delta.type != DeltaType.ADD]
+        unordered = [delta for delta in deltas if delta.type == DeltaType.ADD]
+        if ordered or partition.stream_position:
+            self.mark.positions[partition_id] = max(
+                [delta.stream_position for delta in ordered] + [partition.stream_position or 0, position or 0]
+            )
+        if not deltas:
+            return []
+
+        commit_time = self._commit_time_lookup(deltas[0])
+        if position is None and self.since_time is not None:
+            # Ordered deltas commit one after another, so their commit times increase with their positions
+            low, high = 0, len(ordered)
+            while low < high:
+                middle = (low + high) // 2
+                if commit_time(ordered[middle]) > self.since_time:
+                    high = middle
+                else:
+                    low = middle + 1
+            ordered = ordered[low:]
+        if self.since_time is not None:
+            unordered = [delta for delta in unordered if commit_time(delta) > self.since_time]
+        elif position is not None:
+            self.unordered_skipped += len(unordered)
+            unordered = []
+        return [DeltaChange(delta=delta, commit_time=commit_time(delta)) for delta in ordered + unordered]
+
+    def _commit_time_lookup(self, delta: Delta) -> Callable[[Delta], int]:
+        """Commit time lookup, cached per delta, for the deltas of the partition of `delta`."""
+        filesystem = self.inner.filesystem
+        # Deltas are stored as <partition root>/<delta id>/rev/.../<revision>_<operation>_<transaction id>.<ext>
+        partition_root = delta.parent_root_path(catalog_root=self.inner.root, filesystem=filesystem)
+        cache: dict[int, int] = {}
+
+        def commit_time(delta: Delta) -> int:
+            if delta.stream_position not in cache:
+                revision_dir = posixpath.join(partition_root, str(delta.id), REVISION_DIR_NAME)
+                revisions = [
+                    MetafileRevisionInfo.parse(info.path)
+                    for info in filesystem.get_file_info(pa_fs.FileSelector(revision_dir, recursive=True))
+                    if info.type == pa_fs.FileType.File
+                ]
+                if not revisions:
+                    raise ValueError(f'No revisions found for delta {delta.stream_position} in {revision_dir}')
+                txn_id = min(revisions, key=lambda revision: revision.revision).txn_id
+                end_time = Transaction.read_end_time(
+                    Transaction.success_txn_log_dir_path(self._success_txn_log_dir, txn_id), filesystem
+                )
+                # Transaction ids start with the transaction's start time, close enough if the log was pruned
+                cache[delta.stream_position] = end_time if end_time is not None else int(txn_id.split('_', 1)[0])
+            return cache[delta.stream_position]
+
+        return commit_time
+
+
+def print_high_water_mark(scan: ChangeScan, state_file: Path | None = None) -> None:
+    """Print where the next incremental read continues from, saving it to `state_file` if given."""
+    mark = scan.mark
+    if scan.unordered_skipped:
+        console.print(
+            f'{scan.unordered_skipped} ADD delta(s) have no stream order and were skipped, '
+            'use --since-time or --state-file to read them',
+            style='yellow',
+        )
+    options = []
+    if mark.position is not None:
+        options.append(f'--since-position {mark.position}')
+    if mark.commit_time is not None:
+        options.append(f'--since-time {format_timestamp(mark.commit_time)}')
+    if state_file is not None:
+        mark.save(state_file)
+        console.print(f'High-water mark saved to {state_file}', style='dim')
+    elif options:
+        console.print(f'High-water mark, continue with: {" or ".join(options)}', style='dim')
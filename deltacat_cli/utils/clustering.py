@@ -0,0 +1,91 @@
+"""Sort keys and clustering of table data, so data file statistics are selective for filters on those columns.
+
+deltacat's own sort schemes can't be written with write_to_table nor changed by alter_table yet, so a table's
+sort keys and clustering mode are kept in its table version properties and applied by the CLI's write paths:
+
+- linear: rows sorted by the sort keys in order, which makes files selective on the first key, less so on others
+- zorder: rows sorted by the Z-order (Morton) value of the keys, interleaving the bits of each key's rank, so
+  files are selective on every key, at the cost of some selectivity on the first one
+"""
+
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+
+SORT_KEYS_PROPERTY = 'sort_keys'
+CLUSTERING_PROPERTY = 'clustering'
+
+CLUSTERING_MODES = ('linear', 'zorder')
+
+# Bits of a Z-order value, shared by the keys
+ZORDER_BITS = 64
+MAX_KEY_BITS = 32
+
+
+def parse_columns(columns: str | None) -> list[str]:
+    """Column names from a comma-separated list."""
+    return [key.strip() for key in columns.split(',') if key.strip()] if columns else []
+
+
+def validate_clustering(
+    sort_keys: list[str], clustering: str | None, columns: list[str] | None = None, merge_keys: list[str] | None = None
+) -> None:
+    """Fail on an unknown clustering mode, or on sort keys missing from `columns` if the columns are known.
+
+    Tables with merge keys can't have sort keys: a merge keeps the last of duplicate keys, so reordering rows
+    would change which one is kept.
+    """
+    if sort_keys and merge_keys:
+        raise ValueError('Sort keys are only supported for tables without merge keys')
+    if clustering is not None and clustering not in CLUSTERING_MODES:
+        raise ValueError(f'Unknown clustering {clustering}, expected one of {", ".join(CLUSTERING_MODES)}')
+    if clustering == 'zorder' and len(sort_keys) < 2:
+        raise ValueError('Z-order clustering needs at least two sort keys, use linear clustering for one')
+    if columns is not None:
+        missing = [key for key in sort_keys if key not in columns]
+        if missing:
+            raise ValueError(f'Sort key(s) {", ".join(missing)} not found in the table schema')
+
+
+def clustering_properties(sort_keys: list[str], clustering: str | None) -> dict[str, Any]:
+    """Table properties declaring sort keys and a clustering mode, linear unless given."""
+    return {SORT_KEYS_PROPERTY: sort_keys, CLUSTERING_PROPERTY: clustering or 'linear'}
+
+
+def table_clustering(table_version: Any) -> tuple[list[str], str]:
+    """Sort keys and clustering mode of a table version, no keys if it has none."""
+    properties = table_version.properties or {}
+    return list(properties.get(SORT_KEYS_PROPERTY) or []), properties.get(CLUSTERING_PROPERTY) or 'linear'
+
+
+def zorder_values(table: pa.Table, sort_keys: list[str]) -> np.ndarray:
+    """Z-order value of each row: the interleaved bits of each key's dense rank, scaled to the bits of a key.
+
+    Ranks make every sortable type comparable, strings included, and spread the values of each key evenly over
+    its bits whatever their distribution. Nulls rank last.
+    """
+    bits = min(MAX_KEY_BITS, ZORDER_BITS // len(sort_keys))
+    scaled = []
+    for key in sort_keys:
+        column = table.column(key)
+        ranks = pc.rank(column, sort_keys='ascending', null_placement='at_end', tiebreaker='dense')
+        ranks = ranks.to_numpy().astype(np.float64) - 1
+        distinct = ranks.max() + 1 if len(ranks) else 1
+        scaled.append(np.floor(ranks / distinct * (1 << bits)).astype(np.uint64))
+    values = np.zeros(table.num_rows, dtype=np.uint64)
+    for bit in range(bits - 1, -1, -1):
+        for key_values in scaled:
+            values = (values << np.uint64(1)) | ((key_values >> np.uint64(bit)) & np.uint64(1))
+    return values
+
+
+def cluster_table(table: pa.Table, sort_keys: list[str], clustering: str = 'linear') -> pa.Table:
+    """Rows of `table` ordered by the sort keys, linearly or in Z-order. Without sort keys, the table as is."""
+    if not sort_keys or table.num_rows < 2:
+        return table
+    if clustering == 'zorder':
+        return table.take(pa.array(np.argsort(zorder_values(table, sort_keys), kind='stable')))
+    return table.sort_by([(key, 'ascending') for key in sort_keys])
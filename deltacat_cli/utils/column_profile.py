@@ -0,0 +1,320 @@
+"""Exact column profiles of a table, computed over streamed record batches.
+
+Each record batch is profiled with vectorized pyarrow and NumPy kernels and folded into state of bounded size
+per column, so a profile streams a table in constant memory: null counts, min and max, a HyperLogLog of the
+distinct values, the most frequent values, and histograms of numeric values and of string lengths.
+
+Histograms are built in one pass, without knowing the range of a column up front: bins are a power of two wide
+and aligned to multiples of their width, and once the values seen no longer fit in the number of bins, the
+width doubles and neighbouring bins merge. Counts stay exact, and the bins span at least half of the range of
+the values.
+
+Frequent values are counted with a Misra-Gries summary of FREQUENT_COUNTERS values: while a column has fewer
+distinct values than that, counts are exact; otherwise each count is short by at most rows / FREQUENT_COUNTERS
+and values more frequent than that are always kept.
+"""
+
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from deltacat_cli.utils.sketches import HyperLogLog, hash_columns
+from deltacat_cli.utils.table_scan import TableScan
+
+
+DEFAULT_TOP_K = 5
+DEFAULT_BINS = 10
+FREQUENT_COUNTERS = 4096
+DISTINCT_PRECISION = 12
+
+
+class Histogram:
+    """Counts of values in equal-width bins, widened as values outside of them arrive."""
+
+    def __init__(self, bins: int = DEFAULT_BINS, integer: bool = False):
+        self.bins = bins
+        self.integer = integer
+        self.width: int | float | None = None
+        self.start = 0
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    def _initial_width(self, low: float, high: float) -> int | float:
+        span = (high - low) or abs(low) or 1
+        width = 2.0 ** math.ceil(math.log2(span / self.bins))
+        return max(1, int(width)) if self.integer else width
+
+    def _coarsen(self) -> None:
+        """Double the width of the bins, merging them in pairs."""
+        if self.start % 2:
+            self.counts = np.concatenate([np.zeros(1, dtype=np.int64), self.counts])
+            self.start -= 1
+        if len(self.counts) % 2:
+            self.counts = np.append(self.counts, 0)
+        self.counts = self.counts.reshape(-1, 2).sum(axis=1)
+        self.start //= 2
+        self.width *= 2
+
+    def _cover(self, low: float, high: float) -> None:
+        """Widen the bins until low to high fits in them along with the values counted so far."""
+        while True:
+            first, last = math.floor(low // self.width), math.floor(high // self.width)
+            if len(self.counts):
+                first, last = min(first, self.start), max(last, self.start + len(self.counts) - 1)
+            if last - first < self.bins:
+                break
+            self._coarsen()
+        before = self.start - first if len(self.counts) else 0
+        self.counts = np.pad(self.counts, (before, last - first + 1 - before - len(self.counts)))
+        self.start = first
+
+    def update(self, values: np.ndarray) -> None:
+        if not self.integer:
+            values = values[np.isfinite(values)]
+        if not len(values):
+            return
+        low, high = values.min().item(), values.max().item()
+        if self.width is None:
+            self.width = self._initial_width(low, high)
+        self._cover(low, high)
+        slots = np.floor_divide(values, self.width).astype(np.int64) - self.start
+        # Integers beyond 2**53 may round into a neighbouring bin as floats
+        np.clip(slots, 0, len(self.counts) - 1, out=slots)
+        self.counts += np.bincount(slots, minlength=len(self.counts))
+
+    def merge(self, other: 'Histogram') -> None:
+        if other.width is None:
+            return
+        if self.width is None:
+            self.width, self.start, self.counts = other.width, other.start, other.counts.copy()
+            return
+        while self.width < other.width:
+            self._coarsen()
+        self._cover(other.start * other.width, (other.start + len(other.counts) - 1) * other.width)
+        source = Histogram(other.bins, other.integer)
+        source.width, source.start, source.counts = other.width, other.start, other.counts.copy()
+        while source.width < self.width:
+            source._coarsen()
+        offset = source.start - self.start
+        self.counts[offset : offset + len(source.counts)] += source.counts
+
+    def to_list(self) -> list[dict[str, Any]]:
+        """Bins as lower bound (inclusive), upper bound (exclusive) and count."""
+        return [
+            {'lower': (self.start + index) * self.width, 'upper': (self.start + index + 1) * self.width, 'count': count}
+            for index, count in enumerate(self.counts.tolist())
+        ]
+
+
+class FrequentValues:
+    """Most frequent values of a column, counted with a Misra-Gries summary."""
+
+    def __init__(self, counters: int = FREQUENT_COUNTERS):
+        self.counters = counters
+        self.counts: pa.Table | None = None
+        self.pending: list[pa.Table] = []
+        self.pending_rows = 0
+        # Whether every value was counted, so counts are exact
+        self.exact = True
+
+    def update(self, values: pa.Array) -> None:
+        counts = pc.value_counts(values.drop_null())
+        if not len(counts):
+            return
+        self.pending.append(pa.table({'value': counts.field('values'), 'count': counts.field('counts')}))
+        self.pending_rows += len(counts)
+        if self.pending_rows >= self.counters:
+            self._reduce()
+
+    def _reduce(self) -> None:
+        tables = ([self.counts] if self.counts is not None else []) + self.pending
+        self.pending, self.pending_rows = [], 0
+        if not tables:
+            return
+        summed = pa.concat_tables(tables).group_by('value').aggregate([('count', 'sum')])
+        table = pa.table({'value': summed.column('value'), 'count': summed.column('count_sum')})
+        if table.num_rows > self.counters:
+            # Take the count of the first value that doesn't fit off every count, dropping those left at zero
+            table = table.sort_by([('count', 'descending')])
+            threshold = table.column('count')[self.counters].as_py()
+            table = table.slice(0, self.counters)
+            table = table.set_column(1, 'count', pc.subtract(table.column('count'), threshold))
+            table = table.filter(pc.greater(table.column('count'), 0))
+            self.exact = False
+        self.counts = table
+
+    def merge(self, other: 'FrequentValues') -> None:
+        self.pending += ([other.counts] if other.counts is not None else []) + other.pending
+        self.exact = self.exact and other.exact
+        self._reduce()
+
+    def top(self, k: int) -> list[dict[str, Any]]:
+        self._reduce()
+        if self.counts is None:
+            return []
+        table = self.counts.sort_by([('count', 'descending'), ('value', 'ascending')]).slice(0, k)
+        return table.to_pylist()
+
+
+def _numbers(values: pa.Array, integer: bool) -> np.ndarray:
+    values = values.drop_null()
+    if integer:
+        return values.to_numpy(zero_copy_only=False).astype(np.int64, copy=False)
+    # Integers above 2**53 round to the nearest float, a safe cast would refuse them
+    return values.cast(pa.float64(), safe=False).to_numpy(zero_copy_only=False)
+
+
+def _is_string(data_type: pa.DataType) -> bool:
+    return pa.types.is_string(data_type) or pa.types.is_large_string(data_type)
+
+
+def _lengths(values: pa.Array) -> pa.Array:
+    """Lengths of the non-null values of a string or binary column, in characters or bytes."""
+    values = values.drop_null()
+    return pc.utf8_length(values) if _is_string(values.type) else pc.binary_length(values)
+
+
+class ColumnProfile:
+    """Profile of a column: nulls, min and max, distinct and frequent values, and a histogram where it has one."""
+
+    def __init__(self, data_type: pa.DataType, top_k: int = DEFAULT_TOP_K, bins: int = DEFAULT_BINS):
+        self.type = data_type
+        self.top_k = top_k
+        self.rows = 0
+        self.null_count = 0
+        self.min: Any = None
+        self.max: Any = None
+        # Nested columns only get their nulls counted
+        self.nested = pa.types.is_nested(data_type)
+        self.distinct = HyperLogLog(DISTINCT_PRECISION)
+        self.frequent = FrequentValues() if not self.nested else None
+        # 64-bit unsigned integers don't fit NumPy's int64, they're binned as floats
+        numeric = pa.types.is_integer(data_type) or pa.types.is_floating(data_type) or pa.types.is_decimal(data_type)
+        integer = pa.types.is_integer(data_type) and data_type != pa.uint64()
+        self.histogram = Histogram(bins, integer) if numeric else None
+        binary = pa.types.is_binary(data_type) or pa.types.is_large_binary(data_type)
+        self.lengths = Histogram(bins, integer=True) if _is_string(data_type) or binary else None
+        self.length_total = 0
+        self.length_min: int | None = None
+        self.length_max: int | None = None
+
+    def update(self, values: pa.Array | pa.ChunkedArray) -> None:
+        if isinstance(values, pa.ChunkedArray):
+            values = values.combine_chunks()
+        self.rows += len(values)
+        self.null_count += values.null_count
+        if self.nested or values.null_count == len(values):
+            return
+        bounds = pc.min_max(values)
+        self._bounds(bounds['min'].as_py(), bounds['max'].as_py())
+        self.distinct.update_hashes(hash_columns(pa.table({'value': values.drop_null()})))
+        self.frequent.update(values)
+        if self.histogram is not None:
+            self.histogram.update(_numbers(values, self.histogram.integer))
+        if self.lengths is not None:
+            lengths = _lengths(values)
+            length_bounds = pc.min_max(lengths)
+            self.length_total += pc.sum(lengths).as_py()
+            self._length_bounds(length_bounds['min'].as_py(), length_bounds['max'].as_py())
+            self.lengths.update(lengths.to_numpy(zero_copy_only=False).astype(np.int64, copy=False))
+
+    def _bounds(self, low: Any, high: Any) -> None:
+        if low is None:
+            return
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+
+    def _length_bounds(self, low: int | None, high: int | None) -> None:
+        if low is None:
+            return
+        self.length_min = low if self.length_min is None else min(self.length_min, low)
+        self.length_max = high if self.length_max is None else max(self.length_max, high)
+
+    def merge(self, other: 'ColumnProfile') -> None:
+        self.rows += other.rows
+        self.null_count += other.null_count
+        self._bounds(other.min, other.max)
+        self.distinct.merge(other.distinct)
+        if self.frequent is not None and other.frequent is not None:
+            self.frequent.merge(other.frequent)
+        if self.histogram is not None and other.histogram is not None:
+            self.histogram.merge(other.histogram)
+        if self.lengths is not None and other.lengths is not None:
+            self.lengths.merge(other.lengths)
+            self.length_total += other.length_total
+            self._length_bounds(other.length_min, other.length_max)
+
+    @property
+    def unique(self) -> bool | None:
+        """Whether the values profiled are all distinct and none null, as merge keys must be.
+
+        None when it can't be told: for nested columns, or once the frequent values were not all counted.
+        """
+        if self.null_count:
+            return False
+        if self.frequent is None:
+            return None
+        top = self.frequent.top(1)
+        if top and top[0]['count'] > 1:
+            return False
+        return True if self.frequent.exact else None
+
+    def to_dict(self, name: str) -> dict[str, Any]:
+        values = self.rows - self.null_count
+        record: dict[str, Any] = {
+            'column': name,
+            'type': str(self.type),
+            'rows': self.rows,
+            'null_count': self.null_count,
+            'null_ratio': self.null_count / self.rows if self.rows else 0.0,
+            'distinct': min(self.distinct.estimate(), values),
+            'unique': self.unique,
+            'min': self.min,
+            'max': self.max,
+            'top_values': self.frequent.top(self.top_k) if self.frequent is not None else [],
+            'top_values_exact': self.frequent.exact if self.frequent is not None else True,
+            'histogram': self.histogram.to_list() if self.histogram is not None else None,
+            'length': None,
+        }
+        if self.lengths is not None:
+            record['length'] = {
+                'min': self.length_min,
+                'mean': self.length_total / values if values else None,
+                'max': self.length_max,
+                'histogram': self.lengths.to_list(),
+            }
+        return record
+
+
+def profile_scan(scan: TableScan, top_k: int, bins: int, workers: int) -> dict[str, ColumnProfile]:
+    """Profile the columns of a scan, with workers each profiling the data files they pull."""
+    schema = scan.output_schema
+    files = scan.files()
+    lock = threading.Lock()
+
+    def profile_files() -> dict[str, ColumnProfile]:
+        profiles = {field.name: ColumnProfile(field.type, top_k, bins) for field in schema}
+        while True:
+            with lock:
+                scan_file = next(files, None)
+            if scan_file is None:
+                return profiles
+            for batch in scan.file_batches(scan_file):
+                for name, profile in profiles.items():
+                    profile.update(batch.column(name))
+
+    if workers == 1:
+        profiles = profile_files()
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='table-profile') as executor:
+            results = [future.result() for future in [executor.submit(profile_files) for _ in range(workers)]]
+        profiles = results[0]
+        for other in results[1:]:
+            for name, profile in profiles.items():
+                profile.merge(other[name])
+    scan.stats.rows_read += next(iter(profiles.values())).rows if profiles else 0
+    return profiles
@@ -0,0 +1,160 @@
+"""Compaction status and on-demand compaction of table partitions.
+
+deltacat compacts a partition after a write when the table's read optimization level is MAX and either an
+UPSERT or DELETE delta was written, or the deltas appended since the last compaction reach one of the
+appended delta, file or record count triggers. Counts here follow the same rules, so the status shows how far
+each partition is from its next automatic compaction.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+from deltacat import TableProperty, TableReadOptimizationLevel
+from deltacat.storage import CommitState, DeltaType, Partition, SortKey, TableVersion, metastore
+from deltacat.storage.model.delta import MAX_DELTA_STREAM_POSITION
+from deltacat.types.media import ContentType
+
+from deltacat_cli.utils.clustering import table_clustering
+
+
+# In-place compaction commits the compacted delta at stream position 1, later deltas are not compacted yet
+FIRST_UNCOMPACTED_POSITION = 2
+
+
+@dataclass
+class CompactionStatus:
+    """Deltas of a partition not compacted yet, against the table's compaction triggers."""
+
+    partition: Partition
+    deltas: int = 0
+    files: int = 0
+    records: int = 0
+    # UPSERT and DELETE deltas can't be read until they are compacted
+    merge_deltas: int = 0
+    delta_trigger: int | None = None
+    file_trigger: int | None = None
+    record_trigger: int | None = None
+    hash_bucket_count: int | None = None
+    compacted: bool = False
+
+    @property
+    def partition_values(self) -> list[Any] | None:
+        return self.partition.partition_values
+
+    @property
+    def due(self) -> bool:
+        """Whether the next write would compact the partition, given a MAX read optimization level."""
+        return bool(
+            self.merge_deltas
+            or (self.delta_trigger and self.deltas >= self.delta_trigger)
+            or (self.file_trigger and self.files >= self.file_trigger)
+            or (self.record_trigger and self.records >= self.record_trigger)
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'partition_id': self.partition.partition_id,
+            'partition_values': self.partition_values,
+            'compacted': self.compacted,
+            'hash_bucket_count': self.hash_bucket_count,
+            'deltas': self.deltas,
+            'delta_trigger': self.delta_trigger,
+            'files': self.files,
+            'file_trigger': self.file_trigger,
+            'records': self.records,
+            'record_trigger': self.record_trigger,
+            'merge_deltas': self.merge_deltas,
+            'due': self.due,
+        }
+
+
+def auto_compaction_enabled(table_version: TableVersion) -> bool:
+    """Whether deltacat compacts the table automatically after writes."""
+    level = table_version.read_table_property(TableProperty.READ_OPTIMIZATION_LEVEL)
+    return level == TableReadOptimizationLevel.MAX
+
+
+def default_hash_bucket_count(partition: Partition, table_version: TableVersion) -> int:
+    """Hash buckets of the partition's last compaction, else the table's default."""
+    round_completion_info = partition.compaction_round_completion_info
+    if round_completion_info and round_completion_info.hash_bucket_count:
+        return round_completion_info.hash_bucket_count
+    return table_version.read_table_property(TableProperty.DEFAULT_COMPACTION_HASH_BUCKET_COUNT)
+
+
+def compaction_status(inner: Any, namespace: str, table_version: TableVersion) -> list[CompactionStatus]:
+    """Status of every committed partition of a table version, read from delta metadata."""
+    table = table_version.locator.table_name
+    statuses = []
+    partitions = metastore.list_partitions(
+        namespace, table, table_version=table_version.table_version, inner=inner
+    ).all_items()
+    for partition in partitions:
+        if partition.state != CommitState.COMMITTED:
+            continue
+        status = CompactionStatus(
+            partition=partition,
+            delta_trigger=table_version.read_table_property(TableProperty.APPENDED_DELTA_COUNT_COMPACTION_TRIGGER),
+            file_trigger=table_version.read_table_property(TableProperty.APPENDED_FILE_COUNT_COMPACTION_TRIGGER),
+            record_trigger=table_version.read_table_property(TableProperty.APPENDED_RECORD_COUNT_COMPACTION_TRIGGER),
+            hash_bucket_count=default_hash_bucket_count(partition, table_version),
+            compacted=partition.compaction_round_completion_info is not None,
+        )
+        deltas = metastore.list_partition_deltas(
+            partition, first_stream_position=FIRST_UNCOMPACTED_POSITION, include_manifest=True, inner=inner
+        ).all_items()
+        for delta in deltas:
+            status.deltas += 1
+            status.files += len(delta.manifest.entries or []) if delta.manifest else 0
+            status.records += (delta.meta.record_count or 0) if delta.meta else 0
+            if delta.type in (DeltaType.UPSERT, DeltaType.DELETE):
+                status.merge_deltas += 1
+        statuses.append(status)
+    return statuses
+
+
+def compact_partition(
+    inner: Any,
+    table_version: TableVersion,
+    partition: Partition,
+    hash_bucket_count: int | None = None,
+    workers: int | None = None,
+) -> None:
+    """Compact a partition in place with deltacat's compactor, as an automatic compaction would.
+
+    `hash_bucket_count` overrides the partition's previous or the table's default bucket count, and `workers`
+    caps the number of concurrent compaction tasks.
+    """
+    # Imported here: the compactor pulls in Ray, which only compaction needs
+    from deltacat.compute.compactor.model.compact_partition_params import CompactPartitionParams
+    from deltacat.compute.compactor_v2.compaction_session import compact_partition as compact
+
+    schema = table_version.schema
+    if schema is None:
+        raise ValueError('Compaction needs a table schema')
+    params = {
+        'catalog': inner,
+        'source_partition_locator': partition.locator,
+        'destination_partition_locator': partition.locator,
+        'primary_keys': set(schema.merge_keys or []),
+        'last_stream_position_to_compact': MAX_DELTA_STREAM_POSITION,
+        'deltacat_storage': metastore,
+        'deltacat_storage_kwargs': {},
+        'list_deltas_kwargs': {},
+        'table_writer_kwargs': {'schema': schema, 'sort_scheme_id': table_version.sort_scheme.id},
+        'hash_bucket_count': hash_bucket_count or default_hash_bucket_count(partition, table_version),
+        'records_per_compacted_file': table_version.read_table_property(TableProperty.RECORDS_PER_COMPACTED_FILE),
+        'compacted_file_content_type': ContentType.PARQUET,
+        'drop_duplicates': True,
+        'sort_keys': schema.merge_order_sort_keys(),
+        'original_fields': set(schema.arrow.names),
+        'all_column_names': schema.arrow.names,
+    }
+    sort_keys, clustering = table_clustering(table_version)
+    # The compactor keeps the last of duplicate keys in sort order, so only tables without merge keys are sorted,
+    # and only linearly
+    if sort_keys and clustering == 'linear' and not schema.merge_keys:
+        params['sort_keys'] = [SortKey.of([key]) for key in sort_keys]
+    if workers:
+        params['task_max_parallelism'] = workers
+    compact(params=CompactPartitionParams.of(params))
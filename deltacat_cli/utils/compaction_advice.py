@@ -0,0 +1,239 @@
+"""Compaction settings recommended from a table's metadata and a sample of its merge keys.
+
+Sizes and row counts come from delta manifests. The number of distinct merge keys, which decides how many rows
+compaction keeps, is merged from the merge key sketches of every delta when the table has them (see
+delta_sketches), or estimated with a HyperLogLog over the merge key columns of a sample of data files.
+From those:
+
+- records per compacted file: rows of the average on-disk width that fill the target file size
+- hash buckets: enough buckets for each one to compact into about one file of that size
+- appended file trigger: compact once appended files outnumber the compacted files twice over, which bounds
+  the extra files a read opens between compactions
+- appended delta trigger: the appended file trigger in deltas, at the table's average files per delta
+
+The record count trigger follows from the first two, as `TableProperties.of` derives it.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Any
+
+from deltacat import TableProperty
+from deltacat.storage import Delta, DeltaType, TableVersion
+
+from deltacat_cli.utils.delta_sketches import DeltaSketches
+from deltacat_cli.utils.sketches import HyperLogLog
+from deltacat_cli.utils.table_scan import ScanFile, TableScan
+from deltacat_cli.utils.table_stats import committed_deltas
+from deltacat_cli.utils.table_utils import merge_key_names
+
+
+DEFAULT_TARGET_FILE_BYTES = 256 * 1024 * 1024
+DEFAULT_SAMPLE_FILES = 32
+
+MIN_RECORDS_PER_FILE = 10_000
+MAX_RECORDS_PER_FILE = 100_000_000
+FILE_TRIGGER_RANGE = (10, 1000)
+DELTA_TRIGGER_RANGE = (10, 100)
+
+
+@dataclass
+class Recommendation:
+    """A recommended value of a table property, as the alter command option names it."""
+
+    option: str
+    current: Any
+    recommended: int
+    reason: str
+
+    @property
+    def changed(self) -> bool:
+        return self.current != self.recommended
+
+
+@dataclass
+class CompactionAdvice:
+    """What was measured of a table, and the settings recommended from it."""
+
+    rows: int = 0
+    files: int = 0
+    bytes: int = 0
+    deltas: int = 0
+    merge_keys: list[str] = field(default_factory=list)
+    sampled_files: int = 0
+    sampled_rows: int = 0
+    sampled_distinct_keys: int = 0
+    sketched_deltas: int = 0
+    distinct_keys: int = 0
+    recommendations: list[Recommendation] = field(default_factory=list)
+
+    @property
+    def average_row_bytes(self) -> float:
+        return self.bytes / self.rows if self.rows else 0.0
+
+    @property
+    def average_file_bytes(self) -> float:
+        return self.bytes / self.files if self.files else 0.0
+
+    def recommended(self, option: str) -> int:
+        return next(item.recommended for item in self.recommendations if item.option == option)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'rows': self.rows,
+            'files': self.files,
+            'bytes': self.bytes,
+            'deltas': self.deltas,
+            'average_row_bytes': round(self.average_row_bytes, 2),
+            'average_file_bytes': round(self.average_file_bytes),
+            'merge_keys': self.merge_keys,
+            'sampled_files': self.sampled_files,
+            'sampled_rows': self.sampled_rows,
+            'sketched_deltas': self.sketched_deltas,
+            'distinct_keys': self.distinct_keys,
+            'recommendations': [
+                {'option': item.option, 'current': item.current, 'recommended': item.recommended, 'reason': item.reason}
+                for item in self.recommendations
+            ],
+        }
+
+
+def round_significant(value: float, digits: int = 2) -> int:
+    """Round to a number that reads well as a setting, 3,456,789 to 3,500,000."""
+    if value <= 0:
+        return 0
+    magnitude = 10 ** max(0, math.floor(math.log10(value)) - digits + 1)
+    return int(round(value / magnitude) * magnitude)
+
+
+def _clamp(value: int, bounds: tuple[int, int]) -> int:
+    return max(bounds[0], min(bounds[1], value))
+
+
+def _sample(files: list[ScanFile], count: int) -> list[ScanFile]:
+    """Files spread evenly over the table, so old and recent data are both represented."""
+    if len(files) <= count:
+        return files
+    step = len(files) / count
+    return [files[int(index * step)] for index in range(count)]
+
+
+def estimate_distinct_keys(scan: TableScan, files: list[ScanFile], sample_files: int, advice: CompactionAdvice) -> None:
+    """Estimate the distinct merge keys of the table from a sample of its data files."""
+    sketch = HyperLogLog()
+    for scan_file in _sample(files, sample_files):
+        for batch in scan.file_batches(scan_file):
+            sketch.update(batch)
+            advice.sampled_rows += batch.num_rows
+        advice.sampled_files += 1
+    advice.sampled_distinct_keys = min(sketch.estimate(), advice.sampled_rows)
+    if advice.sampled_files == len(files) or not advice.sampled_rows:
+        advice.distinct_keys = advice.sampled_distinct_keys
+    else:
+        # Keys repeat across files as well as within them, so scaling the sample's ratio is an upper bound
+        advice.distinct_keys = round(advice.rows * advice.sampled_distinct_keys / advice.sampled_rows)
+
+
+def distinct_keys_from_sketches(
+    inner: Any, namespace: str, table_version: TableVersion, deltas: list[Delta], advice: CompactionAdvice
+) -> bool:
+    """Merge the distinct merge keys of the table from the sketches of its deltas, False unless all have one."""
+    sketches = DeltaSketches(inner, namespace, table_version)
+    if not sketches.store.exists:
+        return False
+    sketched = {partition_id: set(positions) for partition_id, positions in sketches.store.state['partitions'].items()}
+    if any(delta.stream_position not in sketched.get(delta.partition_id, ()) for delta in deltas):
+        return False
+    merged = sketches.merged(delta for delta in deltas if delta.type != DeltaType.DELETE)
+    advice.sketched_deltas = merged.deltas
+    advice.distinct_keys = min(merged.merge_key_distinct.estimate(), advice.rows)
+    return True
+
+
+def advise_compaction(
+    inner: Any,
+    namespace: str,
+    table: str,
+    table_version: str | None = None,
+    target_file_bytes: int = DEFAULT_TARGET_FILE_BYTES,
+    sample_files: int = DEFAULT_SAMPLE_FILES,
+) -> CompactionAdvice:
+    """Measure a table and recommend its compaction settings."""
+    resolved = TableScan(namespace=namespace, table=table, inner=inner, table_version=table_version).table_version
+    merge_keys = merge_key_names(resolved.schema)
+    scan = TableScan(namespace=namespace, table=table, inner=inner, table_version=table_version, columns=merge_keys)
+    advice = CompactionAdvice(merge_keys=merge_keys)
+
+    files: list[ScanFile] = []
+    deltas: list[Delta] = []
+    for _, delta in committed_deltas(inner, namespace, resolved):
+        advice.deltas += 1
+        deltas.append(delta)
+        if delta.type == DeltaType.DELETE:
+            continue
+        for scan_file in scan.files_of(delta):
+            files.append(scan_file)
+            advice.files += 1
+            advice.rows += scan_file.record_count
+            advice.bytes += scan_file.content_length
+
+    if merge_keys and files:
+        if not distinct_keys_from_sketches(inner, namespace, resolved, deltas, advice):
+            estimate_distinct_keys(scan, files, sample_files, advice)
+    else:
+        advice.distinct_keys = advice.rows
+
+    def current(prop: TableProperty) -> Any:
+        return resolved.read_table_property(prop)
+
+    if advice.rows and advice.bytes:
+        records_per_file = _clamp(
+            round_significant(target_file_bytes / advice.average_row_bytes),
+            (MIN_RECORDS_PER_FILE, MAX_RECORDS_PER_FILE),
+        )
+        records_reason = (
+            f'{advice.average_row_bytes:,.1f} bytes per row on disk fill {target_file_bytes / 2**20:,.0f} MiB files'
+        )
+    else:
+        records_per_file = current(TableProperty.RECORDS_PER_COMPACTED_FILE)
+        records_reason = 'no rows to measure, kept'
+    advice.recommendations.append(
+        Recommendation(
+            'records_per_compacted_file',
+            current(TableProperty.RECORDS_PER_COMPACTED_FILE),
+            records_per_file,
+            records_reason,
+        )
+    )
+
+    buckets = max(1, math.ceil(advice.distinct_keys / records_per_file))
+    kept = 'distinct merge keys' if merge_keys else 'rows (no merge keys)'
+    advice.recommendations.append(
+        Recommendation(
+            'default_compaction_hash_bucket_count',
+            current(TableProperty.DEFAULT_COMPACTION_HASH_BUCKET_COUNT),
+            buckets,
+            f'~{advice.distinct_keys:,} {kept} fill about one file per bucket',
+        )
+    )
+
+    file_trigger = _clamp(2 * buckets, FILE_TRIGGER_RANGE)
+    advice.recommendations.append(
+        Recommendation(
+            'appended_file_count_compaction_trigger',
+            current(TableProperty.APPENDED_FILE_COUNT_COMPACTION_TRIGGER),
+            file_trigger,
+            f'twice the {buckets:,} compacted file(s), bounding the files a read opens',
+        )
+    )
+
+    files_per_delta = advice.files / advice.deltas if advice.deltas else 1.0
+    advice.recommendations.append(
+        Recommendation(
+            'appended_delta_count_compaction_trigger',
+            current(TableProperty.APPENDED_DELTA_COUNT_COMPACTION_TRIGGER),
+            _clamp(math.ceil(file_trigger / max(files_per_delta, 1.0)), DELTA_TRIGGER_RANGE),
+            f'{files_per_delta:,.1f} file(s) per delta reach the file trigger',
+        )
+    )
+    return advice
@@ -0,0 +1,277 @@
+"""Local daemon keeping the catalog warm between CLI invocations.
+
+`deltacat serve` listens on a Unix socket and runs forwarded commands in its own process, so deltacat is
+imported and the catalog registered once instead of on every invocation. The client side lives here too
+and only depends on the standard library, so forwarding doesn't pay the imports the daemon saves.
+
+Protocol: one JSON object per line. The client sends `{"argv": [...], "cwd": "...", "tty": bool, "env": {...}}`
+(whether its stdout is a terminal, which selects the output format, and its DELTACAT_CLI_* variables, which the
+command runs with instead of the daemon's) and receives `{"out": text}` / `{"err": text}` frames followed by
+either `{"exit": code}` or `{"local": true}` when the command needs an interactive terminal and must be run by
+the client itself.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+
+# Commands always run in the client process: they manage the daemon or the local catalog configuration, or
+# measure the process they run in
+LOCAL_COMMANDS = {'serve', 'catalog', 'bench'}
+
+CONNECT_TIMEOUT_SECONDS = 0.5
+
+# Environment variables configuring the CLI, forwarded so commands behave as they would locally
+ENV_PREFIX = 'DELTACAT_CLI_'
+
+# Global options skipped to find the command
+GLOBAL_VALUE_OPTIONS = {'--output', '-o', '--profile-file', '--profile-memory'}
+GLOBAL_FLAGS = {'--no-cache', '--profile'}
+
+# Global options measuring the process the command runs in, which should be the caller's
+LOCAL_GLOBAL_OPTIONS = {'--profile', '--profile-file', '--profile-memory'}
+
+# Output formats writing binary data, which the daemon's text frames can't carry
+BINARY_OUTPUT_FORMATS = {'arrow'}
+
+
+def socket_path() -> Path:
+    """Daemon socket path, overridable with DELTACAT_CLI_SOCKET."""
+    return Path(os.environ.get('DELTACAT_CLI_SOCKET') or Path.home() / '.deltacat_cli' / 'serve.sock')
+
+
+def should_forward(args: list[str]) -> bool:
+    """Whether a command line is eligible to run in the daemon."""
+    if os.environ.get('DELTACAT_CLI_NO_DAEMON') or any(key.endswith('_COMPLETE') for key in os.environ):
+        return False
+    index = 0
+    while index < len(args):
+        option, separator, value = args[index].partition('=')
+        if option not in GLOBAL_VALUE_OPTIONS and option not in GLOBAL_FLAGS:
+            break
+        if option in LOCAL_GLOBAL_OPTIONS:
+            return False
+        if option in GLOBAL_VALUE_OPTIONS and not separator:
+            value = args[index + 1] if index + 1 < len(args) else ''
+            index += 1
+        if value in BINARY_OUTPUT_FORMATS:
+            return False
+        index += 1
+    # Other global options (--version, --help, --install-completion) are cheap locally
+    return index < len(args) and not args[index].startswith('-') and args[index] not in LOCAL_COMMANDS
+
+
+def connect(path: Path | None = None) -> socket.socket | None:
+    """Connect to a running daemon, or return None if there is none."""
+    path = path or socket_path()
+    if not path.exists():
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT_SECONDS)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        return None
+    sock.settimeout(None)
+    return sock
+
+
+def forward(args: list[str], path: Path | None = None, stdout: Any = None, stderr: Any = None) -> int | None:
+    """Run a command in the daemon, streaming its output. Returns None if it has to run locally instead."""
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    sock = connect(path)
+    if sock is None:
+        return None
+
+    with sock, sock.makefile('rw', encoding='utf-8') as stream:
+        try:
+            env = {key: value for key, value in os.environ.items() if key.startswith(ENV_PREFIX)}
+            _send(stream, {'argv': args, 'cwd': os.getcwd(), 'tty': stdout.isatty(), 'env': env})
+            for line in stream:
+                frame = json.loads(line)
+                if 'out' in frame:
+                    stdout.write(frame['out'])
+                    stdout.flush()
+                elif 'err' in frame:
+                    stderr.write(frame['err'])
+                    stderr.flush()
+                elif 'exit' in frame:
+                    return frame['exit']
+                elif frame.get('local'):
+                    return None
+        except OSError:
+            pass
+    # The daemon went away mid-command
+    stderr.write('deltacat daemon connection lost\n')
+    return 1
+
+
+def request(message: dict[str, Any], path: Path | None = None) -> dict[str, Any] | None:
+    """Send a control message to the daemon and return its reply, or None if it isn't running."""
+    sock = connect(path)
+    if sock is None:
+        return None
+    with sock, sock.makefile('rw', encoding='utf-8') as stream:
+        _send(stream, message)
+        line = stream.readline()
+    return json.loads(line) if line else None
+
+
+@contextmanager
+def _environment(env: dict[str, str]) -> Iterator[None]:
+    """Replace the daemon's DELTACAT_CLI_* variables with the client's for the duration of a command."""
+    previous = {key: value for key, value in os.environ.items() if key.startswith(ENV_PREFIX)}
+
+    def apply(variables: dict[str, str]) -> None:
+        for key in [key for key in os.environ if key.startswith(ENV_PREFIX)]:
+            del os.environ[key]
+        os.environ.update(variables)
+
+    apply(env)
+    try:
+        yield
+    finally:
+        apply(previous)
+
+
+def _send(stream: Any, message: dict[str, Any]) -> None:
+    stream.write(json.dumps(message) + '\n')
+    stream.flush()
+
+
+class _FrameWriter:
+    """Text stream sending complete lines to the client as frames.
+
+    A trailing partial line is held back so that a prompt printed right before InteractiveInputRequired
+    isn't shown twice once the client reruns the command locally.
+    """
+
+    def __init__(self, stream: Any, key: str, lock: threading.Lock, tty: bool = False):
+        self._stream = stream
+        self._key = key
+        self._lock = lock
+        self._tty = tty
+        self._pending = ''
+
+    def write(self, text: str) -> int:
+        self._pending += text
+        complete, newline, self._pending = self._pending.rpartition('\n')
+        if newline:
+            self._emit(complete + newline)
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        """Send any held back partial line."""
+        if self._pending:
+            self._emit(self._pending)
+            self._pending = ''
+
+    def discard(self) -> None:
+        self._pending = ''
+
+    def isatty(self) -> bool:
+        """Whether the client's stream is a terminal."""
+        return self._tty
+
+    @property
+    def encoding(self) -> str:
+        return 'utf-8'
+
+    def _emit(self, text: str) -> None:
+        with self._lock:
+            _send(self._stream, {self._key: text})
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server running forwarded CLI commands."""
+
+    daemon_threads = True
+
+    def __init__(self, path: Path):
+        self.path = path
+        # Commands run one at a time: each one runs in the client's working directory
+        self.command_lock = threading.Lock()
+        self.commands_served = 0
+        super().__init__(str(path), _RequestHandler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.path.unlink(missing_ok=True)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: DaemonServer
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+        message = json.loads(line)
+        writer = _LineSocketWriter(self.wfile)
+
+        if message.get('control') == 'status':
+            writer.send({'pid': os.getpid(), 'commands_served': self.server.commands_served})
+        elif message.get('control') == 'stop':
+            writer.send({'stopping': True})
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+        elif 'argv' in message:
+            self._run_command(writer, message)
+
+    def _run_command(self, writer: '_LineSocketWriter', message: dict[str, Any]) -> None:
+        from deltacat_cli.utils.invoke import InteractiveInputRequired, NoInput, invoke
+
+        argv, cwd = message['argv'], message.get('cwd')
+        lock = threading.Lock()
+        stdout = _FrameWriter(writer, 'out', lock, tty=bool(message.get('tty')))
+        stderr = _FrameWriter(writer, 'err', lock)
+        with self.server.command_lock, _environment(message.get('env') or {}):
+            previous_cwd = os.getcwd()
+            try:
+                if cwd:
+                    os.chdir(cwd)
+                exit_code = invoke(argv, stdout, stderr, stdin=NoInput())
+            except InteractiveInputRequired:
+                stdout.discard()
+                stderr.discard()
+                writer.send({'local': True})
+                return
+            finally:
+                os.chdir(previous_cwd)
+            # Commands handed back to the client run there, only those run here are counted
+            self.server.commands_served += 1
+        stdout.close()
+        stderr.close()
+        writer.send({'exit': exit_code})
+
+
+class _LineSocketWriter:
+    """Writes JSON frames to the client connection, ignoring a client that hung up."""
+
+    def __init__(self, out: Any):
+        self._out = out
+
+    def write(self, text: str) -> None:
+        try:
+            self._out.write(text.encode('utf-8'))
+            self._out.flush()
+        except OSError:
+            pass
+
+    def flush(self) -> None:
+        pass
+
+    def send(self, message: dict[str, Any]) -> None:
+        _send(self, message)
@@ -0,0 +1,369 @@
+"""Compile `--where` filters into pyarrow compute expressions.
+
+Supported syntax, case-insensitive keywords:
+
+    expr      := expr OR expr | expr AND expr | NOT expr | ( expr ) | predicate
+    predicate := operand (= | == | != | <> | < | <= | > | >=) operand
+               | column IS [NOT] NULL
+               | column [NOT] IN ( literal, ... )
+               | column BETWEEN literal AND literal
+    operand   := column | literal
+    literal   := number | 'string' | TRUE | FALSE | NULL
+
+Columns are bare identifiers or "double quoted". Literals compared with a column are cast to the column's type,
+so `ts >= '2026-01-01'` works against timestamp and date columns. Numbers a numeric column can't hold exactly, like
+`user_id > 1.5`, are compared numerically instead. NULL in an IN list matches nothing, as in SQL.
+
+The same filter also compiles into a test of whether a file may hold matching rows, from statistics of its
+columns: their min/max, null count and an optional Bloom filter. Negations and comparisons between columns
+can't rule a file out, so they are assumed to match.
+"""
+
+import re
+from collections.abc import Callable, Mapping
+from typing import Any, Protocol
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+
+TOKEN_PATTERN = re.compile(
+    r"""
+    \s*(?:
+        (?P<number>-?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)
+      | '(?P<string>(?:[^']|'')*)'
+      | "(?P<quoted>(?:[^"]|"")+)"
+      | (?P<op><=|>=|<>|!=|==|=|<|>)
+      | (?P<punct>[(),])
+      | (?P<word>[A-Za-z_][A-Za-z0-9_.]*)
+    )""",
+    re.VERBOSE,
+)
+
+KEYWORDS = {'AND', 'OR', 'NOT', 'IS', 'NULL', 'IN', 'BETWEEN', 'TRUE', 'FALSE'}
+
+COMPARISONS = {
+    '=': lambda left, right: left == right,
+    '==': lambda left, right: left == right,
+    '!=': lambda left, right: left != right,
+    '<>': lambda left, right: left != right,
+    '<': lambda left, right: left < right,
+    '<=': lambda left, right: left <= right,
+    '>': lambda left, right: left > right,
+    '>=': lambda left, right: left >= right,
+}
+
+
+class _Column:
+    def __init__(self, name: str):
+        self.name = name
+
+
+class _Literal:
+    def __init__(self, value: Any):
+        self.value = value
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+def _is_numeric(data_type: pa.DataType) -> bool:
+    return pa.types.is_integer(data_type) or pa.types.is_floating(data_type) or pa.types.is_decimal(data_type)
+
+
+def tokenize(text: str) -> list[tuple[str, Any, int]]:
+    """Split a filter into (kind, value, position) tokens."""
+    tokens = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = TOKEN_PATTERN.match(text, position)
+        if not match:
+            raise ValueError(f'Invalid filter near position {position}: {text[position:]!r}')
+        kind = match.lastgroup
+        value, start = match.group(kind), match.start(kind)
+        if kind == 'number':
+            value = float(value) if any(c in value for c in '.eE') else int(value)
+        elif kind == 'string':
+            value = value.replace("''", "'")
+        elif kind == 'quoted':
+            kind, value = 'column', value.replace('""', '"')
+        elif kind == 'word':
+            kind, value = ('keyword', value.upper()) if value.upper() in KEYWORDS else ('column', value)
+        tokens.append((kind, value, start))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    def __init__(self, text: str, schema: pa.Schema | None):
+        self.tokens = tokenize(text)
+        self.index = 0
+        self.schema = schema
+
+    def parse(self) -> pc.Expression:
+        if not self.tokens:
+            raise ValueError('Empty filter')
+        expression = self.parse_or()
+        if self.index < len(self.tokens):
+            raise self.error('Unexpected')
+        return expression
+
+    def parse_or(self) -> pc.Expression:
+        expression = self.parse_and()
+        while self.accept('keyword', 'OR'):
+            expression = expression | self.parse_and()
+        return expression
+
+    def parse_and(self) -> pc.Expression:
+        expression = self.parse_not()
+        while self.accept('keyword', 'AND'):
+            expression = expression & self.parse_not()
+        return expression
+
+    def parse_not(self) -> pc.Expression:
+        if self.accept('keyword', 'NOT'):
+            return ~self.parse_not()
+        if self.accept('punct', '('):
+            expression = self.parse_or()
+            self.expect('punct', ')')
+            return expression
+        return self.parse_predicate()
+
+    def parse_predicate(self) -> pc.Expression:
+        left = self.parse_operand()
+        if self.accept('keyword', 'IS'):
+            negate = self.accept('keyword', 'NOT')
+            self.expect('keyword', 'NULL')
+            expression = self.field(left).is_null()
+            return ~expression if negate else expression
+        negate = self.accept('keyword', 'NOT')
+        if self.accept('keyword', 'IN'):
+            column = self.field(left)
+            self.expect('punct', '(')
+            values = [self.parse_literal()]
+            while self.accept('punct', ','):
+                values.append(self.parse_literal())
+            self.expect('punct', ')')
+            values = [value for value in values if value is not None]
+            types = {self.literal_type(left, value) for value in values} or {self.type_of(left)}
+            # Numbers keeping their own type mix types, pyarrow then infers one holding all of them
+            value_type = types.pop() if len(types) == 1 else None
+            expression = column.isin(pa.array([self.cast(left, value) for value in values], value_type))
+            return ~expression if negate else expression
+        if self.accept('keyword', 'BETWEEN'):
+            column = self.field(left)
+            low = self.parse_literal()
+            self.expect('keyword', 'AND')
+            high = self.parse_literal()
+            expression = (column >= self.scalar(left, low)) & (column <= self.scalar(left, high))
+            return ~expression if negate else expression
+        if negate:
+            raise self.error('Expected IN or BETWEEN after NOT')
+
+        kind, op, _ = self.peek()
+        if kind != 'op':
+            raise self.error('Expected a comparison operator at')
+        self.index += 1
+        right = self.parse_operand()
+        if isinstance(left, _Literal) and isinstance(right, _Literal):
+            raise ValueError('A comparison needs at least one column')
+        return COMPARISONS[op](self.operand(left, right), self.operand(right, left))
+
+    def parse_operand(self) -> _Column | _Literal:
+        kind, value, _ = self.peek()
+        if kind == 'column':
+            self.index += 1
+            self.column_type(value)
+            return _Column(value)
+        return _Literal(self.parse_literal())
+
+    def parse_literal(self) -> Any:
+        kind, value, _ = self.peek()
+        if kind in ('number', 'string'):
+            self.index += 1
+            return value
+        if kind == 'keyword' and value in ('TRUE', 'FALSE', 'NULL'):
+            self.index += 1
+            return {'TRUE': True, 'FALSE': False, 'NULL': None}[value]
+        raise self.error('Expected a literal at')
+
+    def operand(self, operand: _Column | _Literal, other: _Column | _Literal) -> Any:
+        """Expression for one side of a comparison, literals cast to the type of the column they're compared with."""
+        if isinstance(operand, _Column):
+            return pc.field(operand.name)
+        return self.scalar(other, operand.value)
+
+    def field(self, operand: _Column | _Literal) -> pc.Expression:
+        if not isinstance(operand, _Column):
+            raise self.error('Expected a column before')
+        return pc.field(operand.name)
+
+    def scalar(self, column: _Column | _Literal, value: Any) -> pa.Scalar:
+        return pa.scalar(self.cast(column, value), self.literal_type(column, value))
+
+    def cast(self, column: _Column | _Literal, value: Any) -> Any:
+        value_type = self.literal_type(column, value)
+        if value is None or value_type is None:
+            return value
+        return pa.scalar(value).cast(value_type).as_py()
+
+    def literal_type(self, column: _Column | _Literal, value: Any) -> pa.DataType | None:
+        """Type of a literal compared with a column: the column's, or its own for a number the column can't hold.
+
+        pyarrow compares such numbers with the column in a type holding both, so `user_id > 1.5` works.
+        """
+        column_type = self.type_of(column)
+        if value is None or column_type is None:
+            return column_type
+        try:
+            pa.scalar(value).cast(column_type)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+            if _is_number(value) and _is_numeric(column_type):
+                return pa.scalar(value).type
+            raise ValueError(f'Cannot compare column "{column.name}" of type {column_type} with {value!r}') from e
+        return column_type
+
+    def type_of(self, operand: _Column | _Literal) -> pa.DataType | None:
+        return self.column_type(operand.name) if isinstance(operand, _Column) else None
+
+    def column_type(self, name: str) -> pa.DataType | None:
+        if self.schema is None:
+            return None
+        if name not in self.schema.names:
+            raise ValueError(f'Unknown column "{name}" in filter, available columns: {", ".join(self.schema.names)}')
+        return self.schema.field(name).type
+
+    def peek(self) -> tuple[str, Any, int]:
+        return self.tokens[self.index] if self.index < len(self.tokens) else ('end', None, -1)
+
+    def accept(self, kind: str, value: Any) -> bool:
+        token_kind, token_value, _ = self.peek()
+        if token_kind == kind and token_value == value:
+            self.index += 1
+            return True
+        return False
+
+    def expect(self, kind: str, value: Any) -> None:
+        if not self.accept(kind, value):
+            raise self.error(f'Expected {value} at')
+
+    def error(self, message: str) -> ValueError:
+        kind, value, position = self.peek()
+        if kind == 'end':
+            return ValueError(f'{message} end of filter')
+        return ValueError(f'{message} {value!r} (position {position})')
+
+
+def compile_where(text: str, schema: pa.Schema | None = None) -> pc.Expression:
+    """Compile a filter into a pyarrow expression, checking columns and casting literals against `schema`."""
+    return _Parser(text, schema).parse()
+
+
+class ColumnStatistics(Protocol):
+    """Statistics of a column of a file, as needed to rule the file out."""
+
+    min: Any
+    max: Any
+    null_count: int
+    row_count: int
+
+    def might_contain(self, value: Any) -> bool: ...
+
+
+FileStatistics = Mapping[str, ColumnStatistics]
+
+
+class _FileTest:
+    """Whether a file may hold rows matching part of a filter, given the statistics of its columns."""
+
+    def __init__(self, test: Callable[[FileStatistics], bool]):
+        self.test = test
+
+    def __and__(self, other: '_FileTest') -> '_FileTest':
+        return _FileTest(lambda stats: self.test(stats) and other.test(stats))
+
+    def __or__(self, other: '_FileTest') -> '_FileTest':
+        return _FileTest(lambda stats: self.test(stats) or other.test(stats))
+
+    def __invert__(self) -> '_FileTest':
+        return _MAY_MATCH
+
+
+_MAY_MATCH = _FileTest(lambda stats: True)
+
+
+class _ColumnTest:
+    """A column in a filter compiled into file tests: comparisons test its statistics instead of its values."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def _test(self, other: Any, test: Callable[[ColumnStatistics, Any], bool]) -> _FileTest:
+        if isinstance(other, _ColumnTest) or other is None:
+            return _MAY_MATCH
+
+        def file_test(stats: FileStatistics) -> bool:
+            column = stats.get(self.name)
+            if column is None:
+                return True
+            if column.null_count >= column.row_count:
+                # Only nulls, which no comparison matches
+                return False
+            try:
+                return test(column, other)
+            except TypeError:
+                return True
+
+        return _FileTest(file_test)
+
+    def __eq__(self, other: Any) -> _FileTest:  # type: ignore[override]
+        return self._test(other, lambda c, v: c.min <= v <= c.max and c.might_contain(v))
+
+    def __ne__(self, other: Any) -> _FileTest:  # type: ignore[override]
+        return self._test(other, lambda c, v: not (c.min == c.max == v and c.null_count == 0))
+
+    def __lt__(self, other: Any) -> _FileTest:
+        return self._test(other, lambda c, v: c.min < v)
+
+    def __le__(self, other: Any) -> _FileTest:
+        return self._test(other, lambda c, v: c.min <= v)
+
+    def __gt__(self, other: Any) -> _FileTest:
+        return self._test(other, lambda c, v: c.max > v)
+
+    def __ge__(self, other: Any) -> _FileTest:
+        return self._test(other, lambda c, v: c.max >= v)
+
+    def isin(self, values: pa.Array) -> _FileTest:
+        tests = [self == value for value in values.to_pylist()]
+        return _FileTest(lambda stats: any(test.test(stats) for test in tests))
+
+    def is_null(self) -> _FileTest:
+        return _FileTest(lambda stats: self.name not in stats or stats[self.name].null_count > 0)
+
+
+class _FileTestParser(_Parser):
+    """Parser building file tests instead of expressions, with literals as Python values cast to column types."""
+
+    def operand(self, operand: _Column | _Literal, other: _Column | _Literal) -> Any:
+        if isinstance(operand, _Column):
+            return _ColumnTest(operand.name)
+        return self.cast(other, operand.value)
+
+    def field(self, operand: _Column | _Literal) -> Any:
+        if not isinstance(operand, _Column):
+            raise self.error('Expected a column before')
+        return _ColumnTest(operand.name)
+
+    def scalar(self, column: _Column | _Literal, value: Any) -> Any:
+        return self.cast(column, value)
+
+
+def compile_file_filter(text: str, schema: pa.Schema | None = None) -> Callable[[FileStatistics], bool]:
+    """Compile a filter into a test of a file's column statistics, false only if no row of the file can match.
+
+    Columns without statistics are assumed to match.
+    """
+    return _FileTestParser(text, schema).parse().test
@@ -0,0 +1,64 @@
+import re
+from datetime import datetime, timezone
+
+
+def format_bytes(num_bytes: float) -> str:
+    """Human readable byte size, e.g. 1.5 MiB."""
+    for unit in ('B', 'KiB', 'MiB', 'GiB', 'TiB'):
+        if abs(num_bytes) < 1024 or unit == 'TiB':
+            return f'{num_bytes:.0f} {unit}' if unit == 'B' else f'{num_bytes:.1f} {unit}'
+        num_bytes /= 1024
+    return f'{num_bytes:.1f} PiB'
+
+
+def format_rate(count: float, seconds: float, unit: str = '') -> str:
+    """Per-second rate, e.g. 12,345 rows/s."""
+    rate = count / seconds if seconds > 0 else 0.0
+    return f'{format_bytes(rate)}/s' if unit == 'bytes' else f'{rate:,.0f} {unit}/s'
+
+
+BYTE_UNITS = {'': 1, 'b': 1, 'k': 1000, 'kb': 1000, 'kib': 1024, 'm': 1000**2, 'mb': 1000**2, 'mib': 1024**2}
+BYTE_UNITS |= {'g': 1000**3, 'gb': 1000**3, 'gib': 1024**3, 't': 1000**4, 'tb': 1000**4, 'tib': 1024**4}
+
+SIZE_PATTERN = re.compile(r'\s*(\d+(?:\.\d+)?)\s*([a-zA-Z]*)\s*')
+
+
+def parse_bytes(size: str) -> int:
+    """Byte count from a human readable size, e.g. 512MiB, 1.5GB or 1000."""
+    match = SIZE_PATTERN.fullmatch(size)
+    if not match or match.group(2).lower() not in BYTE_UNITS:
+        raise ValueError(f'Invalid size {size}, expected e.g. 512MiB, 1GB or a number of bytes')
+    return int(float(match.group(1)) * BYTE_UNITS[match.group(2).lower()])
+
+
+TIMESTAMP_PATTERN = re.compile(r'\s*([^.]+?)(?:\.(\d{1,9}))?(Z|[+-]\d{2}:?\d{2})?\s*')
+
+
+def parse_timestamp(value: str) -> int:
+    """Nanoseconds since the epoch of an ISO 8601 timestamp, UTC unless it has an offset.
+
+    Up to 9 fractional digits are kept, so timestamps printed by format_timestamp round trip exactly.
+    """
+    match = TIMESTAMP_PATTERN.fullmatch(value)
+    try:
+        if not match:
+            raise ValueError
+        offset = match.group(3) or '+00:00'
+        if offset == 'Z':
+            offset = '+00:00'
+        elif ':' not in offset:
+            # Python 3.10 only parses offsets with a colon
+            offset = f'{offset[:3]}:{offset[3:]}'
+        parsed = datetime.fromisoformat(match.group(1) + offset)
+    except ValueError:
+        raise ValueError(f'Invalid timestamp {value}, expected e.g. 2026-01-01 or 2026-01-01T12:00:00Z') from None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    fraction = int((match.group(2) or '').ljust(9, '0'))
+    return int(parsed.timestamp()) * 1_000_000_000 + fraction
+
+
+def format_timestamp(nanoseconds: int) -> str:
+    """ISO 8601 UTC timestamp with nanoseconds, e.g. 2026-01-01T12:00:00.000000001Z."""
+    seconds, fraction = divmod(nanoseconds, 1_000_000_000)
+    return f'{datetime.fromtimestamp(seconds, timezone.utc):%Y-%m-%dT%H:%M:%S}.{fraction:09d}Z'
@@ -0,0 +1,167 @@
+"""Sidecar indexes of a table version, kept under the catalog root so everyone using the catalog shares them.
+
+Each kind of index has its own directory, `.deltacat_cli/indexes/<namespace>/<table>/<table version>/<kind>`,
+holding its segments and an `index.json` state file listing them along with the deltas of each partition
+already indexed. A refresh indexes only the deltas committed since the last one, as a new segment. The index is
+rebuilt from scratch once a partition it covers was replaced, as compaction and table optimize do, when it has
+MAX_SEGMENTS segments, or when its configuration changed.
+"""
+
+import json
+import posixpath
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any
+
+import pyarrow.fs as pa_fs
+from deltacat.storage import Delta, DeltaType, TableVersion
+
+from deltacat_cli.utils.table_scan import ScanFile
+from deltacat_cli.utils.table_stats import committed_deltas
+
+
+INDEX_ROOT = '.deltacat_cli/indexes'
+STATE_FILE = 'index.json'
+INDEX_FORMAT = 1
+
+MAX_SEGMENTS = 8
+
+
+@dataclass
+class IndexRefresh:
+    """What a refresh of an index did."""
+
+    rebuilt: bool = False
+    reason: str = ''
+    deltas: int = 0
+    files: int = 0
+    rows: int = 0
+    seconds: float = 0.0
+
+
+class IndexStore:
+    """Directory and state of one kind of index of a table version."""
+
+    def __init__(self, inner: Any, namespace: str, table_version: TableVersion, kind: str, config: dict[str, Any]):
+        self.inner = inner
+        self.namespace = namespace
+        self.table_version = table_version
+        self.table = table_version.locator.table_name
+        self.config = config
+        self.filesystem: pa_fs.FileSystem = inner.filesystem
+        self.directory = inner.reconstruct_full_path(
+            posixpath.join(INDEX_ROOT, namespace, self.table, table_version.table_version, kind)
+        )
+        self.state = self._load_state()
+
+    def _load_state(self) -> dict[str, Any]:
+        path = posixpath.join(self.directory, STATE_FILE)
+        if self.filesystem.get_file_info(path).type != pa_fs.FileType.File:
+            return {}
+        with self.filesystem.open_input_stream(path) as source:
+            state = json.loads(source.read())
+        # An index built with another configuration is of no use, it will be rebuilt
+        if state.get('format') != INDEX_FORMAT or state.get('config') != self.config:
+            return {}
+        return state
+
+    @property
+    def exists(self) -> bool:
+        return bool(self.state)
+
+    @property
+    def segments(self) -> list[dict[str, Any]]:
+        return self.state.get('segments', [])
+
+    def path(self, *parts: str) -> str:
+        return posixpath.join(self.directory, *parts)
+
+    def pending(
+        self, rebuild: bool = False, upserts: bool = False
+    ) -> tuple[IndexRefresh, list[ScanFile], dict[str, list[int]]]:
+        """Data files of the deltas not indexed yet, clearing the index first when it has to be rebuilt.
+
+        Also returns the stream positions of every delta of each partition, to be committed with the new segment.
+        With `upserts`, the files of UPSERT deltas are pending too and DELETE deltas are taken as indexed, for
+        indexes summarizing every row written rather than those a read returns.
+        """
+        result = IndexRefresh()
+        indexed: dict[str, list[int]] = self.state.get('partitions', {})
+        deltas_by_partition: dict[str, list[Delta]] = defaultdict(list)
+        for partition, delta in committed_deltas(self.inner, self.namespace, self.table_version):
+            if delta.type not in (DeltaType.ADD, DeltaType.APPEND) and not upserts:
+                raise ValueError(
+                    f'Table {self.namespace}.{self.table} has {delta.type.value} deltas, use table compact to apply '
+                    'them before indexing it'
+                )
+            deltas_by_partition[partition.partition_id].append(delta)
+
+        if rebuild:
+            result.reason = 'requested'
+        elif not self.state:
+            result.reason = 'no index yet'
+        elif set(indexed) - set(deltas_by_partition):
+            result.reason = 'a partition was replaced'
+        elif len(self.segments) >= MAX_SEGMENTS:
+            result.reason = f'{len(self.segments)} segments'
+        if result.reason:
+            result.rebuilt = True
+            self.clear()
+            indexed = {}
+
+        files: list[ScanFile] = []
+        for partition_id, deltas in deltas_by_partition.items():
+            done = set(indexed.get(partition_id, []))
+            for delta in deltas:
+                if delta.stream_position in done or delta.type == DeltaType.DELETE:
+                    continue
+                result.deltas += 1
+                entries = (delta.manifest.entries or []) if delta.manifest else []
+                for index, entry in enumerate(entries):
+                    files.append(
+                        ScanFile(
+                            delta=delta,
+                            entry_index=index,
+                            entry=entry,
+                            path=self.inner.reconstruct_full_path(entry.url),
+                        )
+                    )
+        result.files = len(files)
+        result.rows = sum(scan_file.record_count for scan_file in files)
+        partitions = {
+            partition_id: sorted({*indexed.get(partition_id, []), *(delta.stream_position for delta in deltas)})
+            for partition_id, deltas in deltas_by_partition.items()
+        }
+        return result, files, partitions
+
+    def commit(self, refresh: IndexRefresh, partitions: dict[str, list[int]], segment: dict[str, Any] | None) -> None:
+        """Record a new segment and the deltas it indexed."""
+        segments = [*self.segments, segment] if segment else self.segments
+        self.state = {'format': INDEX_FORMAT, 'config': self.config, 'partitions': partitions, 'segments': segments}
+        if refresh.deltas or refresh.rebuilt:
+            self._save()
+
+    def add_segment(self, segment: dict[str, Any], deltas: list[Delta]) -> None:
+        """Record a segment indexing the given deltas, as their writer built it."""
+        partitions = {partition_id: list(positions) for partition_id, positions in self.state['partitions'].items()}
+        for delta in deltas:
+            partitions.setdefault(delta.partition_id, []).append(delta.stream_position)
+        self.state = {**self.state, 'partitions': partitions, 'segments': [*self.segments, segment]}
+        self._save()
+
+    def replace_segments(self, segment: dict[str, Any]) -> None:
+        """Replace every segment by one holding all of their entries, then delete their files."""
+        replaced = self.segments
+        self.state = {**self.state, 'segments': [segment]}
+        self._save()
+        for old in replaced:
+            self.filesystem.delete_file(self.path(old['name']))
+
+    def _save(self) -> None:
+        self.filesystem.create_dir(self.directory, recursive=True)
+        with self.filesystem.open_output_stream(self.path(STATE_FILE)) as sink:
+            sink.write(json.dumps(self.state, indent=2).encode())
+
+    def clear(self) -> None:
+        self.filesystem.delete_dir_contents(self.directory, missing_dir_ok=True)
+        self.state = {}
@@ -0,0 +1,143 @@
+"""Streaming readers for Parquet, CSV and NDJSON input files.
+
+Files are decoded as record batches conforming to a table's Arrow schema, so no input file is ever held in
+memory as a whole. Paths may be local paths, local globs or filesystem URIs (`s3://bucket/prefix/*.parquet`).
+"""
+
+import fnmatch
+import glob
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.fs as pa_fs
+import pyarrow.json as pa_json
+import pyarrow.parquet as pq
+
+
+INPUT_FORMATS = ('parquet', 'csv', 'ndjson')
+
+EXTENSION_FORMATS = {
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.csv': 'csv',
+    '.ndjson': 'ndjson',
+    '.jsonl': 'ndjson',
+    '.json': 'ndjson',
+}
+
+COMPRESSION_EXTENSIONS = ('.gz', '.bz2', '.zst', '.lz4')
+
+DEFAULT_BATCH_SIZE = 64 * 1024
+
+# Bytes of newline-delimited JSON parsed at a time
+NDJSON_BLOCK_SIZE = 16 * 1024 * 1024
+
+
+@dataclass
+class InputFile:
+    """An input file with the filesystem to open it with."""
+
+    path: str
+    filesystem: pa_fs.FileSystem
+    size: int
+    format: str
+
+
+def detect_format(path: str) -> str:
+    """Input format from a file extension, ignoring a trailing compression extension."""
+    name = path.lower()
+    for extension in COMPRESSION_EXTENSIONS:
+        name = name.removesuffix(extension)
+    input_format = EXTENSION_FORMATS.get(os.path.splitext(name)[1])
+    if not input_format:
+        raise ValueError(f'Cannot detect the format of {path}, pass --format ({", ".join(INPUT_FORMATS)})')
+    return input_format
+
+
+def resolve_inputs(patterns: list[str], input_format: str | None = None) -> list[InputFile]:
+    """Expand paths and globs into input files, in a stable order."""
+    inputs = []
+    for pattern in patterns:
+        if '://' in pattern:
+            filesystem, path = pa_fs.FileSystem.from_uri(pattern)
+            infos = _glob_filesystem(filesystem, path) if glob.has_magic(path) else [filesystem.get_file_info(path)]
+            paths = [(info.path, info.size) for info in infos if info.type == pa_fs.FileType.File]
+        else:
+            filesystem = pa_fs.LocalFileSystem()
+            matches = sorted(glob.glob(os.path.expanduser(pattern), recursive=True)) or [os.path.expanduser(pattern)]
+            paths = [(os.path.abspath(path), os.path.getsize(path)) for path in matches if os.path.isfile(path)]
+        if not paths:
+            raise ValueError(f'No input files match {pattern}')
+        inputs.extend(
+            InputFile(path=path, filesystem=filesystem, size=size or 0, format=input_format or detect_format(path))
+            for path, size in paths
+        )
+    return inputs
+
+
+def _glob_filesystem(filesystem: pa_fs.FileSystem, pattern: str) -> list[pa_fs.FileInfo]:
+    """Glob on a pyarrow filesystem by listing everything below the directory of the first wildcard."""
+    base = pattern[: min(pattern.index(char) for char in '*?[' if char in pattern)].rsplit('/', 1)[0]
+    selector = pa_fs.FileSelector(base, recursive=True)
+    return sorted(
+        (info for info in filesystem.get_file_info(selector) if fnmatch.fnmatch(info.path, pattern)),
+        key=lambda info: info.path,
+    )
+
+
+def read_batches(
+    input_file: InputFile, schema: pa.Schema, batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[pa.RecordBatch]:
+    """Stream an input file as record batches conforming to `schema`."""
+    if input_file.format == 'parquet':
+        with input_file.filesystem.open_input_file(input_file.path) as source:
+            for batch in pq.ParquetFile(source).iter_batches(batch_size=batch_size):
+                yield conform_batch(batch, schema, input_file.path)
+    elif input_file.format == 'csv':
+        with input_file.filesystem.open_input_stream(input_file.path, compression='detect') as source:
+            reader = pa_csv.open_csv(
+                source, convert_options=pa_csv.ConvertOptions(column_types={field.name: field.type for field in schema})
+            )
+            for batch in reader:
+                yield conform_batch(batch, schema, input_file.path)
+    elif input_file.format == 'ndjson':
+        parse_options = pa_json.ParseOptions(explicit_schema=schema, unexpected_field_behavior='error')
+        with input_file.filesystem.open_input_stream(input_file.path, compression='detect') as source:
+            for block in _line_blocks(source):
+                for batch in pa_json.read_json(pa.BufferReader(block), parse_options=parse_options).to_batches(
+                    batch_size
+                ):
+                    yield conform_batch(batch, schema, input_file.path)
+    else:
+        raise ValueError(f'Unsupported input format {input_file.format}, expected one of {", ".join(INPUT_FORMATS)}')
+
+
+def _line_blocks(source: pa.NativeFile) -> Iterator[bytes]:
+    """Read a stream in blocks of whole lines."""
+    remainder = b''
+    while chunk := source.read(NDJSON_BLOCK_SIZE):
+        block, newline, remainder = (remainder + chunk).rpartition(b'\n')
+        if newline:
+            yield block + newline
+    if remainder.strip():
+        yield remainder
+
+
+def conform_batch(batch: pa.RecordBatch, schema: pa.Schema, source: str = 'input') -> pa.RecordBatch:
+    """Cast a batch to `schema`: columns are reordered, missing ones filled with nulls, extra ones rejected."""
+    extra = [name for name in batch.schema.names if name not in schema.names]
+    if extra:
+        raise ValueError(f'{source} has columns that are not in the table schema: {", ".join(extra)}')
+
+    arrays = []
+    for field in schema:
+        if field.name in batch.schema.names:
+            arrays.append(batch.column(field.name).cast(field.type))
+        elif field.nullable:
+            arrays.append(pa.nulls(batch.num_rows, field.type))
+        else:
+            raise ValueError(f'{source} is missing required column {field.name}')
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
@@ -0,0 +1,127 @@
+"""Run CLI commands in-process with their output routed to a per-thread destination.
+
+Used by long-lived entry points (the `serve` daemon, `run` scripts) that execute many commands in one
+process. Commands print through the shared rich consoles and click, which both resolve `sys.stdout` and
+`sys.stderr` at write time, so routing those per thread is enough to capture each command separately.
+"""
+
+import sys
+import threading
+import traceback
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, TextIO
+
+from deltacat_cli.config import SHOW_TRACEBACK
+from deltacat_cli.utils.emojis import get_emoji
+
+
+class InteractiveInputRequired(Exception):
+    """Raised when a command invoked without a terminal tries to prompt for input."""
+
+
+class NoInput:
+    """Stdin replacement for commands that must not prompt."""
+
+    def read(self, *_: Any) -> str:
+        raise InteractiveInputRequired
+
+    def readline(self, *_: Any) -> str:
+        raise InteractiveInputRequired
+
+    def isatty(self) -> bool:
+        return False
+
+
+class _ThreadRoutedStream:
+    """Stream proxy writing to the current thread's target, or to the original stream if none is set."""
+
+    def __init__(self, default: TextIO):
+        self._default = default
+        self._local = threading.local()
+
+    @property
+    def target(self) -> Any:
+        return getattr(self._local, 'target', None) or self._default
+
+    @target.setter
+    def target(self, value: Any) -> None:
+        self._local.target = value
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.target, name)
+
+
+_install_lock = threading.Lock()
+_install_count = 0
+
+
+@contextmanager
+def _routed_streams() -> Iterator[tuple[_ThreadRoutedStream, _ThreadRoutedStream, _ThreadRoutedStream]]:
+    """Install routed sys.stdin/stdout/stderr for as long as any thread is redirecting."""
+    global _install_count  # noqa: PLW0603
+    with _install_lock:
+        if _install_count == 0:
+            sys.stdin = _ThreadRoutedStream(sys.stdin)
+            sys.stdout = _ThreadRoutedStream(sys.stdout)
+            sys.stderr = _ThreadRoutedStream(sys.stderr)
+        _install_count += 1
+        streams = (sys.stdin, sys.stdout, sys.stderr)
+    try:
+        yield streams
+    finally:
+        with _install_lock:
+            _install_count -= 1
+            if _install_count == 0:
+                sys.stdin = streams[0]._default
+                sys.stdout = streams[1]._default
+                sys.stderr = streams[2]._default
+
+
+@contextmanager
+def redirect_output(stdout: Any, stderr: Any, stdin: Any | None = None) -> Iterator[None]:
+    """Route this thread's stdout/stderr (and optionally stdin) to the given streams."""
+    # Redirecting to the current sys streams (e.g. a `run` script inside the daemon) means their current target
+    stdout, stderr, stdin = (
+        stream.target if isinstance(stream, _ThreadRoutedStream) else stream for stream in (stdout, stderr, stdin)
+    )
+    with _routed_streams() as (routed_in, routed_out, routed_err):
+        previous = (routed_in.target, routed_out.target, routed_err.target)
+        routed_in.target, routed_out.target, routed_err.target = stdin or previous[0], stdout, stderr
+        try:
+            yield
+        finally:
+            routed_in.target, routed_out.target, routed_err.target = previous
+
+
+def invoke(args: list[str], stdout: Any, stderr: Any, stdin: Any | None = None) -> int:
+    """Run `deltacat <args>` in this process, writing output to the given streams. Returns the exit code.
+
+    Raises InteractiveInputRequired if `stdin` is a NoInput and the command prompts.
+    """
+    from deltacat_cli.main import app
+
+    with redirect_output(stdout, stderr, stdin):
+        try:
+            app(args=args, prog_name='deltacat')
+        except SystemExit as e:
+            return _exit_code(e.code)
+        except InteractiveInputRequired:
+            raise
+        except Exception as e:  # noqa: BLE001
+            if SHOW_TRACEBACK:
+                traceback.print_exception(e, file=sys.stderr)
+            else:
+                sys.stderr.write(f'{get_emoji("error")} Error: {e}\n')
+            return 1
+    return 0
+
+
+def _exit_code(code: Any) -> int:
+    """Convert a SystemExit code to an int exit status."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    sys.stderr.write(f'{code}\n')
+    return 1
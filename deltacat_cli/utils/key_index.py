@@ -0,0 +1,259 @@
+"""Persisted index of a table's merge keys, for point lookups that read a single row group.
+
+The index maps the 64-bit hash of each row's merge key columns to the data file and Parquet row group holding
+it. It is a sidecar index, see index_store, whose segments are Parquet files sorted by hash:
+
+- each refresh indexes the deltas committed since the last one as a new segment, reading only the merge key
+  columns of their files
+- a segment is split into shards by the top bits of the hash, about SHARD_ROWS rows each, so building one
+  sorts a shard at a time in memory, and a lookup opens only the shard of its key, whose row group statistics
+  narrow it down to one row group
+
+Hashes only select candidate row groups, the rows read from them are compared with the keys themselves.
+"""
+
+import math
+import posixpath
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import uuid4
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from deltacat.storage import TableVersion
+
+from deltacat_cli.utils.index_store import IndexRefresh, IndexStore
+from deltacat_cli.utils.sketches import hash_columns
+from deltacat_cli.utils.table_scan import ScanFile
+from deltacat_cli.utils.table_stats import PARQUET_CONTENT_TYPE
+from deltacat_cli.utils.table_utils import merge_key_names
+
+
+SHARD_ROWS = 4_000_000
+MAX_SHARD_BITS = 12
+INDEX_ROW_GROUP_SIZE = 64 * 1024
+
+INDEX_SCHEMA = pa.schema(
+    [
+        pa.field('key_hash', pa.uint64()),
+        pa.field('stream_position', pa.int64()),
+        pa.field('entry', pa.int32()),
+        pa.field('file', pa.string()),
+        pa.field('row_group', pa.int32()),
+    ]
+)
+
+
+@dataclass
+class LookupResult:
+    """Rows found for a set of keys, and how much was read to find them."""
+
+    rows: pa.Table
+    keys: int = 0
+    found: int = 0
+    row_groups_read: int = 0
+    files_read: int = 0
+    index_row_groups_read: int = 0
+    missing: list[dict[str, Any]] = field(default_factory=list)
+
+
+def key_hashes(table: pa.Table | pa.RecordBatch, merge_keys: list[str], schema: pa.Schema) -> np.ndarray:
+    """Hashes of the merge key columns of each row, after casting them to the table's types."""
+    columns = [table.column(name).cast(schema.field(name).type) for name in merge_keys]
+    return hash_columns(pa.table(columns, names=merge_keys))
+
+
+def _shard_bits(rows: int) -> int:
+    return min(MAX_SHARD_BITS, max(0, math.ceil(math.log2(max(1, rows / SHARD_ROWS)))))
+
+
+def _shards(hashes: np.ndarray, bits: int) -> np.ndarray:
+    if not bits:
+        return np.zeros(len(hashes), dtype=np.int64)
+    return (hashes >> np.uint64(64 - bits)).astype(np.int64)
+
+
+class KeyIndex:
+    """The merge key index of a table version."""
+
+    def __init__(self, inner: Any, namespace: str, table_version: TableVersion):
+        self.inner = inner
+        self.namespace = namespace
+        self.table_version = table_version
+        self.table = table_version.locator.table_name
+        self.merge_keys = merge_key_names(table_version.schema)
+        if not self.merge_keys:
+            raise ValueError(f'Table {namespace}.{self.table} has no merge keys to look up records by')
+        self.schema: pa.Schema = table_version.schema.arrow
+        self.store = IndexStore(inner, namespace, table_version, 'keys', {'merge_keys': self.merge_keys})
+        self.filesystem = self.store.filesystem
+
+    @property
+    def key_schema(self) -> pa.Schema:
+        """Schema of the merge key columns."""
+        return pa.schema([self.schema.field(name) for name in self.merge_keys])
+
+    @property
+    def segments(self) -> list[dict[str, Any]]:
+        return self.store.segments
+
+    def refresh(self, workers: int = 4, rebuild: bool = False) -> IndexRefresh:
+        """Index the deltas committed since the last refresh, rebuilding the index when it can't be extended."""
+        start = time.perf_counter()
+        result, files, partitions = self.store.pending(rebuild)
+        for scan_file in files:
+            if scan_file.content_type != PARQUET_CONTENT_TYPE:
+                raise ValueError(f'Only Parquet data files can be indexed, {scan_file.entry.url} is not one')
+        segment = self._write_segment(files, workers) if files else None
+        self.store.commit(result, partitions, segment)
+        result.seconds = time.perf_counter() - start
+        return result
+
+    def _file_hashes(self, scan_file: ScanFile) -> pa.Table:
+        """Index rows of a data file: the hash of each row's keys with the row group holding it."""
+        with self.filesystem.open_input_file(scan_file.path) as source:
+            parquet_file = pq.ParquetFile(source)
+            tables = []
+            for row_group in range(parquet_file.metadata.num_row_groups):
+                keys = parquet_file.read_row_group(row_group, columns=self.merge_keys)
+                hashes = key_hashes(keys, self.merge_keys, self.schema)
+                tables.append(
+                    pa.table(
+                        [
+                            pa.array(hashes, pa.uint64()),
+                            pa.repeat(pa.scalar(scan_file.delta.stream_position, pa.int64()), len(hashes)),
+                            pa.repeat(pa.scalar(scan_file.entry_index, pa.int32()), len(hashes)),
+                            pa.repeat(pa.scalar(scan_file.entry.url, pa.string()), len(hashes)),
+                            pa.repeat(pa.scalar(row_group, pa.int32()), len(hashes)),
+                        ],
+                        schema=INDEX_SCHEMA,
+                    )
+                )
+        return pa.concat_tables(tables) if tables else INDEX_SCHEMA.empty_table()
+
+    def _write_segment(self, files: list[ScanFile], workers: int) -> dict[str, Any]:
+        """Index files as a new segment: rows are spilled unsorted per shard, then each shard is sorted on its own."""
+        name = f'segment-{uuid4().hex}'
+        directory = self.store.path(name)
+        self.filesystem.create_dir(directory, recursive=True)
+        bits = _shard_bits(sum(scan_file.record_count for scan_file in files))
+        spills: dict[int, pq.ParquetWriter] = {}
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='key-index') as executor:
+                for rows in executor.map(self._file_hashes, files):
+                    shards = _shards(rows.column('key_hash').to_numpy(), bits)
+                    for shard in np.unique(shards):
+                        if int(shard) not in spills:
+                            path = posixpath.join(directory, f'spill-{shard:04d}.parquet')
+                            spills[int(shard)] = pq.ParquetWriter(
+                                self.filesystem.open_output_stream(path), INDEX_SCHEMA, compression='none'
+                            )
+                        spills[int(shard)].write_table(rows.filter(pa.array(shards == shard)))
+        finally:
+            for writer in spills.values():
+                writer.close()
+
+        for shard in sorted(spills):
+            spill = posixpath.join(directory, f'spill-{shard:04d}.parquet')
+            with self.filesystem.open_input_file(spill) as source:
+                rows = pq.read_table(source)
+            rows = rows.sort_by([('key_hash', 'ascending'), ('stream_position', 'ascending'), ('entry', 'ascending')])
+            with self.filesystem.open_output_stream(posixpath.join(directory, f'shard-{shard:04d}.parquet')) as sink:
+                pq.write_table(rows, sink, row_group_size=INDEX_ROW_GROUP_SIZE, compression='zstd')
+            self.filesystem.delete_file(spill)
+        return {'name': name, 'shard_bits': bits, 'shards': sorted(spills)}
+
+    def candidates(self, hashes: np.ndarray) -> tuple[pa.Table, int]:
+        """Index rows of the given hashes, and the number of index row groups read to find them."""
+        hashes = np.unique(hashes.astype(np.uint64))
+        tables = []
+        row_groups_read = 0
+        for segment in self.segments:
+            bits = segment['shard_bits']
+            shards = _shards(hashes, bits)
+            for shard in np.unique(shards):
+                if int(shard) not in segment['shards']:
+                    continue
+                wanted = hashes[shards == shard]
+                path = self.store.path(segment['name'], f'shard-{shard:04d}.parquet')
+                with self.filesystem.open_input_file(path) as source:
+                    parquet_file = pq.ParquetFile(source)
+                    row_groups = list(_matching_row_groups(parquet_file.metadata, wanted))
+                    if not row_groups:
+                        continue
+                    row_groups_read += len(row_groups)
+                    rows = parquet_file.read_row_groups(row_groups)
+                tables.append(rows.filter(ds.field('key_hash').isin(pa.array(wanted, pa.uint64()))))
+        return (pa.concat_tables(tables) if tables else INDEX_SCHEMA.empty_table()), row_groups_read
+
+
+def _matching_row_groups(metadata: pq.FileMetaData, hashes: np.ndarray) -> Iterator[int]:
+    """Row groups of a sorted shard whose key_hash range holds one of the sorted `hashes`."""
+    for row_group in range(metadata.num_row_groups):
+        statistics = metadata.row_group(row_group).column(0).statistics
+        if statistics is None or not statistics.has_min_max:
+            yield row_group
+            continue
+        first = np.searchsorted(hashes, np.uint64(statistics.min), side='left')
+        if first < len(hashes) and hashes[first] <= np.uint64(statistics.max):
+            yield row_group
+
+
+def lookup(
+    index: KeyIndex, keys: pa.Table, columns: list[str] | None = None, all_versions: bool = False
+) -> LookupResult:
+    """Find the rows of the given merge keys through a refreshed index.
+
+    By default only the last row of each key in stream order is returned, the one a merge would keep.
+    """
+    inner = index.inner
+    missing_columns = [name for name in index.merge_keys if name not in keys.column_names]
+    if missing_columns:
+        raise ValueError(f'Keys must give every merge key column, missing {", ".join(missing_columns)}')
+    keys = keys.select(index.merge_keys).cast(index.key_schema)
+    hashes = key_hashes(keys, index.merge_keys, index.schema)
+    candidates, index_row_groups = index.candidates(hashes)
+
+    result = LookupResult(rows=pa.table({}), keys=keys.num_rows, index_row_groups_read=index_row_groups)
+    wanted = {_key_tuple(row, index.merge_keys) for row in keys.to_pylist()}
+    output_schema = pa.schema([index.schema.field(name) for name in columns]) if columns else index.schema
+    read_columns = list(dict.fromkeys([*index.merge_keys, *(columns or index.schema.names)]))
+
+    # Read each candidate file's row groups once, in stream order, then keep the rows whose keys really match
+    groups: dict[tuple[int, int, str], set[int]] = defaultdict(set)
+    for row in candidates.to_pylist():
+        groups[(row['stream_position'], row['entry'], row['file'])].add(row['row_group'])
+    matches: list[tuple[tuple[Any, ...], pa.Table]] = []
+    for stream_position, entry, url in sorted(groups):
+        row_groups = sorted(groups[(stream_position, entry, url)])
+        dataset = ds.dataset(
+            inner.reconstruct_full_path(url), schema=index.schema, format='parquet', filesystem=inner.filesystem
+        )
+        fragment = next(dataset.get_fragments()).subset(row_group_ids=row_groups)
+        rows = fragment.to_table(schema=index.schema, columns=read_columns)
+        result.files_read += 1
+        result.row_groups_read += len(row_groups)
+        rows = rows.filter(pa.array(np.isin(key_hashes(rows, index.merge_keys, index.schema), hashes)))
+        for position, row in enumerate(rows.select(index.merge_keys).to_pylist()):
+            key = _key_tuple(row, index.merge_keys)
+            if key in wanted:
+                matches.append((key, rows.slice(position, 1).select(output_schema.names)))
+
+    if not all_versions:
+        # Later matches of a key replace earlier ones, as a merge would
+        matches = list(dict(matches).items())
+    found = {key for key, _ in matches}
+    result.found = len(found)
+    result.missing = [dict(zip(index.merge_keys, key, strict=True)) for key in sorted(wanted - found, key=str)]
+    result.rows = pa.concat_tables([rows for _, rows in matches]) if matches else output_schema.empty_table()
+    return result
+
+
+def _key_tuple(row: dict[str, Any], merge_keys: list[str]) -> tuple[Any, ...]:
+    return tuple(row[name] for name in merge_keys)
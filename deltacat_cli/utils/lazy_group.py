@@ -0,0 +1,89 @@
+"""Lazily resolved command groups.
+
+Command modules import deltacat and pyarrow at module load, so the command tree is registered by
+import path and only the module of the command that actually runs gets imported. Help screens and
+shell completion are served from the registry without importing anything.
+"""
+
+import importlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import typer
+from typer.core import TyperCommand, TyperGroup
+
+from deltacat_cli.utils.profiling import profiler
+
+
+# Command name -> (import path of a Typer app as 'package.module:attr', short help)
+LazyCommands = dict[str, tuple[str, str]]
+
+
+class LazyGroup(TyperGroup):
+    """TyperGroup resolving its subcommands from `lazy_subcommands` on first use."""
+
+    lazy_subcommands: LazyCommands = {}
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._listing_only = False
+
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        eager = super().list_commands(ctx)
+        return eager + [name for name in self.lazy_subcommands if name not in eager]
+
+    def get_command(self, ctx: typer.Context, cmd_name: str) -> Any:
+        if cmd_name in self.commands or cmd_name not in self.lazy_subcommands:
+            return super().get_command(ctx, cmd_name)
+
+        import_path, short_help = self.lazy_subcommands[cmd_name]
+        if self._listing_only:
+            # Listing commands only needs names and help, don't import the command module for that
+            return TyperCommand(name=cmd_name, help=short_help)
+
+        command = load_command(import_path)
+        command.name = cmd_name
+        command.help = command.help or short_help
+        self.commands[cmd_name] = command
+        return command
+
+    def format_help(self, ctx: typer.Context, formatter: Any) -> None:
+        with self._listing():
+            return super().format_help(ctx, formatter)
+
+    def shell_complete(self, ctx: typer.Context, incomplete: str) -> list[Any]:
+        with self._listing():
+            return super().shell_complete(ctx, incomplete)
+
+    @contextmanager
+    def _listing(self) -> Iterator[None]:
+        self._listing_only = True
+        try:
+            yield
+        finally:
+            self._listing_only = False
+
+
+def lazy_group(subcommands: LazyCommands) -> type[LazyGroup]:
+    """Build a LazyGroup class for the given subcommands, to be passed as `typer.Typer(cls=...)`."""
+    return type('LazyGroup', (LazyGroup,), {'lazy_subcommands': subcommands})
+
+
+def load_command(import_path: str) -> Any:
+    """Import a Typer app by import path and convert it into a click command or group."""
+    module_name, attr = import_path.split(':', 1)
+    with profiler.phase('import'):
+        typer_app: typer.Typer = getattr(importlib.import_module(module_name), attr)
+
+    if (
+        len(typer_app.registered_commands) == 1
+        and not typer_app.registered_groups
+        and not typer_app.registered_callback
+    ):
+        return typer.main.get_command_from_info(
+            typer_app.registered_commands[0],
+            pretty_exceptions_short=typer_app.pretty_exceptions_short,
+            rich_markup_mode=typer_app.rich_markup_mode,
+        )
+    return typer.main.get_group(typer_app)
@@ -0,0 +1,152 @@
+"""On-disk cache of namespace and table metadata.
+
+Opt-in with DELTACAT_CLI_CACHE_TTL (seconds). `namespace get/list` and `table get/list` then serve results younger
+than the TTL from `~/.deltacat_cli/cache.db` without reading the catalog root, and without registering the catalog.
+Entries are keyed by catalog root and object path, e.g. `s3://bucket/catalog/namespace/prod/table/events`, and
+the least recently used ones are evicted beyond DELTACAT_CLI_CACHE_SIZE entries.
+
+The CLI's own create, alter and drop commands invalidate the entries they affect, whether or not the cache is
+enabled; changes made outside the CLI are picked up once entries expire. `deltacat --no-cache ...` bypasses the
+cache for one command.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+
+CACHE_TTL_ENV_VAR = 'DELTACAT_CLI_CACHE_TTL'
+CACHE_SIZE_ENV_VAR = 'DELTACAT_CLI_CACHE_SIZE'
+CACHE_PATH_ENV_VAR = 'DELTACAT_CLI_CACHE'
+
+DEFAULT_MAX_ENTRIES = 10_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL
+)
+"""
+
+
+def normalize(value: Any) -> Any:
+    """The value as printed: deltacat metadata converted to plain JSON types, the same way print_as_json does."""
+    return json.loads(json.dumps(value, default=str))
+
+
+class MetadataCache:
+    """TTL and LRU bounded key-value cache in a SQLite database shared by all CLI processes."""
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+
+    @property
+    def path(self) -> Path:
+        return Path(os.environ.get(CACHE_PATH_ENV_VAR) or Path.home() / '.deltacat_cli' / 'cache.db')
+
+    @property
+    def ttl(self) -> float:
+        return float(os.environ.get(CACHE_TTL_ENV_VAR) or 0)
+
+    @property
+    def max_entries(self) -> int:
+        return int(os.environ.get(CACHE_SIZE_ENV_VAR) or DEFAULT_MAX_ENTRIES)
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and not getattr(self._local, 'bypass', False)
+
+    @contextmanager
+    def bypassed(self) -> Iterator[None]:
+        """Skip the cache for the duration of a command."""
+        previous = getattr(self._local, 'bypass', False)
+        self._local.bypass = True
+        try:
+            yield
+        finally:
+            self._local.bypass = previous
+
+    @staticmethod
+    def key(*parts: str) -> str:
+        """Cache key for an object path of the current catalog."""
+        from deltacat_cli.utils.catalog_context import catalog_context
+
+        name, root = catalog_context.get_catalog_info(silent=True)
+        return '/'.join([root.rstrip('/'), name, *parts])
+
+    def get(self, key: str) -> Any | None:
+        """A cached value younger than the TTL, or None."""
+        if not self.enabled or not self.path.exists():
+            return None
+        now = time.time()
+        with self._connect() as connection:
+            row = connection.execute('SELECT value, created FROM entries WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            if now - row[1] > self.ttl:
+                connection.execute('DELETE FROM entries WHERE key = ?', (key,))
+                return None
+            connection.execute('UPDATE entries SET accessed = ? WHERE key = ?', (now, key))
+        return json.loads(row[0])
+
+    def put(self, key: str, value: Any) -> None:
+        """Cache a value, evicting the least recently used entries beyond the size limit."""
+        if not self.enabled:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute(
+                'INSERT OR REPLACE INTO entries (key, value, created, accessed) VALUES (?, ?, ?, ?)',
+                (key, json.dumps(normalize(value)), now, now),
+            )
+            connection.execute(
+                'DELETE FROM entries WHERE key NOT IN (SELECT key FROM entries ORDER BY accessed DESC LIMIT ?)',
+                (self.max_entries,),
+            )
+
+    def invalidate(self, *keys: str) -> None:
+        """Drop entries for the given keys and everything below them."""
+        if not self.path.exists():
+            return
+        with self._connect() as connection:
+            for key in keys:
+                prefix = key.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+                connection.execute("DELETE FROM entries WHERE key = ? OR key LIKE ? ESCAPE '\\'", (key, f'{prefix}/%'))
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(self.path, timeout=10)
+        try:
+            with connection:
+                connection.execute(SCHEMA)
+                yield connection
+        finally:
+            connection.close()
+
+
+metadata_cache = MetadataCache()
+
+
+def namespaces_key() -> str:
+    return MetadataCache.key('namespaces')
+
+
+def namespace_key(namespace: str) -> str:
+    return MetadataCache.key('namespace', namespace)
+
+
+def tables_key(namespace: str) -> str:
+    return MetadataCache.key('namespace', namespace, 'tables')
+
+
+def table_key(namespace: str, table: str) -> str:
+    return MetadataCache.key('namespace', namespace, 'table', table)
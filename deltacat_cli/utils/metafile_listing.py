@@ -0,0 +1,152 @@
+"""Lazy, resumable listing of namespaces and tables.
+
+deltacat's list operations read the latest revision of every sibling metafile before returning the first one,
+which on object storage means thousands of sequential reads. This lists the parent directory once, in a stable
+order, and resolves revisions a page at a time so results can be printed as they arrive. The continuation token
+of an item is its metafile ID: listing `after` a token resumes right behind it.
+
+Complete listings are kept in the metadata cache when it is enabled, and served from it until they expire.
+"""
+
+import posixpath
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from deltacat.constants import REVISION_DIR_NAME, SUCCESS_TXN_DIR_NAME, TXN_DIR_NAME
+from deltacat.exceptions import NamespaceNotFoundError, ObjectNotFoundError
+from deltacat.storage import Namespace, NamespaceLocator, Table, TableLocator
+from deltacat.storage.model.metafile import Metafile, MetafileRevisionInfo
+from deltacat.storage.model.transaction import Transaction
+from deltacat.storage.model.types import TransactionOperationType
+from deltacat.utils.filesystem import list_directory
+
+from deltacat_cli.utils.metadata_cache import metadata_cache, namespaces_key, normalize, tables_key
+
+
+DEFAULT_PAGE_SIZE = 100
+
+# Revisions resolved concurrently within a page
+MAX_PAGE_WORKERS = 16
+
+
+@dataclass
+class ListedItem:
+    """A listed metafile and the token to resume listing after it."""
+
+    token: str
+    metafile: Metafile | dict[str, Any]
+
+    @property
+    def name(self) -> str:
+        """Name of the listed namespace or table, read from the catalog or from the cache."""
+        if isinstance(self.metafile, dict):
+            locator = self.metafile.get('tableLocator') or self.metafile['namespaceLocator']
+            return locator.get('tableName') or locator['namespace']
+        return self.metafile.table_name if isinstance(self.metafile, Table) else self.metafile.namespace
+
+
+class MetafileListing:
+    """Iterate the live siblings of a metafile page by page."""
+
+    def __init__(
+        self,
+        metafile: Metafile,
+        inner: Any,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        after: str | None = None,
+        missing_parent_error: Exception | None = None,
+        cache_key: str | None = None,
+    ):
+        self.metafile = metafile
+        self.inner = inner
+        self.page_size = page_size
+        self.after = after
+        self.missing_parent_error = missing_parent_error
+        self.cache_key = cache_key
+        self.last_token: str | None = None
+
+    def __iter__(self) -> Iterator[ListedItem]:
+        cached = metadata_cache.get(self.cache_key) if self.cache_key else None
+        if cached is not None:
+            for record in cached:
+                if not self.after or record['id'] > self.after:
+                    self.last_token = record['id']
+                    yield ListedItem(record['id'], record)
+            return
+
+        records = [] if self.cache_key and metadata_cache.enabled and not self.after else None
+        for item in self._list():
+            self.last_token = item.token
+            if records is not None:
+                records.append(normalize(item.metafile))
+            yield item
+        # Only reached when the listing was read to the end
+        if records is not None:
+            metadata_cache.put(self.cache_key, records)
+
+    def _list(self) -> Iterator[ListedItem]:
+        # A read transaction pins what's visible: revisions committed after it started are ignored
+        transaction = Transaction.of([]).start(self.inner.root, self.inner.filesystem)
+        filesystem = self.inner.filesystem
+        success_txn_log_dir = posixpath.join(transaction.catalog_root_normalized, TXN_DIR_NAME, SUCCESS_TXN_DIR_NAME)
+        try:
+            parent_path = self.metafile.parent_root_path(
+                catalog_root=transaction.catalog_root_normalized,
+                current_txn_start_time=transaction.start_time,
+                current_txn_id=transaction.id,
+                filesystem=filesystem,
+            )
+        except ObjectNotFoundError as e:
+            raise (self.missing_parent_error or e) from e
+        paths = sorted(
+            path
+            for path, _ in list_directory(parent_path, filesystem, ignore_missing_path=True)
+            if path != success_txn_log_dir and (not self.after or posixpath.basename(path) > self.after)
+        )
+
+        def resolve(path: str) -> ListedItem | None:
+            revision = MetafileRevisionInfo.latest_revision(
+                revision_dir_path=posixpath.join(path, REVISION_DIR_NAME),
+                filesystem=filesystem,
+                success_txn_log_dir=success_txn_log_dir,
+                current_txn_start_time=transaction.start_time,
+                current_txn_id=transaction.id,
+                ignore_missing_revision=True,
+            )
+            # Name resolution directories have no revisions, deleted metafiles end in a DELETE revision
+            if not revision.exists() or revision.txn_op_type == TransactionOperationType.DELETE:
+                return None
+            return ListedItem(posixpath.basename(path), self.metafile.read(path=revision.path, filesystem=filesystem))
+
+        with ThreadPoolExecutor(max_workers=min(self.page_size, MAX_PAGE_WORKERS)) as executor:
+            for start in range(0, len(paths), self.page_size):
+                for item in executor.map(resolve, paths[start : start + self.page_size]):
+                    if item is not None:
+                        yield item
+
+
+def list_namespaces_lazily(inner: Any, page_size: int = DEFAULT_PAGE_SIZE, after: str | None = None) -> MetafileListing:
+    """Namespaces of a catalog."""
+    return MetafileListing(
+        Namespace.of(NamespaceLocator.of('placeholder')),
+        inner,
+        page_size,
+        after,
+        cache_key=namespaces_key() if metadata_cache.enabled else None,
+    )
+
+
+def list_tables_lazily(
+    namespace: str, inner: Any, page_size: int = DEFAULT_PAGE_SIZE, after: str | None = None
+) -> MetafileListing:
+    """Tables of a namespace."""
+    return MetafileListing(
+        Table.of(locator=TableLocator.at(namespace, 'placeholder')),
+        inner,
+        page_size,
+        after,
+        missing_parent_error=NamespaceNotFoundError(f'Namespace {namespace} not found'),
+        cache_key=tables_key(namespace) if metadata_cache.enabled else None,
+    )
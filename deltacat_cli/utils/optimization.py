@@ -0,0 +1,313 @@
+"""Small-file optimization: bin-packing the data files of a partition into files of a target size.
+
+Plans are made from delta manifests alone. A partition's files are walked in stream order, and runs of
+consecutive small files are packed next-fit into groups of up to the target size, so the rows keep their order
+when each group is rewritten as one file. A large file ends the run before it and is kept as it is.
+
+The rewritten files and the kept ones are committed as a single APPEND delta of a new revision of the partition,
+which replaces the current revision atomically, the way compaction commits its results. Files of the previous
+revision are left in place, it still references them.
+
+Tables with sort keys have the rows of each group ordered by them. Clustering rewrites every file of a partition
+ordered by the sort keys as a whole, so each file covers a narrow range of them and is skipped by filters on
+them; the partition is sorted in memory.
+"""
+
+import math
+import posixpath
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import uuid4
+
+import pyarrow as pa
+from deltacat.constants import DATA_FILE_DIR_NAME
+from deltacat.storage import (
+    Delta,
+    DeltaLocator,
+    DeltaType,
+    EntryType,
+    Manifest,
+    ManifestAuthor,
+    ManifestEntry,
+    Partition,
+    Stream,
+    TableVersion,
+    metastore,
+)
+from deltacat.storage.model.transaction import Transaction
+
+from deltacat import __version__ as deltacat_version
+from deltacat_cli.utils.clustering import cluster_table, table_clustering
+from deltacat_cli.utils.input_files import InputFile
+from deltacat_cli.utils.output_files import COMPRESSIONS, PartWriter
+from deltacat_cli.utils.parquet_footers import manifest_entry, read_footer
+from deltacat_cli.utils.table_scan import ScanFile, TableScan
+from deltacat_cli.utils.table_stats import PARQUET_CONTENT_TYPE, committed_deltas
+from deltacat_cli.utils.table_utils import merge_key_names
+
+
+DEFAULT_TARGET_FILE_BYTES = 256 * 1024 * 1024
+
+# Files below this fraction of the target size are rewritten, larger ones are close enough to keep
+SMALL_FILE_FRACTION = 0.75
+
+DEFAULT_ROW_GROUP_SIZE = 1_000_000
+
+
+@dataclass
+class RewriteGroup:
+    """Files of a partition rewritten together, into one file or, when clustering, files of up to max_bytes."""
+
+    files: list[ScanFile] = field(default_factory=list)
+    max_bytes: int | None = None
+
+    @property
+    def outputs(self) -> int:
+        """Files the group is expected to be rewritten into."""
+        return max(1, math.ceil(self.bytes / self.max_bytes)) if self.max_bytes else 1
+
+    @property
+    def rows(self) -> int:
+        return sum(scan_file.record_count for scan_file in self.files)
+
+    @property
+    def bytes(self) -> int:
+        return sum(scan_file.content_length for scan_file in self.files)
+
+
+@dataclass
+class PartitionPlan:
+    """The files of a partition in stream order and the groups of them to rewrite."""
+
+    partition: Partition
+    deltas: int = 0
+    files: list[ScanFile] = field(default_factory=list)
+    groups: list[RewriteGroup] = field(default_factory=list)
+
+    @property
+    def partition_values(self) -> list[Any] | None:
+        return self.partition.partition_values
+
+    @property
+    def files_rewritten(self) -> int:
+        return sum(len(group.files) for group in self.groups)
+
+    @property
+    def files_after(self) -> int:
+        return len(self.files) - self.files_rewritten + sum(group.outputs for group in self.groups)
+
+    @property
+    def rows_rewritten(self) -> int:
+        return sum(group.rows for group in self.groups)
+
+    @property
+    def bytes_rewritten(self) -> int:
+        return sum(group.bytes for group in self.groups)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'partition_id': self.partition.partition_id,
+            'partition_values': self.partition_values,
+            'deltas': self.deltas,
+            'files_before': len(self.files),
+            'files_after': self.files_after,
+            'groups': len(self.groups),
+            'files_rewritten': self.files_rewritten,
+            'rows_rewritten': self.rows_rewritten,
+            'bytes_rewritten': self.bytes_rewritten,
+        }
+
+
+def pack_files(files: list[ScanFile], target_bytes: int) -> list[RewriteGroup]:
+    """Next-fit packing of runs of consecutive small Parquet files into groups of up to `target_bytes`.
+
+    Groups of a single file would only be copied, so they are dropped.
+    """
+    groups: list[RewriteGroup] = []
+    current = RewriteGroup()
+
+    def close() -> None:
+        nonlocal current
+        if len(current.files) > 1:
+            groups.append(current)
+        current = RewriteGroup()
+
+    for scan_file in files:
+        small = scan_file.content_length < target_bytes * SMALL_FILE_FRACTION
+        if not small or scan_file.content_type != PARQUET_CONTENT_TYPE:
+            close()
+            continue
+        if current.files and current.bytes + scan_file.content_length > target_bytes:
+            close()
+        current.files.append(scan_file)
+    close()
+    return groups
+
+
+def plan_optimize(
+    inner: Any,
+    namespace: str,
+    table_version: TableVersion,
+    target_bytes: int = DEFAULT_TARGET_FILE_BYTES,
+    cluster: bool = False,
+) -> list[PartitionPlan]:
+    """Plan the rewrite of every committed partition of a table version from its delta manifests.
+
+    With `cluster`, every file of a partition is rewritten, ordered by the table's sort keys as a whole.
+    """
+    merge_keys = merge_key_names(table_version.schema)
+    table = table_version.locator.table_name
+    if merge_keys:
+        raise ValueError(
+            f'Table {namespace}.{table} has merge keys ({", ".join(merge_keys)}), use table compact to merge its files'
+        )
+    if cluster and not table_clustering(table_version)[0]:
+        raise ValueError(f'Table {namespace}.{table} has no sort keys to cluster by, set them with table alter')
+    scan = TableScan(namespace=namespace, table=table, inner=inner, table_version=table_version.table_version)
+
+    plans: dict[str, PartitionPlan] = {}
+    for partition, delta in committed_deltas(inner, namespace, table_version):
+        if delta.type not in (DeltaType.ADD, DeltaType.APPEND):
+            raise ValueError(
+                f'Table {namespace}.{table} has {delta.type.value} deltas, use table compact to apply them first'
+            )
+        plan = plans.setdefault(partition.partition_id, PartitionPlan(partition=partition))
+        plan.deltas += 1
+        plan.files.extend(scan.files_of(delta))
+    for plan in plans.values():
+        if cluster:
+            plan.groups = [RewriteGroup(files=list(plan.files), max_bytes=target_bytes)] if plan.files else []
+        else:
+            plan.groups = pack_files(plan.files, target_bytes)
+    return list(plans.values())
+
+
+def _rewrite_group(
+    scan: TableScan, group: RewriteGroup, directory: str, row_group_size: int, sort_keys: list[str], clustering: str
+) -> list[tuple[str, int]]:
+    """Write the rows of a group to new files in `directory`. Returns the paths and sizes written.
+
+    Rows keep their order unless the table has sort keys, in which case the group is ordered by them in memory.
+    """
+    writer = PartWriter(
+        scan.inner.filesystem,
+        directory,
+        uuid4().hex,
+        'parquet',
+        COMPRESSIONS['parquet'][0],
+        row_group_size,
+        # Packed groups are already sized by the plan, so each one becomes a single file
+        max_bytes=group.max_bytes or 2**63,
+        schema=scan.arrow_schema,
+    )
+    batches = (batch for scan_file in group.files for batch in scan.file_batches(scan_file))
+    if sort_keys:
+        data = cluster_table(pa.Table.from_batches(batches, schema=scan.arrow_schema), sort_keys, clustering)
+        batches = iter(data.to_batches(max_chunksize=row_group_size))
+    for batch in batches:
+        writer.write(batch)
+    writer.close()
+    return [(part.path, part.bytes) for part in writer.parts]
+
+
+def _partition_changed(inner: Any, stream: Stream, plan: PartitionPlan) -> bool:
+    """Whether the planned partition was replaced or got deltas since it was planned, as committed by now."""
+    # A read transaction started now sees every commit made so far, unlike the reads of the commit's transaction
+    reads = Transaction.of([]).start(inner.root, inner.filesystem)
+    current = metastore.get_partition(stream.locator, plan.partition.partition_values, transaction=reads, inner=inner)
+    if current is None or current.partition_id != plan.partition.partition_id:
+        return True
+    return len(metastore.list_partition_deltas(current, transaction=reads, inner=inner).all_items()) != plan.deltas
+
+
+def optimize_partition(
+    inner: Any,
+    namespace: str,
+    table_version: TableVersion,
+    plan: PartitionPlan,
+    workers: int = 1,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    on_group: Callable[[RewriteGroup], None] | None = None,
+) -> Partition:
+    """Rewrite the groups of a plan concurrently and commit them with the kept files as a new partition revision.
+
+    Rewritten rows are ordered by the table's sort keys, if it has any.
+
+    Fails without committing anything if the partition changed since it was planned, deleting the new files.
+    """
+    table = table_version.locator.table_name
+    if table_version.schema is None:
+        raise ValueError(f'Table {namespace}.{table} has no schema to rewrite its files with')
+    scan = TableScan(namespace=namespace, table=table, inner=inner, table_version=table_version.table_version)
+    sort_keys, clustering = table_clustering(table_version)
+    stream = metastore.get_stream(namespace, table, table_version.table_version, inner=inner)
+    new_partition = metastore.stage_partition(
+        stream, plan.partition.partition_values, plan.partition.partition_scheme_id, inner=inner
+    )
+    relative_dir = posixpath.join(DATA_FILE_DIR_NAME, new_partition.partition_id)
+    directory = inner.reconstruct_full_path(relative_dir)
+    inner.filesystem.create_dir(directory, recursive=True)
+
+    written: list[str] = []
+    lock = threading.Lock()
+
+    def rewrite(group: RewriteGroup) -> list[ManifestEntry]:
+        parts = _rewrite_group(scan, group, directory, row_group_size, sort_keys, clustering)
+        with lock:
+            written.extend(path for path, _ in parts)
+        entries = [
+            manifest_entry(
+                read_footer(InputFile(path=path, filesystem=inner.filesystem, size=size, format='parquet')),
+                table_version.schema.id,
+                url=posixpath.join(relative_dir, posixpath.basename(path)),
+            )
+            for path, size in parts
+        ]
+        if on_group is not None:
+            on_group(group)
+        return entries
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='optimize') as executor:
+            rewritten = list(executor.map(rewrite, plan.groups))
+
+        # Each group's file takes the place of the group's first file, the other files of the group are dropped
+        replaced = {id(group.files[0]): entries for group, entries in zip(plan.groups, rewritten, strict=True)}
+        dropped = {id(scan_file) for group in plan.groups for scan_file in group.files[1:]}
+        entries: list[ManifestEntry] = []
+        for scan_file in plan.files:
+            if id(scan_file) in replaced:
+                entries.extend(replaced[id(scan_file)])
+            elif id(scan_file) not in dropped:
+                entries.append(scan_file.entry)
+
+        manifest = Manifest.of(
+            entries=entries,
+            author=ManifestAuthor.of(name='deltacat-cli.table.optimize', version=deltacat_version),
+            entry_type=EntryType.DATA,
+        )
+        delta = Delta.of(
+            locator=DeltaLocator.of(new_partition.locator, None),
+            delta_type=DeltaType.APPEND,
+            meta=manifest.meta,
+            properties=None,
+            manifest=manifest,
+            previous_stream_position=new_partition.stream_position,
+        )
+        # The delta and the new revision commit together, and deltacat fails them if the partition was replaced.
+        # ADD deltas don't write the partition, so they're counted last, right before the transaction is sealed
+        with Transaction.of([]).start(inner.root, inner.filesystem) as transaction:
+            metastore.commit_delta(delta, transaction=transaction, inner=inner)
+            committed = metastore.commit_partition(new_partition, transaction=transaction, inner=inner)
+            if _partition_changed(inner, stream, plan):
+                raise ValueError(
+                    f'Table {namespace}.{table} changed while its files were rewritten, nothing was committed'
+                )
+        return committed
+    except BaseException:
+        for path in written:
+            inner.filesystem.delete_file(path)
+        raise
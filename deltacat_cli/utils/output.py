@@ -0,0 +1,205 @@
+"""Machine-readable output for commands that print data.
+
+`deltacat --output ndjson|json|csv|arrow ...` writes records and table rows straight to stdout, skipping Rich
+rendering, while status messages move to stderr so the output can be piped. The default, `auto`, renders with Rich
+on a terminal and writes NDJSON otherwise. Set DELTACAT_CLI_OUTPUT to change the default.
+
+JSON is encoded with orjson when it is installed.
+"""
+
+import csv
+import datetime
+import io
+import json
+import os
+import sys
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Literal
+
+from deltacat_cli.utils.profiling import profiler
+
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+OUTPUT_ENV_VAR = 'DELTACAT_CLI_OUTPUT'
+
+OUTPUT_FORMATS = ('auto', 'rich', 'ndjson', 'json', 'csv', 'arrow')
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return str(value)
+
+
+def dumps(value: Any) -> str:
+    """Compact JSON for one value, values JSON can't represent are converted to strings."""
+    if orjson is not None:
+        return orjson.dumps(value, default=_default, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value, default=_default, separators=(',', ':'), ensure_ascii=False)
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ''
+    return value if isinstance(value, (str, int, float)) else dumps(value)
+
+
+def validate_format(output_format: str) -> str:
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f'Unknown output format {output_format}, expected one of {", ".join(OUTPUT_FORMATS)}')
+    return output_format
+
+
+class OutputContext:
+    """Output format of the command running on the current thread."""
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+
+    @property
+    def format(self) -> str:
+        return getattr(self._local, 'format', None) or validate_format(os.environ.get(OUTPUT_ENV_VAR) or 'auto')
+
+    @format.setter
+    def format(self, value: str | None) -> None:
+        self._local.format = validate_format(value) if value else None
+
+    def resolve(self) -> str:
+        """The output format in effect, with `auto` resolved against stdout."""
+        if self.format == 'auto':
+            return 'rich' if sys.stdout.isatty() else 'ndjson'
+        return self.format
+
+    @property
+    def machine(self) -> bool:
+        """Whether stdout carries machine-readable output, and status messages go to stderr."""
+        return self.resolve() != 'rich'
+
+    @contextmanager
+    def scoped(self, output_format: str | None) -> Iterator[None]:
+        """Use an output format for the duration of a command, restoring the previous one afterwards."""
+        previous = getattr(self._local, 'format', None)
+        self.format = output_format
+        try:
+            yield
+        finally:
+            self._local.format = previous
+
+
+output_context = OutputContext()
+
+
+def print_record(source_type: Literal['namespace', 'table'], record: dict[Any, Any]) -> None:
+    """Print a single namespace or table."""
+    output_format = output_context.resolve()
+    with profiler.phase('render'):
+        if output_format == 'rich':
+            from deltacat_cli.utils.print_as_json import print_as_json
+
+            print_as_json(source_type=source_type, data=record)
+        elif output_format == 'json':
+            sys.stdout.write(dumps(record) + '\n')
+        else:
+            print_records(source_type, [record])
+
+
+def print_records(source_type: Literal['namespace', 'table'], records: Iterable[dict[Any, Any]]) -> int:
+    """Print namespaces or tables as they are listed, as CSV once all are. Returns the number printed."""
+    output_format = output_context.resolve()
+    if output_format == 'arrow':
+        raise ValueError('--output arrow is only supported for table data, use ndjson, json or csv')
+    if output_format == 'json':
+        sys.stdout.write('[')
+
+    count = 0
+    rows = []
+    for record in records:
+        with profiler.phase('render'):
+            if output_format == 'rich':
+                from deltacat_cli.utils.print_as_json import print_as_json
+
+                print_as_json(source_type=source_type, data=record)
+            elif output_format == 'json':
+                sys.stdout.write((',' if count else '') + dumps(record))
+            elif output_format == 'csv':
+                # Written once all are listed, the header names the fields of every record
+                rows.append({key: _csv_value(value) for key, value in record.items()})
+            else:
+                sys.stdout.write(dumps(record) + '\n')
+        count += 1
+
+    if output_format == 'json':
+        sys.stdout.write(']\n')
+    if rows:
+        with profiler.phase('render'):
+            fieldnames = list(dict.fromkeys(key for row in rows for key in row))
+            writer = csv.DictWriter(sys.stdout, fieldnames=fieldnames, lineterminator='\n')
+            writer.writeheader()
+            writer.writerows(rows)
+    return count
+
+
+def print_table_batches(batches: Iterable['pa.RecordBatch']) -> int:
+    """Print table rows as record batches arrive. Returns the number of rows printed."""
+    output_format = output_context.resolve()
+    if output_format == 'rich':
+        from deltacat_cli.utils.print_batches import print_batches
+
+        return print_batches(batches)
+    if output_format == 'arrow':
+        return _write_arrow(batches)
+
+    import pyarrow.csv as pa_csv
+
+    rows = 0
+    if output_format == 'json':
+        sys.stdout.write('[')
+    for batch in batches:
+        if batch.num_rows == 0:
+            continue
+        with profiler.phase('render'):
+            if output_format == 'csv':
+                sink = io.BytesIO()
+                pa_csv.write_csv(batch, sink, write_options=pa_csv.WriteOptions(include_header=rows == 0))
+                sys.stdout.write(sink.getvalue().decode('utf-8'))
+            elif output_format == 'json':
+                sys.stdout.write((',' if rows else '') + ','.join(dumps(row) for row in batch.to_pylist()))
+            else:
+                sys.stdout.write(''.join(dumps(row) + '\n' for row in batch.to_pylist()))
+        rows += batch.num_rows
+    if output_format == 'json':
+        sys.stdout.write(']\n')
+    sys.stdout.flush()
+    return rows
+
+
+def _write_arrow(batches: Iterable['pa.RecordBatch']) -> int:
+    """Write batches as an Arrow IPC stream to the binary stdout."""
+    import pyarrow as pa
+
+    sink = getattr(sys.stdout, 'buffer', None)
+    if sink is None:
+        raise ValueError('--output arrow needs stdout to be a file or a pipe')
+    sys.stdout.flush()
+    rows = 0
+    writer = None
+    for batch in batches:
+        with profiler.phase('render'):
+            if writer is None:
+                writer = pa.ipc.new_stream(sink, batch.schema)
+            writer.write_batch(batch)
+        rows += batch.num_rows
+    if writer is not None:
+        writer.close()
+    sink.flush()
+    return rows
@@ -0,0 +1,266 @@
+"""Streaming writers for Parquet, Arrow IPC and CSV part files.
+
+Record batches are buffered up to a row group, written, and a new part file is started once the current one
+reaches a size bound, so exports of any size are written with at most a row group per writer in memory.
+Directories may be local paths or filesystem URIs (`s3://bucket/prefix`).
+"""
+
+import os
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.fs as pa_fs
+import pyarrow.parquet as pq
+
+
+if TYPE_CHECKING:
+    from deltacat_cli.utils.table_scan import ScanFile, TableScan
+
+
+EXPORT_FORMATS = ('parquet', 'ipc', 'csv')
+
+# Codecs per format, the first one is the default
+COMPRESSIONS = {
+    'parquet': ('zstd', 'snappy', 'gzip', 'brotli', 'lz4', 'none'),
+    'ipc': ('none', 'zstd', 'lz4'),
+    'csv': ('none', 'gzip'),
+}
+
+EXTENSIONS = {'parquet': '.parquet', 'ipc': '.arrow', 'csv': '.csv'}
+
+PART_PREFIX = 'part-'
+
+
+@dataclass
+class OutputPart:
+    """A finished part file."""
+
+    path: str
+    rows: int
+    bytes: int
+
+
+def validate_compression(export_format: str, compression: str | None) -> str:
+    """The codec to use, the format's default if none is given."""
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f'Unknown format {export_format}, expected one of {", ".join(EXPORT_FORMATS)}')
+    codecs = COMPRESSIONS[export_format]
+    if compression is None:
+        return codecs[0]
+    if compression not in codecs:
+        raise ValueError(f'Unknown compression {compression} for {export_format}, expected one of {", ".join(codecs)}')
+    return compression
+
+
+def resolve_output_dir(out: str, overwrite: bool = False) -> tuple[pa_fs.FileSystem, str]:
+    """Filesystem and path of an output directory, created if missing.
+
+    Fails if the directory already holds part files, unless `overwrite` is set, in which case they are deleted.
+    """
+    if '://' in out:
+        filesystem, path = pa_fs.FileSystem.from_uri(out)
+    else:
+        filesystem, path = pa_fs.LocalFileSystem(), os.path.abspath(os.path.expanduser(out))
+    prepare_output_dir(filesystem, path, overwrite)
+    return filesystem, path
+
+
+def prepare_output_dir(filesystem: pa_fs.FileSystem, path: str, overwrite: bool = False) -> None:
+    """Create a directory, failing if it holds part files unless `overwrite` is set, which deletes them."""
+    filesystem.create_dir(path, recursive=True)
+    existing = [
+        info.path
+        for info in filesystem.get_file_info(pa_fs.FileSelector(path, allow_not_found=True))
+        if info.type == pa_fs.FileType.File and info.base_name.startswith(PART_PREFIX)
+    ]
+    if existing and not overwrite:
+        raise ValueError(f'{path} already contains {len(existing)} part file(s), pass --overwrite to replace them')
+    for part in existing:
+        filesystem.delete_file(part)
+
+
+class PartWriter:
+    """Writes batches to `<prefix>-00000.<ext>`, `<prefix>-00001.<ext>`, ... starting a new part past max_bytes."""
+
+    def __init__(
+        self,
+        filesystem: pa_fs.FileSystem,
+        directory: str,
+        prefix: str,
+        export_format: str,
+        compression: str,
+        row_group_size: int,
+        max_bytes: int,
+        schema: pa.Schema | None = None,
+    ):
+        self.filesystem = filesystem
+        self.directory = directory
+        self.prefix = prefix
+        self.export_format = export_format
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self.max_bytes = max_bytes
+        self.schema = schema
+        self.parts: list[OutputPart] = []
+        self._pending: list[pa.RecordBatch] = []
+        self._pending_rows = 0
+        self._path = ''
+        self._stream: Any = None
+        self._sink: Any = None
+        self._writer: Any = None
+        self._part_rows = 0
+
+    def write(self, batch: pa.RecordBatch) -> OutputPart | None:
+        """Buffer a batch, writing a row group once enough rows are pending. Returns a part if one was finished."""
+        if self.schema is None:
+            self.schema = batch.schema
+        self._pending.append(batch)
+        self._pending_rows += batch.num_rows
+        finished = None
+        while self._pending_rows >= self.row_group_size:
+            finished = self._flush() or finished
+        return finished
+
+    def close(self) -> OutputPart | None:
+        """Write what's pending and finish the current part. Returns it, if there was one."""
+        finished = self._flush() if self._pending_rows else None
+        return self._finish_part() or finished
+
+    def _flush(self) -> OutputPart | None:
+        """Write up to a row group of the pending rows, finishing the part if it reached max_bytes."""
+        pending = pa.Table.from_batches(self._pending, schema=self.schema)
+        table, rest = pending.slice(0, self.row_group_size), pending.slice(self.row_group_size)
+        self._pending, self._pending_rows = rest.to_batches(), rest.num_rows
+        if self._writer is None:
+            self._open_part()
+        if self.export_format == 'parquet':
+            self._writer.write_table(table, row_group_size=self.row_group_size)
+        elif self.export_format == 'ipc':
+            self._writer.write_table(table, max_chunksize=self.row_group_size)
+        else:
+            self._writer.write_table(table)
+        self._part_rows += table.num_rows
+        if self._stream.tell() >= self.max_bytes:
+            return self._finish_part()
+        return None
+
+    def _open_part(self) -> None:
+        extension = EXTENSIONS[self.export_format]
+        if self.export_format == 'csv' and self.compression == 'gzip':
+            extension += '.gz'
+        self._path = f'{self.directory.rstrip("/")}/{self.prefix}-{len(self.parts):05d}{extension}'
+        # Compression is applied below, not detected from the extension, so the stream counts compressed bytes
+        self._stream = self.filesystem.open_output_stream(self._path, compression=None)
+        self._part_rows = 0
+        if self.export_format == 'parquet':
+            self._sink = self._stream
+            self._writer = pq.ParquetWriter(self._sink, self.schema, compression=self.compression)
+        elif self.export_format == 'ipc':
+            self._sink = self._stream
+            options = pa.ipc.IpcWriteOptions(compression=None if self.compression == 'none' else self.compression)
+            self._writer = pa.ipc.new_file(self._sink, self.schema, options=options)
+        else:
+            gzip = self.compression == 'gzip'
+            self._sink = pa.CompressedOutputStream(self._stream, 'gzip') if gzip else self._stream
+            self._writer = pa_csv.CSVWriter(self._sink, self.schema)
+
+    def _finish_part(self) -> OutputPart | None:
+        if self._writer is None:
+            return None
+        self._writer.close()
+        # Closing a compressed stream closes the file under it as well
+        self._sink.close()
+        if not self._stream.closed:
+            self._stream.close()
+        part = OutputPart(
+            path=self._path, rows=self._part_rows, bytes=self.filesystem.get_file_info(self._path).size or 0
+        )
+        self.parts.append(part)
+        self._writer = self._sink = self._stream = None
+        return part
+
+
+class ExportProgress:
+    """Counters shared by the writers of an export."""
+
+    def __init__(self, files: Iterator['ScanFile']):
+        self._files = files
+        self._lock = threading.Lock()
+        self.stop = threading.Event()
+        self.rows = 0
+        self.bytes = 0
+        self.parts = 0
+
+    def next_file(self) -> 'ScanFile | None':
+        """The next data file to export, None once all are taken or the export failed."""
+        with self._lock:
+            if self.stop.is_set():
+                return None
+            return next(self._files, None)
+
+    def finished(self, part: OutputPart) -> None:
+        with self._lock:
+            self.rows += part.rows
+            self.bytes += part.bytes
+            self.parts += 1
+
+
+def export_scan(
+    scan: 'TableScan',
+    filesystem: pa_fs.FileSystem,
+    directory: str,
+    export_format: str,
+    compression: str,
+    row_group_size: int,
+    max_bytes: int,
+    workers: int,
+    on_part: Callable[[OutputPart, ExportProgress], None] | None = None,
+) -> ExportProgress:
+    """Write the data files of a scan to part files with a pool of writers.
+
+    Each writer pulls data files and writes its own parts, named part-<writer>-<sequence>, so rows keep the table
+    order within a part, not across writers. The first failure stops every writer and is raised.
+    """
+    progress = ExportProgress(scan.files())
+
+    def report(part: OutputPart | None) -> None:
+        if part is not None:
+            progress.finished(part)
+            if on_part is not None:
+                on_part(part, progress)
+
+    def export_files(worker: int) -> None:
+        writer = PartWriter(
+            filesystem,
+            directory,
+            f'{PART_PREFIX}{worker:04d}',
+            export_format,
+            compression,
+            row_group_size,
+            max_bytes,
+            schema=scan.output_schema,
+        )
+        try:
+            while (scan_file := progress.next_file()) is not None:
+                for batch in scan.file_batches(scan_file):
+                    if progress.stop.is_set():
+                        break
+                    report(writer.write(batch))
+            report(writer.close())
+        except BaseException:
+            progress.stop.set()
+            raise
+
+    if workers == 1:
+        export_files(0)
+        return progress
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='table-export') as executor:
+        # Surface the first failure once every writer has stopped
+        for future in [executor.submit(export_files, worker) for worker in range(workers)]:
+            future.result()
+    return progress
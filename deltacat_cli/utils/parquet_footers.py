@@ -0,0 +1,157 @@
+"""Parquet footers: row counts, statistics and schema checks without reading any data pages.
+
+A Parquet file's footer holds its schema, row groups and per column chunk statistics, typically a few KiB at
+the end of the file. Reading only footers, many at a time, lets files be validated against a table schema and
+registered as table data without downloading them.
+"""
+
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.fs as pa_fs
+import pyarrow.parquet as pq
+from deltacat.storage import EntryType, ManifestEntry, ManifestMeta
+from deltacat.types.media import ContentEncoding, ContentType
+
+from deltacat_cli.utils.input_files import InputFile
+
+
+@dataclass
+class ColumnStats:
+    """Statistics of a column, merged over row groups and files."""
+
+    null_count: int | None = 0
+    min: Any = None
+    max: Any = None
+
+    def merge(self, null_count: int | None, minimum: Any, maximum: Any) -> None:
+        self.null_count = None if self.null_count is None or null_count is None else self.null_count + null_count
+        if minimum is not None and (self.min is None or minimum < self.min):
+            self.min = minimum
+        if maximum is not None and (self.max is None or maximum > self.max):
+            self.max = maximum
+
+
+@dataclass
+class FileFooter:
+    """What a Parquet footer says about its file."""
+
+    input_file: InputFile
+    schema: pa.Schema
+    rows: int
+    row_groups: int
+    uncompressed_bytes: int
+    columns: dict[str, ColumnStats] = field(default_factory=dict)
+
+    @property
+    def uri(self) -> str:
+        """Absolute URI of the file, with the scheme of its filesystem unless it is local."""
+        filesystem = self.input_file.filesystem
+        if isinstance(filesystem, pa_fs.LocalFileSystem):
+            return self.input_file.path
+        return f'{filesystem.type_name}://{self.input_file.path}'
+
+
+def read_footer(input_file: InputFile) -> FileFooter:
+    """Read the footer of a Parquet file, and nothing else."""
+    with input_file.filesystem.open_input_file(input_file.path) as source:
+        try:
+            parquet_file = pq.ParquetFile(source)
+        except pa.ArrowInvalid as e:
+            raise ValueError(f'{input_file.path} is not a Parquet file: {e}') from e
+        metadata = parquet_file.metadata
+        footer = FileFooter(
+            input_file=input_file,
+            schema=parquet_file.schema_arrow,
+            rows=metadata.num_rows,
+            row_groups=metadata.num_row_groups,
+            uncompressed_bytes=0,
+        )
+    # Leaf column paths of top level columns are their names, nested columns are not tracked
+    names = set(footer.schema.names)
+    for row_group_index in range(metadata.num_row_groups):
+        row_group = metadata.row_group(row_group_index)
+        footer.uncompressed_bytes += row_group.total_byte_size
+        for column_index in range(row_group.num_columns):
+            column = row_group.column(column_index)
+            if column.path_in_schema not in names:
+                continue
+            stats = footer.columns.setdefault(column.path_in_schema, ColumnStats())
+            statistics = column.statistics
+            if statistics is None:
+                stats.merge(None, None, None)
+            else:
+                stats.merge(
+                    statistics.null_count if statistics.has_null_count else None,
+                    statistics.min if statistics.has_min_max else None,
+                    statistics.max if statistics.has_min_max else None,
+                )
+    return footer
+
+
+def read_footers(input_files: Iterable[InputFile], workers: int) -> list[FileFooter]:
+    """Read footers concurrently, in the order of the files."""
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='parquet-footer') as executor:
+        return list(executor.map(read_footer, input_files))
+
+
+def _compatible(file_type: pa.DataType, table_type: pa.DataType) -> bool:
+    """Whether values of a file column can be read as the table type without loss."""
+    if file_type.equals(table_type):
+        return True
+    if pa.types.is_integer(file_type) and pa.types.is_integer(table_type):
+        same_sign = pa.types.is_signed_integer(file_type) == pa.types.is_signed_integer(table_type)
+        return same_sign and file_type.bit_width <= table_type.bit_width
+    if pa.types.is_floating(file_type) and pa.types.is_floating(table_type):
+        return file_type.bit_width <= table_type.bit_width
+    string_types = (pa.string(), pa.large_string())
+    binary_types = (pa.binary(), pa.large_binary())
+    return (file_type in string_types and table_type in string_types) or (
+        file_type in binary_types and table_type in binary_types
+    )
+
+
+def validate_footer(footer: FileFooter, schema: pa.Schema, merge_keys: Iterable[str] = ()) -> list[str]:
+    """Reasons a file can't be read as table data of `schema`, empty if it can.
+
+    Columns must exist in the table with a compatible type. Table columns missing from the file must be
+    nullable, and required and merge key columns must have statistics showing they hold no nulls.
+    """
+    problems = []
+    extra = [name for name in footer.schema.names if name not in schema.names]
+    if extra:
+        problems.append(f'columns not in the table schema: {", ".join(extra)}')
+    merge_keys = set(merge_keys)
+    for table_field in schema:
+        name = table_field.name
+        if name not in footer.schema.names:
+            if not table_field.nullable or name in merge_keys:
+                problems.append(f'missing required column {name}')
+            continue
+        file_type = footer.schema.field(name).type
+        if not _compatible(file_type, table_field.type):
+            problems.append(f'column {name} is {file_type}, the table expects {table_field.type}')
+        if not table_field.nullable or name in merge_keys:
+            null_count = footer.columns[name].null_count if name in footer.columns else None
+            if null_count is None:
+                problems.append(f'column {name} has no null count statistics to show it holds no nulls')
+            elif null_count:
+                problems.append(f'column {name} must not be null but has {null_count:,} null(s)')
+    return problems
+
+
+def manifest_entry(footer: FileFooter, schema_id: int | None, url: str | None = None) -> ManifestEntry:
+    """Manifest entry referencing a Parquet file where it is, at `url` if given, e.g. relative to the catalog root."""
+    meta = ManifestMeta.of(
+        record_count=footer.rows,
+        content_length=footer.input_file.size,
+        content_type=ContentType.PARQUET.value,
+        content_encoding=ContentEncoding.IDENTITY.value,
+        source_content_length=footer.uncompressed_bytes,
+        entry_type=EntryType.DATA,
+        schema_id=schema_id,
+    )
+    return ManifestEntry.of(url=url or footer.uri, meta=meta, mandatory=True)
@@ -0,0 +1,43 @@
+from collections.abc import Iterable
+
+import pyarrow as pa
+from rich import box
+from rich.table import Table
+from rich.text import Text
+
+from deltacat_cli.config import console
+from deltacat_cli.utils.profiling import profiler
+
+
+MAX_COLUMN_WIDTH = 40
+
+
+def print_batches(batches: Iterable[pa.RecordBatch]) -> int:
+    """Print record batches as table rows while they arrive. Returns the number of rows printed.
+
+    Column widths are fixed from the first batch so that every batch renders as a continuation of the same table.
+    """
+    widths: list[int] | None = None
+    rows_printed = 0
+    for batch in batches:
+        if batch.num_rows == 0:
+            continue
+        with profiler.phase('render'):
+            columns = [[_format_value(value) for value in column.to_pylist()] for column in batch.columns]
+            if widths is None:
+                widths = [
+                    min(MAX_COLUMN_WIDTH, max([len(name)] + [len(value) for value in values]))
+                    for name, values in zip(batch.schema.names, columns, strict=True)
+                ]
+            table = Table(box=box.SIMPLE_HEAD, show_header=rows_printed == 0, show_edge=False, pad_edge=False)
+            for name, width in zip(batch.schema.names, widths, strict=True):
+                table.add_column(name, width=width, no_wrap=True, overflow='ellipsis', header_style='bold cyan')
+            for row in zip(*columns, strict=True):
+                table.add_row(*(Text(value, style='dim') if value == 'null' else Text(value) for value in row))
+            console.print(table)
+        rows_printed += batch.num_rows
+    return rows_printed
+
+
+def _format_value(value: object) -> str:
+    return 'null' if value is None else str(value)
@@ -0,0 +1,175 @@
+"""Per-phase timing of a command, with optional cProfile and tracemalloc reports.
+
+`deltacat --profile ...` splits the time of a command into the phases below and prints the breakdown to stderr
+once it finishes. Phases nest: time spent in an inner phase is only counted there, and whatever isn't covered
+by a phase is counted as `deltacat`, the calls into deltacat and the command's own logic.
+
+- startup: interpreter start and CLI imports, before the command was parsed
+- import: command modules and deltacat, imported on first use
+- config: reading the catalog configuration
+- catalog: constructing and registering the catalog
+- render: formatting and writing output
+
+`--profile-file out.prof` also records a cProfile of the command for `snakeviz` or `pstats`, and
+`--profile-memory N` traces allocations with tracemalloc and lists the N largest allocation sites.
+"""
+
+import cProfile
+import os
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+
+PHASES = ('startup', 'import', 'config', 'catalog', 'deltacat', 'render')
+
+
+def process_age() -> float | None:
+    """Seconds since this process started, where /proc tells."""
+    try:
+        with open('/proc/self/stat') as stat, open('/proc/uptime') as uptime:
+            # The command name in field 2 may contain spaces, fields after it are space separated
+            start_ticks = int(stat.read().rsplit(')', 1)[1].split()[19])
+            return float(uptime.read().split()[0]) - start_ticks / os.sysconf('SC_CLK_TCK')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+@dataclass
+class PhaseTiming:
+    calls: int = 0
+    seconds: float = 0.0
+
+
+class Profiler:
+    """Accumulates phase timings of the commands run while a session is active."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._sessions = 0
+        self._timings: dict[str, PhaseTiming] = defaultdict(PhaseTiming)
+        self._measured_startup = False
+
+    @property
+    def active(self) -> bool:
+        return self._sessions > 0
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Count the time of a block, minus that of phases nested in it, towards a phase."""
+        if not self._sessions:
+            yield
+            return
+        # Per thread: elapsed time of nested phases of every open phase
+        stack = self._local.__dict__.setdefault('stack', [])
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            with self._lock:
+                timing = self._timings[name]
+                timing.calls += 1
+                timing.seconds += elapsed - nested
+
+    @contextmanager
+    def session(self, profile_file: Path | None = None, memory_top: int = 0) -> Iterator[None]:
+        """Profile the commands run inside the block and print a report when it ends."""
+        with self._lock:
+            self._sessions += 1
+            if not self._measured_startup:
+                self._measured_startup = True
+                age = process_age()
+                if age is not None:
+                    self._timings['startup'] = PhaseTiming(calls=1, seconds=age)
+
+        profile = cProfile.Profile() if profile_file else None
+        tracing = memory_top > 0 and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        start = time.perf_counter()
+        if profile is not None:
+            profile.enable()
+        try:
+            with self.phase('deltacat'):
+                yield
+        finally:
+            if profile is not None:
+                profile.disable()
+            wall_seconds = time.perf_counter() - start
+            snapshot = tracemalloc.take_snapshot() if tracing else None
+            peak = tracemalloc.get_traced_memory()[1] if tracing else None
+            if tracing:
+                tracemalloc.stop()
+            with self._lock:
+                self._sessions -= 1
+                timings, self._timings = dict(self._timings), defaultdict(PhaseTiming)
+
+            print_report(timings, wall_seconds)
+            if profile is not None:
+                profile.dump_stats(profile_file)
+                _stderr_line(f'cProfile written to {profile_file}, view with: python -m pstats {profile_file}')
+            if snapshot is not None:
+                print_allocations(snapshot, memory_top, peak)
+
+
+profiler = Profiler()
+
+
+def _stderr_line(message: str) -> None:
+    from deltacat_cli.config import err_console
+
+    err_console.print(message, style='dim', soft_wrap=True)
+
+
+def print_report(timings: dict[str, PhaseTiming], wall_seconds: float) -> None:
+    """Print the phase breakdown to stderr."""
+    from rich.table import Table
+
+    from deltacat_cli.config import err_console
+
+    startup = timings.get('startup')
+    total = wall_seconds + (startup.seconds if startup else 0)
+    table = Table(title='Profile', title_justify='left')
+    table.add_column('Phase', style='cyan')
+    table.add_column('Calls', justify='right')
+    table.add_column('Seconds', justify='right')
+    table.add_column('%', justify='right')
+    names = [name for name in PHASES if name in timings] + sorted(set(timings) - set(PHASES))
+    for name in names:
+        timing = timings[name]
+        share = timing.seconds / total * 100 if total else 0
+        table.add_row(name, f'{timing.calls:,}', f'{timing.seconds:.3f}', f'{share:.1f}')
+    table.add_row('total', '', f'{total:.3f}', '100.0', style='bold')
+    err_console.print(table)
+
+
+def print_allocations(snapshot: tracemalloc.Snapshot, top: int, peak: int | None) -> None:
+    """Print the largest allocation sites still held when the command finished."""
+    from rich.table import Table
+
+    from deltacat_cli.config import err_console
+    from deltacat_cli.utils.formatting import format_bytes
+
+    statistics = snapshot.statistics('lineno')
+    table = Table(
+        title=f'Top {top} allocation sites' + (f', peak traced {format_bytes(peak)}' if peak is not None else ''),
+        title_justify='left',
+    )
+    table.add_column('Size', justify='right')
+    table.add_column('Blocks', justify='right')
+    table.add_column('Location', style='cyan', overflow='fold')
+    for statistic in statistics[:top]:
+        frame = statistic.traceback[0]
+        table.add_row(format_bytes(statistic.size), f'{statistic.count:,}', f'{frame.filename}:{frame.lineno}')
+    err_console.print(table)
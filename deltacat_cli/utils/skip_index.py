@@ -0,0 +1,202 @@
+"""Skip index of a table: statistics of each data file's columns, so filtered reads rule files out unopened.
+
+Parquet footers already let a read skip row groups, but only once the file is opened. The skip index keeps the
+min/max and null count of chosen columns of every data file, and a Bloom filter of the values of some of them,
+in a sidecar index (see index_store) read once per scan. Bloom filters rule out files on equality filters that
+min/max can't, typically on high-cardinality string columns such as ids, whose values spread over every file.
+
+Which columns are indexed is configured per table version, in its SKIP_INDEX_PROPERTY property. The index is
+built by table index rebuild, files committed since aren't ruled out until the next one.
+"""
+
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+from uuid import uuid4
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from deltacat.storage import TableVersion
+
+from deltacat_cli.utils.filter_expression import compile_file_filter
+from deltacat_cli.utils.index_store import IndexRefresh, IndexStore
+from deltacat_cli.utils.sketches import BloomFilter, hash_columns
+from deltacat_cli.utils.table_scan import ScanFile, TableScan
+
+
+SKIP_INDEX_PROPERTY = 'skip_index'
+
+
+@dataclass
+class SkipIndexConfig:
+    """Columns of a table whose statistics are indexed, and those also getting a Bloom filter."""
+
+    columns: list[str]
+    bloom_filter_columns: list[str]
+
+    @classmethod
+    def of(cls, columns: list[str], bloom_filter_columns: list[str]) -> 'SkipIndexConfig':
+        """Configuration from the given columns, Bloom filter columns having their statistics indexed too."""
+        return cls(list(dict.fromkeys([*columns, *bloom_filter_columns])), list(dict.fromkeys(bloom_filter_columns)))
+
+    @classmethod
+    def from_table_version(cls, table_version: TableVersion) -> 'SkipIndexConfig | None':
+        """Skip index configuration of a table version, None if it has none."""
+        config = (table_version.properties or {}).get(SKIP_INDEX_PROPERTY)
+        if not config or not config.get('columns'):
+            return None
+        return cls(list(config['columns']), list(config.get('bloom_filter_columns') or []))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {'columns': self.columns, 'bloom_filter_columns': self.bloom_filter_columns}
+
+    def validate(self, schema: pa.Schema | None) -> None:
+        """Fail on columns missing from the table schema, or whose values can't be ordered."""
+        if schema is None:
+            if self.columns:
+                raise ValueError('Skip index columns need a table schema')
+            return
+        missing = [name for name in self.columns if name not in schema.names]
+        if missing:
+            raise ValueError(f'Skip index column(s) {", ".join(missing)} not found in the table schema')
+        nested = [name for name in self.columns if pa.types.is_nested(schema.field(name).type)]
+        if nested:
+            raise ValueError(f"Nested column(s) {', '.join(nested)} can't be indexed")
+
+
+@dataclass
+class ColumnSkipStats:
+    """Statistics of a column of a data file."""
+
+    type: pa.DataType
+    min: Any
+    max: Any
+    null_count: int
+    row_count: int
+    bloom_filter: BloomFilter | None = None
+
+    def might_contain(self, value: Any) -> bool:
+        if self.bloom_filter is None:
+            return True
+        hashes = hash_columns(pa.table({'value': pa.array([value], self.type)}))
+        return bool(self.bloom_filter.might_contain_hashes(hashes)[0])
+
+
+def _stats_schema(config: SkipIndexConfig, schema: pa.Schema) -> pa.Schema:
+    fields = [pa.field('file', pa.string()), pa.field('rows', pa.int64())]
+    for name in config.columns:
+        column_type = schema.field(name).type
+        fields += [
+            pa.field(f'{name}.min', column_type),
+            pa.field(f'{name}.max', column_type),
+            pa.field(f'{name}.null_count', pa.int64()),
+        ]
+        if name in config.bloom_filter_columns:
+            fields.append(pa.field(f'{name}.bloom_filter', pa.binary()))
+    return pa.schema(fields)
+
+
+class SkipIndex:
+    """The skip index of a table version."""
+
+    def __init__(self, inner: Any, namespace: str, table_version: TableVersion, config: SkipIndexConfig):
+        self.inner = inner
+        self.namespace = namespace
+        self.table_version = table_version
+        self.config = config
+        self.schema: pa.Schema = table_version.schema.arrow
+        self.store = IndexStore(inner, namespace, table_version, 'skip', config.to_dict())
+
+    @classmethod
+    def of(cls, inner: Any, namespace: str, table_version: TableVersion) -> 'SkipIndex | None':
+        """Skip index of a table version, None if none is configured."""
+        config = SkipIndexConfig.from_table_version(table_version)
+        return cls(inner, namespace, table_version, config) if config else None
+
+    def refresh(self, workers: int = 4, rebuild: bool = False) -> IndexRefresh:
+        """Index the deltas committed since the last refresh, all of them with `rebuild`."""
+        start = time.perf_counter()
+        result, files, partitions = self.store.pending(rebuild)
+        segment = None
+        if files:
+            scan = TableScan(
+                self.namespace,
+                self.table_version.locator.table_name,
+                self.inner,
+                table_version=self.table_version.table_version,
+                columns=self.config.columns,
+            )
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='skip-index') as executor:
+                rows = list(executor.map(lambda scan_file: self._file_stats(scan, scan_file), files))
+            name = f'segment-{uuid4().hex}.parquet'
+            self.store.filesystem.create_dir(self.store.directory, recursive=True)
+            with self.store.filesystem.open_output_stream(self.store.path(name)) as sink:
+                pq.write_table(
+                    pa.Table.from_pylist(rows, _stats_schema(self.config, self.schema)), sink, compression='zstd'
+                )
+            segment = {'name': name, 'files': len(rows)}
+        self.store.commit(result, partitions, segment)
+        result.seconds = time.perf_counter() - start
+        return result
+
+    def _file_stats(self, scan: TableScan, scan_file: ScanFile) -> dict[str, Any]:
+        """Statistics of the indexed columns of a data file, read from its indexed columns only."""
+        data = pa.Table.from_batches(scan.file_batches(scan_file), scan.output_schema)
+        row = {'file': scan_file.entry.url, 'rows': data.num_rows}
+        for name in self.config.columns:
+            column = data.column(name)
+            min_max = pc.min_max(column)
+            row[f'{name}.min'] = min_max['min'].as_py()
+            row[f'{name}.max'] = min_max['max'].as_py()
+            row[f'{name}.null_count'] = column.null_count
+            if name in self.config.bloom_filter_columns:
+                values = pc.unique(column.drop_null())
+                bloom_filter = BloomFilter.for_count(len(values))
+                bloom_filter.update_hashes(hash_columns(pa.table({'value': values})))
+                row[f'{name}.bloom_filter'] = bloom_filter.to_bytes()
+        return row
+
+    def file_statistics(self) -> dict[str, dict[str, ColumnSkipStats]]:
+        """Column statistics of every indexed data file, by manifest entry URL."""
+        statistics: dict[str, dict[str, ColumnSkipStats]] = {}
+        for segment in self.store.segments:
+            with self.store.filesystem.open_input_file(self.store.path(segment['name'])) as source:
+                rows = pq.read_table(source).to_pylist()
+            for row in rows:
+                statistics[row['file']] = {
+                    name: ColumnSkipStats(
+                        type=self.schema.field(name).type,
+                        min=row[f'{name}.min'],
+                        max=row[f'{name}.max'],
+                        null_count=row[f'{name}.null_count'],
+                        row_count=row['rows'],
+                        bloom_filter=BloomFilter.from_bytes(row[f'{name}.bloom_filter'])
+                        if row.get(f'{name}.bloom_filter') is not None
+                        else None,
+                    )
+                    for name in self.config.columns
+                }
+        return statistics
+
+    def file_filter(self, where: str) -> Callable[[ScanFile], bool]:
+        """Test of whether a data file may hold rows matching a filter. Files not indexed are assumed to."""
+        statistics = self.file_statistics()
+        test = compile_file_filter(where, self.schema)
+
+        def may_match(scan_file: ScanFile) -> bool:
+            stats = statistics.get(scan_file.entry.url)
+            return stats is None or test(stats)
+
+        return may_match
+
+
+def apply_skip_index(scan: TableScan, where: str) -> bool:
+    """Have a filtered scan skip the files its table's skip index rules out. False if the table has no index."""
+    index = SkipIndex.of(scan.inner, scan.namespace, scan.table_version)
+    if index is None or not index.store.exists:
+        return False
+    scan.file_filter = index.file_filter(where)
+    return True
@@ -0,0 +1,249 @@
+"""Incremental scans over the data files of a table.
+
+deltacat's `read_table` downloads and concatenates every file of a table before returning. TableScan walks
+the committed partitions, deltas and manifest entries itself and decodes one file at a time as record
+batches, so callers can stop as soon as they have enough rows and never hold more than a batch in memory.
+
+A scan can also sample a fraction of a table: row groups of Parquet files are kept or skipped whole, before
+any of their pages are read, and rows of other files are sampled once decoded.
+"""
+
+import random
+import threading
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+from deltacat.storage import CommitState, Delta, DeltaType, ManifestEntry, TableVersion, metastore
+
+from deltacat import DatasetType
+
+
+# Content types pyarrow can scan directly, with statistics and row group pruning where the format has them
+DATASET_FORMATS = {'application/parquet': 'parquet', 'application/feather': 'ipc', 'application/orc': 'orc'}
+
+DEFAULT_BATCH_SIZE = 64 * 1024
+
+
+@dataclass
+class ScanFile:
+    """A data file of a table, as recorded by a delta's manifest."""
+
+    delta: Delta
+    entry_index: int
+    entry: ManifestEntry
+    path: str
+
+    @property
+    def content_type(self) -> str | None:
+        return self.entry.meta.content_type if self.entry.meta else None
+
+    @property
+    def record_count(self) -> int:
+        return (self.entry.meta.record_count or 0) if self.entry.meta else 0
+
+    @property
+    def content_length(self) -> int:
+        return (self.entry.meta.content_length or 0) if self.entry.meta else 0
+
+
+@dataclass
+class ScanStats:
+    """Counters describing how much of the table a scan touched."""
+
+    files_read: int = 0
+    files_skipped: int = 0
+    files_skipped_by_index: int = 0
+    row_groups_read: int = 0
+    row_groups_skipped: int = 0
+    rows_read: int = 0
+    bytes_read: int = 0
+
+
+class TableScan:
+    """Scan of a table version's committed data, one file at a time."""
+
+    def __init__(
+        self,
+        namespace: str,
+        table: str,
+        inner: Any,
+        table_version: str | None = None,
+        columns: list[str] | None = None,
+        filter: pc.Expression | None = None,  # noqa: A002
+        sample_fraction: float | None = None,
+    ):
+        self.namespace = namespace
+        self.table = table
+        self.inner = inner
+        self.columns = columns
+        self.filter = filter
+        self.sample_fraction = sample_fraction
+        self.random = random.Random()
+        # Test of whether a file may hold rows matching the filter, from statistics kept outside of it
+        self.file_filter: Callable[[ScanFile], bool] | None = None
+        self.stats = ScanStats()
+        # Workers read files of the same scan concurrently, each counting what it read
+        self._stats_lock = threading.Lock()
+        self.table_version = self._resolve_table_version(table_version)
+
+    @property
+    def arrow_schema(self) -> pa.Schema | None:
+        """Arrow schema of the table version, None for schemaless tables."""
+        schema = self.table_version.schema
+        return schema.arrow if schema else None
+
+    @property
+    def output_schema(self) -> pa.Schema | None:
+        """Schema of the batches produced by this scan, None for schemaless tables."""
+        schema = self.arrow_schema
+        if schema is None or not self.columns:
+            return schema
+        return pa.schema([schema.field(name) for name in self.columns])
+
+    def deltas(self) -> Iterator[Delta]:
+        """Committed ADD/APPEND deltas of the table version, in stream order per partition."""
+        partitions = metastore.list_partitions(
+            self.namespace, self.table, table_version=self.table_version.table_version, inner=self.inner
+        ).all_items()
+        for partition in partitions:
+            if partition.state != CommitState.COMMITTED:
+                continue
+            deltas = metastore.list_partition_deltas(
+                partition, ascending_order=True, include_manifest=True, inner=self.inner
+            ).all_items()
+            for delta in deltas:
+                if delta.type not in (DeltaType.ADD, DeltaType.APPEND):
+                    raise ValueError(
+                        f'Table {self.namespace}.{self.table} has {delta.type.value} deltas that need compaction '
+                        'before they can be read'
+                    )
+                yield delta
+
+    def files(self) -> Iterator[ScanFile]:
+        """Data files of the table version, except those the file filter rules out."""
+        for delta in self.deltas():
+            for scan_file in self.files_of(delta):
+                if self.file_filter is not None and not self.file_filter(scan_file):
+                    self._count(files_skipped_by_index=1)
+                    continue
+                yield scan_file
+
+    def files_of(self, delta: Delta) -> Iterator[ScanFile]:
+        """Data files of a delta."""
+        entries = delta.manifest.entries if delta.manifest else []
+        for index, entry in enumerate(entries or []):
+            yield ScanFile(
+                delta=delta, entry_index=index, entry=entry, path=self.inner.reconstruct_full_path(entry.url)
+            )
+
+    def batches(self, limit: int | None = None, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[pa.RecordBatch]:
+        """Yield record batches, stopping once `limit` rows have been produced."""
+        if limit is not None:
+            batch_size = max(1, min(batch_size, limit))
+        remaining = limit
+        for scan_file in self.files():
+            for batch in self.file_batches(scan_file, batch_size):
+                if remaining is not None:
+                    if batch.num_rows > remaining:
+                        batch = batch.slice(0, remaining)
+                    remaining -= batch.num_rows
+                self._count(rows_read=batch.num_rows)
+                yield batch
+                if remaining == 0:
+                    return
+
+    def file_batches(self, scan_file: ScanFile, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[pa.RecordBatch]:
+        """Decode a single data file as record batches conforming to the output schema."""
+        file_format = DATASET_FORMATS.get(scan_file.content_type)
+        if file_format:
+            dataset = ds.dataset(
+                scan_file.path, schema=self.arrow_schema, format=file_format, filesystem=self.inner.filesystem
+            )
+        else:
+            # Text and other formats: let deltacat decode the file, then filter and project in memory
+            table = metastore.download_delta_manifest_entry(
+                scan_file.delta, scan_file.entry_index, table_type=DatasetType.PYARROW, inner=self.inner
+            )
+            if self.arrow_schema is not None:
+                table = _conform(table, self.arrow_schema)
+            dataset = ds.dataset(table)
+
+        sampled = self.sample_fraction is not None and self.sample_fraction < 1
+        if file_format == 'parquet' and (self.filter is not None or sampled):
+            dataset = self._prune_row_groups(dataset)
+            if dataset is None:
+                return
+        else:
+            self._count(bytes_read=scan_file.content_length)
+        self._count(files_read=1)
+        batches = dataset.to_batches(
+            columns=self.columns,
+            filter=self.filter,
+            batch_size=batch_size,
+            # Keep read-ahead small: a limited scan should stop decoding shortly after it has enough rows
+            batch_readahead=1,
+            fragment_readahead=1,
+        )
+        if not sampled or file_format == 'parquet':
+            yield from batches
+            return
+        rng = np.random.default_rng(self.random.getrandbits(64))
+        for batch in batches:
+            yield batch.filter(pa.array(rng.random(batch.num_rows) < self.sample_fraction))
+
+    def _prune_row_groups(self, dataset: ds.FileSystemDataset) -> ds.FileSystemDataset | None:
+        """Drop the row groups whose statistics show they can't match the filter, or not sampled, None if none left.
+
+        Only the file footer is read to decide this.
+        """
+        fragment = next(dataset.get_fragments())
+        metadata = fragment.metadata
+        if self.filter is not None:
+            matching = fragment.split_by_row_group(self.filter, schema=dataset.schema)
+        else:
+            matching = fragment.split_by_row_group()
+        if self.sample_fraction is not None and self.sample_fraction < 1:
+            matching = [row_group for row_group in matching if self.random.random() < self.sample_fraction]
+        matching_ids = [row_group.id for fragment in matching for row_group in fragment.row_groups]
+        self._count(row_groups_read=len(matching_ids), row_groups_skipped=metadata.num_row_groups - len(matching_ids))
+        if not matching_ids:
+            self._count(files_skipped=1)
+            return None
+        for row_group_id in matching_ids:
+            row_group = metadata.row_group(row_group_id)
+            self._count(
+                bytes_read=sum(row_group.column(index).total_compressed_size for index in range(row_group.num_columns))
+            )
+        return ds.FileSystemDataset(matching, dataset.schema, dataset.format, dataset.filesystem)
+
+    def _count(self, **counts: int) -> None:
+        with self._stats_lock:
+            for name, count in counts.items():
+                setattr(self.stats, name, getattr(self.stats, name) + count)
+
+    def _resolve_table_version(self, table_version: str | None) -> TableVersion:
+        if table_version is None:
+            resolved = metastore.get_latest_active_table_version(self.namespace, self.table, inner=self.inner)
+            if resolved is None:
+                raise ValueError(f'No active table version found for table {self.namespace}.{self.table}')
+            return resolved
+        resolved = metastore.get_table_version(self.namespace, self.table, table_version, inner=self.inner)
+        if resolved is None:
+            raise ValueError(f'Table version {table_version} not found for table {self.namespace}.{self.table}')
+        return resolved
+
+
+def _conform(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Align a decoded table with the table schema, adding missing columns as nulls."""
+    arrays = [
+        table.column(name).cast(schema.field(name).type)
+        if name in table.column_names
+        else pa.nulls(table.num_rows, schema.field(name).type)
+        for name in schema.names
+    ]
+    return pa.Table.from_arrays(arrays, schema=schema)
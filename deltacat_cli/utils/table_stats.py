@@ -0,0 +1,179 @@
+"""Table statistics from metadata alone: delta manifests, plus Parquet footers for column statistics.
+
+Row, file and byte counts come from the manifest of every committed delta, which are read with the delta
+metadata. Column minimums, maximums and null counts come from the footers of the Parquet data files, a few KiB
+each, so no data pages are read either way.
+"""
+
+import time
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+import pyarrow.fs as pa_fs
+from deltacat.storage import CommitState, Delta, DeltaType, Partition, TableVersion, metastore
+
+from deltacat_cli.utils.input_files import InputFile
+from deltacat_cli.utils.parquet_footers import ColumnStats, read_footers
+from deltacat_cli.utils.table_scan import TableScan
+
+
+PARQUET_CONTENT_TYPE = 'application/parquet'
+
+
+@dataclass
+class PartitionStats:
+    """Counts of one partition of a table version."""
+
+    partition_id: str
+    partition_values: list[Any] | None = None
+    deltas: int = 0
+    delta_types: Counter[str] = field(default_factory=Counter)
+    files: int = 0
+    rows: int = 0
+    deleted_rows: int = 0
+    bytes: int = 0
+    columns: dict[str, ColumnStats] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'partition_id': self.partition_id,
+            'partition_values': self.partition_values,
+            'deltas': self.deltas,
+            'delta_types': dict(self.delta_types),
+            'files': self.files,
+            'rows': self.rows,
+            'deleted_rows': self.deleted_rows,
+            'bytes': self.bytes,
+            'columns': _columns_dict(self.columns),
+        }
+
+
+@dataclass
+class TableStats:
+    """Counts of a table version, in total and per partition."""
+
+    namespace: str
+    table: str
+    table_version: str
+    partitions: list[PartitionStats] = field(default_factory=list)
+    footers_read: int = 0
+    seconds: float = 0.0
+
+    @property
+    def deltas(self) -> int:
+        return sum(partition.deltas for partition in self.partitions)
+
+    @property
+    def files(self) -> int:
+        return sum(partition.files for partition in self.partitions)
+
+    @property
+    def rows(self) -> int:
+        return sum(partition.rows for partition in self.partitions)
+
+    @property
+    def deleted_rows(self) -> int:
+        return sum(partition.deleted_rows for partition in self.partitions)
+
+    @property
+    def bytes(self) -> int:
+        return sum(partition.bytes for partition in self.partitions)
+
+    @property
+    def columns(self) -> dict[str, ColumnStats]:
+        """Column statistics merged over partitions."""
+        columns: dict[str, ColumnStats] = {}
+        for partition in self.partitions:
+            for name, stats in partition.columns.items():
+                columns.setdefault(name, ColumnStats()).merge(stats.null_count, stats.min, stats.max)
+        return columns
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'namespace': self.namespace,
+            'table': self.table,
+            'table_version': self.table_version,
+            'deltas': self.deltas,
+            'files': self.files,
+            'rows': self.rows,
+            'deleted_rows': self.deleted_rows,
+            'bytes': self.bytes,
+            'columns': _columns_dict(self.columns),
+            'partitions': [partition.to_dict() for partition in self.partitions],
+        }
+
+
+def _columns_dict(columns: dict[str, ColumnStats]) -> dict[str, dict[str, Any]]:
+    return {
+        name: {'null_count': stats.null_count, 'min': stats.min, 'max': stats.max} for name, stats in columns.items()
+    }
+
+
+def _input_file(path: str, size: int, filesystem: pa_fs.FileSystem) -> InputFile:
+    if '://' in path:
+        filesystem, path = pa_fs.FileSystem.from_uri(path)
+    return InputFile(path=path, filesystem=filesystem, size=size, format='parquet')
+
+
+def committed_deltas(inner: Any, namespace: str, table_version: TableVersion) -> Iterator[tuple[Partition, Delta]]:
+    """Every committed delta of a table version with its partition, in stream order per partition."""
+    partitions = metastore.list_partitions(
+        namespace, table_version.locator.table_name, table_version=table_version.table_version, inner=inner
+    ).all_items()
+    for partition in partitions:
+        if partition.state != CommitState.COMMITTED:
+            continue
+        deltas = metastore.list_partition_deltas(
+            partition, ascending_order=True, include_manifest=True, inner=inner
+        ).all_items()
+        for delta in deltas:
+            yield partition, delta
+
+
+def collect_table_stats(
+    inner: Any,
+    namespace: str,
+    table: str,
+    table_version: str | None = None,
+    column_stats: bool = True,
+    workers: int = 1,
+) -> TableStats:
+    """Collect the statistics of a table version from its metadata.
+
+    Every committed delta is counted. Rows of DELETE deltas are counted as deleted rows, and rows of UPSERT
+    deltas not compacted yet may replace earlier rows, so `rows` is exact only for compacted or append-only
+    tables. With `column_stats`, the footers of Parquet data files are read with `workers` threads.
+    """
+    start = time.perf_counter()
+    scan = TableScan(namespace=namespace, table=table, inner=inner, table_version=table_version)
+    stats = TableStats(namespace=namespace, table=table, table_version=scan.table_version.table_version)
+    footer_files: list[tuple[PartitionStats, InputFile]] = []
+    partition_stats: dict[str, PartitionStats] = {}
+    for partition, delta in committed_deltas(inner, namespace, scan.table_version):
+        if partition.partition_id not in partition_stats:
+            partition_stats[partition.partition_id] = PartitionStats(
+                partition_id=partition.partition_id, partition_values=partition.partition_values
+            )
+            stats.partitions.append(partition_stats[partition.partition_id])
+        counts = partition_stats[partition.partition_id]
+        counts.deltas += 1
+        counts.delta_types[delta.type.value] += 1
+        for scan_file in scan.files_of(delta):
+            counts.files += 1
+            counts.bytes += scan_file.content_length
+            if delta.type == DeltaType.DELETE:
+                counts.deleted_rows += scan_file.record_count
+                continue
+            counts.rows += scan_file.record_count
+            if column_stats and scan_file.content_type == PARQUET_CONTENT_TYPE:
+                footer_files.append((counts, _input_file(scan_file.path, scan_file.content_length, inner.filesystem)))
+
+    footers = read_footers([input_file for _, input_file in footer_files], workers)
+    for (counts, _), footer in zip(footer_files, footers, strict=True):
+        for name, column in footer.columns.items():
+            counts.columns.setdefault(name, ColumnStats()).merge(column.null_count, column.min, column.max)
+    stats.footers_read = len(footers)
+    stats.seconds = time.perf_counter() - start
+    return stats
@@ -24,6 +24,11 @@ TYPE_MAPPING: dict[str, pa.DataType] = {
 }
 
 
+def merge_key_names(schema: DeltacatSchema | None) -> list[str]:
+    """Names of the merge key columns of a schema, none for schemaless tables."""
+    return [schema_field.arrow.name for schema_field in schema.fields if schema_field.is_merge_key] if schema else []
+
+
 class TableProperties(dict):
     @staticmethod
     def of(
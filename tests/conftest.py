@@ -0,0 +1,65 @@
+"""Shared test configuration."""
+
+from collections.abc import Callable, Generator
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+from deltacat.catalog import get_catalog_properties
+
+from deltacat_cli.utils.metadata_cache import CACHE_PATH_ENV_VAR, CACHE_TTL_ENV_VAR
+from deltacat_cli.utils.output import OUTPUT_ENV_VAR
+
+
+@pytest.fixture(autouse=True)
+def rich_output(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Render with Rich by default: CliRunner's stdout isn't a terminal, which would select NDJSON output."""
+    monkeypatch.setenv(OUTPUT_ENV_VAR, 'rich')
+
+
+@pytest.fixture(autouse=True)
+def no_metadata_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Read metadata from the catalog, whatever cache the environment enables."""
+    monkeypatch.delenv(CACHE_TTL_ENV_VAR, raising=False)
+
+
+@pytest.fixture
+def metadata_cache_enabled(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Enable the metadata cache in a temporary database, for tests of commands reading from it."""
+    path = tmp_path / 'cache.db'
+    monkeypatch.setenv(CACHE_PATH_ENV_VAR, str(path))
+    monkeypatch.setenv(CACHE_TTL_ENV_VAR, '60')
+    return path
+
+
+@pytest.fixture
+def local_catalog(tmp_path: Path) -> Generator[Any, None, None]:
+    """Properties of an empty catalog in the test's temporary directory, with the CLI pointed at it."""
+    catalog_properties = get_catalog_properties(root=str(tmp_path / 'catalog'))
+    with (
+        patch('deltacat_cli.utils.catalog_context.catalog_context.get_catalog_info') as mock_catalog_info,
+        patch('deltacat_cli.utils.catalog_context.catalog_context.get_catalog') as mock_get_catalog,
+    ):
+        mock_catalog_info.return_value = ('test_catalog', 'root')
+        mock_get_catalog.return_value = Mock(inner=catalog_properties)
+        yield catalog_properties
+
+
+@pytest.fixture
+def by_inner(local_catalog: Any) -> Generator[Callable[[str, Callable[..., Any]], None], None, None]:
+    """Patch a call the CLI makes with a catalog name to call a function with the local catalog's properties.
+
+    The CLI resolves catalogs by name, which needs Ray.
+    """
+    with ExitStack() as stack:
+
+        def route(target: str, function: Callable[..., Any]) -> None:
+            def call(*args: Any, **kwargs: Any) -> Any:
+                kwargs.pop('catalog')
+                return function(*args, inner=local_catalog, **kwargs)
+
+            stack.enter_context(patch(target, side_effect=call))
+
+        yield route
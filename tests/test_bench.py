@@ -0,0 +1,130 @@
+"""Tests for the benchmark suite."""
+
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from deltacat_cli.benchmarks.dataset import SCHEMA, synthetic_chunks
+from deltacat_cli.benchmarks.measure import Measurement, RssSampler, percentile
+from deltacat_cli.benchmarks.suite import compare
+from deltacat_cli.main import app
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    """Create a CLI test runner."""
+    return CliRunner()
+
+
+class TestMeasure:
+    """Test latency and memory measurement."""
+
+    def test_percentile_interpolates(self) -> None:
+        """Test percentiles interpolate between the closest ranks."""
+        samples = [4.0, 1.0, 3.0, 2.0]
+
+        assert percentile(samples, 50) == 2.5
+        assert percentile(samples, 95) == pytest.approx(3.85)
+        assert percentile([7.0], 95) == 7.0
+
+    def test_summary(self) -> None:
+        """Test the summary reports milliseconds and throughput."""
+        measurement = Measurement('table read', seconds=[0.1, 0.3], rows=1000, peak_rss_bytes=1024)
+
+        summary = measurement.summary()
+
+        assert summary['p50_ms'] == 200.0
+        assert summary['ops_per_second'] == 5.0
+        assert summary['rows_per_second'] == 5000.0
+        assert summary['peak_rss_bytes'] == 1024
+
+    def test_rss_sampler(self) -> None:
+        """Test the peak resident set size is sampled."""
+        with RssSampler() as sampler:
+            data = bytearray(8 * 1024 * 1024)
+
+        assert sampler.peak is not None
+        assert sampler.peak > len(data)
+
+    def test_synthetic_chunks(self) -> None:
+        """Test synthetic data is generated in bounded chunks of the benchmark schema."""
+        chunks = list(synthetic_chunks(25, chunk_rows=10))
+
+        assert [chunk.num_rows for chunk in chunks] == [10, 10, 5]
+        assert all(chunk.schema == SCHEMA for chunk in chunks)
+        assert chunks[2].column('id').to_pylist() == list(range(20, 25))
+
+
+class TestCompare:
+    """Test comparing reports against a baseline."""
+
+    def test_regressions_above_threshold(self) -> None:
+        """Test only commands slower than the allowed regression are reported."""
+        baseline = {'results': [{'command': 'table get', 'p50_ms': 10.0}, {'command': 'table list', 'p50_ms': 10.0}]}
+        report = {
+            'results': [
+                {'command': 'table get', 'p50_ms': 13.0},
+                {'command': 'table list', 'p50_ms': 11.0},
+                {'command': 'table read', 'p50_ms': 50.0},
+            ]
+        }
+
+        regressions = compare(report, baseline, max_regression=0.2)
+
+        assert regressions == [{'command': 'table get', 'baseline_p50_ms': 10.0, 'p50_ms': 13.0, 'change': 0.3}]
+
+
+class TestBenchCLI:
+    """Test the bench CLI command."""
+
+    def test_bench_report(self, runner: CliRunner, tmp_path: Path) -> None:
+        """Test a small run benchmarks the selected commands and saves the report."""
+        report_file = tmp_path / 'report.json'
+        result = runner.invoke(
+            app,
+            [
+                'bench',
+                '--rows',
+                '100',
+                '--tables',
+                '2',
+                '--iterations',
+                '2',
+                '--warmup',
+                '0',
+                '-c',
+                'table list',
+                '-c',
+                'table create',
+                '-c',
+                'table read',
+                '--save',
+                str(report_file),
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        report = json.loads(report_file.read_text())
+        assert report['scale'] == {'name': 'custom', 'rows': 100, 'tables': 2, 'iterations': 2, 'warmup': 0}
+        results = {result['command']: result for result in report['results']}
+        assert list(results) == ['table list', 'table create', 'table read']
+        assert results['table read']['rows_per_second'] > 0
+        assert all(result['p95_ms'] >= result['p50_ms'] > 0 for result in results.values())
+
+    @pytest.mark.parametrize('command', ['namespace alter', 'namespace drop', 'table alter', 'table drop'])
+    def test_bench_command_alone(self, runner: CliRunner, command: str) -> None:
+        """Test commands working on objects of their own create them, whichever commands are selected."""
+        result = runner.invoke(
+            app, ['bench', '--rows', '10', '--tables', '1', '--iterations', '1', '--warmup', '1', '-c', command]
+        )
+
+        assert result.exit_code == 0, result.output
+
+    def test_bench_unknown_command(self, runner: CliRunner) -> None:
+        """Test unknown commands are rejected before provisioning."""
+        result = runner.invoke(app, ['bench', '-c', 'table vacuum'])
+
+        assert result.exit_code == 1
+        assert 'Unknown command table vacuum' in result.output
@@ -0,0 +1,112 @@
+"""Tests for exporting a whole catalog."""
+
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import deltacat.catalog.main.impl as catalog
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pytest
+from typer.testing import CliRunner
+
+from deltacat import TableWriteMode
+from deltacat_cli.main import app
+from deltacat_cli.utils.catalog_export import export_catalog_table
+
+
+TABLES = {('sales', 'orders'): 30, ('sales', 'refunds'): 5, ('web', 'clicks'): 12}
+
+
+@pytest.fixture
+def catalog_properties(local_catalog: Any) -> Any:
+    """Catalog with two namespaces and three tables."""
+    for (namespace, table), rows in TABLES.items():
+        if not catalog.namespace_exists(namespace, inner=local_catalog):
+            catalog.create_namespace(namespace=namespace, inner=local_catalog)
+        data = pa.table({'id': pa.array(range(rows), pa.int64())})
+        catalog.write_to_table(data, table, namespace=namespace, mode=TableWriteMode.AUTO, inner=local_catalog)
+    return local_catalog
+
+
+def export(out: Path, *args: str) -> Any:
+    return CliRunner().invoke(app, ['catalog', 'export', '--out', str(out), '--workers', '2', *args])
+
+
+@pytest.mark.usefixtures('catalog_properties')
+class TestCatalogExportCLI:
+    """Test the catalog export CLI command."""
+
+    def test_export_all_tables(self, tmp_path: Path) -> None:
+        """Test every table is exported with its metadata and recorded in the manifest."""
+        out = tmp_path / 'export'
+        result = export(out)
+
+        assert result.exit_code == 0, result.output
+        assert 'Exported 3 table(s), 47 row(s)' in result.output
+        manifest = json.loads((out / '_manifest.json').read_text())
+        assert {key: entry['rows'] for key, entry in manifest['tables'].items()} == {
+            f'{namespace}/{table}': rows for (namespace, table), rows in TABLES.items()
+        }
+        for (namespace, table), rows in TABLES.items():
+            table_dir = out / namespace / table
+            assert ds.dataset(str(table_dir), exclude_invalid_files=True).count_rows() == rows
+            assert json.loads((table_dir / '_table.json').read_text())['table']['tableLocator']['tableName'] == table
+            assert pa.ipc.read_schema(pa.py_buffer((table_dir / '_schema.arrow').read_bytes())).names == ['id']
+        assert json.loads((out / 'web' / '_namespace.json').read_text())['namespaceLocator']['namespace'] == 'web'
+
+    @pytest.mark.usefixtures('metadata_cache_enabled')
+    def test_export_from_cached_listings(self, tmp_path: Path) -> None:
+        """Test namespaces and tables listed from the metadata cache export like those read from the catalog."""
+        first = export(tmp_path / 'first')
+        second = export(tmp_path / 'second')
+
+        assert first.exit_code == 0, first.output
+        assert second.exit_code == 0, second.output
+        assert 'Exported 3 table(s), 47 row(s)' in second.output
+        assert json.loads((tmp_path / 'second' / 'web' / '_namespace.json').read_text())['namespaceLocator'] == {
+            'namespace': 'web'
+        }
+
+    def test_resume_after_failure(self, tmp_path: Path) -> None:
+        """Test a failed table fails the export, and a rerun only exports the tables not finished."""
+        out = tmp_path / 'export'
+
+        def failing_export(*args: Any, **kwargs: Any) -> Any:
+            if args[4] == 'refunds':
+                raise OSError('connection reset')
+            return export_catalog_table(*args, **kwargs)
+
+        with patch('deltacat_cli.catalog.export.export_catalog_table', side_effect=failing_export):
+            result = export(out)
+        assert result.exit_code == 1
+        assert 'sales/refunds: connection reset' in result.output
+        assert 'sales/refunds' not in json.loads((out / '_manifest.json').read_text())['tables']
+
+        result = export(out)
+
+        assert result.exit_code == 0, result.output
+        assert 'Exported 1 table(s), 5 row(s)' in result.output
+        assert '2 already exported' in result.output
+        assert len(json.loads((out / '_manifest.json').read_text())['tables']) == 3
+
+    def test_settings_must_match_to_resume(self, tmp_path: Path) -> None:
+        """Test resuming with another format is refused unless --overwrite is given."""
+        out = tmp_path / 'export'
+        assert export(out, '--namespace', 'web').exit_code == 0
+
+        result = export(out, '--namespace', 'web', '--format', 'csv')
+        assert result.exit_code == 1
+        assert '--overwrite' in result.output
+
+        result = export(out, '--namespace', 'web', '--format', 'csv', '--overwrite')
+        assert result.exit_code == 0, result.output
+        assert [path.name for path in (out / 'web' / 'clicks').glob('part-*')] == ['part-0000-00000.csv']
+
+    def test_unknown_namespace(self, tmp_path: Path) -> None:
+        """Test a missing namespace is reported."""
+        result = export(tmp_path / 'export', '--namespace', 'missing')
+
+        assert result.exit_code == 1
+        assert 'missing' in result.output
@@ -1,3 +1,91 @@
 """Tests for the app module."""
 
-# Tests will be added when real functionality is implemented
+import os
+import subprocess
+import sys
+import time
+
+
+# Upper bound for `deltacat --version` wall time, including interpreter startup.
+# Can be raised on slow machines through DELTACAT_CLI_STARTUP_BUDGET.
+STARTUP_BUDGET_SECONDS = float(os.environ.get('DELTACAT_CLI_STARTUP_BUDGET', '1.5'))
+
+HEAVY_MODULES = ('deltacat', 'pyarrow', 'ray', 'daft')
+
+RUN_CLI = """
+import sys
+
+from deltacat_cli.main import main
+
+sys.argv = ['deltacat', *sys.argv[1:]]
+try:
+    main()
+except SystemExit:
+    pass
+finally:
+    print('IMPORTED:' + ','.join(m for m in {heavy!r} if m in sys.modules), file=sys.stderr)
+"""
+
+
+def run_cli(*args: str, env: dict[str, str] | None = None) -> tuple[subprocess.CompletedProcess, float, list[str]]:
+    """Run the CLI in a fresh interpreter, returning the result, wall time and heavy modules imported."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-c', RUN_CLI.format(heavy=HEAVY_MODULES), *args],
+        capture_output=True,
+        text=True,
+        timeout=120,
+        env={**os.environ, **(env or {})},
+    )
+    elapsed = time.perf_counter() - start
+    imported_line = next(line for line in result.stderr.splitlines() if line.startswith('IMPORTED:'))
+    imported = [m for m in imported_line.removeprefix('IMPORTED:').split(',') if m]
+    return result, elapsed, imported
+
+
+class TestCliStartup:
+    """Test that the command tree is resolved lazily."""
+
+    def test_version_does_not_import_deltacat(self) -> None:
+        """Test `deltacat --version` skips deltacat and pyarrow imports."""
+        result, _, imported = run_cli('--version')
+
+        assert 'deltacat version:' in result.stdout
+        assert imported == []
+
+    def test_version_within_startup_budget(self) -> None:
+        """Test `deltacat --version` stays within the startup time budget."""
+        run_cli('--version')  # warm up bytecode caches
+        _, elapsed, _ = run_cli('--version')
+
+        assert elapsed < STARTUP_BUDGET_SECONDS, (
+            f'deltacat --version took {elapsed:.2f}s, budget is {STARTUP_BUDGET_SECONDS:.2f}s'
+        )
+
+    def test_help_does_not_import_deltacat(self) -> None:
+        """Test `deltacat --help` lists command groups without importing them."""
+        result, _, imported = run_cli('--help')
+
+        assert 'catalog' in result.stdout
+        assert 'namespace' in result.stdout
+        assert 'table' in result.stdout
+        assert imported == []
+
+    def test_subcommand_completion_does_not_import_deltacat(self) -> None:
+        """Test completing table subcommand names doesn't import the command modules."""
+        result, _, imported = run_cli(
+            env={'_DELTACAT_COMPLETE': 'complete_bash', 'COMP_WORDS': 'deltacat table ', 'COMP_CWORD': '2'}
+        )
+
+        completions = result.stdout.split()
+        assert {'create', 'get', 'list', 'read', 'alter', 'drop'} <= set(completions)
+        assert imported == []
+
+    def test_option_completion_resolves_command(self) -> None:
+        """Test completing options of a command loads that command."""
+        result, _, _ = run_cli(
+            env={'_DELTACAT_COMPLETE': 'complete_bash', 'COMP_WORDS': 'deltacat table create --na', 'COMP_CWORD': '3'}
+        )
+
+        assert '--name' in result.stdout.split()
+        assert '--namespace' in result.stdout.split()
@@ -0,0 +1,92 @@
+"""Tests for compiling --where filters."""
+
+import datetime
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pytest
+
+from deltacat_cli.utils.filter_expression import compile_where
+
+
+SCHEMA = pa.schema(
+    [
+        pa.field('user_id', pa.int64()),
+        pa.field('name', pa.string()),
+        pa.field('score', pa.float64()),
+        pa.field('ts', pa.timestamp('us')),
+    ]
+)
+
+DATA = pa.table(
+    {
+        'user_id': [1, 2, 42, None],
+        'name': ['a', "it's", 'c', None],
+        'score': [0.5, 1.5, 2.5, 3.5],
+        'ts': [datetime.datetime(2025, 12, 31), datetime.datetime(2026, 1, 1), datetime.datetime(2026, 2, 1), None],
+    },
+    schema=SCHEMA,
+)
+
+
+def matching_ids(where: str) -> list[int | None]:
+    """Return user_id of the rows matching a filter."""
+    return DATA.filter(compile_where(where, SCHEMA)).column('user_id').to_pylist()
+
+
+class TestCompileWhere:
+    """Test compile_where."""
+
+    @pytest.mark.parametrize(
+        ('where', 'expected'),
+        [
+            ('user_id = 42', [42]),
+            ('42 <= user_id', [42]),
+            ("user_id = 42 AND ts >= '2026-01-01'", [42]),
+            ("ts >= '2026-01-01' and not user_id <> 2", [2]),
+            ('user_id = 1 OR (score > 2 AND score < 3)', [1, 42]),
+            ("name IN ('a', 'it''s')", [1, 2]),
+            ('user_id NOT IN (1, 2)', [42, None]),
+            ('user_id IN (1, NULL)', [1]),
+            ('user_id IN (NULL)', []),
+            ('user_id IN (2, 1.5)', [2]),
+            ('user_id > 1.5', [2, 42]),
+            ('user_id = 2.0', [2]),
+            ('user_id = 1.5', []),
+            ('score BETWEEN 1 AND 2.5', [2, 42]),
+            ('name IS NULL', [None]),
+            ('"name" IS NOT NULL', [1, 2, 42]),
+        ],
+    )
+    def test_filter(self, where: str, expected: list[int | None]) -> None:
+        """Test filters select the expected rows."""
+        assert matching_ids(where) == expected
+
+    def test_literals_cast_to_column_type(self) -> None:
+        """Test literals are cast to the column type so statistics can be compared."""
+        expression = compile_where("ts >= '2026-01-01'", SCHEMA)
+
+        assert expression.equals(pc.field('ts') >= pa.scalar(datetime.datetime(2026, 1, 1), pa.timestamp('us')))
+
+    def test_inexact_number_keeps_its_type(self) -> None:
+        """Test numbers an integer column can't hold are compared as they are, not cast."""
+        expression = compile_where('user_id > 1.5', SCHEMA)
+
+        assert expression.equals(pc.field('user_id') > pa.scalar(1.5, pa.float64()))
+
+    @pytest.mark.parametrize(
+        ('where', 'message'),
+        [
+            ('missing = 1', 'Unknown column "missing"'),
+            ("user_id = 'abc'", 'Cannot compare column "user_id"'),
+            ('user_id =', 'Expected a literal at end of filter'),
+            ('(user_id = 1', 'Expected \\) at end of filter'),
+            ('user_id = 1 2', 'Unexpected 2'),
+            ('1 = 1', 'at least one column'),
+            ('user_id ~ 1', 'Invalid filter'),
+        ],
+    )
+    def test_invalid_filter(self, where: str, message: str) -> None:
+        """Test invalid filters raise a ValueError describing the problem."""
+        with pytest.raises(ValueError, match=message):
+            compile_where(where, SCHEMA)
@@ -0,0 +1,153 @@
+"""Tests for the on-disk metadata cache."""
+
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from deltacat_cli.main import app
+from deltacat_cli.utils import daemon
+from deltacat_cli.utils.metadata_cache import (
+    CACHE_PATH_ENV_VAR,
+    CACHE_SIZE_ENV_VAR,
+    CACHE_TTL_ENV_VAR,
+    metadata_cache,
+    table_key,
+    tables_key,
+)
+
+
+TABLE = {'tableLocator': {'tableName': 'events'}, 'description': 'cached'}
+
+
+@pytest.fixture(autouse=True)
+def cache(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Enable the cache in a temporary database."""
+    path = tmp_path / 'cache.db'
+    monkeypatch.setenv(CACHE_PATH_ENV_VAR, str(path))
+    monkeypatch.setenv(CACHE_TTL_ENV_VAR, '60')
+    return path
+
+
+@pytest.fixture
+def catalog_context() -> Generator[Mock, None, None]:
+    """Point the CLI at a fake catalog."""
+    with (
+        patch('deltacat_cli.utils.catalog_context.catalog_context.get_catalog_info') as mock_catalog_info,
+        patch('deltacat_cli.utils.catalog_context.catalog_context.get_catalog') as mock_get_catalog,
+    ):
+        mock_catalog_info.return_value = ('test_catalog', 'root')
+        yield mock_get_catalog
+
+
+class TestMetadataCache:
+    """Test MetadataCache."""
+
+    def test_put_get(self) -> None:
+        """Test values round trip through the database."""
+        metadata_cache.put('root/a', {'id': 1, 'keys': ['x']})
+
+        assert metadata_cache.get('root/a') == {'id': 1, 'keys': ['x']}
+        assert metadata_cache.get('root/b') is None
+
+    def test_disabled_without_ttl(self, monkeypatch: pytest.MonkeyPatch, cache: Path) -> None:
+        """Test nothing is read or written unless a TTL is set."""
+        monkeypatch.delenv(CACHE_TTL_ENV_VAR)
+        metadata_cache.put('root/a', 1)
+
+        assert metadata_cache.get('root/a') is None
+        assert not cache.exists()
+
+    def test_expired_entry(self) -> None:
+        """Test entries older than the TTL are not served."""
+        with patch('deltacat_cli.utils.metadata_cache.time.time') as mock_time:
+            mock_time.return_value = 1.0
+            metadata_cache.put('root/a', 1)
+            mock_time.return_value = 50.0
+            assert metadata_cache.get('root/a') == 1
+            mock_time.return_value = 62.0
+            assert metadata_cache.get('root/a') is None
+
+    def test_least_recently_used_evicted(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the least recently used entries are evicted beyond the size limit."""
+        monkeypatch.setenv(CACHE_SIZE_ENV_VAR, '2')
+        with patch('deltacat_cli.utils.metadata_cache.time.time') as mock_time:
+            mock_time.return_value = 1.0
+            metadata_cache.put('root/a', 1)
+            mock_time.return_value = 2.0
+            metadata_cache.put('root/b', 2)
+            mock_time.return_value = 3.0
+            metadata_cache.get('root/a')
+            mock_time.return_value = 4.0
+            metadata_cache.put('root/c', 3)
+
+            assert metadata_cache.get('root/a') == 1
+            assert metadata_cache.get('root/b') is None
+            assert metadata_cache.get('root/c') == 3
+
+    def test_invalidate_prefix(self) -> None:
+        """Test invalidating a key drops everything below it, and only that."""
+        for key in ('root/ns', 'root/ns/table/t', 'root/ns_other/table/t'):
+            metadata_cache.put(key, key)
+
+        metadata_cache.invalidate('root/ns')
+
+        assert metadata_cache.get('root/ns') is None
+        assert metadata_cache.get('root/ns/table/t') is None
+        assert metadata_cache.get('root/ns_other/table/t') == 'root/ns_other/table/t'
+
+    def test_bypassed(self) -> None:
+        """Test the cache is skipped while bypassed."""
+        metadata_cache.put('root/a', 1)
+
+        with metadata_cache.bypassed():
+            assert metadata_cache.get('root/a') is None
+        assert metadata_cache.get('root/a') == 1
+
+    def test_forward_skips_no_cache_flag(self) -> None:
+        """Test commands after --no-cache are forwarded to the daemon."""
+        assert daemon.should_forward(['--no-cache', 'table', 'list'])
+        assert not daemon.should_forward(['--no-cache'])
+
+
+@pytest.mark.usefixtures('catalog_context')
+class TestMetadataCacheCLI:
+    """Test commands served from and invalidating the cache."""
+
+    def test_get_served_from_cache(self, catalog_context: Mock) -> None:
+        """Test a second table get neither registers the catalog nor reads the table."""
+        with patch('deltacat_cli.table.get.get_table', return_value=TABLE) as mock_get_table:
+            first = CliRunner().invoke(app, ['table', 'get', '--name', 'events', '--namespace', 'ns'])
+            second = CliRunner().invoke(app, ['table', 'get', '--name', 'events', '--namespace', 'ns'])
+
+        assert first.exit_code == 0, first.output
+        assert second.exit_code == 0, second.output
+        assert 'cached' in second.output
+        mock_get_table.assert_called_once()
+        catalog_context.assert_called_once()
+
+    def test_no_cache_reads_catalog(self) -> None:
+        """Test --no-cache reads the table even when it is cached."""
+        metadata_cache.put(table_key('ns', 'events'), TABLE)
+
+        with patch('deltacat_cli.table.get.get_table', return_value=TABLE) as mock_get_table:
+            result = CliRunner().invoke(app, ['--no-cache', 'table', 'get', '--name', 'events', '--namespace', 'ns'])
+
+        assert result.exit_code == 0, result.output
+        mock_get_table.assert_called_once()
+
+    def test_drop_invalidates(self) -> None:
+        """Test dropping a table invalidates the table and its namespace's listing."""
+        metadata_cache.put(table_key('ns', 'events'), TABLE)
+        metadata_cache.put(tables_key('ns'), [TABLE])
+        metadata_cache.put(table_key('ns', 'other'), TABLE)
+
+        with patch('deltacat_cli.table.drop.drop_table'):
+            result = CliRunner().invoke(app, ['table', 'drop', '--name', 'events', '--namespace', 'ns', '--drop'])
+
+        assert result.exit_code == 0, result.output
+        assert metadata_cache.get(table_key('ns', 'events')) is None
+        assert metadata_cache.get(tables_key('ns')) is None
+        assert metadata_cache.get(table_key('ns', 'other')) == TABLE
@@ -0,0 +1,101 @@
+"""Tests for lazy namespace and table listing."""
+
+import shutil
+import tempfile
+from collections.abc import Generator
+from typing import Any
+from unittest.mock import Mock, patch
+
+import deltacat.catalog.main.impl as catalog_impl
+import pyarrow as pa
+import pytest
+from deltacat.catalog import get_catalog_properties
+from deltacat.exceptions import NamespaceNotFoundError
+from typer.testing import CliRunner
+
+from deltacat import Schema
+from deltacat_cli.main import app
+from deltacat_cli.utils.metafile_listing import list_namespaces_lazily, list_tables_lazily
+
+
+NAMESPACE = 'test_listing_namespace'
+TABLES = [f'table_{i}' for i in range(7)]
+
+
+@pytest.fixture(scope='module')
+def catalog_properties() -> Generator[Any, None, None]:
+    """Catalog with a namespace of several tables, one of them dropped."""
+    temp_dir = tempfile.mkdtemp()
+    catalog_properties = get_catalog_properties(root=temp_dir)
+    catalog_impl.create_namespace(namespace=NAMESPACE, inner=catalog_properties)
+    catalog_impl.create_namespace(namespace='other', inner=catalog_properties)
+    schema = Schema.of(schema=pa.schema([('id', pa.int64())]))
+    for table in [*TABLES, 'dropped']:
+        catalog_impl.create_table(table, namespace=NAMESPACE, schema=schema, inner=catalog_properties)
+    catalog_impl.drop_table('dropped', namespace=NAMESPACE, inner=catalog_properties)
+    yield catalog_properties
+
+    shutil.rmtree(temp_dir)
+
+
+class TestMetafileListing:
+    """Test MetafileListing."""
+
+    def test_lists_live_tables(self, catalog_properties: Any) -> None:
+        """Test the listing matches deltacat's and skips dropped tables."""
+        listed = [item.metafile.table_name for item in list_tables_lazily(NAMESPACE, catalog_properties, page_size=3)]
+
+        assert sorted(listed) == TABLES
+
+    def test_resume_after_token(self, catalog_properties: Any) -> None:
+        """Test listing after a token continues right behind it, in the same order."""
+        items = list(list_tables_lazily(NAMESPACE, catalog_properties, page_size=2))
+
+        resumed = list(list_tables_lazily(NAMESPACE, catalog_properties, page_size=2, after=items[2].token))
+
+        assert [item.token for item in resumed] == [item.token for item in items[3:]]
+        assert items[2].token == items[2].metafile.id
+
+    def test_lists_namespaces(self, catalog_properties: Any) -> None:
+        """Test namespaces are listed."""
+        listed = [item.metafile.namespace for item in list_namespaces_lazily(catalog_properties)]
+
+        assert {NAMESPACE, 'other'} <= set(listed)
+        assert len(listed) == len(set(listed))
+
+    def test_missing_namespace(self, catalog_properties: Any) -> None:
+        """Test listing the tables of a missing namespace fails like deltacat does."""
+        with pytest.raises(NamespaceNotFoundError, match='Namespace missing not found'):
+            list(list_tables_lazily('missing', catalog_properties))
+
+
+class TestListCLI:
+    """Test --limit and --after on table list."""
+
+    @pytest.fixture(autouse=True)
+    def catalog_context(self, catalog_properties: Any) -> Generator[None, None, None]:
+        """Point the CLI at the test catalog."""
+        with (
+            patch('deltacat_cli.utils.catalog_context.catalog_context.get_catalog_info') as mock_catalog_info,
+            patch('deltacat_cli.utils.catalog_context.catalog_context.get_catalog') as mock_get_catalog,
+            patch('deltacat_cli.utils.catalog_context.catalog_context.get_catalog_properties') as mock_properties,
+        ):
+            mock_catalog_info.return_value = ('test_catalog', 'root')
+            mock_get_catalog.return_value = Mock(inner=catalog_properties)
+            mock_properties.return_value = catalog_properties
+            yield
+
+    def test_limit_prints_continuation(self) -> None:
+        """Test a limited listing prints a token that resumes it."""
+        runner = CliRunner()
+        result = runner.invoke(app, ['table', 'list', '--namespace', NAMESPACE, '--limit', '4', '--page-size', '2'])
+
+        assert result.exit_code == 0, result.output
+        assert 'Found 4 table(s)' in result.stdout
+        token = result.stdout.split('--after ')[1].split()[0]
+
+        result = runner.invoke(app, ['table', 'list', '--namespace', NAMESPACE, '--after', token])
+
+        assert result.exit_code == 0, result.output
+        assert f'Found {len(TABLES) - 4} table(s)' in result.stdout
+        assert 'continue with' not in result.stdout
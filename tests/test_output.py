@@ -0,0 +1,135 @@
+"""Tests for machine-readable output formats."""
+
+import io
+import json
+import shutil
+import tempfile
+from collections.abc import Generator
+from typing import Any
+from unittest.mock import Mock, patch
+
+import deltacat.catalog.main.impl as catalog_impl
+import pyarrow as pa
+import pytest
+from deltacat.catalog import get_catalog_properties
+from typer.testing import CliRunner
+
+from deltacat import TableWriteMode
+from deltacat_cli.main import app
+from deltacat_cli.utils import daemon
+from deltacat_cli.utils.output import OUTPUT_ENV_VAR, dumps, output_context, print_records
+
+
+NAMESPACE = 'test_output_namespace'
+
+
+@pytest.fixture(scope='module')
+def catalog_properties() -> Generator[Any, None, None]:
+    """Catalog with a small table."""
+    temp_dir = tempfile.mkdtemp()
+    catalog_properties = get_catalog_properties(root=temp_dir)
+    catalog_impl.create_namespace(namespace=NAMESPACE, inner=catalog_properties)
+    data = pa.table({'id': pa.array(range(5), pa.int64()), 'name': pa.array([f'name-{i}' for i in range(5)])})
+    catalog_impl.write_to_table(data, 'events', namespace=NAMESPACE, mode=TableWriteMode.AUTO, inner=catalog_properties)
+    yield catalog_properties
+
+    shutil.rmtree(temp_dir)
+
+
+@pytest.fixture
+def catalog_context(catalog_properties: Any) -> Generator[None, None, None]:
+    """Point the CLI at the test catalog."""
+    with (
+        patch('deltacat_cli.utils.catalog_context.catalog_context.get_catalog_info') as mock_catalog_info,
+        patch('deltacat_cli.utils.catalog_context.catalog_context.get_catalog') as mock_get_catalog,
+        patch('deltacat_cli.utils.catalog_context.catalog_context.get_catalog_properties') as mock_properties,
+    ):
+        mock_catalog_info.return_value = ('test_catalog', 'root')
+        mock_get_catalog.return_value = Mock(inner=catalog_properties)
+        mock_properties.return_value = catalog_properties
+        yield
+
+
+class TestOutputContext:
+    """Test output format selection."""
+
+    def test_auto_is_ndjson_without_terminal(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test auto output selects NDJSON when stdout is not a terminal."""
+        monkeypatch.delenv(OUTPUT_ENV_VAR)
+        monkeypatch.setattr('sys.stdout', io.StringIO())
+
+        assert output_context.format == 'auto'
+        assert output_context.resolve() == 'ndjson'
+        assert output_context.machine
+
+    def test_scoped_restores_format(self) -> None:
+        """Test a scoped format is restored afterwards."""
+        with output_context.scoped('csv'):
+            assert output_context.resolve() == 'csv'
+        assert output_context.resolve() == 'rich'
+
+    def test_unknown_format(self) -> None:
+        """Test an unknown format is rejected."""
+        with pytest.raises(ValueError, match='Unknown output format'):
+            output_context.format = 'xml'
+
+    def test_print_records_csv(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test records are written as CSV with nested values encoded as JSON."""
+        with output_context.scoped('csv'):
+            count = print_records('table', [{'name': 'a', 'keys': ['id'], 'note': None}, {'name': 'b', 'keys': []}])
+
+        assert count == 2
+        assert capsys.readouterr().out == 'name,keys,note\na,"[""id""]",\nb,[],\n'
+
+    def test_print_records_csv_fields_of_every_record(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test the CSV header names fields only later records have, and records without them leave them empty."""
+        with output_context.scoped('csv'):
+            print_records('table', iter([{'name': 'a'}, {'name': 'b', 'description': 'events'}]))
+
+        assert capsys.readouterr().out == 'name,description\na,\nb,events\n'
+
+    def test_dumps_is_compact(self) -> None:
+        """Test JSON is compact and falls back to strings."""
+        assert dumps({'a': [1, 2], 'b': pa.int64()}) == '{"a":[1,2],"b":"int64"}'
+
+    def test_forward_skips_output_option(self) -> None:
+        """Test commands after --output are forwarded, and binary output runs locally."""
+        assert daemon.should_forward(['--output', 'ndjson', 'table', 'list'])
+        assert daemon.should_forward(['--output=csv', 'table', 'list'])
+        assert not daemon.should_forward(['-o', 'arrow', 'table', 'read'])
+        assert not daemon.should_forward(['-o', 'json'])
+
+
+@pytest.mark.usefixtures('catalog_context')
+class TestOutputCLI:
+    """Test --output with table commands."""
+
+    def test_read_ndjson(self) -> None:
+        """Test table read writes one JSON object per row to stdout, status to stderr."""
+        result = CliRunner().invoke(
+            app, ['--output', 'ndjson', 'table', 'read', '--name', 'events', '--namespace', NAMESPACE]
+        )
+
+        assert result.exit_code == 0, result.output
+        rows = [json.loads(line) for line in result.stdout.splitlines()]
+        assert rows == [{'id': i, 'name': f'name-{i}'} for i in range(5)]
+        assert '5 row(s) from 1 file(s)' in result.stderr
+
+    def test_read_csv(self) -> None:
+        """Test table read writes CSV with a single header."""
+        result = CliRunner().invoke(
+            app, ['-o', 'csv', 'table', 'read', '--name', 'events', '--namespace', NAMESPACE, '--num-rows', '2']
+        )
+
+        assert result.exit_code == 0, result.output
+        assert result.stdout == '"id","name"\n0,"name-0"\n1,"name-1"\n'
+
+    def test_auto_output_when_piped(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test output defaults to NDJSON when stdout is not a terminal."""
+        monkeypatch.delenv(OUTPUT_ENV_VAR)
+
+        result = CliRunner().invoke(app, ['table', 'list', '--namespace', NAMESPACE])
+
+        assert result.exit_code == 0, result.output
+        tables = [json.loads(line) for line in result.stdout.splitlines()]
+        assert [table['tableLocator']['tableName'] for table in tables] == ['events']
@@ -0,0 +1,93 @@
+"""Tests for --profile phase timing."""
+
+import pstats
+import time
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import deltacat.catalog.main.impl as catalog_impl
+import pytest
+from deltacat.catalog import get_catalog_properties
+from typer.testing import CliRunner
+
+from deltacat_cli.main import app
+from deltacat_cli.utils import daemon
+from deltacat_cli.utils.profiling import PhaseTiming, Profiler
+
+
+@pytest.fixture
+def catalog_properties(tmp_path: Path) -> Any:
+    """Catalog with one namespace."""
+    properties = get_catalog_properties(root=str(tmp_path / 'catalog'))
+    catalog_impl.create_namespace(namespace='profiled', inner=properties)
+    return properties
+
+
+@pytest.fixture
+def reports() -> Generator[list[dict[str, PhaseTiming]], None, None]:
+    """Collect the phase timings of finished sessions instead of printing them."""
+    collected: list[dict[str, PhaseTiming]] = []
+    with patch('deltacat_cli.utils.profiling.print_report', side_effect=lambda timings, _: collected.append(timings)):
+        yield collected
+
+
+class TestProfiler:
+    """Test phase accounting."""
+
+    def test_nested_phase_time_counted_once(self, reports: list[dict[str, PhaseTiming]]) -> None:
+        """Test time of a nested phase is not counted towards the phase around it."""
+        profiler = Profiler()
+        with profiler.session():
+            with profiler.phase('catalog'):
+                with profiler.phase('import'):
+                    time.sleep(0.05)
+            with profiler.phase('import'):
+                pass
+
+        timings = reports[0]
+        assert timings['import'].calls == 2
+        assert timings['import'].seconds >= 0.05
+        assert timings['catalog'].seconds < 0.05
+        assert timings['deltacat'].calls == 1
+
+    def test_phase_outside_session(self, reports: list[dict[str, PhaseTiming]]) -> None:
+        """Test phases are not recorded while no session is active."""
+        profiler = Profiler()
+        with profiler.phase('render'):
+            pass
+        with profiler.session():
+            pass
+
+        assert 'render' not in reports[0]
+
+    def test_profile_runs_locally(self) -> None:
+        """Test profiled commands are not forwarded to the daemon."""
+        assert not daemon.should_forward(['--profile', 'table', 'list'])
+        assert not daemon.should_forward(['--profile-file=out.prof', 'table', 'list'])
+        assert daemon.should_forward(['--no-cache', 'table', 'list'])
+
+
+class TestProfileCLI:
+    """Test the global --profile options."""
+
+    def test_profile_report_and_file(self, tmp_path: Path, catalog_properties: Any) -> None:
+        """Test the breakdown is printed to stderr and the cProfile is written."""
+        profile_file = tmp_path / 'list.prof'
+        with (
+            patch('deltacat_cli.utils.catalog_context.catalog_context.get_catalog_info') as mock_catalog_info,
+            patch('deltacat_cli.utils.catalog_context.catalog_context.get_catalog_properties') as mock_properties,
+        ):
+            mock_catalog_info.return_value = ('test_catalog', 'root')
+            mock_properties.return_value = catalog_properties
+            result = CliRunner().invoke(
+                app, ['--profile-file', str(profile_file), '--profile-memory', '3', 'namespace', 'list']
+            )
+
+        assert result.exit_code == 0, result.output
+        assert 'Profile' in result.stderr
+        assert 'render' in result.stderr
+        assert '"profiled"' in result.stdout
+        assert 'Top 3 allocation sites' in result.stderr
+        assert pstats.Stats(str(profile_file)).total_calls > 0
@@ -0,0 +1,93 @@
+"""Tests for running scripts of commands in one process."""
+
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from deltacat_cli.main import app
+from deltacat_cli.run import parse_script
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    """Create a CLI test runner."""
+    return CliRunner()
+
+
+class TestParseScript:
+    """Test parsing command scripts."""
+
+    def test_parse_skips_comments_and_blank_lines(self) -> None:
+        """Test comments, blank lines and the optional deltacat prefix."""
+        commands = parse_script('# setup\n\ndeltacat namespace create --name a\ntable list --namespace a  # tables\n')
+
+        assert [command.args for command in commands] == [
+            ['namespace', 'create', '--name', 'a'],
+            ['table', 'list', '--namespace', 'a'],
+        ]
+        assert [command.line_number for command in commands] == [3, 4]
+
+    def test_parse_line_continuation_and_quoting(self) -> None:
+        """Test backslash continuations and shell quoting."""
+        commands = parse_script('table create --name t \\\n  --namespace a \\\n  --schema "id:int64, name:string"\n')
+
+        assert len(commands) == 1
+        assert commands[0].args == [
+            'table',
+            'create',
+            '--name',
+            't',
+            '--namespace',
+            'a',
+            '--schema',
+            'id:int64, name:string',
+        ]
+        assert commands[0].line_number == 1
+
+    @pytest.mark.parametrize('line', ['serve --detach', 'deltacat run other.txt'])
+    def test_parse_rejects_unsupported_commands(self, line: str) -> None:
+        """Test commands that would block or recurse are rejected."""
+        with pytest.raises(ValueError, match='cannot be run from a script'):
+            parse_script(line)
+
+
+class TestRunCLI:
+    """Test the run CLI command."""
+
+    def test_run_script(self, runner: CliRunner, tmp_path: Path) -> None:
+        """Test every command runs and the summary is printed."""
+        script = tmp_path / 'commands.txt'
+        script.write_text('--version\ndeltacat --version\n')
+
+        result = runner.invoke(app, ['run', str(script)])
+
+        assert result.exit_code == 0
+        assert result.stdout.count('deltacat version:') == 2
+        assert 'Run summary' in result.stdout
+        assert '2/2 command(s) run, 0 failed' in result.stdout
+
+    def test_run_stops_at_first_failure(self, runner: CliRunner, tmp_path: Path) -> None:
+        """Test a failing command stops the script unless --keep-going is given."""
+        script = tmp_path / 'commands.txt'
+        script.write_text('no-such-command\n--version\n')
+
+        result = runner.invoke(app, ['run', str(script)])
+
+        assert result.exit_code == 1
+        assert 'deltacat version:' not in result.stdout
+        assert '1/2 command(s) run, 1 failed' in result.stdout
+
+        result = runner.invoke(app, ['run', str(script), '--keep-going'])
+
+        assert result.exit_code == 1
+        assert 'deltacat version:' in result.stdout
+        assert '2/2 command(s) run, 1 failed' in result.stdout
+
+    def test_run_parallel_from_stdin(self, runner: CliRunner) -> None:
+        """Test commands read from stdin run on a thread pool."""
+        result = runner.invoke(app, ['run', '-', '--parallel', '3'], input='--version\n' * 5)
+
+        assert result.exit_code == 0
+        assert result.stdout.count('deltacat version:') == 5
+        assert '5/5 command(s) run, 0 failed' in result.stdout
@@ -0,0 +1,134 @@
+"""Tests for the serve daemon and command forwarding."""
+
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from deltacat_cli.utils import daemon
+
+
+@pytest.fixture
+def server() -> Generator[daemon.DaemonServer, None, None]:
+    """Run a daemon on a temporary socket."""
+    # Unix socket paths are length limited, keep it short rather than under pytest's tmp_path
+    socket_dir = tempfile.mkdtemp(prefix='dc-')
+    server = daemon.DaemonServer(Path(socket_dir) / 'serve.sock')
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+
+    server.shutdown()
+    server.server_close()
+    thread.join()
+    shutil.rmtree(socket_dir)
+
+
+class TestForwarding:
+    """Test running commands through the daemon."""
+
+    def test_forward_streams_output_and_exit_code(self, server: daemon.DaemonServer) -> None:
+        """Test a forwarded command's output and exit code reach the client."""
+        stdout, stderr = io.StringIO(), io.StringIO()
+
+        exit_code = daemon.forward(['--version'], server.path, stdout=stdout, stderr=stderr)
+
+        assert exit_code == 0
+        assert 'deltacat version:' in stdout.getvalue()
+
+    def test_forward_usage_error(self, server: daemon.DaemonServer) -> None:
+        """Test usage errors are reported with click's exit code."""
+        stdout, stderr = io.StringIO(), io.StringIO()
+
+        exit_code = daemon.forward(['no-such-command'], server.path, stdout=stdout, stderr=stderr)
+
+        assert exit_code == 2
+        assert 'No such command' in stderr.getvalue()
+
+    def test_prompting_command_runs_locally(self, server: daemon.DaemonServer) -> None:
+        """Test a command that prompts is handed back to the client without echoing the prompt."""
+        stdout, stderr = io.StringIO(), io.StringIO()
+
+        exit_code = daemon.forward(['catalog', 'init'], server.path, stdout=stdout, stderr=stderr)
+        reply = daemon.request({'control': 'status'}, server.path)
+
+        assert exit_code is None
+        assert stdout.getvalue() == ''
+        assert reply is not None
+        assert reply['commands_served'] == 0
+
+    def test_status_counts_commands(self, server: daemon.DaemonServer) -> None:
+        """Test the status control message reports served commands."""
+        daemon.forward(['--version'], server.path, stdout=io.StringIO(), stderr=io.StringIO())
+
+        reply = daemon.request({'control': 'status'}, server.path)
+
+        assert reply is not None
+        assert reply['commands_served'] == 1
+
+    def test_command_runs_with_client_environment(
+        self, server: daemon.DaemonServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test commands see the client's DELTACAT_CLI_* variables instead of the daemon's, for their duration."""
+        monkeypatch.setenv('DELTACAT_CLI_DAEMON_SETTING', 'daemon')
+        monkeypatch.delenv('DELTACAT_CLI_CLIENT_SETTING', raising=False)
+        seen = {}
+
+        def invoke(*args: Any, **kwargs: Any) -> int:
+            seen.update(
+                {key: os.environ.get(key) for key in ('DELTACAT_CLI_DAEMON_SETTING', 'DELTACAT_CLI_CLIENT_SETTING')}
+            )
+            return 0
+
+        sock = daemon.connect(server.path)
+        assert sock is not None
+        with patch('deltacat_cli.utils.invoke.invoke', side_effect=invoke), sock, sock.makefile('rw') as stream:
+            daemon._send(stream, {'argv': ['table', 'list'], 'env': {'DELTACAT_CLI_CLIENT_SETTING': 'client'}})
+            frames = [json.loads(line) for line in stream]
+
+        assert frames == [{'exit': 0}]
+        assert seen == {'DELTACAT_CLI_DAEMON_SETTING': None, 'DELTACAT_CLI_CLIENT_SETTING': 'client'}
+        assert os.environ['DELTACAT_CLI_DAEMON_SETTING'] == 'daemon'
+        assert 'DELTACAT_CLI_CLIENT_SETTING' not in os.environ
+
+    def test_forward_sends_cli_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the client sends its DELTACAT_CLI_* variables and no others."""
+        monkeypatch.setenv('DELTACAT_CLI_CLIENT_SETTING', 'client')
+        monkeypatch.setenv('OTHER_VARIABLE', '1')
+        sent = []
+        sock = MagicMock()
+        sock.makefile.return_value = io.StringIO('{"exit": 0}\n')
+
+        with (
+            patch('deltacat_cli.utils.daemon.connect', return_value=sock),
+            patch('deltacat_cli.utils.daemon._send', side_effect=lambda stream, message: sent.append(message)),
+        ):
+            exit_code = daemon.forward(['table', 'list'], stdout=io.StringIO(), stderr=io.StringIO())
+
+        assert exit_code == 0
+        assert sent[0]['env']['DELTACAT_CLI_CLIENT_SETTING'] == 'client'
+        assert all(key.startswith('DELTACAT_CLI_') for key in sent[0]['env'])
+
+    def test_forward_without_daemon(self, tmp_path: Path) -> None:
+        """Test forwarding falls back to running locally when no daemon is listening."""
+        assert daemon.forward(['--version'], tmp_path / 'missing.sock') is None
+
+    def test_should_forward(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test which command lines are forwarded."""
+        monkeypatch.delenv('DELTACAT_CLI_NO_DAEMON', raising=False)
+
+        assert daemon.should_forward(['table', 'list', '--namespace', 'ns'])
+        assert not daemon.should_forward(['--version'])
+        assert not daemon.should_forward(['catalog', 'show'])
+        assert not daemon.should_forward(['serve', '--stop'])
+
+        monkeypatch.setenv('DELTACAT_CLI_NO_DAEMON', '1')
+        assert not daemon.should_forward(['table', 'list', '--namespace', 'ns'])
@@ -0,0 +1,110 @@
+"""Tests for compaction setting recommendations."""
+
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import deltacat.catalog.main.impl as catalog
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from deltacat.storage import metastore
+from typer.testing import CliRunner
+
+from deltacat import Field, Schema, TableProperty
+from deltacat_cli.main import app
+from deltacat_cli.utils.compaction_advice import advise_compaction, round_significant
+from deltacat_cli.utils.sketches import HyperLogLog
+
+
+NAMESPACE = 'test_table_advise_namespace'
+
+
+@pytest.fixture
+def catalog_properties(local_catalog: Any, tmp_path: Path) -> Any:
+    """Catalog with a table keyed by id of four deltas, each key written twice."""
+    catalog.create_namespace(namespace=NAMESPACE, inner=local_catalog)
+    schema = Schema.of(
+        schema=[
+            Field.of(pa.field('id', pa.int64(), nullable=False), is_merge_key=True),
+            Field.of(pa.field('v', pa.string())),
+        ]
+    )
+    catalog.create_table('events', namespace=NAMESPACE, schema=schema, inner=local_catalog)
+
+    # Tables with merge keys only take MERGE writes, which compact; register files as APPEND deltas instead
+    for index, start in enumerate((0, 0, 1000, 1000)):
+        path = tmp_path / f'part-{index}.parquet'
+        data = pa.table({'id': pa.array(range(start, start + 1000), pa.int64()), 'v': ['x' * 20] * 1000})
+        pq.write_table(data, path)
+        result = CliRunner().invoke(
+            app, ['table', 'register', '--name', 'events', '--namespace', NAMESPACE, '-i', str(path)]
+        )
+        assert result.exit_code == 0, result.output
+    return local_catalog
+
+
+def test_hyperloglog() -> None:
+    """Test distinct counts are estimated within a few percent, and merged sketches count their union."""
+    left, right = HyperLogLog(), HyperLogLog()
+    left.update(pa.table({'id': pa.array(range(100_000))}))
+    right.update(pa.table({'id': pa.array(range(50_000, 150_000))}))
+    left.merge(right)
+
+    assert abs(left.estimate() - 150_000) < 150_000 * 0.03
+
+
+def test_round_significant() -> None:
+    assert [round_significant(value) for value in (3_456_789, 12_345, 7.2)] == [3_500_000, 12_000, 7]
+
+
+def test_advise_compaction(catalog_properties: Any) -> None:
+    """Test duplicate keys are counted once and settings follow from the measured row width."""
+    advice = advise_compaction(catalog_properties, NAMESPACE, 'events', target_file_bytes=1024 * 1024)
+
+    assert (advice.rows, advice.files, advice.deltas, advice.sampled_files) == (4000, 4, 4, 4)
+    assert abs(advice.distinct_keys - 2000) < 60
+    records_per_file = advice.recommended('records_per_compacted_file')
+    assert records_per_file == max(10_000, round_significant(1024 * 1024 / advice.average_row_bytes))
+    assert advice.recommended('default_compaction_hash_bucket_count') == 1
+    assert advice.recommended('appended_file_count_compaction_trigger') == 10
+
+
+@pytest.mark.usefixtures('catalog_properties')
+class TestTableAdviseCLI:
+    """Test the table advise CLI command."""
+
+    def test_advise(self) -> None:
+        """Test the recommendations are printed as one record without altering the table."""
+        with patch('deltacat_cli.table.advise.alter_table_cmd') as alter_table_cmd:
+            result = CliRunner().invoke(
+                app, ['-o', 'ndjson', 'table', 'advise', '--name', 'events', '--namespace', NAMESPACE]
+            )
+
+        assert result.exit_code == 0, result.output
+        alter_table_cmd.assert_not_called()
+        record = json.loads(result.stdout)
+        assert [item['option'] for item in record['recommendations']] == [
+            'records_per_compacted_file',
+            'default_compaction_hash_bucket_count',
+            'appended_file_count_compaction_trigger',
+            'appended_delta_count_compaction_trigger',
+        ]
+        assert 'with --apply' in result.stderr
+
+    def test_apply(self, catalog_properties: Any, by_inner: Any) -> None:
+        """Test --apply sets the recommended values on the table version compaction reads them from."""
+        by_inner('deltacat_cli.table.alter.get_table', catalog.get_table)
+        by_inner('deltacat_cli.table.alter.alter_table', catalog.alter_table)
+
+        result = CliRunner().invoke(app, ['table', 'advise', '--name', 'events', '--namespace', NAMESPACE, '--apply'])
+        again = CliRunner().invoke(app, ['table', 'advise', '--name', 'events', '--namespace', NAMESPACE, '--apply'])
+
+        assert result.exit_code == 0, result.output
+        table_version = metastore.get_latest_active_table_version(NAMESPACE, 'events', inner=catalog_properties)
+        assert table_version.read_table_property(TableProperty.DEFAULT_COMPACTION_HASH_BUCKET_COUNT) == 1
+        assert table_version.read_table_property(TableProperty.APPENDED_FILE_COUNT_COMPACTION_TRIGGER) == 10
+        assert table_version.read_table_property(TableProperty.RECORDS_PER_COMPACTED_FILE) != 4_000_000
+        assert again.exit_code == 0, again.output
+        assert 'already uses the recommended values' in again.output
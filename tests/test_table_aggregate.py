@@ -0,0 +1,143 @@
+"""Tests for table aggregate and the streamed group-by aggregation behind it."""
+
+import json
+from datetime import datetime
+from typing import Any
+
+import deltacat.catalog.main.impl as catalog
+import pyarrow as pa
+import pytest
+from typer.testing import CliRunner
+
+from deltacat import Schema, TableWriteMode
+from deltacat_cli.main import app
+from deltacat_cli.utils import aggregation
+from deltacat_cli.utils.aggregation import Aggregator, parse_aggregates, parse_group_keys
+
+
+NAMESPACE = 'test_table_aggregate_namespace'
+SCHEMA = pa.schema(
+    [
+        pa.field('tenant', pa.string()),
+        pa.field('ts', pa.timestamp('s')),
+        pa.field('amount', pa.int64()),
+        pa.field('user', pa.string()),
+    ]
+)
+
+
+def events(delta: int) -> pa.Table:
+    """Rows of a delta: one tenant a day, with a null tenant and a null amount among them."""
+    return pa.table(
+        {
+            'tenant': ['acme', 'acme', None, 'globex'],
+            'ts': [datetime(2026, 1, 1 + delta, hour) for hour in (1, 2, 3, 4)],
+            'amount': [10, 20, 5, None],
+            'user': ['u1', 'u2', 'u1', f'u{delta}'],
+        },
+        schema=SCHEMA,
+    )
+
+
+@pytest.fixture
+def catalog_properties(local_catalog: Any) -> Any:
+    """Catalog with a table of three deltas, one per day."""
+    catalog.create_namespace(namespace=NAMESPACE, inner=local_catalog)
+    catalog.create_table('events', namespace=NAMESPACE, schema=Schema.of(schema=SCHEMA), inner=local_catalog)
+    for delta in range(3):
+        catalog.write_to_table(
+            events(delta), 'events', namespace=NAMESPACE, mode=TableWriteMode.AUTO, inner=local_catalog
+        )
+    return local_catalog
+
+
+def aggregate(*args: str) -> Any:
+    return CliRunner().invoke(
+        app, ['-o', 'ndjson', 'table', 'aggregate', '--name', 'events', '--namespace', NAMESPACE, *args]
+    )
+
+
+def records(result: Any) -> list[dict[str, Any]]:
+    return [json.loads(line) for line in result.stdout.splitlines()]
+
+
+def test_parse_aggregates() -> None:
+    aggregates = parse_aggregates(['count(*), SUM(amount)', 'count_distinct( user )', 'count'])
+
+    assert [aggregate.name for aggregate in aggregates] == ['count', 'sum(amount)', 'count_distinct(user)']
+    with pytest.raises(ValueError, match='Unknown aggregate median'):
+        parse_aggregates(['median(amount)'])
+    with pytest.raises(ValueError, match='needs a column'):
+        parse_aggregates(['sum'])
+
+
+def test_merged_partials_match_one_pass(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test aggregating batch by batch, merging partial states and other aggregators, matches a single group-by."""
+    monkeypatch.setattr(aggregation, 'MIN_MERGE_ROWS', 3)
+    table = pa.concat_tables([events(delta) for delta in range(20)])
+    group_keys = parse_group_keys(['tenant'])
+    aggregates = parse_aggregates(['count,sum(amount),mean(amount),min(ts),count_distinct(user)'])
+    first, second = Aggregator(group_keys, aggregates), Aggregator(group_keys, aggregates)
+    for index, batch in enumerate(table.to_batches(max_chunksize=3)):
+        (first if index % 2 else second).update(batch)
+    first.merge(second)
+
+    assert first.result(SCHEMA).to_pylist() == [
+        {
+            'tenant': 'acme',
+            'count': 40,
+            'sum(amount)': 600,
+            'mean(amount)': 15.0,
+            'min(ts)': datetime(2026, 1, 1, 1),
+            'count_distinct(user)': 2,
+        },
+        {
+            'tenant': 'globex',
+            'count': 20,
+            'sum(amount)': None,
+            'mean(amount)': None,
+            'min(ts)': datetime(2026, 1, 1, 4),
+            'count_distinct(user)': 20,
+        },
+        {
+            'tenant': None,
+            'count': 20,
+            'sum(amount)': 100,
+            'mean(amount)': 5.0,
+            'min(ts)': datetime(2026, 1, 1, 3),
+            'count_distinct(user)': 1,
+        },
+    ]
+
+
+@pytest.mark.usefixtures('catalog_properties')
+class TestTableAggregateCLI:
+    """Test table aggregate against a local catalog."""
+
+    def test_rows_per_day_per_tenant(self) -> None:
+        result = aggregate('--group-by', 'day(ts),tenant', '--agg', 'count', '--agg', 'sum(amount)', '--workers', '2')
+
+        assert result.exit_code == 0, result.output
+        rows = records(result)
+        assert len(rows) == 9
+        assert rows[0] == {'day(ts)': '2026-01-01T00:00:00', 'tenant': 'acme', 'count': 2, 'sum(amount)': 30}
+        assert rows[2] == {'day(ts)': '2026-01-01T00:00:00', 'tenant': None, 'count': 1, 'sum(amount)': 5}
+        assert 'Aggregated 12 row(s) of 3 file(s) into 9 group(s)' in result.stderr
+
+    def test_where_without_group_by(self) -> None:
+        result = aggregate('--agg', 'count,count_distinct(user),max(amount)', '--where', "tenant = 'acme'")
+
+        assert result.exit_code == 0, result.output
+        assert records(result) == [{'count': 6, 'count_distinct(user)': 2, 'max(amount)': 20}]
+
+    def test_count_reads_no_columns(self) -> None:
+        result = aggregate('--agg', 'count')
+
+        assert result.exit_code == 0, result.output
+        assert records(result) == [{'count': 12}]
+
+    def test_sum_of_string_column(self) -> None:
+        result = aggregate('--agg', 'sum(user)')
+
+        assert result.exit_code == 1
+        assert 'needs a numeric column' in result.output
@@ -0,0 +1,120 @@
+"""Tests for incremental reads of the deltas committed after a high-water mark."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import deltacat.catalog.main.impl as catalog
+import pyarrow as pa
+import pytest
+from typer.testing import CliRunner
+
+from deltacat import TableWriteMode
+from deltacat_cli.main import app
+from deltacat_cli.utils.change_scan import ChangeScan, HighWaterMark
+from deltacat_cli.utils.formatting import format_timestamp, parse_timestamp
+
+
+NAMESPACE = 'test_table_changes_namespace'
+
+
+def write(catalog_properties: Any, ids: list[int], mode: TableWriteMode = TableWriteMode.APPEND) -> None:
+    data = pa.table({'id': pa.array(ids, pa.int64()), 'name': [f'n{i}' for i in ids]})
+    catalog.write_to_table(data, 'events', namespace=NAMESPACE, mode=mode, inner=catalog_properties)
+
+
+def scanned_ids(scan: ChangeScan) -> list[int]:
+    return [value for batch in scan.batches() for value in batch.column('id').to_pylist()]
+
+
+@pytest.fixture
+def catalog_properties(local_catalog: Any) -> Any:
+    """Table with two APPEND deltas and one ADD delta."""
+    catalog.create_namespace(namespace=NAMESPACE, inner=local_catalog)
+    write(local_catalog, [1, 2], TableWriteMode.AUTO)
+    write(local_catalog, [3])
+    write(local_catalog, [4], TableWriteMode.ADD)
+    return local_catalog
+
+
+class TestChangeScan:
+    """Test the selection of deltas after a mark."""
+
+    def test_since_position_skips_unordered_deltas(self, catalog_properties: Any) -> None:
+        """Test only ordered deltas after the position are read, ADD deltas are counted as skipped."""
+        scan = ChangeScan(namespace=NAMESPACE, table='events', inner=catalog_properties, since_position=1)
+
+        assert scanned_ids(scan) == [3]
+        assert scan.unordered_skipped == 1
+        assert scan.mark.position == 2
+
+    def test_since_time(self, catalog_properties: Any) -> None:
+        """Test ordered and ADD deltas committed after a time are read in commit order."""
+        first = ChangeScan(namespace=NAMESPACE, table='events', inner=catalog_properties).changes()[0]
+
+        scan = ChangeScan(namespace=NAMESPACE, table='events', inner=catalog_properties, since_time=first.commit_time)
+
+        assert scanned_ids(scan) == [3, 4]
+        assert scan.mark.commit_time == scan.changes()[-1].commit_time
+
+    def test_mark_resumes(self, catalog_properties: Any, tmp_path: Path) -> None:
+        """Test a saved mark reads exactly the deltas committed since, of either kind."""
+        scan = ChangeScan(namespace=NAMESPACE, table='events', inner=catalog_properties)
+        assert scanned_ids(scan) == [1, 2, 3, 4]
+        scan.mark.save(tmp_path / 'state.json')
+
+        write(catalog_properties, [5], TableWriteMode.ADD)
+        write(catalog_properties, [6])
+        mark = HighWaterMark.load(tmp_path / 'state.json')
+        resumed = ChangeScan(namespace=NAMESPACE, table='events', inner=catalog_properties, since=mark)
+
+        assert scanned_ids(resumed) == [5, 6]
+        assert resumed.mark.position == 3
+        assert HighWaterMark.load(tmp_path / 'missing.json') is None
+
+    def test_timestamps_round_trip(self) -> None:
+        """Test printed marks parse back to the same nanosecond."""
+        assert format_timestamp(1767268800000000001) == '2026-01-01T12:00:00.000000001Z'
+        assert parse_timestamp('2026-01-01T12:00:00.000000001Z') == 1767268800000000001
+        assert parse_timestamp('2026-01-01 14:00:00+02:00') == parse_timestamp('2026-01-01T12:00')
+        assert parse_timestamp('2026-01-01T12:00:00.5+0530') == parse_timestamp('2026-01-01T06:30:00.5Z')
+        with pytest.raises(ValueError, match='Invalid timestamp'):
+            parse_timestamp('yesterday')
+
+
+@pytest.mark.usefixtures('catalog_properties')
+class TestTableChangesCLI:
+    """Test table read --since-* and table changes."""
+
+    def test_read_since_position(self) -> None:
+        """Test table read only prints the new rows and the mark to continue from."""
+        result = CliRunner().invoke(
+            app,
+            ['-o', 'ndjson', 'table', 'read', '--name', 'events', '--namespace', NAMESPACE, '--since-position', '1'],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert [json.loads(line)['id'] for line in result.stdout.splitlines()] == [3]
+        assert 'continue with: --since-position 2' in result.stderr
+        assert '1 ADD delta(s)' in result.stderr
+
+    def test_changes_state_file(self, catalog_properties: Any, tmp_path: Path) -> None:
+        """Test consecutive calls with a state file each read only the changes since the previous one."""
+        args = ['-o', 'ndjson', 'table', 'changes', '--name', 'events', '--namespace', NAMESPACE]
+        args += ['--state-file', str(tmp_path / 'state.json')]
+
+        result = CliRunner().invoke(app, args)
+        assert result.exit_code == 0, result.output
+        rows = [json.loads(line) for line in result.stdout.splitlines()]
+        assert [row['id'] for row in rows] == [1, 2, 3, 4]
+        assert [row['_change_type'] for row in rows] == ['append', 'append', 'append', 'add']
+        assert rows[2]['_stream_position'] == 2
+
+        result = CliRunner().invoke(app, args)
+        assert result.exit_code == 0, result.output
+        assert result.stdout == ''
+        assert 'has no new changes' in result.stderr
+
+        write(catalog_properties, [5])
+        result = CliRunner().invoke(app, args)
+        assert [json.loads(line)['id'] for line in result.stdout.splitlines()] == [5]
@@ -13,6 +13,14 @@ from deltacat.catalog import get_catalog_properties
 from deltacat.exceptions import TableAlreadyExistsError, TableNotFoundError
 from typer.testing import CliRunner
 
+# Command modules are imported lazily by the CLI. Import them up front so that a module first
+# loaded inside one test's patch() context doesn't keep that test's mocks bound for later tests.
+import deltacat_cli.table.alter  # noqa: F401
+import deltacat_cli.table.create  # noqa: F401
+import deltacat_cli.table.drop  # noqa: F401
+import deltacat_cli.table.get  # noqa: F401
+import deltacat_cli.table.list  # noqa: F401
+import deltacat_cli.table.read  # noqa: F401
 from deltacat import LifecycleState, SchemaEvolutionMode, TableReadOptimizationLevel
 from deltacat_cli.main import app
 from deltacat_cli.utils.table_utils import DeltacatTableSchema, TableProperties, TableSchema
@@ -0,0 +1,176 @@
+"""Tests for table sort keys, clustering on writes and Z-order clustering by table optimize."""
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import deltacat.catalog.main.impl as catalog
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from deltacat.storage import metastore
+from typer.testing import CliRunner
+
+from deltacat import Schema, TableProperty, TableWriteMode
+from deltacat_cli.main import app
+from deltacat_cli.utils.clustering import cluster_table, validate_clustering, zorder_values
+from deltacat_cli.utils.table_scan import TableScan
+
+
+NAMESPACE = 'test_table_clustering_namespace'
+SCHEMA = pa.schema([pa.field('x', pa.int64()), pa.field('y', pa.int64())])
+
+
+@pytest.fixture
+def catalog_properties(local_catalog: Any, by_inner: Any) -> Any:
+    """Catalog with a table clustered by x and y in Z-order."""
+    catalog.create_namespace(namespace=NAMESPACE, inner=local_catalog)
+    catalog.create_table(
+        'points',
+        namespace=NAMESPACE,
+        schema=Schema.of(schema=SCHEMA),
+        table_properties={'sort_keys': ['x', 'y'], 'clustering': 'zorder'},
+        inner=local_catalog,
+    )
+    by_inner('deltacat_cli.table.write.write_to_table', catalog.write_to_table)
+    by_inner('deltacat_cli.table.alter.get_table', catalog.get_table)
+    by_inner('deltacat_cli.table.alter.alter_table', catalog.alter_table)
+    return local_catalog
+
+
+def read_points(catalog_properties: Any) -> list[tuple[int, int]]:
+    data = pa.Table.from_batches(TableScan(NAMESPACE, 'points', catalog_properties).batches())
+    return list(zip(data['x'].to_pylist(), data['y'].to_pylist(), strict=True))
+
+
+def test_zorder_values() -> None:
+    """Test Z-order visits a grid quadrant by quadrant, interleaving the bits of x before those of y."""
+    grid = pa.table({'x': [x for x in range(4) for _ in range(4)], 'y': [y for _ in range(4) for y in range(4)]})
+
+    ordered = cluster_table(grid, ['x', 'y'], 'zorder')
+
+    points = list(zip(ordered['x'].to_pylist(), ordered['y'].to_pylist(), strict=True))
+    assert points[:8] == [(0, 0), (0, 1), (1, 0), (1, 1), (0, 2), (0, 3), (1, 2), (1, 3)]
+    assert len(set(zorder_values(grid, ['x', 'y']).tolist())) == 16
+
+
+def test_cluster_table_linear() -> None:
+    """Test linear clustering sorts by the keys in order, nulls last."""
+    data = pa.table({'a': [2, None, 1, 2], 'b': ['y', 'z', 'z', 'x']})
+
+    ordered = cluster_table(data, ['a', 'b'])
+
+    assert ordered['b'].to_pylist() == ['z', 'x', 'y', 'z']
+
+
+@pytest.mark.parametrize(
+    ('sort_keys', 'clustering', 'merge_keys', 'message'),
+    [
+        (['x', 'y'], 'hilbert', None, 'Unknown clustering'),
+        (['x'], 'zorder', None, 'at least two sort keys'),
+        (['x', 'z'], 'linear', None, 'z not found'),
+        (['x'], 'linear', ['y'], 'without merge keys'),
+    ],
+)
+def test_validate_clustering(sort_keys: list[str], clustering: str, merge_keys: list[str] | None, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        validate_clustering(sort_keys, clustering, ['x', 'y'], merge_keys)
+
+
+def test_create_with_sort_keys() -> None:
+    """Test create stores the sort keys and clustering in the table properties."""
+    with (
+        patch('deltacat_cli.utils.catalog_context.catalog_context.get_catalog_info', return_value=('c', 'root')),
+        patch('deltacat_cli.utils.catalog_context.catalog_context.get_catalog'),
+        patch('deltacat_cli.table.create.create_table') as create_table,
+        patch('deltacat_cli.table.create.print_record'),
+    ):
+        result = CliRunner().invoke(
+            app,
+            [
+                'table',
+                'create',
+                '--name',
+                'points',
+                '--namespace',
+                NAMESPACE,
+                '--schema',
+                'x:int64,y:int64',
+                '--sort-keys',
+                'x,y',
+                '--clustering',
+                'zorder',
+            ],
+        )
+
+    assert result.exit_code == 0, result.output
+    properties = create_table.call_args.kwargs['table_properties']
+    assert (properties['sort_keys'], properties['clustering']) == (['x', 'y'], 'zorder')
+
+
+@pytest.mark.usefixtures('catalog_properties')
+class TestClusteringCLI:
+    """Test sort keys set by table alter and applied by table write and table optimize."""
+
+    def test_alter_sort_keys(self, catalog_properties: Any) -> None:
+        """Test alter replaces the sort keys, keeping the clustering unless given."""
+        result = CliRunner().invoke(
+            app, ['table', 'alter', '--name', 'points', '--namespace', NAMESPACE, '--sort-keys', 'y,x']
+        )
+
+        assert result.exit_code == 0, result.output
+        version = metastore.get_latest_active_table_version(NAMESPACE, 'points', inner=catalog_properties)
+        assert (version.properties['sort_keys'], version.properties['clustering']) == (['y', 'x'], 'zorder')
+
+    def test_alter_compaction_keeps_sort_keys(self, catalog_properties: Any) -> None:
+        """Test altering compaction properties sets them on the table version without dropping its sort keys."""
+        result = CliRunner().invoke(
+            app,
+            ['table', 'alter', '--name', 'points', '--namespace', NAMESPACE, '--records-per-compacted-file', '1000'],
+        )
+
+        assert result.exit_code == 0, result.output
+        version = metastore.get_latest_active_table_version(NAMESPACE, 'points', inner=catalog_properties)
+        assert version.read_table_property(TableProperty.RECORDS_PER_COMPACTED_FILE) == 1000
+        assert (version.properties['sort_keys'], version.properties['clustering']) == (['x', 'y'], 'zorder')
+
+    def test_alter_unknown_sort_key(self) -> None:
+        result = CliRunner().invoke(
+            app, ['table', 'alter', '--name', 'points', '--namespace', NAMESPACE, '--sort-keys', 'x,missing']
+        )
+
+        assert result.exit_code == 1
+        assert 'missing not found' in result.output
+
+    def test_write_clusters_rows(self, catalog_properties: Any, tmp_path: Path) -> None:
+        """Test each written delta is ordered by the table's clustering."""
+        points = pa.table({'x': [3, 1, 2, 0], 'y': [0, 1, 3, 0]}, schema=SCHEMA)
+        pq.write_table(points, tmp_path / 'points.parquet')
+
+        result = CliRunner().invoke(
+            app,
+            ['table', 'write', '--name', 'points', '--namespace', NAMESPACE, '-i', str(tmp_path / 'points.parquet')],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert read_points(catalog_properties) == [(0, 0), (1, 1), (3, 0), (2, 3)]
+
+    def test_optimize_cluster(self, catalog_properties: Any) -> None:
+        """Test --cluster rewrites a partition's files as one ordered whole."""
+        for x in (3, 0, 2, 1):
+            data = pa.table({'x': [x] * 4, 'y': [3, 2, 1, 0]}, schema=SCHEMA)
+            catalog.write_to_table(
+                data, 'points', namespace=NAMESPACE, mode=TableWriteMode.AUTO, inner=catalog_properties
+            )
+        before = read_points(catalog_properties)
+
+        result = CliRunner().invoke(
+            app, ['table', 'optimize', '--name', 'points', '--namespace', NAMESPACE, '--cluster']
+        )
+
+        assert result.exit_code == 0, result.output
+        assert 'ordered by x, y (zorder)' in result.output
+        after = read_points(catalog_properties)
+        assert sorted(after) == sorted(before)
+        assert after[:4] == [(0, 0), (0, 1), (1, 0), (1, 1)]
+        assert len(list(TableScan(NAMESPACE, 'points', catalog_properties).files())) == 1
@@ -0,0 +1,90 @@
+"""Tests for compaction status and on-demand compaction."""
+
+import json
+from typing import Any
+from unittest.mock import patch
+
+import deltacat.catalog.main.impl as catalog
+import pyarrow as pa
+import pytest
+from typer.testing import CliRunner
+
+from deltacat import TableWriteMode
+from deltacat_cli.main import app
+from deltacat_cli.utils.compaction import compaction_status
+from deltacat_cli.utils.table_scan import TableScan
+
+
+NAMESPACE = 'test_table_compact_namespace'
+
+
+@pytest.fixture
+def catalog_properties(local_catalog: Any) -> Any:
+    """Catalog with a table of three appended deltas."""
+    catalog.create_namespace(namespace=NAMESPACE, inner=local_catalog)
+    for start in (0, 5, 10):
+        data = pa.table({'id': pa.array(range(start, start + 5), pa.int64())})
+        catalog.write_to_table(data, 'events', namespace=NAMESPACE, mode=TableWriteMode.AUTO, inner=local_catalog)
+    return local_catalog
+
+
+def compact(*args: str) -> Any:
+    return CliRunner().invoke(app, ['table', 'compact', '--name', 'events', '--namespace', NAMESPACE, *args])
+
+
+def test_compaction_status(catalog_properties: Any) -> None:
+    """Test deltas after the first are counted against the table's triggers."""
+    table_version = TableScan(namespace=NAMESPACE, table='events', inner=catalog_properties).table_version
+
+    [status] = compaction_status(catalog_properties, NAMESPACE, table_version)
+
+    assert (status.deltas, status.files, status.records, status.merge_deltas) == (2, 2, 10, 0)
+    assert (status.delta_trigger, status.file_trigger) == (100, 1000)
+    assert status.hash_bucket_count == 8
+    assert not status.due
+    status.delta_trigger = 2
+    assert status.due
+
+
+@pytest.mark.usefixtures('catalog_properties')
+class TestTableCompactCLI:
+    """Test the table compact CLI command."""
+
+    def test_status(self) -> None:
+        """Test --status prints one record per partition without compacting."""
+        with patch('deltacat_cli.table.compact.compact_partition') as compact_partition:
+            result = CliRunner().invoke(
+                app, ['-o', 'ndjson', 'table', 'compact', '--name', 'events', '--namespace', NAMESPACE, '--status']
+            )
+
+        assert result.exit_code == 0, result.output
+        compact_partition.assert_not_called()
+        record = json.loads(result.stdout)
+        assert (record['deltas'], record['delta_trigger'], record['due']) == (2, 100, False)
+
+    def test_status_rich(self) -> None:
+        """Test the status table is rendered, without the manual compaction note for a MAX level table."""
+        result = compact('--status')
+
+        assert result.exit_code == 0, result.output
+        assert 'Compaction status' in result.output
+        assert 'not MAX' not in result.output
+
+    def test_compact_with_overrides(self) -> None:
+        """Test every partition with deltas to compact is compacted with the given buckets and workers."""
+        with patch('deltacat_cli.table.compact.compact_partition') as compact_partition:
+            result = compact('--hash-buckets', '4', '--workers', '2')
+
+        assert result.exit_code == 0, result.output
+        compact_partition.assert_called_once()
+        assert compact_partition.call_args.args[3:] == (4, 2)
+        assert 'Compacted partition 1/1' in result.output
+        assert 'Compacted table "events"' in result.output
+
+    def test_compaction_failure(self) -> None:
+        """Test a failed compaction is reported."""
+        with patch('deltacat_cli.table.compact.compact_partition', side_effect=RuntimeError('out of memory')):
+            result = compact()
+
+        assert result.exit_code == 1
+        assert 'out of memory' in result.output
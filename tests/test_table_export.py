@@ -0,0 +1,148 @@
+"""Tests for exporting tables to files."""
+
+import shutil
+import tempfile
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock, patch
+
+import deltacat.catalog.main.impl as catalog
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as ds
+import pyarrow.fs as pa_fs
+import pyarrow.parquet as pq
+import pytest
+from deltacat.catalog import get_catalog_properties
+from typer.testing import CliRunner
+
+from deltacat import TableWriteMode
+from deltacat_cli.main import app
+from deltacat_cli.utils.formatting import parse_bytes
+from deltacat_cli.utils.output_files import PartWriter, resolve_output_dir, validate_compression
+
+
+NAMESPACE = 'test_table_export_namespace'
+
+
+def make_batch(start: int, rows: int) -> pa.RecordBatch:
+    return pa.record_batch(
+        {'id': pa.array(range(start, start + rows), pa.int64()), 'name': [f'n{i}' for i in range(rows)]}
+    )
+
+
+@pytest.fixture(scope='module')
+def catalog_properties() -> Generator[Any, None, None]:
+    """Catalog with a table of 3 deltas of 100 rows, with the CLI pointed at it."""
+    temp_dir = tempfile.mkdtemp()
+    catalog_properties = get_catalog_properties(root=temp_dir)
+    catalog.create_namespace(namespace=NAMESPACE, inner=catalog_properties)
+    for start in (0, 100, 200):
+        data = pa.Table.from_batches([make_batch(start, 100)])
+        catalog.write_to_table(data, 'events', namespace=NAMESPACE, mode=TableWriteMode.AUTO, inner=catalog_properties)
+
+    with (
+        patch('deltacat_cli.utils.catalog_context.catalog_context.get_catalog_info') as mock_catalog_info,
+        patch('deltacat_cli.utils.catalog_context.catalog_context.get_catalog') as mock_get_catalog,
+    ):
+        mock_catalog_info.return_value = ('test_catalog', 'root')
+        mock_get_catalog.return_value = Mock(inner=catalog_properties)
+        yield catalog_properties
+
+    shutil.rmtree(temp_dir)
+
+
+class TestPartWriter:
+    """Test size-bounded part files."""
+
+    def test_row_groups_and_parts(self, tmp_path: Path) -> None:
+        """Test batches are regrouped into full row groups and parts roll over past the size bound."""
+        writer = PartWriter(pa_fs.LocalFileSystem(), str(tmp_path), 'part-0000', 'parquet', 'none', 250, max_bytes=1)
+        for start in range(0, 1000, 100):
+            writer.write(make_batch(start, 100))
+        writer.close()
+
+        assert [part.rows for part in writer.parts] == [250, 250, 250, 250]
+        files = sorted(tmp_path.iterdir())
+        assert [file.name for file in files] == [f'part-0000-{i:05d}.parquet' for i in range(4)]
+        assert pq.ParquetFile(files[1]).metadata.row_group(0).num_rows == 250
+        assert pq.read_table(files[3]).column('id').to_pylist() == list(range(750, 1000))
+
+    def test_gzip_csv(self, tmp_path: Path) -> None:
+        """Test CSV parts are compressed once and readable."""
+        writer = PartWriter(pa_fs.LocalFileSystem(), str(tmp_path), 'part-0000', 'csv', 'gzip', 100, 1 << 30)
+        writer.write(make_batch(0, 10))
+        part = writer.close()
+
+        assert part.path.endswith('part-0000-00000.csv.gz')
+        assert part.bytes == Path(part.path).stat().st_size
+        assert pa_csv.read_csv(part.path).num_rows == 10
+
+    def test_existing_parts(self, tmp_path: Path) -> None:
+        """Test an output directory with parts is only reused with overwrite."""
+        (tmp_path / 'part-0000-00000.parquet').write_bytes(b'old')
+        (tmp_path / 'notes.txt').write_text('kept')
+
+        with pytest.raises(ValueError, match='--overwrite'):
+            resolve_output_dir(str(tmp_path))
+        resolve_output_dir(str(tmp_path), overwrite=True)
+
+        assert [file.name for file in tmp_path.iterdir()] == ['notes.txt']
+
+    def test_validate_compression(self) -> None:
+        """Test codecs are checked per format and default to the first one."""
+        assert validate_compression('parquet', None) == 'zstd'
+        assert validate_compression('ipc', 'lz4') == 'lz4'
+        with pytest.raises(ValueError, match='Unknown compression snappy for csv'):
+            validate_compression('csv', 'snappy')
+
+    def test_parse_bytes(self) -> None:
+        """Test human readable sizes."""
+        assert parse_bytes('512MiB') == 512 * 1024**2
+        assert parse_bytes('1.5 GB') == 1_500_000_000
+        assert parse_bytes('100') == 100
+        with pytest.raises(ValueError, match='Invalid size'):
+            parse_bytes('lots')
+
+
+@pytest.mark.usefixtures('catalog_properties')
+class TestTableExportCLI:
+    """Test the table export CLI command."""
+
+    @pytest.mark.parametrize('export_format', ['parquet', 'ipc', 'csv'])
+    def test_export_formats(self, tmp_path: Path, export_format: str) -> None:
+        """Test every row is exported by parallel writers in each format."""
+        result = CliRunner().invoke(
+            app,
+            ['table', 'export', '--name', 'events', '--namespace', NAMESPACE, '--out', str(tmp_path)]
+            + ['--format', export_format, '--workers', '2'],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert 'Exported 300 row(s)' in result.output
+        ids = ds.dataset(str(tmp_path), format=export_format).to_table().column('id').to_pylist()
+        assert sorted(ids) == list(range(300))
+
+    def test_export_columns_and_where(self, tmp_path: Path) -> None:
+        """Test exports are projected and filtered like table read."""
+        result = CliRunner().invoke(
+            app,
+            ['table', 'export', '--name', 'events', '--namespace', NAMESPACE, '--out', str(tmp_path)]
+            + ['--columns', 'id', '--where', 'id >= 250', '--workers', '1'],
+        )
+
+        assert result.exit_code == 0, result.output
+        table = ds.dataset(str(tmp_path)).to_table()
+        assert table.column_names == ['id']
+        assert table.column('id').to_pylist() == list(range(250, 300))
+
+    def test_export_refuses_existing_parts(self, tmp_path: Path) -> None:
+        """Test a second export into the same directory needs --overwrite."""
+        args = ['table', 'export', '--name', 'events', '--namespace', NAMESPACE, '--out', str(tmp_path)]
+        assert CliRunner().invoke(app, args).exit_code == 0
+
+        result = CliRunner().invoke(app, args)
+
+        assert result.exit_code == 1
+        assert '--overwrite' in result.output
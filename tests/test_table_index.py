@@ -0,0 +1,134 @@
+"""Tests for the skip index and filtered reads ruling files out with it."""
+
+from typing import Any
+
+import deltacat.catalog.main.impl as catalog
+import numpy as np
+import pyarrow as pa
+import pytest
+from deltacat.storage import metastore
+from typer.testing import CliRunner
+
+from deltacat import Schema, TableWriteMode
+from deltacat_cli.main import app
+from deltacat_cli.utils.filter_expression import compile_file_filter
+from deltacat_cli.utils.skip_index import ColumnSkipStats
+from deltacat_cli.utils.sketches import BloomFilter, hash_columns
+
+
+NAMESPACE = 'test_table_index_namespace'
+SCHEMA = pa.schema([pa.field('id', pa.int64()), pa.field('session', pa.string())])
+
+
+def sessions(delta: int) -> pa.Table:
+    """Rows of a delta: ids in a range of their own, sessions spread over the same range as every other delta."""
+    return pa.table(
+        {'id': range(delta * 100, delta * 100 + 100), 'session': [f'{i:03d}-{delta}' for i in range(100)]},
+        schema=SCHEMA,
+    )
+
+
+def write(catalog_properties: Any, delta: int) -> None:
+    catalog.write_to_table(
+        sessions(delta), 'events', namespace=NAMESPACE, mode=TableWriteMode.AUTO, inner=catalog_properties
+    )
+
+
+@pytest.fixture
+def catalog_properties(local_catalog: Any, by_inner: Any) -> Any:
+    """Catalog with a table of four deltas."""
+    catalog.create_namespace(namespace=NAMESPACE, inner=local_catalog)
+    catalog.create_table('events', namespace=NAMESPACE, schema=Schema.of(schema=SCHEMA), inner=local_catalog)
+    for delta in range(4):
+        write(local_catalog, delta)
+    by_inner('deltacat_cli.table.alter.get_table', catalog.get_table)
+    by_inner('deltacat_cli.table.alter.alter_table', catalog.alter_table)
+    return local_catalog
+
+
+def cli(command: str, *args: str) -> Any:
+    return CliRunner().invoke(app, ['table', *command.split(), '--name', 'events', '--namespace', NAMESPACE, *args])
+
+
+def test_bloom_filter() -> None:
+    """Test added values are always found, and others rarely, at about the rate the filter was sized for."""
+    added = hash_columns(pa.table({'v': [f'key-{i}' for i in range(10_000)]}))
+    others = hash_columns(pa.table({'v': [f'other-{i}' for i in range(10_000)]}))
+    bloom_filter = BloomFilter.for_count(10_000)
+    bloom_filter.update_hashes(added)
+
+    restored = BloomFilter.from_bytes(bloom_filter.to_bytes())
+
+    assert restored.might_contain_hashes(added).all()
+    assert np.mean(restored.might_contain_hashes(others)) < 0.02
+
+
+@pytest.mark.parametrize(
+    ('where', 'may_match'),
+    [
+        ('id = 5', False),
+        ('id = 15', True),
+        ('id < 10', False),
+        ('30 >= id', True),
+        ('id BETWEEN 21 AND 25', False),
+        ('id IN (1, 2, 12)', True),
+        ("session = 'b'", True),
+        ("session = 'c'", False),
+        ("id = 15 AND session = 'c'", False),
+        ("id = 5 OR session = 'b'", True),
+        ('NOT id = 5', True),
+        ('score IS NULL', False),
+        ('score > 0', False),
+    ],
+)
+def test_file_filter(where: str, may_match: bool) -> None:
+    """Test files are ruled out by min/max, Bloom filters and null counts, never by negations."""
+    schema = pa.schema([('id', pa.int64()), ('session', pa.large_string()), ('score', pa.float64())])
+    bloom_filter = BloomFilter.for_count(2)
+    bloom_filter.update_hashes(hash_columns(pa.table({'value': pa.array(['a', 'b'], pa.large_string())})))
+    stats = {
+        'id': ColumnSkipStats(pa.int64(), 10, 20, null_count=0, row_count=10),
+        'session': ColumnSkipStats(pa.large_string(), 'a', 'z', 0, 10, bloom_filter),
+        'score': ColumnSkipStats(pa.float64(), None, None, null_count=0, row_count=0),
+    }
+
+    assert compile_file_filter(where, schema)(stats) is may_match
+
+
+@pytest.mark.usefixtures('catalog_properties')
+class TestTableIndexCLI:
+    """Test skip index configuration, building and use by table read."""
+
+    def test_read_rules_files_out(self, catalog_properties: Any) -> None:
+        """Test Bloom filters rule out files min/max can't, and new files are only ruled out once indexed."""
+        result = cli('alter', '--skip-index-columns', 'id', '--bloom-filter-columns', 'session')
+        assert result.exit_code == 0, result.output
+        version = metastore.get_latest_active_table_version(NAMESPACE, 'events', inner=catalog_properties)
+        assert version.properties['skip_index'] == {'columns': ['id', 'session'], 'bloom_filter_columns': ['session']}
+
+        result = cli('index rebuild', '--workers', '2')
+        assert result.exit_code == 0, result.output
+        assert 'Rebuilt skip index (requested): 4 delta(s), 4 file(s), 400 row(s)' in result.output
+
+        result = cli('read', '--where', "session = '042-2'")
+        assert result.exit_code == 0, result.output
+        assert 'Skip index ruled out 3 file(s)' in result.output
+        assert '042-2' in result.output
+
+        write(catalog_properties, 4)
+        assert 'Skip index ruled out 3 file(s)' in cli('read', '--where', "session = '042-2'").output
+        result = cli('index rebuild', '--incremental')
+        assert 'Refreshed skip index: 1 delta(s), 1 file(s), 100 row(s)' in result.output
+        assert 'Skip index ruled out 4 file(s)' in cli('read', '--where', "session = '042-2'").output
+
+    def test_alter_unknown_column(self) -> None:
+        result = cli('alter', '--bloom-filter-columns', 'missing')
+
+        assert result.exit_code == 1
+        assert 'missing not found' in result.output
+
+    def test_rebuild_without_columns(self) -> None:
+        result = cli('index rebuild')
+
+        assert result.exit_code == 1
+        assert 'skip index columns' in result.output
@@ -0,0 +1,136 @@
+"""Tests for merge key lookups through the key index."""
+
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import deltacat.catalog.main.impl as catalog
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from deltacat.storage import metastore
+from typer.testing import CliRunner
+
+from deltacat import Field, Schema
+from deltacat_cli.main import app
+from deltacat_cli.utils.key_index import KeyIndex, lookup
+
+
+NAMESPACE = 'test_table_lookup_namespace'
+
+
+def register(tmp_path: Path, name: str, ids: range, value: str) -> None:
+    path = tmp_path / f'{name}.parquet'
+    pq.write_table(pa.table({'id': pa.array(ids, pa.int64()), 'v': [value] * len(ids)}), path, row_group_size=100)
+    result = CliRunner().invoke(
+        app, ['table', 'register', '--name', 'users', '--namespace', NAMESPACE, '-i', str(path)]
+    )
+    assert result.exit_code == 0, result.output
+
+
+@pytest.fixture
+def catalog_properties(local_catalog: Any, tmp_path: Path) -> Any:
+    """Catalog with a table keyed by id of two deltas overlapping on ids 500 to 999."""
+    catalog.create_namespace(namespace=NAMESPACE, inner=local_catalog)
+    schema = Schema.of(
+        schema=[
+            Field.of(pa.field('id', pa.int64(), nullable=False), is_merge_key=True),
+            Field.of(pa.field('v', pa.string())),
+        ]
+    )
+    catalog.create_table('users', namespace=NAMESPACE, schema=schema, inner=local_catalog)
+
+    # Tables with merge keys only take MERGE writes, which compact; register files as APPEND deltas instead
+    register(tmp_path, 'first', range(0, 1000), 'a')
+    register(tmp_path, 'second', range(500, 1500), 'b')
+    return local_catalog
+
+
+def lookup_cmd(*args: str) -> Any:
+    return CliRunner().invoke(
+        app, ['-o', 'ndjson', 'table', 'lookup', '--name', 'users', '--namespace', NAMESPACE, *args]
+    )
+
+
+def records(result: Any) -> list[dict[str, Any]]:
+    return [json.loads(line) for line in result.stdout.splitlines()]
+
+
+def test_sharded_index(catalog_properties: Any) -> None:
+    """Test keys are found across shards, each lookup reading one row group of a shard and of a data file."""
+    table_version = metastore.get_latest_active_table_version(NAMESPACE, 'users', inner=catalog_properties)
+    index = KeyIndex(catalog_properties, NAMESPACE, table_version)
+
+    with patch('deltacat_cli.utils.key_index.SHARD_ROWS', 500):
+        index.refresh()
+
+    [segment] = index.segments
+    assert segment['shard_bits'] == 2
+    result = lookup(index, pa.table({'id': [7, 1200]}))
+    assert sorted(result.rows.to_pylist(), key=lambda row: row['id']) == [{'id': 7, 'v': 'a'}, {'id': 1200, 'v': 'b'}]
+    assert (result.files_read, result.row_groups_read, result.index_row_groups_read) == (2, 2, 2)
+
+
+@pytest.mark.usefixtures('catalog_properties')
+class TestTableLookupCLI:
+    """Test the table lookup CLI command."""
+
+    def test_lookup(self) -> None:
+        """Test a key is read from one row group, indexing the table on the first lookup."""
+        result = lookup_cmd('--key', 'id=42')
+
+        assert result.exit_code == 0, result.output
+        assert records(result) == [{'id': 42, 'v': 'a'}]
+        assert 'Rebuilt key index (no index yet): 2 delta(s), 2 file(s), 2,000 row(s)' in result.stderr
+        assert 'Read 1 row group(s) of 1 file(s)' in result.stderr
+
+    def test_last_version(self) -> None:
+        """Test the last row of a key in stream order is returned, every row with --all-versions."""
+        assert records(lookup_cmd('--key', 'id=600')) == [{'id': 600, 'v': 'b'}]
+        assert records(lookup_cmd('--key', 'id=600', '--all-versions')) == [
+            {'id': 600, 'v': 'a'},
+            {'id': 600, 'v': 'b'},
+        ]
+
+    def test_keys_file(self, tmp_path: Path) -> None:
+        """Test a batch of keys read from a file, missing ones reported."""
+        (tmp_path / 'keys.csv').write_text('id\n3\n1499\n5000\n')
+
+        result = lookup_cmd('--keys-file', str(tmp_path / 'keys.csv'), '--columns', 'v')
+
+        assert result.exit_code == 0, result.output
+        assert sorted(row['v'] for row in records(result)) == ['a', 'b']
+        assert "Key {'id': 5000} not found" in result.stderr
+        assert 'Found 2 of 3 key(s)' in result.stderr
+
+    def test_incremental_refresh(self, tmp_path: Path) -> None:
+        """Test deltas committed after the last lookup are indexed on the next one."""
+        assert lookup_cmd('--key', 'id=1').exit_code == 0
+        register(tmp_path, 'third', range(1, 2), 'c')
+
+        result = lookup_cmd('--key', 'id=1')
+
+        assert records(result) == [{'id': 1, 'v': 'c'}]
+        assert 'Indexed: 1 delta(s), 1 file(s), 1 row(s)' in result.stderr
+
+    def test_invalid_key(self) -> None:
+        result = lookup_cmd('--key', 'user=1')
+
+        assert result.exit_code == 1
+        assert 'Invalid key user=1' in result.output
+
+    def test_no_merge_keys(self, catalog_properties: Any) -> None:
+        catalog.create_table(
+            'plain',
+            namespace=NAMESPACE,
+            schema=Schema.of(schema=pa.schema([('id', pa.int64())])),
+            inner=catalog_properties,
+        )
+
+        result = CliRunner().invoke(
+            app, ['table', 'lookup', '--name', 'plain', '--namespace', NAMESPACE, '--key', 'id=1']
+        )
+
+        assert result.exit_code == 1
+        assert 'to look up records by' in result.output
@@ -0,0 +1,144 @@
+"""Tests for small-file bin-packing."""
+
+import json
+import threading
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock, patch
+
+import deltacat.catalog.main.impl as catalog
+import pyarrow as pa
+import pytest
+from deltacat.storage import ManifestEntry, ManifestMeta, metastore
+from typer.testing import CliRunner
+
+from deltacat import Field, Schema, TableWriteMode
+from deltacat_cli.main import app
+from deltacat_cli.utils import optimization
+from deltacat_cli.utils.optimization import pack_files
+from deltacat_cli.utils.table_scan import ScanFile, TableScan
+
+
+NAMESPACE = 'test_table_optimize_namespace'
+
+
+@pytest.fixture
+def catalog_properties(local_catalog: Any) -> Any:
+    """Catalog with a table of six one-file deltas."""
+    catalog.create_namespace(namespace=NAMESPACE, inner=local_catalog)
+    for start in range(0, 30, 5):
+        data = pa.table({'id': pa.array(range(start, start + 5), pa.int64())})
+        catalog.write_to_table(data, 'events', namespace=NAMESPACE, mode=TableWriteMode.AUTO, inner=local_catalog)
+    return local_catalog
+
+
+def optimize(*args: str) -> Any:
+    return CliRunner().invoke(app, ['table', 'optimize', '--name', 'events', '--namespace', NAMESPACE, *args])
+
+
+def scan_file(size: int, content_type: str = 'application/parquet') -> ScanFile:
+    meta = ManifestMeta.of(record_count=1, content_length=size, content_type=content_type, content_encoding='identity')
+    return ScanFile(
+        delta=Mock(), entry_index=0, entry=ManifestEntry.of(url='data/file.pq', meta=meta), path='data/file.pq'
+    )
+
+
+def test_pack_files() -> None:
+    """Test runs of small files are packed next-fit in order, and large or non-Parquet files end a run."""
+    files = [
+        scan_file(40),
+        scan_file(40),
+        scan_file(30),
+        scan_file(90),
+        scan_file(10),
+        scan_file(10, 'text/csv'),
+        scan_file(10),
+        scan_file(20),
+    ]
+
+    groups = pack_files(files, target_bytes=100)
+
+    assert [[files.index(f) for f in group.files] for group in groups] == [[0, 1], [6, 7]]
+
+
+@pytest.mark.usefixtures('catalog_properties')
+class TestTableOptimizeCLI:
+    """Test the table optimize CLI command."""
+
+    def test_dry_run(self, catalog_properties: Any) -> None:
+        """Test --dry-run prints the plan without changing the table."""
+        result = CliRunner().invoke(
+            app, ['-o', 'ndjson', 'table', 'optimize', '--name', 'events', '--namespace', NAMESPACE, '--dry-run']
+        )
+
+        assert result.exit_code == 0, result.output
+        record = json.loads(result.stdout)
+        assert (record['files_before'], record['files_after'], record['groups']) == (6, 1, 1)
+        assert '6 -> 1 file(s) (83% fewer)' in result.stderr
+        assert len(list(TableScan(namespace=NAMESPACE, table='events', inner=catalog_properties).files())) == 6
+
+    def test_optimize(self, catalog_properties: Any) -> None:
+        """Test small files are rewritten into one, keeping the rows in scan order, and the table stays writable."""
+        before = pa.Table.from_batches(TableScan(NAMESPACE, 'events', catalog_properties).batches())
+
+        result = optimize('--workers', '2')
+
+        assert result.exit_code == 0, result.output
+        assert 'Optimized table' in result.output
+        scan = TableScan(namespace=NAMESPACE, table='events', inner=catalog_properties)
+        [rewritten] = list(scan.files())
+        assert not rewritten.entry.url.startswith('/')
+        assert pa.Table.from_batches(scan.batches()).equals(before)
+
+        data = pa.table({'id': pa.array([30], pa.int64())})
+        catalog.write_to_table(data, 'events', namespace=NAMESPACE, mode=TableWriteMode.AUTO, inner=catalog_properties)
+        assert sum(batch.num_rows for batch in TableScan(NAMESPACE, 'events', catalog_properties).batches()) == 31
+
+    def test_large_files_kept(self) -> None:
+        """Test nothing is rewritten when every file is close to the target size."""
+        result = optimize('--target-file-size', '100')
+
+        assert result.exit_code == 0, result.output
+        assert 'no small files to pack' in result.output
+
+    def test_merge_keys_refused(self, catalog_properties: Any) -> None:
+        """Test tables with merge keys are left to compaction."""
+        schema = Schema.of(schema=[Field.of(pa.field('id', pa.int64(), nullable=False), is_merge_key=True)])
+        catalog.create_table('keyed', namespace=NAMESPACE, schema=schema, inner=catalog_properties)
+
+        result = CliRunner().invoke(app, ['table', 'optimize', '--name', 'keyed', '--namespace', NAMESPACE])
+
+        assert result.exit_code == 1
+        assert 'table compact' in result.output
+
+    @pytest.mark.parametrize(
+        'target', ['deltacat_cli.utils.optimization._rewrite_group', 'deltacat.storage.metastore.commit_partition']
+    )
+    def test_concurrent_write_aborts(self, catalog_properties: Any, tmp_path: Path, target: str) -> None:
+        """Test a write made while files are rewritten, or while they're committed, fails the whole commit.
+
+        The rewritten files are deleted.
+        """
+        function = optimization._rewrite_group if target.endswith('_rewrite_group') else metastore.commit_partition
+
+        def write_first(*args: Any, **kwargs: Any) -> Any:
+            data = pa.table({'id': pa.array([30], pa.int64())})
+            # Write from another thread, as another process would, outside the commit's transaction
+            thread = threading.Thread(
+                target=catalog.write_to_table,
+                args=(data, 'events'),
+                kwargs={'namespace': NAMESPACE, 'mode': TableWriteMode.AUTO, 'inner': catalog_properties},
+            )
+            thread.start()
+            thread.join()
+            return function(*args, **kwargs)
+
+        data_files = set((tmp_path / 'catalog' / 'data').rglob('*.*'))
+        with patch(target, side_effect=write_first):
+            result = optimize()
+
+        assert result.exit_code == 1
+        assert 'nothing was committed' in result.output
+        assert len(list(TableScan(NAMESPACE, 'events', catalog_properties).files())) == 7
+        [written] = set((tmp_path / 'catalog' / 'data').rglob('*.*')) - data_files
+        assert written.suffix == '.pq'
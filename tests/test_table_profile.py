@@ -0,0 +1,234 @@
+"""Tests for table profile and the per-delta sketches behind it."""
+
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import deltacat.catalog.main.impl as catalog
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from typer.testing import CliRunner
+
+from deltacat import Field, Schema, TableWriteMode
+from deltacat_cli.main import app
+from deltacat_cli.utils.column_profile import ColumnProfile, FrequentValues, Histogram
+from deltacat_cli.utils.sketches import KllSketch
+
+
+NAMESPACE = 'test_table_profile_namespace'
+SCHEMA = pa.schema([pa.field('id', pa.int64()), pa.field('name', pa.string()), pa.field('ts', pa.timestamp('s'))])
+
+
+def events(start: int, rows: int = 1000) -> pa.Table:
+    """Rows with ids from start, a name per ten ids and a null name every hundredth row."""
+    ids = range(start, start + rows)
+    return pa.table(
+        {
+            'id': ids,
+            'name': [None if i % 100 == 0 else f'n{i // 10}' for i in ids],
+            'ts': [datetime(2026, 1, 1) + timedelta(seconds=i) for i in ids],
+        },
+        schema=SCHEMA,
+    )
+
+
+@pytest.fixture
+def catalog_properties(local_catalog: Any, by_inner: Any, tmp_path: Path) -> Any:
+    """Catalog with a table of three deltas of 1000 rows and a keyed table of two."""
+    catalog.create_namespace(namespace=NAMESPACE, inner=local_catalog)
+    catalog.create_table('events', namespace=NAMESPACE, schema=Schema.of(schema=SCHEMA), inner=local_catalog)
+    for delta in range(3):
+        catalog.write_to_table(
+            events(delta * 1000), 'events', namespace=NAMESPACE, mode=TableWriteMode.AUTO, inner=local_catalog
+        )
+    schema = Schema.of(
+        schema=[
+            Field.of(pa.field('id', pa.int64(), nullable=False), is_merge_key=True),
+            Field.of(pa.field('v', pa.string())),
+        ]
+    )
+    catalog.create_table('users', namespace=NAMESPACE, schema=schema, inner=local_catalog)
+    by_inner('deltacat_cli.table.write.write_to_table', catalog.write_to_table)
+
+    # Tables with merge keys only take MERGE writes, which compact; register files as APPEND deltas instead
+    for name, ids in (('first', range(0, 1000)), ('second', range(500, 1500))):
+        table = pa.table({'id': pa.array(ids, pa.int64()), 'v': ['x'] * len(ids)})
+        pq.write_table(table, tmp_path / f'{name}.pq', row_group_size=100)
+        result = CliRunner().invoke(
+            app, ['table', 'register', '--name', 'users', '--namespace', NAMESPACE, '-i', str(tmp_path / f'{name}.pq')]
+        )
+        assert result.exit_code == 0, result.output
+    return local_catalog
+
+
+def profile(*args: str, table: str = 'events') -> Any:
+    return CliRunner().invoke(
+        app, ['-o', 'ndjson', 'table', 'profile', '--name', table, '--namespace', NAMESPACE, *args]
+    )
+
+
+def records(result: Any) -> dict[str, dict[str, Any]]:
+    return {record['column']: record for record in map(json.loads, result.stdout.splitlines())}
+
+
+def test_kll_sketch_merge() -> None:
+    """Test quantiles of merged sketches are within a percent of rank of the exact ones, and survive serialization."""
+    rng = np.random.default_rng(7)
+    values = rng.normal(size=200_000)
+    sketches = [KllSketch(dtype=np.dtype(np.float64)) for _ in range(4)]
+    for sketch, part in zip(sketches, np.array_split(values, 4), strict=True):
+        sketch.update(part)
+    merged = KllSketch.from_bytes(sketches[0].to_bytes())
+    for sketch in sketches[1:]:
+        merged.merge(sketch)
+
+    estimates = merged.quantiles([0.0, 0.5, 0.99, 1.0])
+    ranks = np.searchsorted(np.sort(values), estimates[1:3]) / len(values)
+
+    assert merged.count == len(values)
+    assert estimates[0] == values.min() and estimates[3] == values.max()
+    assert np.abs(ranks - [0.5, 0.99]).max() < 0.01
+
+
+def test_histogram_merge() -> None:
+    """Test histograms built from parts and merged count every value in the bin it falls in, in at most 10 bins."""
+    rng = np.random.default_rng(7)
+    parts = [rng.normal(loc, 10**loc, size=1000) for loc in range(4)]
+    merged = Histogram(10)
+    for part in parts:
+        histogram = Histogram(10)
+        for chunk in np.array_split(part, 4):
+            histogram.update(chunk)
+        merged.merge(histogram)
+
+    values = np.concatenate(parts)
+    bins = merged.to_list()
+    assert len(bins) <= 10
+    assert bins[0]['lower'] <= values.min() and values.max() < bins[-1]['upper']
+    for bin_ in bins:
+        assert bin_['count'] == ((values >= bin_['lower']) & (values < bin_['upper'])).sum()
+
+
+def test_frequent_values() -> None:
+    """Test counts are exact while the summary holds every value, and short by at most rows / counters after."""
+    values = np.random.default_rng(7).zipf(1.5, 100_000)
+    frequent = FrequentValues(counters=100)
+    for chunk in np.array_split(values, 10):
+        frequent.update(pa.array(chunk))
+    exact = FrequentValues()
+    exact.update(pa.array([3, 1, 3, None, 2, 3, 1]))
+
+    distinct, counts = np.unique(values, return_counts=True)
+    assert [top['value'] for top in frequent.top(3)] == [1, 2, 3]
+    for top in frequent.top(3):
+        assert 0 <= counts[distinct == top['value']][0] - top['count'] <= len(values) / 101
+    assert not frequent.exact
+    assert exact.top(2) == [{'value': 3, 'count': 3}, {'value': 1, 'count': 2}]
+    assert exact.exact
+
+
+def test_uint64_histogram() -> None:
+    """Test 64-bit unsigned integers beyond the range of int64 and of exact floats are binned as floats."""
+    profile = ColumnProfile(pa.uint64(), bins=2)
+    profile.update(pa.array([1, None, 9223372036854775813], pa.uint64()))
+
+    record = profile.to_dict('id')
+    assert (record['min'], record['max']) == (1, 9223372036854775813)
+    assert sum(bin_['count'] for bin_ in record['histogram']) == 2
+
+
+@pytest.mark.usefixtures('catalog_properties')
+class TestTableProfileCLI:
+    """Test table profile against a local catalog."""
+
+    def test_profile_sketches_every_delta(self) -> None:
+        result = profile('--quantiles', '0.5')
+
+        assert result.exit_code == 0, result.output
+        assert '(no index yet): 3 delta(s), 3 file(s), 3,000 row(s)' in result.stderr
+        columns = records(result)
+        assert columns['id']['min'] == 0 and columns['id']['max'] == 2999
+        assert abs(columns['id']['p50'] - 1500) < 60
+        assert abs(columns['id']['distinct'] - 3000) < 150
+        assert columns['name']['null_count'] == 30
+        assert abs(columns['name']['distinct'] - 300) < 15
+        assert columns['name']['min'] is None
+        assert columns['ts']['min'] == '2026-01-01T00:00:00'
+
+    def test_write_records_delta_sketch(self, tmp_path: Path) -> None:
+        assert profile().exit_code == 0
+        pq.write_table(events(3000), tmp_path / 'more.parquet')
+
+        write = CliRunner().invoke(
+            app, ['table', 'write', '--name', 'events', '--namespace', NAMESPACE, '-i', str(tmp_path / 'more.parquet')]
+        )
+        result = profile()
+
+        assert write.exit_code == 0, write.output
+        assert 'Sketched 1 delta(s) for table profile' in write.stdout
+        assert result.exit_code == 0, result.output
+        assert 'sketches' not in result.stderr
+        assert 'Profiled 4,000 row(s) of 4 delta(s)' in result.stderr
+        assert records(result)['id']['max'] == 3999
+
+    def test_merge_keys_sized_from_sketches(self) -> None:
+        result = profile(table='users')
+        advice = CliRunner().invoke(app, ['table', 'advise', '--name', 'users', '--namespace', NAMESPACE])
+
+        assert result.exit_code == 0, result.output
+        assert 'Merge keys id: ~1,' in result.stderr
+        assert advice.exit_code == 0, advice.output
+        assert 'sketches of 2 delta(s)' in advice.stdout
+
+    def test_invalid_quantile(self) -> None:
+        result = profile('--quantiles', '0.5,99')
+
+        assert result.exit_code == 1
+        assert 'Invalid quantile 99' in result.output
+
+    def test_streamed_columns(self) -> None:
+        result = profile('--columns', 'id,name', '--top-k', '2', '--bins', '4')
+
+        assert result.exit_code == 0, result.output
+        assert 'Profiled 3,000 row(s) of 3 file(s)' in result.stderr
+        columns = records(result)
+        assert list(columns) == ['id', 'name']
+        assert columns['id']['unique'] is True
+        assert [bin_['count'] for bin_ in columns['id']['histogram']] == [1024, 1024, 952]
+        assert columns['name']['null_ratio'] == 0.01
+        assert columns['name']['unique'] is False
+        assert columns['name']['top_values'] == [{'value': 'n1', 'count': 10}, {'value': 'n101', 'count': 10}]
+        assert columns['name']['length'] == {
+            'min': 2,
+            'mean': pytest.approx(10791 / 2970),
+            'max': 4,
+            'histogram': [
+                {'lower': 2, 'upper': 3, 'count': 99},
+                {'lower': 3, 'upper': 4, 'count': 891},
+                {'lower': 4, 'upper': 5, 'count': 1980},
+            ],
+        }
+
+    def test_sampled_row_groups(self) -> None:
+        result = profile('--sample-fraction', '0.5', table='users')
+
+        assert result.exit_code == 0, result.output
+        assert 'of 20 row group(s)' in result.stderr
+        sampled = int(result.stderr.split('Sampled ')[1].split(' of')[0])
+        assert 0 < sampled < 20
+        assert records(result)['id']['rows'] == sampled * 100
+
+    def test_streamed_options(self) -> None:
+        unknown = profile('--columns', 'id,missing')
+        rebuild = profile('--columns', 'id', '--rebuild')
+        fraction = profile('--sample-fraction', '1.5')
+
+        assert unknown.exit_code == 1
+        assert 'missing not found' in unknown.output
+        assert rebuild.exit_code == 1
+        assert '--rebuild only applies' in rebuild.output
+        assert fraction.exit_code == 1
+        assert 'Invalid sample fraction 1.5' in fraction.output
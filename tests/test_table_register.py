@@ -0,0 +1,131 @@
+"""Tests for registering existing Parquet files in a table."""
+
+from pathlib import Path
+from typing import Any
+
+import deltacat.catalog.main.impl as catalog
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from typer.testing import CliRunner
+
+from deltacat import Field, Schema
+from deltacat_cli.main import app
+from deltacat_cli.utils.input_files import resolve_inputs
+from deltacat_cli.utils.parquet_footers import read_footer, validate_footer
+from deltacat_cli.utils.table_scan import TableScan
+
+
+NAMESPACE = 'test_table_register_namespace'
+SCHEMA = pa.schema(
+    [pa.field('id', pa.int64(), nullable=False), pa.field('name', pa.large_string()), pa.field('score', pa.float64())]
+)
+
+
+@pytest.fixture
+def catalog_properties(local_catalog: Any) -> Any:
+    """Catalog with an empty table keyed by id."""
+    catalog.create_namespace(namespace=NAMESPACE, inner=local_catalog)
+    schema = Schema.of(
+        schema=[
+            Field.of(SCHEMA.field('id'), is_merge_key=True),
+            Field.of(SCHEMA.field('name')),
+            Field.of(SCHEMA.field('score')),
+        ]
+    )
+    catalog.create_table('events', namespace=NAMESPACE, schema=schema, inner=local_catalog)
+    return local_catalog
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path) -> Path:
+    """Two Parquet files of 10 rows each, outside the catalog."""
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    for part in range(2):
+        ids = range(part * 10, part * 10 + 10)
+        pq.write_table(
+            pa.table({'id': pa.array(ids, pa.int32()), 'name': [f'n{i}' for i in ids]}),
+            data_dir / f'part-{part}.parquet',
+            row_group_size=5,
+        )
+    return data_dir
+
+
+def register(*args: str) -> Any:
+    return CliRunner().invoke(app, ['table', 'register', '--name', 'events', '--namespace', NAMESPACE, *args])
+
+
+class TestValidateFooter:
+    """Test schema checks against Parquet footers."""
+
+    def test_footer_statistics(self, data_dir: Path) -> None:
+        """Test row counts and column statistics are aggregated over row groups."""
+        footer = read_footer(resolve_inputs([str(data_dir / 'part-1.parquet')])[0])
+
+        assert (footer.rows, footer.row_groups) == (10, 2)
+        assert (footer.columns['id'].null_count, footer.columns['id'].min, footer.columns['id'].max) == (0, 10, 19)
+        assert validate_footer(footer, SCHEMA, ['id']) == []
+
+    def test_problems(self, tmp_path: Path) -> None:
+        """Test unknown columns, incompatible types and nulls in required columns are all reported."""
+        path = tmp_path / 'bad.parquet'
+        pq.write_table(pa.table({'id': [1, None], 'score': ['a', 'b'], 'extra': [1, 2]}), path)
+
+        problems = validate_footer(read_footer(resolve_inputs([str(path)])[0]), SCHEMA, ['id'])
+
+        assert problems == [
+            'columns not in the table schema: extra',
+            'column id must not be null but has 1 null(s)',
+            'column score is string, the table expects double',
+        ]
+
+
+@pytest.mark.usefixtures('catalog_properties')
+class TestTableRegisterCLI:
+    """Test the table register CLI command."""
+
+    def test_register_without_copying(self, catalog_properties: Any, data_dir: Path) -> None:
+        """Test registered files are read in place as table data."""
+        result = register('-i', str(data_dir / '*.parquet'))
+
+        assert result.exit_code == 0, result.output
+        assert 'Registered 2 file(s), 20 row(s)' in result.output
+        scan = TableScan(namespace=NAMESPACE, table='events', inner=catalog_properties)
+        assert sorted(scan_file.path for scan_file in scan.files()) == sorted(
+            str(path) for path in data_dir.glob('*.parquet')
+        )
+        assert sorted(pa.Table.from_batches(scan.batches()).column('id').to_pylist()) == list(range(20))
+        assert not list((Path(catalog_properties.root)).rglob('*.parquet'))
+
+    def test_dry_run(self, catalog_properties: Any, data_dir: Path) -> None:
+        """Test a dry run validates the files without committing a delta."""
+        result = register('-i', str(data_dir / 'part-0.parquet'), '--dry-run')
+
+        assert result.exit_code == 0, result.output
+        assert 'Validated 1 file(s): 10 row(s) in 2 row group(s)' in result.output
+        assert 'no files were registered' in result.output
+        assert not list(TableScan(namespace=NAMESPACE, table='events', inner=catalog_properties).deltas())
+
+    def test_invalid_file_registers_nothing(self, catalog_properties: Any, data_dir: Path) -> None:
+        """Test one invalid file fails the whole registration."""
+        pq.write_table(pa.table({'name': ['x']}), data_dir / 'no_id.parquet')
+
+        result = register('-i', str(data_dir / '*.parquet'))
+
+        assert result.exit_code == 1
+        # Rich wraps the long path wherever the temporary directory's length puts it
+        assert 'no_id.parquet' in result.output.replace('\n', '')
+        assert 'missing required column id' in result.output
+        assert not list(TableScan(namespace=NAMESPACE, table='events', inner=catalog_properties).deltas())
+
+    def test_already_registered(self, data_dir: Path) -> None:
+        """Test registering the same file twice is refused."""
+        assert register('-i', str(data_dir / 'part-0.parquet')).exit_code == 0
+
+        result = register('-i', str(data_dir / '*.parquet'))
+
+        assert result.exit_code == 1
+        assert 'part-0.parquet' in result.output
+        assert 'already registered' in result.output
+        assert 'part-1.parquet' not in result.output
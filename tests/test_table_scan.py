@@ -0,0 +1,175 @@
+"""Tests for incremental table scans and table read."""
+
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Generator
+from typing import Any
+from unittest.mock import Mock, patch
+
+import deltacat.catalog.main.impl as catalog
+import pyarrow as pa
+import pytest
+from deltacat.catalog import get_catalog_properties
+from typer.testing import CliRunner
+
+from deltacat import Schema, TableWriteMode
+from deltacat_cli.main import app
+from deltacat_cli.utils.filter_expression import compile_where
+from deltacat_cli.utils.table_scan import ScanStats, TableScan
+
+
+NAMESPACE = 'test_table_scan_namespace'
+ROWS_PER_FILE = 100
+FILES = 3
+
+
+class SlowStats(ScanStats):
+    """Scan stats slow to read, so that counts updated by concurrent workers without a lock get lost."""
+
+    def __getattribute__(self, name: str) -> Any:
+        value = super().__getattribute__(name)
+        time.sleep(0.001)
+        return value
+
+
+@pytest.fixture(scope='module')
+def catalog_properties() -> Generator[Any, None, None]:
+    """Catalog with a table written in several deltas and an empty table."""
+    temp_dir = tempfile.mkdtemp()
+    catalog_properties = get_catalog_properties(root=temp_dir)
+    catalog.create_namespace(namespace=NAMESPACE, inner=catalog_properties)
+    for i in range(FILES):
+        data = pa.table(
+            {
+                'id': pa.array(range(i * ROWS_PER_FILE, (i + 1) * ROWS_PER_FILE), pa.int64()),
+                'name': pa.array([f'name-{j}' for j in range(ROWS_PER_FILE)]),
+            }
+        )
+        mode = TableWriteMode.AUTO if i == 0 else TableWriteMode.APPEND
+        catalog.write_to_table(data, 'events', namespace=NAMESPACE, mode=mode, inner=catalog_properties)
+    catalog.create_table(
+        'empty', namespace=NAMESPACE, schema=Schema.of(schema=pa.schema([('id', pa.int64())])), inner=catalog_properties
+    )
+    yield catalog_properties
+
+    shutil.rmtree(temp_dir)
+
+
+class TestTableScan:
+    """Test TableScan."""
+
+    def test_scan_reads_all_rows(self, catalog_properties: Any) -> None:
+        """Test an unlimited scan reads every file in stream order."""
+        scan = TableScan(NAMESPACE, 'events', inner=catalog_properties)
+
+        table = pa.Table.from_batches(list(scan.batches()))
+
+        assert table.num_rows == FILES * ROWS_PER_FILE
+        assert table.column('id').to_pylist() == list(range(FILES * ROWS_PER_FILE))
+        assert scan.stats.files_read == FILES
+
+    def test_limit_stops_after_enough_files(self, catalog_properties: Any) -> None:
+        """Test the row limit is pushed down: only the files needed are decoded."""
+        scan = TableScan(NAMESPACE, 'events', inner=catalog_properties)
+
+        batches = list(scan.batches(limit=ROWS_PER_FILE + 10))
+
+        assert sum(batch.num_rows for batch in batches) == ROWS_PER_FILE + 10
+        assert scan.stats.files_read == 2
+        assert scan.stats.rows_read == ROWS_PER_FILE + 10
+
+    def test_column_projection(self, catalog_properties: Any) -> None:
+        """Test only the requested columns are produced."""
+        scan = TableScan(NAMESPACE, 'events', inner=catalog_properties, columns=['name'])
+
+        batch = next(scan.batches(limit=5))
+
+        assert batch.schema.names == ['name']
+        assert scan.output_schema.names == ['name']
+
+    def test_filter_skips_files_by_statistics(self, catalog_properties: Any) -> None:
+        """Test files whose statistics can't match the filter are not decoded."""
+        scan = TableScan(NAMESPACE, 'events', inner=catalog_properties)
+        scan.filter = compile_where(f'id >= {2 * ROWS_PER_FILE + 90}', scan.arrow_schema)
+
+        table = pa.Table.from_batches(list(scan.batches()), schema=scan.output_schema)
+
+        assert table.column('id').to_pylist() == list(range(2 * ROWS_PER_FILE + 90, FILES * ROWS_PER_FILE))
+        assert scan.stats.files_skipped == FILES - 1
+        assert scan.stats.files_read == 1
+
+    def test_concurrent_file_reads_counted(self, catalog_properties: Any) -> None:
+        """Test files read by concurrent workers all count in the scan's stats."""
+        scan = TableScan(NAMESPACE, 'events', inner=catalog_properties)
+        scan.filter = compile_where('id >= 0', scan.arrow_schema)
+        scan.stats = SlowStats()
+        files = list(scan.files()) * 20
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            rows = sum(executor.map(lambda scan_file: sum(b.num_rows for b in scan.file_batches(scan_file)), files))
+
+        assert rows == len(files) * ROWS_PER_FILE
+        assert scan.stats.files_read == len(files)
+        assert scan.stats.row_groups_read == len(files)
+
+    def test_empty_table(self, catalog_properties: Any) -> None:
+        """Test scanning a table without data yields nothing."""
+        scan = TableScan(NAMESPACE, 'empty', inner=catalog_properties)
+
+        assert list(scan.batches()) == []
+
+
+class TestTableReadCLI:
+    """Test the table read CLI command."""
+
+    @pytest.fixture(autouse=True)
+    def catalog_context(self, catalog_properties: Any) -> Generator[None, None, None]:
+        """Point the CLI at the test catalog."""
+        with (
+            patch('deltacat_cli.utils.catalog_context.catalog_context.get_catalog_info') as mock_catalog_info,
+            patch('deltacat_cli.utils.catalog_context.catalog_context.get_catalog') as mock_get_catalog,
+        ):
+            mock_catalog_info.return_value = ('test_catalog', 'root')
+            mock_get_catalog.return_value = Mock(inner=catalog_properties)
+            yield
+
+    def test_read_num_rows(self) -> None:
+        """Test --num-rows limits the rows printed and the files read."""
+        result = CliRunner().invoke(
+            app, ['table', 'read', '--name', 'events', '--namespace', NAMESPACE, '--num-rows', '3']
+        )
+
+        assert result.exit_code == 0
+        assert 'name-2' in result.stdout
+        assert 'name-3' not in result.stdout
+        assert '3 row(s) from 1 file(s)' in result.stdout
+
+    def test_read_where(self) -> None:
+        """Test --where filters rows and reports pruning."""
+        result = CliRunner().invoke(
+            app,
+            ['table', 'read', '--name', 'events', '--namespace', NAMESPACE, '--where', "name = 'name-7' AND id > 150"],
+        )
+
+        assert result.exit_code == 0
+        assert '207' in result.stdout
+        assert '1 file(s) by statistics' in result.stdout
+        assert '1 row(s) from 2 file(s)' in result.stdout
+
+    def test_read_invalid_where(self) -> None:
+        """Test an invalid filter is reported as an error."""
+        result = CliRunner().invoke(
+            app, ['table', 'read', '--name', 'events', '--namespace', NAMESPACE, '--where', 'missing = 1']
+        )
+
+        assert result.exit_code == 1
+        assert 'Unknown column "missing"' in result.output
+
+    def test_read_empty_table(self) -> None:
+        """Test reading a table without data."""
+        result = CliRunner().invoke(app, ['table', 'read', '--name', 'empty', '--namespace', NAMESPACE])
+
+        assert result.exit_code == 0
+        assert 'has no rows' in result.stdout
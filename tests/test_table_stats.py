@@ -0,0 +1,94 @@
+"""Tests for table statistics from metadata."""
+
+import json
+from typing import Any
+from unittest.mock import patch
+
+import deltacat.catalog.main.impl as catalog
+import pyarrow as pa
+import pytest
+from typer.testing import CliRunner
+
+from deltacat import TableWriteMode
+from deltacat_cli.main import app
+from deltacat_cli.utils.table_stats import collect_table_stats
+
+
+NAMESPACE = 'test_table_stats_namespace'
+
+
+@pytest.fixture
+def catalog_properties(local_catalog: Any) -> Any:
+    """Catalog with a table of two deltas and a table of one."""
+    catalog.create_namespace(namespace=NAMESPACE, inner=local_catalog)
+    for start in (0, 10):
+        data = pa.table({'id': pa.array(range(start, start + 10), pa.int64()), 'name': [None] + ['x'] * 9})
+        catalog.write_to_table(data, 'events', namespace=NAMESPACE, mode=TableWriteMode.AUTO, inner=local_catalog)
+    data = pa.table({'id': pa.array(range(3), pa.int64())})
+    catalog.write_to_table(data, 'users', namespace=NAMESPACE, mode=TableWriteMode.AUTO, inner=local_catalog)
+    return local_catalog
+
+
+def test_collect_table_stats(catalog_properties: Any) -> None:
+    """Test counts come from manifests and column statistics from footers, without reading data."""
+    with patch('deltacat_cli.utils.table_scan.TableScan.file_batches') as file_batches:
+        stats = collect_table_stats(catalog_properties, NAMESPACE, 'events')
+
+    file_batches.assert_not_called()
+    assert (stats.deltas, stats.files, stats.rows, stats.footers_read) == (2, 2, 20, 2)
+    assert stats.bytes > 0
+    columns = stats.columns
+    assert (columns['id'].min, columns['id'].max, columns['id'].null_count) == (0, 19, 0)
+    assert columns['name'].null_count == 2
+
+
+def test_collect_without_column_stats(catalog_properties: Any) -> None:
+    """Test column statistics are skipped, and no footer read, when not asked for."""
+    stats = collect_table_stats(catalog_properties, NAMESPACE, 'events', column_stats=False)
+
+    assert (stats.rows, stats.footers_read, stats.columns) == (20, 0, {})
+
+
+@pytest.mark.usefixtures('catalog_properties')
+class TestTableStatsCLI:
+    """Test the table stats CLI command."""
+
+    def test_table(self) -> None:
+        """Test the statistics of one table are printed as one record."""
+        result = CliRunner().invoke(
+            app, ['-o', 'ndjson', 'table', 'stats', '--namespace', NAMESPACE, '--name', 'events']
+        )
+
+        assert result.exit_code == 0, result.output
+        record = json.loads(result.stdout)
+        assert (record['table'], record['rows'], record['files'], record['deltas']) == ('events', 20, 2, 2)
+        assert record['columns']['id'] == {'null_count': 0, 'min': 0, 'max': 19}
+        assert len(record['partitions']) == 1
+
+    def test_namespace(self) -> None:
+        """Test every table of the namespace is reported, one record each."""
+        result = CliRunner().invoke(app, ['-o', 'ndjson', 'table', 'stats', '--namespace', NAMESPACE])
+
+        assert result.exit_code == 0, result.output
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        assert {record['table']: record['rows'] for record in records} == {'events': 20, 'users': 3}
+        assert 'Collected statistics of 2 table(s)' in result.stderr
+
+    @pytest.mark.usefixtures('metadata_cache_enabled')
+    def test_namespace_from_cached_listing(self) -> None:
+        """Test the tables of a namespace listed from the metadata cache are reported too."""
+        results = [
+            CliRunner().invoke(app, ['-o', 'ndjson', 'table', 'stats', '--namespace', NAMESPACE]) for _ in range(2)
+        ]
+
+        for result in results:
+            assert result.exit_code == 0, result.output
+            assert 'Collected statistics of 2 table(s)' in result.stderr
+
+    def test_rich(self) -> None:
+        """Test the rich rendering lists partition totals and columns."""
+        result = CliRunner().invoke(app, ['table', 'stats', '--namespace', NAMESPACE, '--name', 'events'])
+
+        assert result.exit_code == 0, result.output
+        assert 'Columns' in result.output
+        assert '20' in result.output
@@ -0,0 +1,136 @@
+"""Tests for bulk writes into tables."""
+
+import json
+import shutil
+import tempfile
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock, patch
+
+import deltacat.catalog.main.impl as catalog
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+import pytest
+from deltacat.catalog import get_catalog_properties
+from typer.testing import CliRunner
+
+from deltacat import Schema
+from deltacat_cli.main import app
+from deltacat_cli.utils.input_files import conform_batch, detect_format, resolve_inputs
+from deltacat_cli.utils.table_scan import TableScan
+
+
+NAMESPACE = 'test_table_write_namespace'
+SCHEMA = pa.schema([pa.field('id', pa.int64()), pa.field('name', pa.large_string()), pa.field('score', pa.float64())])
+
+
+@pytest.fixture
+def catalog_properties() -> Generator[Any, None, None]:
+    """Catalog with an empty table, with the CLI pointed at it."""
+    temp_dir = tempfile.mkdtemp()
+    catalog_properties = get_catalog_properties(root=temp_dir)
+    catalog.create_namespace(namespace=NAMESPACE, inner=catalog_properties)
+    catalog.create_table('events', namespace=NAMESPACE, schema=Schema.of(schema=SCHEMA), inner=catalog_properties)
+
+    def write_to_table(*args: Any, **kwargs: Any) -> Any:
+        # The CLI resolves the catalog by name, which needs Ray; write through the catalog properties instead
+        kwargs.pop('catalog')
+        return catalog.write_to_table(*args, inner=catalog_properties, **kwargs)
+
+    with (
+        patch('deltacat_cli.utils.catalog_context.catalog_context.get_catalog_info') as mock_catalog_info,
+        patch('deltacat_cli.utils.catalog_context.catalog_context.get_catalog') as mock_get_catalog,
+        patch('deltacat_cli.table.write.write_to_table', side_effect=write_to_table),
+    ):
+        mock_catalog_info.return_value = ('test_catalog', 'root')
+        mock_get_catalog.return_value = Mock(inner=catalog_properties)
+        yield catalog_properties
+
+    shutil.rmtree(temp_dir)
+
+
+@pytest.fixture
+def input_dir(tmp_path: Path) -> Path:
+    """Parquet, CSV and NDJSON input files with 10 rows each."""
+    pq.write_table(
+        pa.table({'id': pa.array(range(10), pa.int32()), 'name': [f'p{i}' for i in range(10)]}), tmp_path / 'a.parquet'
+    )
+    pa_csv.write_csv(pa.table({'id': range(10, 20), 'score': [i / 2 for i in range(10)]}), tmp_path / 'b.csv')
+    (tmp_path / 'c.ndjson').write_text(''.join(json.dumps({'id': i, 'name': f'j{i}'}) + '\n' for i in range(20, 30)))
+    return tmp_path
+
+
+class TestInputFiles:
+    """Test input file helpers."""
+
+    def test_detect_format(self) -> None:
+        """Test formats are detected from extensions, ignoring compression."""
+        assert detect_format('data/part.pq') == 'parquet'
+        assert detect_format('events.csv.gz') == 'csv'
+        assert detect_format('events.jsonl') == 'ndjson'
+        with pytest.raises(ValueError, match='--format'):
+            detect_format('events.txt')
+
+    def test_resolve_globs(self, input_dir: Path) -> None:
+        """Test globs expand to sorted files and unmatched patterns fail."""
+        inputs = resolve_inputs([str(input_dir / '*')])
+
+        assert [Path(input_file.path).name for input_file in inputs] == ['a.parquet', 'b.csv', 'c.ndjson']
+        with pytest.raises(ValueError, match='No input files match'):
+            resolve_inputs([str(input_dir / '*.orc')])
+
+    def test_conform_batch(self) -> None:
+        """Test batches are cast and padded to the table schema, and extra columns rejected."""
+        batch = pa.record_batch({'score': [1.0], 'id': pa.array([1], pa.int32())})
+
+        conformed = conform_batch(batch, SCHEMA)
+
+        assert conformed.schema == SCHEMA
+        assert conformed.to_pylist() == [{'id': 1, 'name': None, 'score': 1.0}]
+        with pytest.raises(ValueError, match='not in the table schema: extra'):
+            conform_batch(pa.record_batch({'id': [1], 'extra': [2]}), SCHEMA)
+
+
+class TestTableWriteCLI:
+    """Test the table write CLI command."""
+
+    def test_write_mixed_formats(self, catalog_properties: Any, input_dir: Path) -> None:
+        """Test every input format is written, one delta per batch of rows."""
+        result = CliRunner().invoke(
+            app,
+            [
+                'table',
+                'write',
+                '--name',
+                'events',
+                '--namespace',
+                NAMESPACE,
+                '-i',
+                str(input_dir / '*'),
+                '--batch-rows',
+                '10',
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert 'Wrote 30 row(s) from 3 file(s) in 3 delta(s)' in result.stdout
+        assert 'rows/s' in result.stdout
+
+        scan = TableScan(NAMESPACE, 'events', inner=catalog_properties)
+        table = pa.Table.from_batches(list(scan.batches()), schema=scan.output_schema)
+        assert sorted(table.column('id').to_pylist()) == list(range(30))
+        assert table.filter(pc.field('id') == 25).column('name').to_pylist() == ['j25']
+
+    def test_write_rejects_unknown_columns(self, catalog_properties: Any, tmp_path: Path) -> None:  # noqa: ARG002
+        """Test an input with columns missing from the table fails without writing."""
+        pq.write_table(pa.table({'id': [1], 'unknown': [1]}), tmp_path / 'bad.parquet')
+
+        result = CliRunner().invoke(
+            app, ['table', 'write', '--name', 'events', '--namespace', NAMESPACE, '-i', str(tmp_path / 'bad.parquet')]
+        )
+
+        assert result.exit_code == 1
+        assert 'not in the table schema: unknown' in result.output